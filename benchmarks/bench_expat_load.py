@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+
+"""
+Compares the load time and memory of a Benchmark with the lxml
+and the expat builders.
+
+The input is the large document of bench_trusted_load. The memory is
+measured in a new process loading the document and keeping the
+models: its peak resident size, and the resident size retained by
+the models (Linux only).
+
+Usage: python benchmarks/bench_expat_load.py [--copies N] [--repeat N]
+"""
+
+# Python stdlib
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import timeit
+
+# lxml
+from lxml import etree
+
+# XCCDF
+from xccdf.builder import load
+from xccdf.builder import BUILDER_LXML
+from xccdf.builder import BUILDER_EXPAT
+from bench_trusted_load import build_large_benchmark
+
+#: Loads the document in a new process and prints its memory in KB
+MEMORY_SCRIPT = '''
+import gc, os, resource
+from xccdf.builder import load
+
+def get_resident():
+    if not os.path.exists('/proc/self/statm'):
+        return 0
+    with open('/proc/self/statm') as statm:
+        pages = int(statm.read().split()[1])
+    return pages * os.sysconf('SC_PAGE_SIZE') // 1024
+
+start = get_resident()
+benchmark = load({path!r}, builder={builder!r}, trusted=True)
+gc.collect()
+print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+      get_resident() - start)
+'''
+
+
+def get_memory(path, builder):
+    """
+    Loads a document in a new process.
+
+    :param str path: Path of the document.
+    :param str builder: Builder.
+    :returns: Peak resident size of the process, and resident size
+              retained by the models, in KB.
+    :rtype: tuple
+    """
+
+    output = subprocess.check_output(
+        [sys.executable, '-c', MEMORY_SCRIPT.format(path=path,
+                                                    builder=builder)],
+        env=dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path)))
+
+    peak, retained = output.split()
+    return int(peak), int(retained)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--copies', type=int, default=20)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    xml_element = build_large_benchmark(args.copies)
+    items = len(xml_element.xpath('//*[@id]'))
+
+    document = tempfile.NamedTemporaryFile(suffix='.xml', delete=False)
+    document.write(etree.tostring(xml_element))
+    document.close()
+
+    print('{items} items, best of {repeat} runs'.format(
+        items=items, repeat=args.repeat))
+
+    try:
+        results = dict()
+        for builder in (BUILDER_LXML, BUILDER_EXPAT):
+            timer = timeit.Timer(
+                lambda: load(document.name, builder=builder, trusted=True))
+            results[builder] = min(timer.repeat(repeat=args.repeat,
+                                                number=1))
+            peak, retained = get_memory(document.name, builder)
+            print('{builder}: {time:.3f}s, {peak} KB peak, '
+                  '{retained} KB retained'.format(
+                      builder=builder, time=results[builder],
+                      peak=peak, retained=retained))
+    finally:
+        os.remove(document.name)
+
+    saved = 1 - results[BUILDER_EXPAT] / results[BUILDER_LXML]
+    print('saved: {saved:.1%}'.format(saved=saved))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+
+"""
+Compares the cold start import time of the lazy package API with
+importing every model module.
+
+Each statement runs in a new interpreter, and only the time of the
+statement itself is measured, not the start of the interpreter.
+
+Usage: python benchmarks/bench_import_time.py [--repeat N]
+"""
+
+# Python stdlib
+import argparse
+import os
+import subprocess
+import sys
+
+# XCCDF
+from xccdf.models import MODEL_MODULES
+
+SRC_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), os.pardir, 'src')
+
+#: Measured statement, and the number of modules it loaded
+TIMER = '''
+import sys, time
+modules = len(sys.modules)
+start = time.perf_counter()
+{statement}
+print(time.perf_counter() - start, len(sys.modules) - modules)
+'''
+
+STATEMENTS = [
+    ('eager: every model module',
+     '; '.join('import {module}'.format(module=module)
+               for module in sorted(set(MODEL_MODULES.values())))),
+    ('import xccdf', 'import xccdf'),
+    ('from xccdf import Select', 'from xccdf import Select'),
+    ('from xccdf import Benchmark', 'from xccdf import Benchmark'),
+]
+
+
+def measure(statement, repeat):
+    """
+    Runs a statement in new interpreters.
+
+    :param str statement: Python statement.
+    :param int repeat: Number of runs.
+    :returns: Best time in seconds, and the number of modules loaded.
+    :rtype: tuple
+    """
+
+    environment = dict(os.environ, PYTHONPATH=SRC_PATH)
+    results = list()
+    for run in range(repeat):
+        output = subprocess.check_output(
+            [sys.executable, '-c', TIMER.format(statement=statement)],
+            env=environment)
+        seconds, modules = output.split()
+        results.append((float(seconds), int(modules)))
+
+    return min(results)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+
+    print('best of {repeat} runs'.format(repeat=args.repeat))
+
+    eager = None
+    for name, statement in STATEMENTS:
+        seconds, modules = measure(statement, args.repeat)
+        eager = seconds if eager is None else eager
+        print('{name}: {time:.1f}ms, {modules} modules ({ratio:.0%})'.format(
+            name=name, time=seconds * 1000, modules=modules,
+            ratio=seconds / eager))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,270 @@
+# -*- coding: utf-8 -*-
+
+"""
+Times the main operations of the models over generated documents.
+
+The cases load a Benchmark, reload its children, render the HTML of
+its descriptions, serialize it with as_dict, update_xml_element and
+to_xml_string, resolve its Profiles and load a Tailoring, for several
+numbers of Rules. The inputs are generated with xccdf.testing.generate,
+so they are the same in every run.
+
+For each case the best time of several runs is recorded, timing the
+fast cases in loops, with the peak memory of the Python allocations
+of a run, measured with tracemalloc (the memory of the libxml2 trees
+isn't included). The results can be saved as a JSON baseline, and
+compared with it: the cases slower or bigger than the baseline by
+more than the threshold are reported as regressions, and the exit
+status is 1.
+
+Usage: python benchmarks/bench_suite.py [--sizes N [N ...]] [--repeat N]
+       [--case NAME] [--save PATH] [--compare PATH] [--threshold F]
+"""
+
+# Python stdlib
+import argparse
+import gc
+import io
+import json
+import platform
+import sys
+import timeit
+import tracemalloc
+
+# lxml
+from lxml import etree
+
+# XCCDF
+from xccdf.models.benchmark import Benchmark
+from xccdf.models.html_element import HTMLElement
+from xccdf.models.tailoring import Tailoring
+from xccdf.testing.generate import DocumentGenerator
+
+#: Numbers of Rules of the generated documents
+DEFAULT_SIZES = [100, 1000, 5000]
+
+#: Relative increase of time or memory reported as a regression
+DEFAULT_THRESHOLD = 0.10
+
+#: Version of the format of the saved results
+RESULTS_VERSION = 1
+
+
+def generate_inputs(size):
+    """
+    Generates the documents of a size.
+
+    :param int size: Number of Rules.
+    :returns: Benchmark and Tailoring documents, by name.
+    :rtype: dict
+    """
+
+    generator = DocumentGenerator(rules=size, profiles=3)
+    inputs = dict()
+    for name, write in (('benchmark', generator.write_benchmark),
+                        ('tailoring', generator.write_tailoring)):
+        document = io.BytesIO()
+        write(document)
+        inputs[name] = document.getvalue()
+
+    return inputs
+
+
+def load_benchmark(inputs):
+    """
+    Loads a new Benchmark from the generated document, so the cases
+    that modify it don't change the input of the others.
+
+    :param dict inputs: Generated documents.
+    :returns: Benchmark object.
+    :rtype: xccdf.models.benchmark.Benchmark
+    """
+
+    return Benchmark(etree.fromstring(inputs['benchmark']))
+
+
+def get_html_elements(benchmark):
+    """
+    Collects the HTML elements of the Groups and Rules of a Benchmark,
+    like their descriptions.
+
+    :param xccdf.models.benchmark.Benchmark benchmark: Benchmark.
+    :returns: HTMLElement objects.
+    :rtype: list
+    """
+
+    return [child for item in benchmark.iter_items()
+            for child in item.children if isinstance(child, HTMLElement)]
+
+
+def setup_construct(inputs):
+    xml_element = etree.fromstring(inputs['benchmark'])
+    return lambda: Benchmark(xml_element)
+
+
+def setup_load_children(inputs):
+    return load_benchmark(inputs).load_children
+
+
+def setup_html_content(inputs):
+    html_elements = get_html_elements(load_benchmark(inputs))
+    return lambda: [element.get_html_content() for element in html_elements]
+
+
+def setup_as_dict(inputs):
+    return load_benchmark(inputs).as_dict
+
+
+def setup_update_xml_element(inputs):
+    benchmark = load_benchmark(inputs)
+    return lambda: etree.tostring(benchmark.update_xml_element())
+
+
+def setup_to_xml_string(inputs):
+    html_elements = get_html_elements(load_benchmark(inputs))
+    return lambda: [element.to_xml_string() for element in html_elements]
+
+
+def setup_profiles(inputs):
+    benchmark = load_benchmark(inputs)
+    profile_ids = [profile.id for profile in benchmark.get_profiles()]
+    return lambda: [benchmark.get_selections(profile_id)
+                    for profile_id in profile_ids]
+
+
+def setup_tailoring(inputs):
+    xml_element = etree.fromstring(inputs['tailoring'])
+    return lambda: Tailoring(xml_element)
+
+
+#: Cases of the suite, with the function that prepares their callable
+CASES = [
+    ('construct', setup_construct),
+    ('load_children', setup_load_children),
+    ('html_content', setup_html_content),
+    ('as_dict', setup_as_dict),
+    ('update_xml_element', setup_update_xml_element),
+    ('to_xml_string', setup_to_xml_string),
+    ('profiles', setup_profiles),
+    ('tailoring', setup_tailoring),
+]
+
+
+def measure(function, repeat):
+    """
+    Measures a case.
+
+    :param function: Callable of the case.
+    :param int repeat: Number of timed runs.
+    :returns: Best time of a run in seconds, and peak memory in bytes.
+    :rtype: tuple
+    """
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        function()
+        memory = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    # Fast cases are run in loops of at least 0.2 seconds, like pyperf
+    gc.collect()
+    timer = timeit.Timer(function)
+    number = timer.autorange()[0]
+    time = min(timer.repeat(repeat=repeat, number=number)) / number
+
+    return time, memory
+
+
+def run_suite(sizes, repeat, cases=None):
+    """
+    Runs the cases of the suite for each size.
+
+    :param list sizes: Numbers of Rules.
+    :param int repeat: Number of timed runs of each case.
+    :param list cases: Names of the cases to run, all by default.
+    :returns: Time and memory of each case, by case name and size,
+              like construct[1000].
+    :rtype: dict
+    """
+
+    results = dict()
+    for size in sizes:
+        inputs = generate_inputs(size)
+        for name, setup in CASES:
+            if cases and name not in cases:
+                continue
+            time, memory = measure(setup(inputs), repeat)
+            key = '{name}[{size}]'.format(name=name, size=size)
+            results[key] = {'time': time, 'memory': memory}
+            print('{key:<28} {time:10.4f}s {memory:12,d} B'.format(
+                key=key, time=time, memory=memory))
+
+    return results
+
+
+def compare(results, baseline, threshold):
+    """
+    Compares results with a baseline.
+
+    :param dict results: Results of the suite.
+    :param dict baseline: Results of the baseline.
+    :param float threshold: Relative increase reported as a regression.
+    :returns: Regressions, as tuples of case, metric, baseline value,
+              new value and ratio.
+    :rtype: list
+    """
+
+    regressions = list()
+    for key in sorted(results):
+        if key not in baseline:
+            continue
+        for metric in ('time', 'memory'):
+            old = baseline[key][metric]
+            new = results[key][metric]
+            if old > 0 and new > old * (1 + threshold):
+                regressions.append((key, metric, old, new, new / old))
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--case', action='append', dest='cases',
+                        choices=[name for name, setup in CASES])
+    parser.add_argument('--save', help='path to save the results')
+    parser.add_argument('--compare', help='path of the baseline results')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args()
+
+    results = run_suite(args.sizes, args.repeat, args.cases)
+
+    if args.save:
+        with open(args.save, 'w') as results_file:
+            json.dump({
+                'version': RESULTS_VERSION,
+                'python': platform.python_version(),
+                'lxml': etree.__version__,
+                'results': results,
+            }, results_file, indent=2, sort_keys=True)
+
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            baseline = json.load(baseline_file)['results']
+
+        regressions = compare(results, baseline, args.threshold)
+        for key, metric, old, new, ratio in regressions:
+            print('REGRESSION {key} {metric}: {old:.4g} -> {new:.4g} '
+                  '({ratio:.2f}x)'.format(key=key, metric=metric, old=old,
+                                          new=new, ratio=ratio))
+        if len(regressions) > 0:
+            sys.exit(1)
+        print('no regressions above {threshold:.0%}'.format(
+            threshold=args.threshold))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+
+"""
+Compares the load time of a Benchmark with and without the trusted mode.
+
+The input is built replicating the Groups of the example benchmark
+of the test suite, to get a large document.
+
+Usage: python benchmarks/bench_trusted_load.py [--copies N] [--repeat N]
+"""
+
+# Python stdlib
+import argparse
+import copy
+import os
+import timeit
+
+# lxml
+from lxml import etree
+
+# XCCDF
+from xccdf.models.element import Element
+from xccdf.models.benchmark import Benchmark
+
+EXAMPLE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), os.pardir,
+    'src', 'xccdf', 'models', 'tests', 'examples', 'example_xccdf.xml')
+
+
+def build_large_benchmark(copies):
+    """
+    Builds a Benchmark XML element with the Groups of the example
+    benchmark replicated the given number of times.
+
+    :param int copies: Times the Groups are replicated.
+    :returns: Benchmark XML element.
+    :rtype: lxml.etree._Element
+    """
+
+    xml_element = etree.parse(EXAMPLE_PATH).getroot()
+    groups = [element for element in xml_element
+              if Element.get_namespace_and_tag(element.tag)[1] == 'Group']
+
+    for number in range(1, copies):
+        for group in groups:
+            group_copy = copy.deepcopy(group)
+            for item in group_copy.iter():
+                if item.get('id') is not None:
+                    item.set('id', '{id}-{n}'.format(id=item.get('id'),
+                                                     n=number))
+            xml_element.append(group_copy)
+
+    return xml_element
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--copies', type=int, default=20)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    xml_element = build_large_benchmark(args.copies)
+    items = len(xml_element.xpath('//*[@id]'))
+
+    print('{items} items, best of {repeat} runs'.format(
+        items=items, repeat=args.repeat))
+
+    results = dict()
+    for trusted in (False, True):
+        timer = timeit.Timer(
+            lambda: Benchmark(xml_element, trusted=trusted))
+        results[trusted] = min(timer.repeat(repeat=args.repeat, number=1))
+        print('trusted={trusted}: {time:.3f}s'.format(
+            trusted=trusted, time=results[trusted]))
+
+    saved = 1 - results[True] / results[False]
+    print('saved: {saved:.1%}'.format(saved=saved))
+
+
+if __name__ == '__main__':
+    main()
@@ -25,9 +25,13 @@ setup(
         "License :: OSI Approved :: GNU Lesser "
         "General Public License v3 (LGPLv3)",
         'Operating System :: OS Independent',
-        'Programming Language :: Python :: 2.7',
-        'Programming Language :: Python :: 3.3',
-        'Programming Language :: Python :: 3.4',
+        'Programming Language :: Python :: 3',
+        'Programming Language :: Python :: 3 :: Only',
+        'Programming Language :: Python :: 3.8',
+        'Programming Language :: Python :: 3.9',
+        'Programming Language :: Python :: 3.10',
+        'Programming Language :: Python :: 3.11',
+        'Programming Language :: Python :: 3.12',
         'Programming Language :: Python :: Implementation :: CPython',
         'Topic :: System :: Systems Administration',
         'Topic :: Software Development :: Libraries',
@@ -38,13 +42,23 @@ setup(
     packages=find_packages('src', exclude=['ez_setup', '*.tests', '*.tests.*',
                                            'tests.*', 'tests']),
     package_dir={'': 'src'},
+    package_data={'xccdf': ['schemas/*']},
     include_package_data=True,
     zip_safe=False,
 
     # Dependencies
+    python_requires='>=3.8',
     install_requires=[
         'lxml>=3.3.0',
     ],
+    extras_require={
+        'numpy': ['numpy>=1.13'],
+    },
+
+    # Console scripts
+    entry_points={
+        'console_scripts': ['xccdf = xccdf.cli:main'],
+    },
 
     # Tests
     test_suite='xccdf.tests.suite',
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+
+"""
+xccdf is a library to create, load, validate and evaluate XCCDF
+documents.
+
+The model classes and the main functions can be imported from this
+package, like ``from xccdf import Benchmark, validate``. Each module
+is imported on first use, so a script that edits a Select doesn't
+load the rest of the models, nor the validation or scoring modules.
+
+This module is part of the xccdf library.
+
+Author: Rodrigo Núñez <rnunezmujica@icloud.com>
+"""
+
+# XCCDF
+from xccdf.models import MODEL_MODULES
+from xccdf.models import load_attribute
+
+#: Module of each lazy attribute that isn't a model class, by name
+API_MODULES = {
+    'ValidationException': 'xccdf.exceptions',
+    'InvalidValueException': 'xccdf.exceptions',
+    'RequiredAttributeException': 'xccdf.exceptions',
+    'CardinalityException': 'xccdf.exceptions',
+    'ReferenceException': 'xccdf.exceptions',
+    'validate': 'xccdf.validation',
+    'validate_schema': 'xccdf.validation',
+    'validate_file': 'xccdf.validation',
+    'validate_files': 'xccdf.validation',
+    'check_references': 'xccdf.references',
+    'iter_rule_results': 'xccdf.results',
+    'diff_results': 'xccdf.diff',
+    'freeze': 'xccdf.frozen',
+    'Substitution': 'xccdf.substitution',
+    'CheckIndex': 'xccdf.checks',
+    'ScoringTree': 'xccdf.scoring',
+    'DependencyGraph': 'xccdf.dependencies',
+    'ApplicabilityEvaluator': 'xccdf.cpe',
+    'SharedBenchmarkStore': 'xccdf.shared',
+    'AsyncLoader': 'xccdf.aio',
+    'ExpatBuilder': 'xccdf.builder',
+    'Instrumentation': 'xccdf.instrumentation',
+    'memory_report': 'xccdf.memory',
+}
+
+#: Module of each lazy attribute, by name
+LAZY_MODULES = dict(MODEL_MODULES, **API_MODULES)
+
+__all__ = sorted(LAZY_MODULES.keys())
+
+
+def __getattr__(name):
+    """
+    Imports a model class or a function on first use.
+
+    :param str name: Name of the attribute.
+    :returns: Value of the attribute.
+    :raises AttributeError: If there is no attribute with the name.
+    """
+
+    return load_attribute(globals(), LAZY_MODULES, name)
+
+
+def __dir__():
+    """
+    Lists the attributes of the package, with the lazy ones.
+
+    :returns: Names of the attributes.
+    :rtype: list
+    """
+
+    return sorted(set(globals().keys()) | set(__all__))
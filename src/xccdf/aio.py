@@ -0,0 +1,378 @@
+# -*- coding: utf-8 -*-
+
+"""
+xccdf.aio includes the class AsyncLoader and the coroutines
+load_benchmark, load_tailoring, load_results and dump, to load and
+export documents from asyncio code without blocking the event loop.
+
+The parsing, model building and serialization run in an executor.
+A thread executor is used by default. A process executor uses all
+the cores, and its models are sent back frozen (see xccdf.frozen)
+and thawed, because lxml elements can't be pickled. The thawed
+models have no XML element until update_xml_element is called.
+
+The number of documents processed at the same time is limited, so
+the callers wait instead of queueing work without bounds. The module
+coroutines share a default loader per event loop, and so its limit.
+Cancelling a coroutine drops its work if it has not started yet. The
+work that is already running in the executor finishes, and its result
+is discarded, but it keeps its slot until it finishes.
+
+This module is part of the xccdf library.
+
+Author: Rodrigo Núñez <rnunezmujica@icloud.com>
+"""
+
+# Python stdlib
+import asyncio
+import io
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+
+# lxml
+from lxml import etree
+
+# XCCDF
+from xccdf.models.element import Element
+from xccdf.models.benchmark import Benchmark
+from xccdf.models.tailoring import Tailoring
+from xccdf.models.test_result import TestResult
+from xccdf.frozen import FrozenElement
+from xccdf.frozen import freeze
+
+#: Default number of documents processed at the same time
+DEFAULT_LIMIT = 8
+
+#: Default loaders of the module coroutines, by event loop
+DEFAULT_LOADERS = weakref.WeakKeyDictionary()
+
+
+def parse_document(source):
+    """
+    Parses a document.
+
+    :param source: Path or file object of the document, or its content.
+    :type source: str or bytes or file
+    :returns: Root element of the document.
+    :rtype: lxml.etree._Element
+    """
+
+    if isinstance(source, bytes):
+        return etree.fromstring(source)
+
+    return etree.parse(source).getroot()
+
+
+def load_document(source, model, frozen=False):
+    """
+    Parses a document and builds the model of its root element.
+
+    :param source: Path or file object of the document, or its content.
+    :param type model: Element subclass of the root element.
+    :param bool frozen: If the model is returned frozen.
+    :returns: Model of the root element.
+    :rtype: xccdf.models.element.Element or xccdf.frozen.FrozenElement
+    """
+
+    element = model(parse_document(source))
+
+    return freeze(element) if frozen else element
+
+
+def load_test_results(source, frozen=False):
+    """
+    Parses a result document and builds its TestResults. The root
+    element can be a TestResult or contain them, like a Benchmark.
+
+    :param source: Path or file object of the document, or its content.
+    :param bool frozen: If the models are returned frozen.
+    :returns: List of TestResult objects, in document order.
+    :rtype: list
+    """
+
+    xml_element = parse_document(source)
+    if Element.get_namespace_and_tag(xml_element.tag)[1] == 'TestResult':
+        xml_elements = [xml_element]
+    else:
+        xml_elements = xml_element.findall('{*}TestResult')
+
+    results = [TestResult(child) for child in xml_elements]
+
+    return [freeze(result) for result in results] if frozen else results
+
+
+def dump_element(element, destination=None, pretty_print=False):
+    """
+    Serializes an element model as an XML document.
+
+    :param element: Element model, frozen or not.
+    :type element: xccdf.models.element.Element or
+                   xccdf.frozen.FrozenElement
+    :param destination: Path or file object to write the document.
+    :type destination: str or file
+    :param bool pretty_print: If the document is indented.
+    :returns: The document if there is no destination.
+    :rtype: bytes or NoneType
+    """
+
+    if isinstance(element, FrozenElement):
+        element = element.thaw()
+
+    content = etree.tostring(element.update_xml_element(),
+                             xml_declaration=True, encoding='UTF-8',
+                             pretty_print=pretty_print)
+
+    if destination is None:
+        return content
+
+    if hasattr(destination, 'write'):
+        destination.write(content)
+    else:
+        with io.open(destination, 'wb') as document_file:
+            document_file.write(content)
+
+
+class AsyncLoader(object):
+
+    """
+    Loads and exports documents in an executor, limiting
+    the number of documents processed at the same time.
+    """
+
+    def __init__(self, executor=None, limit=DEFAULT_LIMIT):
+        """
+        Initializes the loader.
+
+        :param executor: Executor of the work, by default a thread
+                         executor with a thread for each document
+                         processed at the same time.
+        :type executor: concurrent.futures.Executor
+        :param int limit: Number of documents processed at the same time.
+        :raises ValueError: If the limit is not positive.
+        """
+
+        if limit < 1:
+            raise ValueError('limit must be at least 1')
+
+        if executor is None:
+            executor = ThreadPoolExecutor(limit)
+
+        self.executor = executor
+        self.limit = limit
+        self.semaphore = asyncio.Semaphore(limit)
+
+    def __str__(self):
+        """
+        String representation of AsyncLoader object.
+
+        :returns: AsyncLoader object as a string.
+        :rtype: str
+        """
+
+        string_value = 'async loader ({kind}, limit {limit})'.format(
+            kind='processes' if self.uses_processes() else 'threads',
+            limit=self.limit)
+        return string_value
+
+    def uses_processes(self):
+        """
+        Tells if the work runs in other processes, so the models
+        must be frozen to be sent back.
+
+        :returns: If the executor is a process executor.
+        :rtype: bool
+        """
+
+        return isinstance(self.executor, ProcessPoolExecutor)
+
+    async def run(self, function, *args):
+        """
+        Runs a function in the executor, waiting for a free slot first.
+
+        :param function: Function to run.
+        :param args: Arguments of the function.
+        :returns: Result of the function.
+        :raises asyncio.CancelledError: If the coroutine is cancelled.
+        """
+
+        await self.semaphore.acquire()
+        loop = asyncio.get_running_loop()
+
+        try:
+            future = self.executor.submit(function, *args)
+        except BaseException:
+            self.semaphore.release()
+            raise
+
+        # The slot is freed when the work finishes, even if this
+        # coroutine was cancelled while the work was running
+        future.add_done_callback(lambda done: self.release(loop))
+
+        return await asyncio.wrap_future(future)
+
+    def release(self, loop):
+        """
+        Frees a slot from the thread of the executor.
+
+        :param asyncio.AbstractEventLoop loop: Event loop of the slot.
+        """
+
+        if not loop.is_closed():
+            loop.call_soon_threadsafe(self.semaphore.release)
+
+    async def load(self, source, model):
+        """
+        Loads the model of the root element of a document.
+
+        :param source: Path of the document, or its content. File
+                       objects can only be loaded by thread executors.
+        :param type model: Element subclass of the root element.
+        :returns: Model of the root element.
+        :rtype: xccdf.models.element.Element
+        """
+
+        if not self.uses_processes():
+            return await self.run(load_document, source, model)
+
+        frozen = await self.run(load_document, source, model, True)
+        return frozen.thaw()
+
+    async def load_benchmark(self, source):
+        """
+        Loads a Benchmark document.
+
+        :param source: Path of the document, or its content.
+        :returns: Benchmark.
+        :rtype: xccdf.models.benchmark.Benchmark
+        """
+
+        return await self.load(source, Benchmark)
+
+    async def load_tailoring(self, source):
+        """
+        Loads a Tailoring document.
+
+        :param source: Path of the document, or its content.
+        :returns: Tailoring.
+        :rtype: xccdf.models.tailoring.Tailoring
+        """
+
+        return await self.load(source, Tailoring)
+
+    async def load_results(self, source):
+        """
+        Loads the TestResults of a result document.
+
+        :param source: Path of the document, or its content.
+        :returns: List of TestResult objects, in document order.
+        :rtype: list
+        """
+
+        if not self.uses_processes():
+            return await self.run(load_test_results, source)
+
+        results = await self.run(load_test_results, source, True)
+        return [result.thaw() for result in results]
+
+    async def dump(self, element, destination=None, pretty_print=False):
+        """
+        Serializes an element model as an XML document. With a process
+        executor, the model is frozen in the event loop thread before
+        being sent, unless it is already frozen.
+
+        :param element: Element model, frozen or not.
+        :type element: xccdf.models.element.Element or
+                       xccdf.frozen.FrozenElement
+        :param str destination: Path to write the document.
+        :param bool pretty_print: If the document is indented.
+        :returns: The document if there is no destination.
+        :rtype: bytes or NoneType
+        """
+
+        if self.uses_processes() and not isinstance(element, FrozenElement):
+            element = freeze(element)
+
+        return await self.run(dump_element, element, destination,
+                              pretty_print)
+
+
+def get_default_loader():
+    """
+    Returns the loader shared by the module coroutines in the running
+    event loop, creating it the first time.
+
+    :returns: Default loader of the event loop.
+    :rtype: xccdf.aio.AsyncLoader
+    """
+
+    loop = asyncio.get_running_loop()
+    loader = DEFAULT_LOADERS.get(loop)
+    if loader is None:
+        loader = DEFAULT_LOADERS[loop] = AsyncLoader()
+
+    return loader
+
+
+async def load_benchmark(source, loader=None):
+    """
+    Loads a Benchmark document without blocking the event loop.
+
+    :param source: Path of the document, or its content.
+    :param xccdf.aio.AsyncLoader loader: Loader, by default the one
+                                       shared in the event loop.
+    :returns: Benchmark.
+    :rtype: xccdf.models.benchmark.Benchmark
+    """
+
+    loader = get_default_loader() if loader is None else loader
+    return await loader.load_benchmark(source)
+
+
+async def load_tailoring(source, loader=None):
+    """
+    Loads a Tailoring document without blocking the event loop.
+
+    :param source: Path of the document, or its content.
+    :param xccdf.aio.AsyncLoader loader: Loader, by default the one
+                                       shared in the event loop.
+    :returns: Tailoring.
+    :rtype: xccdf.models.tailoring.Tailoring
+    """
+
+    loader = get_default_loader() if loader is None else loader
+    return await loader.load_tailoring(source)
+
+
+async def load_results(source, loader=None):
+    """
+    Loads the TestResults of a result document without blocking
+    the event loop.
+
+    :param source: Path of the document, or its content.
+    :param xccdf.aio.AsyncLoader loader: Loader, by default the one
+                                       shared in the event loop.
+    :returns: List of TestResult objects, in document order.
+    :rtype: list
+    """
+
+    loader = get_default_loader() if loader is None else loader
+    return await loader.load_results(source)
+
+
+async def dump(element, destination=None, pretty_print=False, loader=None):
+    """
+    Serializes an element model as an XML document without blocking
+    the event loop.
+
+    :param element: Element model, frozen or not.
+    :param str destination: Path to write the document.
+    :param bool pretty_print: If the document is indented.
+    :param xccdf.aio.AsyncLoader loader: Loader, by default the one
+                                       shared in the event loop.
+    :returns: The document if there is no destination.
+    :rtype: bytes or NoneType
+    """
+
+    loader = get_default_loader() if loader is None else loader
+    return await loader.dump(element, destination, pretty_print)
@@ -0,0 +1,329 @@
+# -*- coding: utf-8 -*-
+
+"""
+xccdf.builder includes the class ExpatBuilder and the function load,
+to load the models of a document choosing the builder: lxml, or expat
+for read-only uses.
+
+The expat builder builds the models from the expat parser events,
+without a libxml2 tree. The elements are compact C elements of
+xml.etree.ElementTree, built by its TreeBuilder. On non strict loads,
+the errors need the line and the parent of the elements, so the
+elements are built by Python handlers as Nodes, which keep them.
+
+The elements only live while the models are built: the models are
+returned without XML element, like thawed models (see xccdf.frozen),
+and update_xml_element builds a new lxml one when it is needed.
+The as_dict of the models, and the errors of non strict loads,
+are the same for both builders.
+
+This module is part of the xccdf library.
+
+Author: Rodrigo Núñez <rnunezmujica@icloud.com>
+"""
+
+# Python stdlib
+from xml.etree import ElementTree
+from xml.parsers import expat
+
+# lxml
+from lxml import etree
+
+# XCCDF
+from xccdf.models.element import Element
+from xccdf.models.benchmark import Benchmark
+from xccdf.models.tailoring import Tailoring
+from xccdf.models.test_result import TestResult
+
+#: Builders available to load
+BUILDER_LXML = 'lxml'
+BUILDER_EXPAT = 'expat'
+
+#: Models of the root elements, by tag name
+ROOT_MODELS = {
+    'Benchmark': Benchmark,
+    'Tailoring': Tailoring,
+    'TestResult': TestResult,
+}
+
+#: Bytes read from the file objects at a time
+READ_SIZE = 64 * 1024
+
+
+class Node(ElementTree.Element):
+
+    """
+    XML element built by the expat builder on non strict loads,
+    with the lxml attributes used to locate the errors.
+    """
+
+    __slots__ = ('sourceline', 'parent')
+
+    def getparent(self):
+        """
+        Returns the parent of the node.
+
+        :returns: Parent node, None for the root.
+        :rtype: xccdf.builder.Node or NoneType
+        """
+
+        return self.parent
+
+
+class ExpatBuilder(object):
+
+    """
+    Builds the XML elements of a document from the expat parser events.
+    """
+
+    def __init__(self, track_lines=False):
+        """
+        Initializes the parser.
+
+        :param bool track_lines: If the elements are Nodes, with their
+                                 line and parent. Otherwise, they are
+                                 built by the C TreeBuilder.
+        """
+
+        self.track_lines = track_lines
+        self.root = None
+        self.current = None
+
+        if track_lines:
+            self.parser = expat.ParserCreate(namespace_separator='}')
+            self.parser.buffer_text = True
+            self.parser.StartElementHandler = self.start
+            self.parser.EndElementHandler = self.end
+            self.parser.CharacterDataHandler = self.data
+            self.parser.CommentHandler = self.comment
+        else:
+            self.parser = ElementTree.XMLParser(
+                target=ElementTree.TreeBuilder(insert_comments=True))
+
+    def __str__(self):
+        """
+        String representation of ExpatBuilder object.
+
+        :returns: ExpatBuilder object as a string.
+        :rtype: str
+        """
+
+        string_value = 'expat builder'
+        if self.root is not None:
+            string_value += ' ({tag})'.format(tag=self.root.tag)
+        return string_value
+
+    @staticmethod
+    def get_name(name):
+        """
+        Converts an expat name to the Clark notation of lxml.
+
+        :param str name: Name, like uri}tag when it has a namespace.
+        :returns: Name, like {uri}tag when it has a namespace.
+        :rtype: str
+        """
+
+        return '{' + name if '}' in name else name
+
+    def add_node(self, tag, attrib):
+        """
+        Creates a node as the last child of the current node.
+
+        :param tag: Tag name, or ElementTree.Comment.
+        :param dict attrib: Attributes.
+        :returns: New node.
+        :rtype: xccdf.builder.Node
+        """
+
+        node = Node(tag, attrib)
+        node.sourceline = self.parser.CurrentLineNumber
+        node.parent = self.current
+
+        if self.current is not None:
+            self.current.append(node)
+        elif self.root is None:
+            self.root = node
+
+        return node
+
+    def start(self, name, attributes):
+        """
+        Handles the start of an element.
+
+        :param str name: Name of the element.
+        :param dict attributes: Attributes of the element.
+        """
+
+        attrib = dict((self.get_name(key), value)
+                      for key, value in attributes.items())
+        self.current = self.add_node(self.get_name(name), attrib)
+
+    def end(self, name):
+        """
+        Handles the end of an element.
+
+        :param str name: Name of the element.
+        """
+
+        self.current = self.current.parent
+
+    def data(self, text):
+        """
+        Handles the text of an element, or the tail of its last child.
+
+        :param str text: Text.
+        """
+
+        if self.current is None:
+            return
+
+        if len(self.current) == 0:
+            self.current.text = (self.current.text or '') + text
+        else:
+            last = self.current[-1]
+            last.tail = (last.tail or '') + text
+
+    def comment(self, text):
+        """
+        Handles a comment inside the root element.
+
+        :param str text: Text of the comment.
+        """
+
+        if self.current is not None:
+            self.add_node(ElementTree.Comment, dict()).text = text
+
+    def feed(self, data):
+        """
+        Parses a chunk of the document.
+
+        :param bytes data: Chunk of the document.
+        """
+
+        if self.track_lines:
+            self.parser.Parse(data, False)
+        else:
+            self.parser.feed(data)
+
+    def close(self):
+        """
+        Finishes the parse.
+
+        :returns: Root element.
+        :rtype: xml.etree.ElementTree.Element
+        """
+
+        if self.track_lines:
+            self.parser.Parse(b'', True)
+        else:
+            self.root = self.parser.close()
+
+        return self.root
+
+    def parse(self, source):
+        """
+        Parses a document.
+
+        :param source: Path or file object of the document, or its content.
+        :type source: str or bytes or file
+        :returns: Root element.
+        :rtype: xml.etree.ElementTree.Element
+        :raises xml.parsers.expat.ExpatError: If the document is not
+                                              well formed.
+        :raises xml.etree.ElementTree.ParseError: The same, when the
+                                                  lines are not tracked.
+        """
+
+        if isinstance(source, bytes):
+            self.feed(source)
+        elif hasattr(source, 'read'):
+            self.feed_file(source)
+        else:
+            with open(source, 'rb') as document_file:
+                self.feed_file(document_file)
+
+        return self.close()
+
+    def feed_file(self, document_file):
+        """
+        Parses a file object in chunks.
+
+        :param file document_file: Binary file object.
+        """
+
+        data = document_file.read(READ_SIZE)
+        while len(data) > 0:
+            self.feed(data)
+            data = document_file.read(READ_SIZE)
+
+    def release(self):
+        """
+        Removes the parent references of the Nodes, so they are freed
+        as soon as they aren't used, without the garbage collector.
+        """
+
+        if self.track_lines and self.root is not None:
+            for node in self.root.iter():
+                node.parent = None
+
+
+def release_nodes(element):
+    """
+    Removes the XML elements of a model and its children.
+
+    :param xccdf.models.element.Element element: Model.
+    """
+
+    pending = [element]
+    while len(pending) > 0:
+        element = pending.pop()
+        element.__dict__.pop('xml_element', None)
+        pending.extend(getattr(element, 'children', list()))
+
+
+def load(source, model=None, builder=BUILDER_LXML, strict=True,
+         trusted=False):
+    """
+    Loads the model of the root element of a document.
+
+    :param source: Path or file object of the document, or its content.
+    :param type model: Element subclass of the root element. By default,
+                       chosen from its tag: Benchmark, Tailoring
+                       or TestResult.
+    :param str builder: lxml, to keep the lxml elements in the models,
+                        or expat, to build compact models without them.
+    :param bool strict: If False, validation errors are collected
+                        in the errors attribute instead of raised.
+    :param bool trusted: If True, the value and cardinality checks
+                         are skipped, for already validated documents.
+    :returns: Model of the root element.
+    :rtype: xccdf.models.element.Element
+    :raises ValueError: If the builder is unknown or there is no model
+                        for the root element.
+    """
+
+    if builder == BUILDER_LXML:
+        if isinstance(source, bytes):
+            xml_element = etree.fromstring(source)
+        else:
+            xml_element = etree.parse(source).getroot()
+    elif builder == BUILDER_EXPAT:
+        expat_builder = ExpatBuilder(track_lines=not strict)
+        xml_element = expat_builder.parse(source)
+    else:
+        raise ValueError('unknown builder {builder}'.format(builder=builder))
+
+    if model is None:
+        tag = Element.get_namespace_and_tag(xml_element.tag)[1]
+        if tag not in ROOT_MODELS:
+            raise ValueError('no model for the {tag} element'.format(
+                tag=tag))
+        model = ROOT_MODELS[tag]
+
+    element = model(xml_element, strict=strict, trusted=trusted)
+
+    if builder == BUILDER_EXPAT:
+        release_nodes(element)
+        expat_builder.release()
+
+    return element
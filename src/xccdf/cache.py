@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+
+"""
+xccdf.cache includes the class ResultCache, an SQLite store of check
+results, to skip the checks whose content, values and host did not
+change since the last scan.
+
+The key of each result is a hash of the check content, the Rule, the
+effective values of the profile, the values exported to the check and
+a fingerprint of the host facts (see get_cache_key). The results
+expire after a time to live, and the least recently used ones are
+evicted when the cache is full.
+
+This module is part of the xccdf library.
+
+Author: Rodrigo Núñez <rnunezmujica@icloud.com>
+"""
+
+# Python stdlib
+from collections import OrderedDict
+import hashlib
+import json
+import sqlite3
+import time
+
+#: Statements to create the results table
+CREATE_STATEMENTS = [
+    'CREATE TABLE IF NOT EXISTS results ('
+    'key TEXT PRIMARY KEY, rule_id TEXT, result TEXT, exit_code INTEGER, '
+    'stdout TEXT, stderr TEXT, created REAL, accessed REAL)',
+    'CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed)',
+]
+
+
+def get_fingerprint(data):
+    """
+    Builds a stable hash of JSON serializable data,
+    independent of the order of the dictionary keys.
+
+    :param data: Data to hash, like the host facts.
+    :returns: Hexadecimal SHA-256 digest.
+    :rtype: str
+    """
+
+    serialized = json.dumps(data, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(serialized.encode('utf-8')).hexdigest()
+
+
+def get_cache_key(content, values, facts, rule_id=None, exports=None):
+    """
+    Builds the cache key of a check result.
+
+    Rules can share the content of a check and export different values
+    to it, so the Rule and its exported values are part of the key.
+
+    :param bytes content: Content of the check, like a script.
+    :param dict values: Effective values of the profile by Value id.
+    :param dict facts: Facts of the host.
+    :param str rule_id: Id of the Rule of the check.
+    :param dict exports: Values given to the check, like the environment
+                         variables of a script, by name.
+    :returns: Hexadecimal SHA-256 digest.
+    :rtype: str
+    """
+
+    digest = hashlib.sha256(content)
+    digest.update(get_fingerprint(values).encode('utf-8'))
+    digest.update(get_fingerprint(facts).encode('utf-8'))
+    digest.update(get_fingerprint([rule_id, exports]).encode('utf-8'))
+
+    return digest.hexdigest()
+
+
+class ResultCache(object):
+
+    """
+    SQLite cache of check results, with time to live, LRU eviction
+    and hit metrics by Rule.
+    """
+
+    def __init__(self, path=':memory:', ttl=None, max_entries=None):
+        """
+        Opens the cache database, creating it if needed.
+
+        :param str path: Path of the SQLite database file,
+                         ':memory:' for a temporary cache.
+        :param float ttl: Seconds a result is valid, None for no expiration.
+        :param int max_entries: Number of results kept, None for no limit.
+        """
+
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.clock = time.time
+
+        self.hits = OrderedDict()
+        self.misses = OrderedDict()
+
+        self.connection = sqlite3.connect(path)
+        for statement in CREATE_STATEMENTS:
+            self.connection.execute(statement)
+        self.connection.commit()
+
+    def __str__(self):
+        """
+        String representation of ResultCache object.
+
+        :returns: ResultCache object as a string.
+        :rtype: str
+        """
+
+        string_value = 'result cache {path} ({entries} entries)'.format(
+            path=self.path, entries=len(self))
+        return string_value
+
+    def __len__(self):
+        """
+        Number of results in the cache, including the expired ones.
+
+        :returns: Number of results.
+        :rtype: int
+        """
+
+        cursor = self.connection.execute('SELECT COUNT(*) FROM results')
+        return cursor.fetchone()[0]
+
+    def get(self, key, rule_id):
+        """
+        Returns a cached result and counts the hit or the miss of the Rule.
+        Expired results are removed.
+
+        :param str key: Cache key of the result.
+        :param str rule_id: Id of the Rule of the check.
+        :returns: Result, exit code, stdout and stderr,
+                  None if the result is not cached.
+        :rtype: tuple or NoneType
+        """
+
+        now = self.clock()
+        row = self.connection.execute(
+            'SELECT result, exit_code, stdout, stderr, created '
+            'FROM results WHERE key = ?', (key,)).fetchone()
+
+        if row is not None and self.ttl is not None \
+                and row[4] + self.ttl <= now:
+            self.connection.execute('DELETE FROM results WHERE key = ?',
+                                    (key,))
+            self.connection.commit()
+            row = None
+
+        if row is None:
+            self.misses[rule_id] = self.misses.get(rule_id, 0) + 1
+            return None
+
+        self.connection.execute(
+            'UPDATE results SET accessed = ? WHERE key = ?', (now, key))
+        self.connection.commit()
+        self.hits[rule_id] = self.hits.get(rule_id, 0) + 1
+
+        return row[:4]
+
+    def set(self, key, rule_id, result, exit_code=None, stdout='',
+            stderr=''):
+        """
+        Stores a result and evicts the least recently used results
+        if the cache is full.
+
+        :param str key: Cache key of the result.
+        :param str rule_id: Id of the Rule of the check.
+        :param str result: Result string.
+        :param int exit_code: Exit code of the check.
+        :param str stdout: Standard output of the check.
+        :param str stderr: Standard error of the check.
+        """
+
+        now = self.clock()
+        self.connection.execute(
+            'INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+            (key, rule_id, result, exit_code, stdout, stderr, now, now))
+        self.evict()
+
+    def evict(self):
+        """
+        Removes the expired results and, if the cache is full,
+        the least recently used ones.
+
+        :returns: Number of removed results.
+        :rtype: int
+        """
+
+        removed = 0
+
+        if self.ttl is not None:
+            cursor = self.connection.execute(
+                'DELETE FROM results WHERE created + ? <= ?',
+                (self.ttl, self.clock()))
+            removed += cursor.rowcount
+
+        if self.max_entries is not None:
+            cursor = self.connection.execute(
+                'DELETE FROM results WHERE key IN (SELECT key FROM results '
+                'ORDER BY accessed DESC, rowid DESC LIMIT -1 OFFSET ?)',
+                (self.max_entries,))
+            removed += cursor.rowcount
+
+        self.connection.commit()
+
+        return removed
+
+    def clear(self):
+        """
+        Removes every result and resets the metrics.
+        """
+
+        self.connection.execute('DELETE FROM results')
+        self.connection.commit()
+        self.hits.clear()
+        self.misses.clear()
+
+    def get_hit_rates(self):
+        """
+        Returns the hit rate of the lookups of each Rule.
+
+        :returns: Hit rates between 0 and 1 by Rule id.
+        :rtype: collections.OrderedDict
+        """
+
+        rates = OrderedDict()
+        for rule_id in list(self.hits.keys()) + list(self.misses.keys()):
+            if rule_id in rates:
+                continue
+            hits = self.hits.get(rule_id, 0)
+            rates[rule_id] = float(hits) / (hits + self.misses.get(rule_id, 0))
+
+        return rates
+
+    def close(self):
+        """
+        Closes the cache database.
+        """
+
+        self.connection.close()
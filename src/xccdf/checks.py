@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+
+"""
+xccdf.checks includes the class CheckIndex, to map the checks of the
+Rules of a Benchmark, keyed by (check system, href, name), to the Rules
+and back, and to export the check content files they reference.
+
+This module is part of the xccdf library.
+
+Author: Rodrigo Núñez <rnunezmujica@icloud.com>
+"""
+
+# Python stdlib
+from collections import OrderedDict
+import os
+import shutil
+
+# XCCDF
+from xccdf.models.rule import Rule
+
+
+class CheckIndex(object):
+
+    """
+    Index of the check content references of the Rules of a Benchmark.
+    """
+
+    def __init__(self, benchmark):
+        """
+        Indexes every check content reference of the benchmark.
+
+        :param xccdf.models.benchmark.Benchmark benchmark: Benchmark.
+        """
+
+        self.rules = OrderedDict()
+        self.checks = OrderedDict()
+
+        for item in benchmark.iter_items():
+            if not isinstance(item, Rule):
+                continue
+            for check in item.iter_checks():
+                for content_ref in check.get_content_refs():
+                    key = (check.system, content_ref.href,
+                           content_ref.name_ref)
+                    rule_ids = self.rules.setdefault(key, list())
+                    if item.id not in rule_ids:
+                        rule_ids.append(item.id)
+                    keys = self.checks.setdefault(item.id, list())
+                    if key not in keys:
+                        keys.append(key)
+
+    def __str__(self):
+        """
+        String representation of CheckIndex object.
+
+        :returns: CheckIndex object as a string.
+        :rtype: str
+        """
+
+        string_value = 'check index ({checks} checks, {rules} rules)'.format(
+            checks=len(self.rules), rules=len(self.checks))
+        return string_value
+
+    def get_rules(self, system, href, name=None):
+        """
+        Returns the Rules that use a check.
+
+        :param str system: URI of the checking system.
+        :param str href: Location of the check content file.
+        :param str name: Name of the check inside the file.
+        :returns: Ids of the Rules, in document order.
+        :rtype: list
+        """
+
+        return list(self.rules.get((system, href, name), list()))
+
+    def get_checks(self, rule_id):
+        """
+        Returns the checks of a Rule.
+
+        :param str rule_id: Id of the Rule.
+        :returns: (system, href, name) keys of the checks.
+        :rtype: list
+        """
+
+        return list(self.checks.get(rule_id, list()))
+
+    def get_content_files(self, system=None):
+        """
+        Returns the check content files referenced by the Rules,
+        with the names of the checks used from each one.
+
+        :param str system: URI of the checking system, None for all.
+        :returns: Names by href, in document order. The names are None
+                  if a reference has no name, so the whole file is used.
+        :rtype: collections.OrderedDict
+        """
+
+        content_files = OrderedDict()
+
+        for check_system, href, name in self.rules.keys():
+            if system is not None and check_system != system:
+                continue
+            names = content_files.setdefault(href, list())
+            if name is None:
+                content_files[href] = None
+            elif names is not None and name not in names:
+                names.append(name)
+
+        return content_files
+
+    def export_content_files(self, source_dir, target_dir, system=None):
+        """
+        Copies the local check content files referenced by the Rules,
+        keeping their relative paths. Remote hrefs are not copied.
+
+        Every href is checked before copying any file, and an href that
+        leads outside the source or target directory, like an absolute
+        path or one with '..', is rejected.
+
+        :param str source_dir: Directory the hrefs are relative to,
+                               usually the one of the Benchmark file.
+        :param str target_dir: Directory where the files are copied.
+        :param str system: URI of the checking system, None for all.
+        :returns: Paths of the copied files.
+        :rtype: list
+        :raises ValueError: If an href leads outside the directories.
+        :raises IOError: If a referenced file doesn't exist.
+        """
+
+        paths = list()
+
+        for href in self.get_content_files(system).keys():
+            if '://' in href:
+                continue
+            paths.append((get_local_path(source_dir, href),
+                          get_local_path(target_dir, href)))
+
+        copied = list()
+
+        for source_path, target_path in paths:
+            target_parent = os.path.dirname(target_path)
+            if not os.path.isdir(target_parent):
+                os.makedirs(target_parent)
+            shutil.copyfile(source_path, target_path)
+            copied.append(target_path)
+
+        return copied
+
+
+def get_local_path(base_dir, href):
+    """
+    Returns the path of a local href inside a directory.
+
+    :param str base_dir: Directory the href is relative to.
+    :param str href: Relative location of a file.
+    :returns: Path of the file.
+    :rtype: str
+    :raises ValueError: If the real path of the href, following
+                        symbolic links, is outside the directory.
+    """
+
+    path = os.path.normpath(os.path.join(base_dir, href))
+    real_base_dir = os.path.realpath(base_dir)
+    real_path = os.path.realpath(path)
+
+    if os.path.isabs(href) or os.path.commonprefix(
+            [real_path, real_base_dir + os.sep]) != real_base_dir + os.sep:
+        error_msg = 'href {href} is outside of {base_dir}'.format(
+            href=href, base_dir=base_dir)
+        raise ValueError(error_msg)
+
+    return path
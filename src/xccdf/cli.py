@@ -0,0 +1,620 @@
+# -*- coding: utf-8 -*-
+
+"""
+xccdf.cli includes the function main, entry point of the xccdf
+command, with the subcommands:
+
+- convert: converts documents to JSON, CSV or trimmed XML.
+- stats: counts the items and results of documents.
+- validate: validates documents against the XCCDF schemas.
+
+The inputs can be files or directories, which are searched for XML
+files. The files are processed in a process pool, and each result is
+printed as soon as it is ready. convert keeps a manifest with the
+content hash of each converted file, to skip the unchanged ones in the
+next runs. Every subcommand reports its throughput when it finishes.
+
+This module is part of the xccdf library.
+
+Author: Rodrigo Núñez <rnunezmujica@icloud.com>
+"""
+
+# Python stdlib
+from collections import namedtuple
+from multiprocessing import Pool
+import argparse
+import hashlib
+import json
+import csv
+import io
+import os
+import sys
+import time
+
+# lxml
+from lxml import etree
+
+# XCCDF
+from xccdf.models.element import Element
+from xccdf.models.benchmark import Benchmark
+from xccdf.models.tailoring import Tailoring
+from xccdf.models.test_result import TestResult
+from xccdf.models.group import Group
+from xccdf.models.rule import Rule
+from xccdf.models.title import Title
+from xccdf.results import iter_rule_results
+from xccdf.validation import XSD_PATH
+from xccdf.validation import SCHEMATRON_PATH
+from xccdf.validation import validate_file
+from xccdf.validation import load_schemas
+
+#: Output formats of convert, and the extension of their files
+CONVERT_FORMATS = {
+    'json': '.json',
+    'csv': '.csv',
+    'xml': '.xml',
+}
+
+#: Models of the root elements that can be converted to JSON, by tag name
+CONVERT_MODELS = {
+    'Benchmark': Benchmark,
+    'Tailoring': Tailoring,
+    'TestResult': TestResult,
+}
+
+#: Columns of the CSV files of Benchmarks
+ITEM_COLUMNS = ['id', 'kind', 'parent', 'selected', 'severity', 'title']
+
+#: Columns of the CSV files of result documents
+RESULT_COLUMNS = ['idref', 'result', 'severity', 'weight', 'time']
+
+#: Elements counted by stats
+STATS_TAGS = ['Group', 'Rule', 'Value', 'Profile', 'TestResult',
+              'rule-result']
+
+#: Default name of the manifest of convert, in the output directory
+MANIFEST_NAME = '.xccdf-manifest.json'
+
+#: Outcome of the processing of a file
+FileResult = namedtuple('FileResult', [
+    'path', 'output', 'digest', 'size', 'status', 'message'])
+
+#: Statuses of the processed files
+STATUS_OK = 'ok'
+STATUS_SKIPPED = 'skipped'
+STATUS_ERROR = 'error'
+
+
+def find_input_files(inputs, output_dir=None):
+    """
+    Finds the XML files of the inputs, with the path of their output.
+
+    :param list inputs: Paths of files and directories.
+    :param str output_dir: Directory of the outputs. The files found
+                           in a directory keep their relative path.
+    :returns: List of (input path, output path without extension) tuples,
+              the output path is None if there is no output directory.
+    :rtype: list
+    :raises ValueError: If different inputs have the same output path,
+                        like two files with the same name.
+    """
+
+    files = list()
+    for path in inputs:
+        if os.path.isdir(path):
+            for directory, dir_names, file_names in os.walk(path):
+                dir_names.sort()
+                for file_name in sorted(file_names):
+                    if file_name.lower().endswith('.xml'):
+                        file_path = os.path.join(directory, file_name)
+                        files.append((file_path,
+                                      os.path.relpath(file_path, path)))
+        else:
+            files.append((path, os.path.basename(path)))
+
+    if output_dir is None:
+        return [(file_path, None) for file_path, relative_path in files]
+
+    input_files = list()
+    outputs = dict()
+    for file_path, relative_path in files:
+        output = os.path.join(output_dir, os.path.splitext(relative_path)[0])
+        key = os.path.normcase(os.path.normpath(output))
+        previous = outputs.setdefault(key, file_path)
+        if previous == file_path:
+            if (file_path, output) not in input_files:
+                input_files.append((file_path, output))
+            continue
+        error_msg = '{first} and {second} have the same output {output}'\
+                    .format(first=previous, second=file_path, output=output)
+        raise ValueError(error_msg)
+
+    return input_files
+
+
+def get_digest(content):
+    """
+    Returns the content hash of a file.
+
+    :param bytes content: Content of the file.
+    :returns: SHA-256 hex digest.
+    :rtype: str
+    """
+
+    return hashlib.sha256(content).hexdigest()
+
+
+def load_manifest(path):
+    """
+    Reads the manifest of a previous conversion.
+
+    :param str path: Path of the manifest.
+    :returns: Content hash of each converted file, by output path.
+              Empty if the manifest doesn't exist or can't be read.
+    :rtype: dict
+    """
+
+    try:
+        with io.open(path, 'r', encoding='utf-8') as manifest_file:
+            return json.load(manifest_file)
+    except (IOError, ValueError):
+        return dict()
+
+
+def save_manifest(path, manifest):
+    """
+    Writes the manifest of a conversion.
+
+    :param str path: Path of the manifest.
+    :param dict manifest: Content hash of each converted file,
+                          by output path.
+    """
+
+    with io.open(path, 'w', encoding='utf-8') as manifest_file:
+        manifest_file.write(json.dumps(manifest, indent=2, sort_keys=True))
+
+
+def get_title(item):
+    """
+    Returns the text of the first title of an item.
+
+    :param xccdf.models.element.Element item: Group or Rule.
+    :returns: Title text, empty if the item has no title.
+    :rtype: str
+    """
+
+    for child in item.children:
+        if isinstance(child, Title):
+            return getattr(child, 'text', '') or ''
+
+    return ''
+
+
+def write_item_rows(writer, benchmark):
+    """
+    Writes a CSV row for each Group and Rule of a Benchmark.
+
+    :param csv.writer writer: CSV writer.
+    :param xccdf.models.benchmark.Benchmark benchmark: Benchmark.
+    """
+
+    writer.writerow(ITEM_COLUMNS)
+
+    pending = [(child, '') for child in reversed(benchmark.children)]
+    while len(pending) > 0:
+        item, parent = pending.pop()
+        if not isinstance(item, (Group, Rule)):
+            continue
+        writer.writerow([item.id, type(item).__name__, parent,
+                         getattr(item, 'selected', 'true'),
+                         getattr(item, 'severity', ''),
+                         get_title(item)])
+        if isinstance(item, Group):
+            pending.extend((child, item.id)
+                           for child in reversed(item.children))
+
+
+def convert_document(content, output_format):
+    """
+    Converts a document.
+
+    :param bytes content: Content of the document.
+    :param str output_format: json, csv or xml.
+    :returns: Content of the converted document.
+    :rtype: bytes
+    :raises ValueError: If the document can't be converted to the format.
+    """
+
+    if output_format == 'xml':
+        # Trimmed: without comments, processing instructions and
+        # the whitespace between the elements
+        parser = etree.XMLParser(remove_blank_text=True, remove_comments=True,
+                                 remove_pis=True)
+        return etree.tostring(etree.fromstring(content, parser),
+                              xml_declaration=True, encoding='UTF-8')
+
+    xml_element = etree.fromstring(content)
+    tag = Element.get_namespace_and_tag(xml_element.tag)[1]
+
+    if output_format == 'json':
+        if tag not in CONVERT_MODELS:
+            raise ValueError('{tag} can not be converted to json'.format(
+                tag=tag))
+        element_dict = CONVERT_MODELS[tag](xml_element).as_dict()
+        return json.dumps(element_dict, indent=2).encode('utf-8')
+
+    output = io.StringIO()
+    writer = csv.writer(output, lineterminator='\n')
+
+    records = list(iter_rule_results(io.BytesIO(content)))
+    if len(records) > 0 or tag == 'TestResult':
+        writer.writerow(RESULT_COLUMNS)
+        for record in records:
+            writer.writerow([record.idref, record.result, record.severity,
+                             record.weight, record.time or ''])
+    elif tag == 'Benchmark':
+        write_item_rows(writer, Benchmark(xml_element))
+    else:
+        raise ValueError('{tag} can not be converted to csv'.format(tag=tag))
+
+    return output.getvalue().encode('utf-8')
+
+
+def convert_file(task):
+    """
+    Converts a file, unless its content hash matches the one of its
+    last conversion and the output still exists. Run by the workers.
+
+    :param tuple task: Input path, output path, format and content hash
+                       of the last conversion (or None).
+    :returns: Outcome of the conversion.
+    :rtype: xccdf.cli.FileResult
+    """
+
+    path, output, output_format, last_digest = task
+
+    try:
+        with io.open(path, 'rb') as input_file:
+            content = input_file.read()
+    except IOError as error:
+        return FileResult(path, output, None, 0, STATUS_ERROR, str(error))
+
+    digest = get_digest(content)
+    if digest == last_digest and os.path.exists(output):
+        return FileResult(path, output, digest, len(content),
+                          STATUS_SKIPPED, None)
+
+    try:
+        converted = convert_document(content, output_format)
+    except Exception as error:
+        return FileResult(path, output, digest, len(content), STATUS_ERROR,
+                          str(error))
+
+    output_dir = os.path.dirname(output)
+    if output_dir and not os.path.isdir(output_dir):
+        try:
+            os.makedirs(output_dir)
+        except OSError:
+            # Created by another worker
+            pass
+    with io.open(output, 'wb') as output_file:
+        output_file.write(converted)
+
+    return FileResult(path, output, digest, len(content), STATUS_OK, None)
+
+
+def get_file_stats(path):
+    """
+    Counts the items and results of a file, reading it as a stream.
+    Run by the workers.
+
+    :param str path: Path of the file.
+    :returns: Outcome of the count, its message is the JSON
+              of the counts.
+    :rtype: xccdf.cli.FileResult
+    """
+
+    counts = dict((tag, 0) for tag in STATS_TAGS)
+    root = None
+
+    try:
+        size = os.path.getsize(path)
+        for event, element in etree.iterparse(path, events=('start', 'end')):
+            if event == 'start':
+                if root is None:
+                    root = Element.get_namespace_and_tag(element.tag)[1]
+                continue
+            tag = Element.get_namespace_and_tag(element.tag)[1]
+            if tag in counts:
+                counts[tag] += 1
+            element.clear()
+    except (IOError, etree.XMLSyntaxError) as error:
+        return FileResult(path, None, None, 0, STATUS_ERROR, str(error))
+
+    stats = dict(counts)
+    stats['root'] = root
+    return FileResult(path, None, None, size, STATUS_OK,
+                      json.dumps(stats, sort_keys=True))
+
+
+def check_file(task):
+    """
+    Validates a file against the schemas. Run by the workers.
+
+    :param tuple task: Path of the file, of the XML Schema and
+                       of the Schematron (or None).
+    :returns: Outcome of the validation, its message lists the errors.
+    :rtype: xccdf.cli.FileResult
+    """
+
+    path, xsd_path, schematron_path = task
+    path, errors = validate_file(path, xsd_path, schematron_path)
+
+    try:
+        size = os.path.getsize(path)
+    except OSError:
+        size = 0
+
+    if len(errors) == 0:
+        return FileResult(path, None, None, size, STATUS_OK, None)
+
+    message = '\n'.join('  line {line}: {error}'.format(
+        line=error.sourceline, error=str(error)) for error in errors)
+    return FileResult(path, None, None, size, STATUS_ERROR, message)
+
+
+def format_throughput(files, size, seconds):
+    """
+    Describes the throughput of a run.
+
+    :param int files: Number of processed files.
+    :param int size: Bytes of the processed files.
+    :param float seconds: Duration of the run.
+    :returns: Throughput in files/s and MB/s.
+    :rtype: str
+    """
+
+    seconds = max(seconds, 1e-6)
+    megabytes = size / 1000000.0
+
+    return '{files} files, {size:.2f} MB in {seconds:.2f} s '\
+           '({files_rate:.1f} files/s, {size_rate:.2f} MB/s)'.format(
+               files=files, size=megabytes, seconds=seconds,
+               files_rate=files / seconds, size_rate=megabytes / seconds)
+
+
+def run_pool(function, tasks, processes=None):
+    """
+    Runs the tasks in a process pool, yielding each outcome as soon
+    as it is ready.
+
+    :param function: Worker function.
+    :param list tasks: Arguments of each call.
+    :param int processes: Number of processes, by default the CPU count.
+    :returns: Iterator of the outcomes, in completion order.
+    :rtype: generator
+    """
+
+    pool = Pool(processes)
+    try:
+        for outcome in pool.imap_unordered(function, tasks):
+            yield outcome
+    finally:
+        pool.close()
+        pool.join()
+
+
+def report(outcomes, stream, describe):
+    """
+    Prints the outcome of each file as it is ready, and the throughput.
+
+    :param outcomes: Iterator of FileResult tuples.
+    :param file stream: Output stream.
+    :param describe: Function returning the line of an outcome.
+    :returns: Outcomes, and if there were errors.
+    :rtype: tuple
+    """
+
+    start = time.time()
+    results = list()
+    errors = False
+    size = 0
+
+    for outcome in outcomes:
+        results.append(outcome)
+        errors = errors or outcome.status == STATUS_ERROR
+        if outcome.status != STATUS_SKIPPED:
+            size += outcome.size
+        stream.write(describe(outcome) + '\n')
+        stream.flush()
+
+    skipped = len([outcome for outcome in results
+                   if outcome.status == STATUS_SKIPPED])
+    summary = format_throughput(len(results) - skipped, size,
+                                time.time() - start)
+    if skipped > 0:
+        summary += ', {skipped} unchanged'.format(skipped=skipped)
+    sys.stderr.write(summary + '\n')
+
+    return results, errors
+
+
+def describe_outcome(outcome):
+    """
+    Describes the outcome of a file.
+
+    :param xccdf.cli.FileResult outcome: Outcome.
+    :returns: Line of the outcome.
+    :rtype: str
+    """
+
+    if outcome.status == STATUS_ERROR:
+        return 'error {path}: {message}'.format(path=outcome.path,
+                                                message=outcome.message)
+    if outcome.output is not None:
+        return '{status} {path} -> {output}'.format(
+            status=outcome.status, path=outcome.path, output=outcome.output)
+    if outcome.message is not None:
+        return '{path}\t{message}'.format(path=outcome.path,
+                                          message=outcome.message)
+
+    return '{status} {path}'.format(status=outcome.status, path=outcome.path)
+
+
+def command_convert(arguments, stream):
+    """
+    Runs the convert subcommand.
+
+    :param argparse.Namespace arguments: Parsed arguments.
+    :param file stream: Output stream.
+    :returns: Exit status, 2 if different inputs have the same output.
+    :rtype: int
+    """
+
+    manifest_path = arguments.manifest or os.path.join(arguments.output_dir,
+                                                       MANIFEST_NAME)
+    manifest = dict() if arguments.force else load_manifest(manifest_path)
+    extension = CONVERT_FORMATS[arguments.format]
+
+    try:
+        input_files = find_input_files(arguments.inputs,
+                                       arguments.output_dir)
+    except ValueError as error:
+        sys.stderr.write('error: {error}\n'.format(error=error))
+        return 2
+
+    tasks = list()
+    for path, output in input_files:
+        output += extension
+        tasks.append((path, output, arguments.format, manifest.get(output)))
+
+    results, errors = report(
+        run_pool(convert_file, tasks, arguments.processes),
+        stream, describe_outcome)
+
+    for outcome in results:
+        if outcome.status == STATUS_ERROR:
+            manifest.pop(outcome.output, None)
+        else:
+            manifest[outcome.output] = outcome.digest
+    if not os.path.isdir(arguments.output_dir):
+        os.makedirs(arguments.output_dir)
+    save_manifest(manifest_path, manifest)
+
+    return 1 if errors else 0
+
+
+def command_stats(arguments, stream):
+    """
+    Runs the stats subcommand.
+
+    :param argparse.Namespace arguments: Parsed arguments.
+    :param file stream: Output stream.
+    :returns: Exit status.
+    :rtype: int
+    """
+
+    paths = [path for path, output in find_input_files(arguments.inputs)]
+    results, errors = report(
+        run_pool(get_file_stats, paths, arguments.processes),
+        stream, describe_outcome)
+
+    return 1 if errors else 0
+
+
+def command_validate(arguments, stream):
+    """
+    Runs the validate subcommand.
+
+    :param argparse.Namespace arguments: Parsed arguments.
+    :param file stream: Output stream.
+    :returns: Exit status, 2 if the schemas can't be loaded.
+    :rtype: int
+    """
+
+    schematron_path = SCHEMATRON_PATH if arguments.schematron else None
+    tasks = [(path, arguments.xsd, schematron_path)
+             for path, output in find_input_files(arguments.inputs)]
+
+    # Compiled once here, the forked workers inherit them
+    try:
+        load_schemas(arguments.xsd, schematron_path)
+    except (IOError, etree.XMLSchemaParseError,
+            etree.SchematronParseError) as error:
+        sys.stderr.write('error loading the schemas: {error}\n'.format(
+            error=error))
+        return 2
+
+    results, errors = report(
+        run_pool(check_file, tasks, arguments.processes),
+        stream, describe_outcome)
+
+    return 1 if errors else 0
+
+
+def get_parser():
+    """
+    Builds the parser of the command line arguments.
+
+    :returns: Parser of the xccdf command.
+    :rtype: argparse.ArgumentParser
+    """
+
+    parser = argparse.ArgumentParser(
+        prog='xccdf', description='Process XCCDF documents in batches.')
+    subparsers = parser.add_subparsers(dest='command')
+    subparsers.required = True
+
+    convert_parser = subparsers.add_parser(
+        'convert', help='convert documents to JSON, CSV or trimmed XML')
+    convert_parser.add_argument('-f', '--format', required=True,
+                                choices=sorted(CONVERT_FORMATS.keys()))
+    convert_parser.add_argument('-o', '--output-dir', required=True,
+                                help='directory of the converted files')
+    convert_parser.add_argument('--manifest',
+                                help='content hash manifest, {name} in the '
+                                     'output directory by default'.format(
+                                         name=MANIFEST_NAME))
+    convert_parser.add_argument('--force', action='store_true',
+                                help='convert the unchanged files too')
+    convert_parser.set_defaults(function=command_convert)
+
+    stats_parser = subparsers.add_parser(
+        'stats', help='count the items and results of documents')
+    stats_parser.set_defaults(function=command_stats)
+
+    validate_parser = subparsers.add_parser(
+        'validate', help='validate documents against the XCCDF schemas')
+    validate_parser.add_argument('--xsd', default=XSD_PATH,
+                                 help='XML Schema, XCCDF 1.2 by default')
+    validate_parser.add_argument('--schematron', action='store_true',
+                                 help='check the Schematron rules too')
+    validate_parser.set_defaults(function=command_validate)
+
+    for subparser in [convert_parser, stats_parser, validate_parser]:
+        subparser.add_argument('-j', '--processes', type=int,
+                               help='worker processes, the CPU count '
+                                    'by default')
+        subparser.add_argument('inputs', nargs='+',
+                               help='XCCDF files or directories')
+
+    return parser
+
+
+def main(argv=None, stream=None):
+    """
+    Entry point of the xccdf command.
+
+    :param list argv: Command line arguments, by default sys.argv.
+    :param file stream: Output stream, by default sys.stdout.
+    :returns: Exit status, 1 if any file failed.
+    :rtype: int
+    """
+
+    arguments = get_parser().parse_args(argv)
+
+    return arguments.function(arguments, stream or sys.stdout)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+
+# Well known values for the system attribute of a check
+CHECK_SYSTEM_OVAL = 'http://oval.mitre.org/XMLSchema/oval-definitions-5'
+CHECK_SYSTEM_OCIL = 'http://scap.nist.gov/schema/ocil/2'
+CHECK_SYSTEM_SCE = 'http://open-scap.org/page/SCE'
+
+# Possible values for the operator attribute of a complex-check
+CHECK_OPERATOR_AND = 'AND'
+CHECK_OPERATOR_OR = 'OR'
+
+CHECK_OPERATOR_CHOICES = [
+    CHECK_OPERATOR_AND,
+    CHECK_OPERATOR_OR,
+]
+
+# Exit codes of the SCE scripts for each result value. The scripts get
+# them in the XCCDF_RESULT_<VALUE> environment variables. Any other
+# exit code is an error.
+SCE_EXIT_CODES = {
+    'pass': 101,
+    'fail': 102,
+    'error': 103,
+    'unknown': 104,
+    'notapplicable': 105,
+    'notchecked': 106,
+    'notselected': 107,
+    'informational': 108,
+    'fixed': 109,
+}
@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+
+# Possible values for the result element of a rule-result
+RESULT_VALUE_PASS = 'pass'
+RESULT_VALUE_FAIL = 'fail'
+RESULT_VALUE_ERROR = 'error'
+RESULT_VALUE_UNKNOWN = 'unknown'
+RESULT_VALUE_NOTAPPLICABLE = 'notapplicable'
+RESULT_VALUE_NOTCHECKED = 'notchecked'
+RESULT_VALUE_NOTSELECTED = 'notselected'
+RESULT_VALUE_INFORMATIONAL = 'informational'
+RESULT_VALUE_FIXED = 'fixed'
+
+RESULT_VALUE_CHOICES = [
+    RESULT_VALUE_PASS,
+    RESULT_VALUE_FAIL,
+    RESULT_VALUE_ERROR,
+    RESULT_VALUE_UNKNOWN,
+    RESULT_VALUE_NOTAPPLICABLE,
+    RESULT_VALUE_NOTCHECKED,
+    RESULT_VALUE_NOTSELECTED,
+    RESULT_VALUE_INFORMATIONAL,
+    RESULT_VALUE_FIXED,
+]
+
+# Numeric codes of the result values, for compact result matrices.
+# The code 0 means that there is no result for the rule.
+RESULT_CODE_NONE = 0
+RESULT_CODES = dict((value, index + 1)
+                    for index, value in enumerate(RESULT_VALUE_CHOICES))
@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+
+# Possible values for the type attribute of a Value
+VALUE_TYPE_NUMBER = 'number'
+VALUE_TYPE_STRING = 'string'
+VALUE_TYPE_BOOLEAN = 'boolean'
+
+VALUE_TYPE_CHOICES = [
+    VALUE_TYPE_NUMBER,
+    VALUE_TYPE_STRING,
+    VALUE_TYPE_BOOLEAN,
+]
+
+# Possible values for the operator attribute of a Value
+VALUE_OPERATOR_EQUALS = 'equals'
+VALUE_OPERATOR_NOT_EQUAL = 'not equal'
+VALUE_OPERATOR_GREATER_THAN = 'greater than'
+VALUE_OPERATOR_LESS_THAN = 'less than'
+VALUE_OPERATOR_GREATER_THAN_OR_EQUAL = 'greater than or equal'
+VALUE_OPERATOR_LESS_THAN_OR_EQUAL = 'less than or equal'
+VALUE_OPERATOR_PATTERN_MATCH = 'pattern match'
+
+VALUE_OPERATOR_CHOICES = [
+    VALUE_OPERATOR_EQUALS,
+    VALUE_OPERATOR_NOT_EQUAL,
+    VALUE_OPERATOR_GREATER_THAN,
+    VALUE_OPERATOR_LESS_THAN,
+    VALUE_OPERATOR_GREATER_THAN_OR_EQUAL,
+    VALUE_OPERATOR_LESS_THAN_OR_EQUAL,
+    VALUE_OPERATOR_PATTERN_MATCH,
+]
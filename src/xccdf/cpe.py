@@ -0,0 +1,347 @@
+# -*- coding: utf-8 -*-
+
+"""
+xccdf.cpe includes the functions to parse and match CPE names and the
+class ApplicabilityEvaluator, to decide which Groups and Rules of a
+Benchmark apply to a host from its inventory of CPE names.
+
+The platform idrefs can be CPE names or references (#id) to the
+platforms of a CPE applicability language <cpe-lang:platform-specification>
+of the Benchmark. The results are memoized by inventory, so hosts with
+the same inventory are evaluated only once.
+
+This module is part of the xccdf library.
+
+Author: Rodrigo Núñez <rnunezmujica@icloud.com>
+"""
+
+# Python stdlib
+from collections import OrderedDict
+from fnmatch import fnmatchcase
+import re
+
+# XCCDF
+from xccdf.models.element import Element
+from xccdf.models.group import Group
+from xccdf.models.platform import Platform
+from xccdf.models.rule import Rule
+from xccdf.constants import NSMAP
+
+#: Value of the CPE name components that match any value
+CPE_ANY = '*'
+
+#: Names of the components of a CPE name, in order
+CPE_COMPONENTS = ['part', 'vendor', 'product', 'version', 'update',
+                  'edition', 'language', 'sw_edition', 'target_sw',
+                  'target_hw', 'other']
+
+#: Regular expression of the separators of a CPE 2.3 formatted string
+CPE_23_SEPARATOR = re.compile(r'(?<!\\):')
+
+#: Operators of the logical tests
+CPE_OPERATOR_AND = 'AND'
+CPE_OPERATOR_OR = 'OR'
+
+
+def parse_cpe_name(name):
+    """
+    Splits a CPE 2.2 URI (cpe:/...) or a CPE 2.3 formatted string
+    (cpe:2.3:...) in its components. Missing and empty components
+    of a URI match any value.
+
+    :param str name: CPE name.
+    :returns: Lowercase components, CPE_ANY for the missing ones.
+    :rtype: tuple
+    :raises ValueError: If the name is not a CPE name.
+    """
+
+    lower_name = name.strip().lower()
+
+    if lower_name.startswith('cpe:2.3:'):
+        components = CPE_23_SEPARATOR.split(lower_name[len('cpe:2.3:'):])
+    elif lower_name.startswith('cpe:/'):
+        components = [component if component != '' else CPE_ANY
+                      for component in lower_name[len('cpe:/'):].split(':')]
+    else:
+        raise ValueError('{name} is not a CPE name'.format(name=name))
+
+    if len(components) > len(CPE_COMPONENTS):
+        raise ValueError('{name} has too many components'.format(name=name))
+
+    components.extend([CPE_ANY] * (len(CPE_COMPONENTS) - len(components)))
+
+    return tuple(components)
+
+
+def match_cpe_name(pattern, name):
+    """
+    Checks if a CPE name matches a CPE name pattern, like the
+    name of a fact-ref. Each component of the pattern must be
+    CPE_ANY, equal to the one of the name or, with the * and ?
+    wildcards of CPE 2.3, match it.
+
+    :param tuple pattern: Components of the pattern.
+    :param tuple name: Components of the name.
+    :returns: If the name matches the pattern.
+    :rtype: bool
+    """
+
+    for pattern_component, name_component in zip(pattern, name):
+        if pattern_component == CPE_ANY:
+            continue
+        if pattern_component == name_component:
+            continue
+        if (('*' in pattern_component or '?' in pattern_component)
+                and fnmatchcase(name_component, pattern_component)):
+            continue
+        return False
+
+    return True
+
+
+class ApplicabilityEvaluator(object):
+
+    """
+    Evaluator of the platforms of the Groups and Rules of a Benchmark.
+    """
+
+    def __init__(self, benchmark, specifications=None):
+        """
+        Compiles the platform specifications and indexes the platforms
+        of the Benchmark, its Groups and its Rules.
+
+        :param xccdf.models.benchmark.Benchmark benchmark: Benchmark.
+        :param list specifications: Extra <cpe-lang:platform-specification>
+                                    XML elements, from other files.
+                                    The ones of the Benchmark XML element
+                                    are always loaded.
+        """
+
+        self.benchmark = benchmark
+        self.platforms = dict()
+        self.item_platforms = OrderedDict()
+        self.item_parents = dict()
+
+        self.inventories = dict()
+        self.results = dict()
+        self.applicability = dict()
+
+        if hasattr(benchmark, 'xml_element'):
+            tag = '{{{uri}}}platform-specification'.format(uri=NSMAP['cpel'])
+            for element in benchmark.xml_element.iter(tag):
+                self.load_specification(element)
+        for element in specifications or list():
+            self.load_specification(element)
+
+        self.load_items(benchmark, None)
+
+    def __str__(self):
+        """
+        String representation of ApplicabilityEvaluator object.
+
+        :returns: ApplicabilityEvaluator object as a string.
+        :rtype: str
+        """
+
+        string_value = 'applicability evaluator ({platforms} platforms, '\
+                       '{inventories} inventories)'.format(
+                           platforms=len(self.platforms),
+                           inventories=len(self.applicability))
+        return string_value
+
+    def load_specification(self, xml_element):
+        """
+        Compiles the platforms of a platform specification.
+
+        :param lxml.etree._Element xml_element: XML element of the
+                                                platform specification.
+        """
+
+        for element in xml_element:
+            uri, tag = Element.get_namespace_and_tag(element.tag)
+            if tag != 'platform':
+                continue
+            for child in element:
+                uri, tag = Element.get_namespace_and_tag(child.tag)
+                if tag == 'logical-test':
+                    self.platforms[element.get('id')] = self.compile_test(
+                        child)
+
+    def compile_test(self, xml_element):
+        """
+        Compiles a <cpe-lang:logical-test> element.
+
+        :param lxml.etree._Element xml_element: XML element of the test.
+        :returns: Operator, negate flag and operands. The operands are
+                  CPE name components of the fact-refs or compiled tests.
+        :rtype: tuple
+        """
+
+        operands = list()
+
+        for element in xml_element:
+            uri, tag = Element.get_namespace_and_tag(element.tag)
+            if tag == 'fact-ref':
+                operands.append(parse_cpe_name(element.get('name')))
+            elif tag == 'logical-test':
+                operands.append(self.compile_test(element))
+
+        operator = xml_element.get('operator', CPE_OPERATOR_AND).upper()
+        negate = xml_element.get('negate', 'false') in ['true', '1']
+
+        return operator, negate, operands
+
+    def load_items(self, parent, parent_id):
+        """
+        Indexes the platforms of an item and its Groups and Rules.
+
+        :param xccdf.models.element.Element parent: Benchmark or Group.
+        :param str parent_id: Id of the parent of the item.
+        """
+
+        self.item_platforms[parent.id] = [
+            child.idref for child in parent.children
+            if isinstance(child, Platform)]
+        self.item_parents[parent.id] = parent_id
+
+        for child in parent.children:
+            if isinstance(child, Group):
+                self.load_items(child, parent.id)
+            elif isinstance(child, Rule):
+                self.item_platforms[child.id] = [
+                    platform.idref for platform in child.children
+                    if isinstance(platform, Platform)]
+                self.item_parents[child.id] = parent.id
+
+    def get_inventory_key(self, inventory):
+        """
+        Returns the memoization key of an inventory.
+
+        :param iterable inventory: CPE names of the host.
+        :returns: Parsed CPE names of the inventory.
+        :rtype: frozenset
+        """
+
+        key = inventory if isinstance(inventory, frozenset) \
+            else frozenset(inventory)
+        if key not in self.inventories:
+            self.inventories[key] = frozenset(
+                parse_cpe_name(name) for name in key)
+
+        return self.inventories[key]
+
+    def evaluate_test(self, test, inventory_names):
+        """
+        Evaluates a compiled logical test.
+
+        :param tuple test: Compiled logical test.
+        :param frozenset inventory_names: Parsed CPE names of the host.
+        :returns: Result of the test.
+        :rtype: bool
+        """
+
+        operator, negate, operands = test
+        results = (self.evaluate_operand(operand, inventory_names)
+                   for operand in operands)
+
+        if operator == CPE_OPERATOR_OR:
+            result = any(results)
+        else:
+            result = all(results)
+
+        return result != negate
+
+    def evaluate_operand(self, operand, inventory_names):
+        """
+        Evaluates an operand of a logical test.
+
+        :param tuple operand: CPE name components or a compiled test.
+        :param frozenset inventory_names: Parsed CPE names of the host.
+        :returns: Result of the operand.
+        :rtype: bool
+        """
+
+        if len(operand) == 3 and isinstance(operand[2], list):
+            return self.evaluate_test(operand, inventory_names)
+
+        return any(match_cpe_name(operand, name) for name in inventory_names)
+
+    def is_platform_applicable(self, idref, inventory):
+        """
+        Checks if a platform applies to a host. Unknown platform
+        references don't apply.
+
+        :param str idref: CPE name or #id of a platform.
+        :param iterable inventory: CPE names of the host.
+        :returns: If the platform applies.
+        :rtype: bool
+        """
+
+        return self.evaluate_platform(idref,
+                                      self.get_inventory_key(inventory))
+
+    def evaluate_platform(self, idref, inventory_names):
+        """
+        Evaluates a platform for a parsed inventory, memoized.
+
+        :param str idref: CPE name or #id of a platform.
+        :param frozenset inventory_names: Parsed CPE names of the host.
+        :returns: If the platform applies.
+        :rtype: bool
+        """
+
+        key = (idref, inventory_names)
+
+        if key not in self.results:
+            if idref.startswith('#'):
+                test = self.platforms.get(idref[1:])
+                result = (test is not None
+                          and self.evaluate_test(test, inventory_names))
+            else:
+                result = self.evaluate_operand(parse_cpe_name(idref),
+                                               inventory_names)
+            self.results[key] = result
+
+        return self.results[key]
+
+    def get_applicability(self, inventory):
+        """
+        Decides which items apply to a host. An item applies if it has
+        no platforms or any of them applies, and its parent applies.
+
+        :param iterable inventory: CPE names of the host.
+        :returns: If each item applies, by id, parents first.
+                  The Benchmark is included.
+        :rtype: collections.OrderedDict
+        """
+
+        inventory_names = self.get_inventory_key(inventory)
+
+        if inventory_names not in self.applicability:
+            applicability = OrderedDict()
+            # Parents are indexed before their children
+            for item_id, idrefs in self.item_platforms.items():
+                parent_id = self.item_parents[item_id]
+                if parent_id is not None and not applicability[parent_id]:
+                    applicability[item_id] = False
+                else:
+                    applicability[item_id] = (
+                        len(idrefs) == 0
+                        or any(self.evaluate_platform(idref, inventory_names)
+                               for idref in idrefs))
+            self.applicability[inventory_names] = applicability
+
+        return self.applicability[inventory_names]
+
+    def is_applicable(self, item_id, inventory):
+        """
+        Checks if an item applies to a host.
+
+        :param str item_id: Id of the Benchmark, a Group or a Rule.
+        :param iterable inventory: CPE names of the host.
+        :returns: If the item applies.
+        :rtype: bool
+        :raises KeyError: If the item doesn't exist.
+        """
+
+        return self.get_applicability(inventory)[item_id]
@@ -0,0 +1,299 @@
+# -*- coding: utf-8 -*-
+
+"""
+xccdf.dependencies includes the class DependencyGraph, to validate
+the <xccdf:requires> and <xccdf:conflicts> dependencies between the
+Groups and Rules selected by a Profile, find the requirement cycles
+and select the missing required items.
+
+An item is effectively selected if it and all its parent Groups are
+selected. Every operation visits each item and each dependency a
+bounded number of times, so it runs in linear time.
+
+This module is part of the xccdf library.
+
+Author: Rodrigo Núñez <rnunezmujica@icloud.com>
+"""
+
+# Python stdlib
+from collections import namedtuple
+from collections import deque
+from collections import OrderedDict
+
+# XCCDF
+from xccdf.models.group import Group
+from xccdf.models.rule import Rule
+from xccdf.models.requires import Requires
+from xccdf.models.conflicts import Conflicts
+
+#: Kinds of dependency problems
+PROBLEM_MISSING = 'missing'
+PROBLEM_CONFLICT = 'conflict'
+PROBLEM_UNKNOWN = 'unknown'
+PROBLEM_CYCLE = 'cycle'
+
+#: Dependency problem of an item. The idrefs are the alternatives of a
+#: missing requirement, the conflicting item, the unknown references
+#: or the items of a requirement cycle.
+DependencyProblem = namedtuple('DependencyProblem',
+                               ['kind', 'item_id', 'idrefs'])
+
+#: Selection of an item by the propagation of the requirements,
+#: required by another item through one of its requirements
+SelectionStep = namedtuple('SelectionStep',
+                           ['item_id', 'required_by', 'requirement'])
+
+
+class DependencyGraph(object):
+
+    """
+    Graph of the requires and conflicts dependencies of a Benchmark.
+    """
+
+    def __init__(self, benchmark):
+        """
+        Indexes the items of the benchmark and their dependencies.
+
+        :param xccdf.models.benchmark.Benchmark benchmark: Benchmark.
+        """
+
+        self.benchmark = benchmark
+        self.items = benchmark.get_item_index()
+        self.parents = dict()
+        self.children = dict()
+        self.requires = OrderedDict()
+        self.conflicts = OrderedDict()
+
+        for item_id, item in self.items.items():
+            self.children[item_id] = list()
+            self.requires[item_id] = list()
+            self.conflicts[item_id] = list()
+            for child in item.children:
+                if isinstance(child, (Group, Rule)):
+                    self.parents[child.id] = item_id
+                    self.children[item_id].append(child.id)
+                elif isinstance(child, Requires):
+                    self.requires[item_id].append(child.get_idrefs())
+                elif isinstance(child, Conflicts):
+                    self.conflicts[item_id].append(child.idref)
+
+        self.cycles = None
+
+    def __str__(self):
+        """
+        String representation of DependencyGraph object.
+
+        :returns: DependencyGraph object as a string.
+        :rtype: str
+        """
+
+        string_value = 'dependency graph ({items} items, '\
+                       '{requires} requires, {conflicts} conflicts)'.format(
+                           items=len(self.items),
+                           requires=sum(len(requirements) for requirements
+                                        in self.requires.values()),
+                           conflicts=sum(len(conflicts) for conflicts
+                                         in self.conflicts.values()))
+        return string_value
+
+    def find_cycles(self):
+        """
+        Finds the cycles of the requirements, as the strongly connected
+        components of the graph (Tarjan's algorithm, without recursion).
+
+        :returns: Lists of item ids of each cycle.
+        :rtype: list
+        """
+
+        if self.cycles is not None:
+            return self.cycles
+
+        edges = dict((item_id, [idref for requirement in requirements
+                                for idref in requirement
+                                if idref in self.items])
+                     for item_id, requirements in self.requires.items())
+
+        indexes = dict()
+        lowlinks = dict()
+        stack = list()
+        on_stack = set()
+        cycles = list()
+
+        for root in self.items.keys():
+            if root in indexes:
+                continue
+            work = [(root, 0)]
+            while len(work) > 0:
+                item_id, edge_index = work.pop()
+                if edge_index == 0:
+                    indexes[item_id] = lowlinks[item_id] = len(indexes)
+                    stack.append(item_id)
+                    on_stack.add(item_id)
+                else:
+                    # Back from the item of the previous edge
+                    target = edges[item_id][edge_index - 1]
+                    lowlinks[item_id] = min(lowlinks[item_id],
+                                            lowlinks[target])
+
+                while edge_index < len(edges[item_id]):
+                    target = edges[item_id][edge_index]
+                    edge_index += 1
+                    if target not in indexes:
+                        work.append((item_id, edge_index))
+                        work.append((target, 0))
+                        break
+                    elif target in on_stack:
+                        lowlinks[item_id] = min(lowlinks[item_id],
+                                                indexes[target])
+                else:
+                    if lowlinks[item_id] == indexes[item_id]:
+                        component = list()
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            component.append(member)
+                            if member == item_id:
+                                break
+                        if len(component) > 1 or item_id in edges[item_id]:
+                            cycles.append(list(reversed(component)))
+
+        self.cycles = cycles
+
+        return cycles
+
+    def get_effective_selections(self, selections):
+        """
+        Applies the selection of the Groups to their items.
+
+        :param dict selections: If each item is selected, by id.
+        :returns: If each item is effectively selected, by id.
+        :rtype: dict
+        """
+
+        effective = dict()
+        # Parents come before their children
+        for item_id in self.items.keys():
+            parent_id = self.parents.get(item_id)
+            effective[item_id] = (selections.get(item_id, False)
+                                  and (parent_id is None
+                                       or effective[parent_id]))
+
+        return effective
+
+    def validate(self, profile_id=None, selections=None):
+        """
+        Finds the dependency problems of the selection of a profile:
+        requirements of selected items without any selected alternative,
+        selected items in conflict, unknown references and
+        requirement cycles.
+
+        :param str profile_id: Id of the Profile, None for the defaults.
+        :param dict selections: If each item is selected, by id.
+                                By default, the ones of the profile.
+        :returns: List of DependencyProblem tuples.
+        :rtype: list
+        :raises ValueError: If the profile doesn't exist.
+        """
+
+        if selections is None:
+            selections = self.benchmark.get_selections(profile_id)
+        effective = self.get_effective_selections(selections)
+        problems = list()
+
+        for item_id in self.items.keys():
+            for requirement in self.requires[item_id]:
+                unknown = [idref for idref in requirement
+                           if idref not in self.items]
+                if len(unknown) > 0:
+                    problems.append(DependencyProblem(PROBLEM_UNKNOWN,
+                                                      item_id, unknown))
+                if effective[item_id] and not any(
+                        effective.get(idref, False) for idref in requirement):
+                    problems.append(DependencyProblem(PROBLEM_MISSING,
+                                                      item_id, requirement))
+            for idref in self.conflicts[item_id]:
+                if idref not in self.items:
+                    problems.append(DependencyProblem(PROBLEM_UNKNOWN,
+                                                      item_id, [idref]))
+                elif effective[item_id] and effective[idref]:
+                    problems.append(DependencyProblem(PROBLEM_CONFLICT,
+                                                      item_id, [idref]))
+
+        for cycle in self.find_cycles():
+            problems.append(DependencyProblem(PROBLEM_CYCLE, cycle[0], cycle))
+
+        return problems
+
+    def propagate(self, profile_id=None, selections=None):
+        """
+        Selects the items required by the selected items, and the
+        Groups that contain them, until every known requirement is met.
+        The first known alternative of a requirement is selected.
+
+        :param str profile_id: Id of the Profile, None for the defaults.
+        :param dict selections: If each item is selected, by id.
+                                By default, the ones of the profile.
+        :returns: New selections and the list of SelectionStep tuples
+                  explaining each new selection, in order.
+        :rtype: tuple
+        :raises ValueError: If the profile doesn't exist.
+        """
+
+        if selections is None:
+            selections = self.benchmark.get_selections(profile_id)
+        selections = dict(selections)
+        effective = self.get_effective_selections(selections)
+        trace = list()
+
+        pending = deque(item_id for item_id in self.items.keys()
+                        if effective[item_id])
+
+        while len(pending) > 0:
+            item_id = pending.popleft()
+            for requirement in self.requires[item_id]:
+                known = [idref for idref in requirement
+                         if idref in self.items]
+                if len(known) == 0 or any(effective[idref]
+                                          for idref in known):
+                    continue
+
+                # Select the item and its parents
+                path = list()
+                target = known[0]
+                while target is not None and not effective[target]:
+                    path.append(target)
+                    target = self.parents.get(target)
+                for target in reversed(path):
+                    if not selections.get(target, False):
+                        selections[target] = True
+                        trace.append(SelectionStep(target, item_id,
+                                                   requirement))
+
+                # Mark the newly effective items, from the top one
+                newly = [path[-1]]
+                while len(newly) > 0:
+                    target = newly.pop()
+                    effective[target] = True
+                    pending.append(target)
+                    newly.extend(child_id
+                                 for child_id in self.children[target]
+                                 if selections.get(child_id, False)
+                                 and not effective[child_id])
+
+        return selections, trace
+
+    @staticmethod
+    def explain(trace):
+        """
+        Describes the steps of a propagation.
+
+        :param list trace: List of SelectionStep tuples.
+        :returns: Description of each step.
+        :rtype: list
+        """
+
+        return ['{item} selected: required by {required_by} '
+                '({requirement})'.format(
+                    item=step.item_id, required_by=step.required_by,
+                    requirement=' or '.join(step.requirement))
+                for step in trace]
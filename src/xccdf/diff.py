@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+
+"""
+xccdf.diff includes the function diff_results, to compare the rule results
+of two result documents of the same host with a streaming merge join.
+
+The rule results of each document are sorted by idref with an external
+sort, in chunks of bounded size spilled to temporary files, so the memory
+used doesn't depend on the number of rule results.
+
+This module is part of the xccdf library.
+
+Author: Rodrigo Núñez <rnunezmujica@icloud.com>
+"""
+
+# Python stdlib
+from collections import namedtuple
+import heapq
+import pickle
+import tempfile
+
+# XCCDF
+from xccdf.results import iter_rule_results
+from xccdf.constants.result import RESULT_VALUE_PASS
+from xccdf.constants.result import RESULT_VALUE_FIXED
+from xccdf.constants.result import RESULT_VALUE_FAIL
+from xccdf.constants.result import RESULT_VALUE_ERROR
+from xccdf.constants.result import RESULT_VALUE_UNKNOWN
+
+#: Change between the results of a rule in two documents
+RuleResultChange = namedtuple('RuleResultChange', [
+    'kind', 'idref', 'old', 'new'])
+
+#: Kinds of change
+CHANGE_REGRESSION = 'regression'
+CHANGE_FIX = 'fix'
+CHANGE_NEW = 'new'
+CHANGE_REMOVED = 'removed'
+CHANGE_OTHER = 'changed'
+
+#: Results of a passing and of a failing rule
+PASSING_RESULTS = (RESULT_VALUE_PASS, RESULT_VALUE_FIXED)
+FAILING_RESULTS = (RESULT_VALUE_FAIL, RESULT_VALUE_ERROR,
+                   RESULT_VALUE_UNKNOWN)
+
+#: Number of rule results sorted in memory at once
+DEFAULT_CHUNK_SIZE = 100000
+
+
+def write_run(pairs):
+    """
+    Writes a sorted run of (idref, result) pairs in a temporary file.
+
+    :param list pairs: Sorted (idref, result) pairs.
+    :returns: Temporary file, positioned at its start.
+    :rtype: file
+    """
+
+    run_file = tempfile.TemporaryFile()
+    for pair in pairs:
+        pickle.dump(pair, run_file, pickle.HIGHEST_PROTOCOL)
+    run_file.seek(0)
+
+    return run_file
+
+
+def read_run(run_file):
+    """
+    Reads the (idref, result) pairs of a run written with write_run.
+    The file is closed, and so removed, once read.
+
+    :param file run_file: Temporary file of the run.
+    :returns: Iterator of the sorted pairs.
+    :rtype: generator of tuple
+    """
+
+    try:
+        while True:
+            try:
+                yield pickle.load(run_file)
+            except EOFError:
+                return
+    finally:
+        run_file.close()
+
+
+def iter_sorted_results(source, presorted=False,
+                        chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Reads the rule results of a document sorted by idref. If a rule has
+    more than one result, only the last one in the document is kept.
+
+    :param source: Path or file object of the result document.
+    :param bool presorted: If True, the document is known to be sorted
+                           by idref and is not sorted again.
+    :param int chunk_size: Number of rule results sorted in memory at once.
+    :returns: Iterator of the (idref, result) pairs, sorted by idref.
+    :rtype: generator of tuple
+    :raises ValueError: If presorted is True and the document isn't sorted.
+    """
+
+    pairs = ((record.idref, record.result)
+             for record in iter_rule_results(source))
+
+    if not presorted:
+        # Sorted runs, keeping the document order of repeated idrefs
+        runs = list()
+        chunk = list()
+        position = 0
+        for idref, result in pairs:
+            chunk.append((idref, position, result))
+            position += 1
+            if len(chunk) >= chunk_size:
+                chunk.sort()
+                runs.append(read_run(write_run(chunk)))
+                chunk = list()
+        chunk.sort()
+
+        if len(runs) == 0:
+            merged = iter(chunk)
+        else:
+            runs.append(iter(chunk))
+            merged = heapq.merge(*runs)
+        pairs = ((idref, result) for idref, position, result in merged)
+
+    previous = None
+    for pair in pairs:
+        if previous is not None:
+            if pair[0] < previous[0]:
+                error_msg = '{idref} found after {previous}, the rule '\
+                            'results are not sorted'.format(
+                                idref=pair[0], previous=previous[0])
+                raise ValueError(error_msg)
+            if pair[0] != previous[0]:
+                yield previous
+        previous = pair
+    if previous is not None:
+        yield previous
+
+
+def get_change(idref, old, new):
+    """
+    Classifies the change between two results of a rule.
+
+    :param str idref: Id of the rule.
+    :param str old: Previous result, None if the rule was not present.
+    :param str new: New result, None if the rule is not present.
+    :returns: Change of the rule, or None if the result is the same.
+    :rtype: xccdf.diff.RuleResultChange or NoneType
+    """
+
+    if old == new:
+        return None
+    elif old is None:
+        kind = CHANGE_NEW
+    elif new is None:
+        kind = CHANGE_REMOVED
+    elif new in FAILING_RESULTS and old not in FAILING_RESULTS:
+        kind = CHANGE_REGRESSION
+    elif old in FAILING_RESULTS and new in PASSING_RESULTS:
+        kind = CHANGE_FIX
+    else:
+        kind = CHANGE_OTHER
+
+    return RuleResultChange(kind, idref, old, new)
+
+
+def diff_results(old_source, new_source, presorted=False,
+                 chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Compares the rule results of two result documents with a merge join
+    of both documents sorted by idref.
+
+    :param old_source: Path or file object of the previous document.
+    :param new_source: Path or file object of the new document.
+    :param bool presorted: If True, both documents are known to be sorted
+                           by idref and are not sorted again.
+    :param int chunk_size: Number of rule results sorted in memory at once.
+    :returns: Iterator of the changed rules, sorted by idref.
+    :rtype: generator of RuleResultChange
+    :raises ValueError: If presorted is True and a document isn't sorted.
+    """
+
+    old_pairs = iter_sorted_results(old_source, presorted, chunk_size)
+    new_pairs = iter_sorted_results(new_source, presorted, chunk_size)
+
+    old = next(old_pairs, None)
+    new = next(new_pairs, None)
+
+    while old is not None or new is not None:
+        if new is None or (old is not None and old[0] < new[0]):
+            change = get_change(old[0], old[1], None)
+            old = next(old_pairs, None)
+        elif old is None or new[0] < old[0]:
+            change = get_change(new[0], None, new[1])
+            new = next(new_pairs, None)
+        else:
+            change = get_change(old[0], old[1], new[1])
+            old = next(old_pairs, None)
+            new = next(new_pairs, None)
+
+        if change is not None:
+            yield change
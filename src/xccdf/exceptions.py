@@ -1,20 +1,31 @@
 # -*- coding: utf-8 -*-
 
 
-class InvalidValueException(Exception):
+class ValidationException(Exception):
 
     """
-    This exception is raised when an Element has an invalid value
+    Base class of the exceptions raised when an Element does not comply
+    with the XCCDF rules.
+
+    When a document is loaded with ``strict=False`` these exceptions are
+    collected instead of raised, and the path and sourceline attributes
+    locate the offending element.
 
     :param str value: Exception message
     """
 
     #: Default message value
-    value = 'The value of the element is not valid'
+    value = 'The element is not valid'
+
+    #: Path of the offending element, if known
+    path = None
+
+    #: Line of the offending element in the source document, if known
+    sourceline = None
 
     def __init__(self, value=None):
 
-        super(InvalidValueException, self).__init__()
+        super(ValidationException, self).__init__()
 
         if value is not None:
             self.value = value
@@ -30,36 +41,31 @@ class InvalidValueException(Exception):
         return self.value
 
 
-class RequiredAttributeException(Exception):
+class InvalidValueException(ValidationException):
 
     """
-    This exception is raised when an Element has a missing attribute
+    This exception is raised when an Element has an invalid value
 
     :param str value: Exception message
     """
 
     #: Default message value
-    value = 'The required attribute is missing'
-
-    def __init__(self, value=None):
+    value = 'The value of the element is not valid'
 
-        super(RequiredAttributeException, self).__init__()
 
-        if value is not None:
-            self.value = value
+class RequiredAttributeException(ValidationException):
 
-    def __str__(self):
-        """
-        String representation of the exception
+    """
+    This exception is raised when an Element has a missing attribute
 
-        :returns: Exception message as string
-        :rtype: str
-        """
+    :param str value: Exception message
+    """
 
-        return self.value
+    #: Default message value
+    value = 'The required attribute is missing'
 
 
-class CardinalityException(Exception):
+class CardinalityException(ValidationException):
 
     """
     This exception is raised when a children doesn't comply
@@ -72,9 +78,34 @@ class CardinalityException(Exception):
     value = 'This element is invalid based on '\
             'the cardinality rules of the parent'
 
+
+class ReferenceException(ValidationException):
+
+    """
+    This exception is raised when a reference to another element
+    doesn't match any element of the document
+
+    :param str value: Exception message
+    """
+
+    #: Default message value
+    value = 'The referenced element does not exist'
+
+
+class FrozenElementException(AttributeError):
+
+    """
+    This exception is raised when a frozen element is modified
+
+    :param str value: Exception message
+    """
+
+    #: Default message value
+    value = 'A frozen element can not be modified'
+
     def __init__(self, value=None):
 
-        super(CardinalityException, self).__init__()
+        super(FrozenElementException, self).__init__()
 
         if value is not None:
             self.value = value
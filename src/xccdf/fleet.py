@@ -0,0 +1,295 @@
+# -*- coding: utf-8 -*-
+
+"""
+xccdf.fleet includes the class ResultMatrix and the function build_matrix,
+to gather the results of many hosts in a compact hosts x rules matrix
+of result codes (see xccdf.constants.result.RESULT_CODES).
+
+The columns follow the rule order of xccdf.scoring.ScoringTree, so the
+codes of a ResultMatrix can be scored directly. This module requires NumPy.
+
+This module is part of the xccdf library.
+
+Author: Rodrigo Núñez <rnunezmujica@icloud.com>
+"""
+
+# Python stdlib
+from multiprocessing import Pool
+import json
+
+# NumPy
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+# XCCDF
+from xccdf.results import iter_rule_results
+from xccdf.constants.result import RESULT_CODES
+from xccdf.constants.result import RESULT_CODE_NONE
+from xccdf.exceptions import InvalidValueException
+
+#: Suffix of the metadata file of a saved ResultMatrix
+METADATA_SUFFIX = '.json'
+
+#: Rule column index of the worker processes of build_matrix
+WORKER_RULE_INDEX = dict()
+
+
+class ResultMatrix(object):
+
+    """
+    Hosts x rules matrix of result codes.
+    """
+
+    def __init__(self, hosts, rule_ids, codes=None):
+        """
+        Initializes the matrix.
+
+        :param list hosts: Names of the hosts, one per row.
+        :param list rule_ids: Rule ids, one per column.
+        :param numpy.ndarray codes: uint8 matrix of result codes.
+                                    By default, a matrix without results.
+        :raises ImportError: If NumPy is not installed.
+        :raises ValueError: If the shape of codes doesn't match.
+        """
+
+        if numpy is None:
+            raise ImportError('NumPy is required to build a ResultMatrix')
+
+        self.hosts = list(hosts)
+        self.rule_ids = list(rule_ids)
+
+        if codes is None:
+            codes = numpy.zeros((len(self.hosts), len(self.rule_ids)),
+                                dtype=numpy.uint8)
+        elif codes.shape != (len(self.hosts), len(self.rule_ids)):
+            raise ValueError('the result codes must have one row per host '
+                             'and one column per rule')
+
+        self.codes = codes
+        self.host_index = dict((host, index)
+                               for index, host in enumerate(self.hosts))
+        self.rule_index = dict((rule_id, index)
+                               for index, rule_id in enumerate(self.rule_ids))
+
+    def __str__(self):
+        """
+        String representation of ResultMatrix object.
+
+        :returns: ResultMatrix object as a string.
+        :rtype: str
+        """
+
+        string_value = 'result matrix ({hosts} hosts, {rules} rules)'.format(
+            hosts=len(self.hosts), rules=len(self.rule_ids))
+        return string_value
+
+    def get_host(self, host):
+        """
+        Returns the result codes of a host.
+
+        :param str host: Name of the host.
+        :returns: Result codes of the host, one per rule.
+        :rtype: numpy.ndarray
+        """
+
+        return self.codes[self.host_index[host]]
+
+    def get_rule(self, rule_id):
+        """
+        Returns the result codes of a rule.
+
+        :param str rule_id: Id of the rule.
+        :returns: Result codes of the rule, one per host.
+        :rtype: numpy.ndarray
+        """
+
+        return self.codes[:, self.rule_index[rule_id]]
+
+    def count_by_rule(self, result):
+        """
+        Counts the hosts with the given result of each rule.
+
+        :param str result: Result string, or None for the missing results.
+        :returns: Number of hosts, one per rule.
+        :rtype: numpy.ndarray
+        """
+
+        code = RESULT_CODE_NONE if result is None else RESULT_CODES[result]
+
+        return numpy.count_nonzero(self.codes == code, axis=0)
+
+    def count_by_host(self, result):
+        """
+        Counts the rules with the given result of each host.
+
+        :param str result: Result string, or None for the missing results.
+        :returns: Number of rules, one per host.
+        :rtype: numpy.ndarray
+        """
+
+        code = RESULT_CODE_NONE if result is None else RESULT_CODES[result]
+
+        return numpy.count_nonzero(self.codes == code, axis=1)
+
+    def get_rule_summary(self):
+        """
+        Counts the hosts of every result code of each rule.
+
+        :returns: rules x codes matrix, where the column of a result
+                  is its code in RESULT_CODES.
+        :rtype: numpy.ndarray
+        """
+
+        summary = numpy.zeros((len(self.rule_ids), len(RESULT_CODES) + 1),
+                              dtype=numpy.int64)
+        for code in range(summary.shape[1]):
+            summary[:, code] = numpy.count_nonzero(self.codes == code, axis=0)
+
+        return summary
+
+    def save(self, path):
+        """
+        Saves the matrix in a .npy file, that can be memory-mapped,
+        and the hosts and rule ids in a JSON file next to it.
+
+        :param str path: Path of the .npy file.
+        """
+
+        # numpy.save would append .npy to a path without it
+        with open(path, 'wb') as codes_file:
+            numpy.save(codes_file, self.codes)
+        self.save_metadata(path)
+
+    def save_metadata(self, path):
+        """
+        Saves the hosts and rule ids in the JSON file of a .npy file.
+
+        :param str path: Path of the .npy file.
+        """
+
+        with open(path + METADATA_SUFFIX, 'w') as metadata_file:
+            json.dump({'hosts': self.hosts, 'rule_ids': self.rule_ids},
+                      metadata_file)
+
+    @classmethod
+    def load(cls, path, mmap_mode='r'):
+        """
+        Loads a matrix saved with save.
+
+        :param str path: Path of the .npy file.
+        :param str mmap_mode: numpy.load memory-map mode, None
+                              to read the whole matrix in memory.
+        :returns: Loaded matrix.
+        :rtype: xccdf.fleet.ResultMatrix
+        """
+
+        with open(path + METADATA_SUFFIX) as metadata_file:
+            metadata = json.load(metadata_file)
+
+        codes = numpy.load(path, mmap_mode=mmap_mode)
+
+        return cls(metadata['hosts'], metadata['rule_ids'], codes)
+
+
+def set_worker_rule_index(rule_ids):
+    """
+    Builds the rule column index of this process.
+
+    :param list rule_ids: Rule ids, one per column.
+    """
+
+    WORKER_RULE_INDEX.clear()
+    WORKER_RULE_INDEX.update((rule_id, index)
+                             for index, rule_id in enumerate(rule_ids))
+
+
+def read_result_codes(path):
+    """
+    Reads the result codes of a result document, with the rule column
+    index of this process. Results of unknown rules are ignored and
+    if a rule has more than one result, the last one is kept.
+
+    :param str path: Path of the result document.
+    :returns: Result codes, one byte per rule.
+    :rtype: bytearray
+    :raises InvalidValueException: If a rule result is missing
+                                   or is not a valid result.
+    """
+
+    codes = bytearray(len(WORKER_RULE_INDEX))
+
+    for record in iter_rule_results(path):
+        index = WORKER_RULE_INDEX.get(record.idref)
+        if index is None:
+            continue
+        code = RESULT_CODES.get(record.result)
+        if code is None:
+            error_msg = '{path}: {result} is not a valid result of '\
+                        'rule {idref}'.format(path=path, result=record.result,
+                                              idref=record.idref)
+            raise InvalidValueException(error_msg)
+        codes[index] = code
+
+    return codes
+
+
+def build_matrix(tree, paths, hosts=None, processes=None, filename=None):
+    """
+    Builds the result matrix of many result documents, one per host,
+    streaming the documents in a process pool.
+
+    :param xccdf.scoring.ScoringTree tree: Scoring tree of the Benchmark.
+    :param list paths: Paths of the result documents.
+    :param list hosts: Names of the hosts, by default the paths.
+    :param int processes: Number of processes, by default the CPU count.
+                          With 1, the documents are read in this process.
+    :param str filename: If given, the matrix is written in a new
+                         memory-mapped .npy file instead of in memory.
+    :returns: Result matrix.
+    :rtype: xccdf.fleet.ResultMatrix
+    :raises ImportError: If NumPy is not installed.
+    :raises InvalidValueException: If a rule result of a document is
+                                   missing or is not a valid result.
+    :raises ValueError: If there isn't one host per result document.
+    """
+
+    if numpy is None:
+        raise ImportError('NumPy is required to build a ResultMatrix')
+
+    paths = list(paths)
+    hosts = paths if hosts is None else list(hosts)
+    if len(hosts) != len(paths):
+        raise ValueError('{hosts} hosts for {paths} result documents'.format(
+            hosts=len(hosts), paths=len(paths)))
+    shape = (len(paths), len(tree.rule_ids))
+
+    if filename is None:
+        codes = numpy.zeros(shape, dtype=numpy.uint8)
+    else:
+        codes = numpy.lib.format.open_memmap(filename, mode='w+',
+                                             dtype=numpy.uint8, shape=shape)
+
+    if processes == 1:
+        set_worker_rule_index(tree.rule_ids)
+        for row, path in enumerate(paths):
+            codes[row] = numpy.frombuffer(read_result_codes(path),
+                                          dtype=numpy.uint8)
+    else:
+        pool = Pool(processes, initializer=set_worker_rule_index,
+                    initargs=(tree.rule_ids,))
+        try:
+            rows = pool.imap(read_result_codes, paths, chunksize=16)
+            for row, row_codes in enumerate(rows):
+                codes[row] = numpy.frombuffer(row_codes, dtype=numpy.uint8)
+        finally:
+            pool.close()
+            pool.join()
+
+    matrix = ResultMatrix(hosts, tree.rule_ids, codes)
+    if filename is not None:
+        codes.flush()
+        matrix.save_metadata(filename)
+
+    return matrix
@@ -0,0 +1,338 @@
+# -*- coding: utf-8 -*-
+
+"""
+xccdf.frozen includes the classes FrozenElement and FrozenBenchmark,
+immutable and hashable copies of the element models, to share a loaded
+document between threads without locks.
+
+A frozen element keeps the attributes of its model, with the lists
+turned into tuples, and its frozen children. It has no XML element,
+so nothing is modified while reading it. thaw() gives back an editable
+copy made of the original models.
+
+This module is part of the xccdf library.
+
+Author: Rodrigo Núñez <rnunezmujica@icloud.com>
+"""
+
+# Python stdlib
+from types import MappingProxyType
+
+# XCCDF
+from xccdf.models.group import Group
+from xccdf.models.rule import Rule
+from xccdf.models.value import Value
+from xccdf.models.profile import Profile
+from xccdf.exceptions import FrozenElementException
+
+#: Model attributes that are not copied to the frozen elements
+UNFROZEN_ATTRIBUTES = ['xml_element', 'children', 'errors', 'trusted']
+
+
+def freeze_value(value):
+    """
+    Converts an attribute value to an immutable one.
+
+    :param value: Attribute value.
+    :returns: The value, with the lists turned into tuples.
+    """
+
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze_value(item) for item in value)
+
+    return value
+
+
+def thaw_value(value):
+    """
+    Converts a frozen attribute value to an editable one.
+
+    :param value: Frozen attribute value.
+    :returns: The value, with the tuples turned into lists.
+    """
+
+    if isinstance(value, tuple):
+        return [thaw_value(item) for item in value]
+
+    return value
+
+
+def freeze(element, frozen_class=None):
+    """
+    Builds the frozen copy of an element and its children.
+
+    :param xccdf.models.element.Element element: Element to freeze.
+    :param type frozen_class: FrozenElement subclass of the copy,
+                              FrozenElement by default.
+    :returns: Frozen element.
+    :rtype: xccdf.frozen.FrozenElement
+    """
+
+    fields = tuple(sorted(
+        (name, freeze_value(value))
+        for name, value in vars(element).items()
+        if name not in UNFROZEN_ATTRIBUTES))
+    children = tuple(freeze(child)
+                     for child in getattr(element, 'children', list()))
+
+    if frozen_class is None:
+        frozen_class = FrozenElement
+
+    return frozen_class(type(element), fields, children)
+
+
+class FrozenElement(object):
+
+    """
+    Immutable and hashable copy of an element model.
+    """
+
+    __slots__ = ('model', 'fields', 'children', 'field_index', 'hash_value')
+
+    def __init__(self, model, fields, children):
+        """
+        Initializes the frozen element. Use freeze() to build it.
+
+        :param type model: Element subclass of the original element.
+        :param tuple fields: Sorted (name, value) pairs of its attributes.
+        :param tuple children: Frozen children.
+        """
+
+        object.__setattr__(self, 'model', model)
+        object.__setattr__(self, 'fields', fields)
+        object.__setattr__(self, 'children', children)
+        object.__setattr__(self, 'field_index', dict(fields))
+        object.__setattr__(self, 'hash_value',
+                           hash((model, fields, children)))
+
+    def __str__(self):
+        """
+        String representation of FrozenElement object.
+
+        :returns: FrozenElement object as a string.
+        :rtype: str
+        """
+
+        string_value = 'frozen {model}'.format(model=self.model.__name__)
+        if 'id' in self.field_index:
+            string_value += ' {id}'.format(id=self.field_index['id'])
+        return string_value
+
+    def __getattr__(self, name):
+        """
+        Returns an attribute of the original element.
+
+        :param str name: Name of the attribute.
+        :returns: Frozen value of the attribute.
+        :raises AttributeError: If the element has no such attribute.
+        """
+
+        # Slots not set yet, like while copying
+        if name in FrozenElement.__slots__:
+            raise AttributeError(name)
+
+        try:
+            return self.field_index[name]
+        except KeyError:
+            raise AttributeError(name)
+
+    def __setattr__(self, name, value):
+        """
+        Frozen elements can't be modified.
+
+        :raises FrozenElementException: Always.
+        """
+
+        raise FrozenElementException(
+            'can not set {name}, the element is frozen'.format(name=name))
+
+    def __delattr__(self, name):
+        """
+        Frozen elements can't be modified.
+
+        :raises FrozenElementException: Always.
+        """
+
+        raise FrozenElementException(
+            'can not delete {name}, the element is frozen'.format(name=name))
+
+    def __eq__(self, other):
+        """
+        Frozen elements are equal if their models, attributes
+        and children are equal.
+
+        :param other: Object to compare.
+        :returns: If both elements are equal.
+        :rtype: bool
+        """
+
+        if not isinstance(other, FrozenElement):
+            return NotImplemented
+        return (self.hash_value == other.hash_value
+                and self.model == other.model
+                and self.fields == other.fields
+                and self.children == other.children)
+
+    def __ne__(self, other):
+        """
+        Opposite of __eq__.
+
+        :param other: Object to compare.
+        :returns: If both elements are different.
+        :rtype: bool
+        """
+
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    def __hash__(self):
+        """
+        Hash of the model, attributes and children.
+
+        :returns: Hash value.
+        :rtype: int
+        """
+
+        return self.hash_value
+
+    def __reduce__(self):
+        """
+        Pickles the frozen element from its constructor arguments.
+
+        :returns: Class and constructor arguments.
+        :rtype: tuple
+        """
+
+        return type(self), (self.model, self.fields, self.children)
+
+    def __copy__(self):
+        """
+        Frozen elements are immutable, so they are their own copy.
+
+        :returns: This element.
+        :rtype: xccdf.frozen.FrozenElement
+        """
+
+        return self
+
+    def __deepcopy__(self, memo):
+        """
+        Frozen elements are immutable, so they are their own copy.
+
+        :param dict memo: Objects already copied.
+        :returns: This element.
+        :rtype: xccdf.frozen.FrozenElement
+        """
+
+        return self
+
+    def get_children(self, model):
+        """
+        Returns the frozen children of a model.
+
+        :param type model: Element subclass of the children.
+        :returns: Tuple of frozen elements.
+        :rtype: tuple
+        """
+
+        return tuple(child for child in self.children
+                     if issubclass(child.model, model))
+
+    def thaw(self):
+        """
+        Builds an editable copy of the original element.
+
+        :returns: Element model without XML element. It is
+                  created by update_xml_element when needed.
+        :rtype: xccdf.models.element.Element
+        """
+
+        element = self.model.__new__(self.model)
+        for name, value in self.fields:
+            setattr(element, name, thaw_value(value))
+        element.errors = None
+        element.trusted = False
+        if len(self.children) > 0 or hasattr(self.model, 'load_children'):
+            element.children = [child.thaw() for child in self.children]
+
+        return element
+
+
+class FrozenBenchmark(FrozenElement):
+
+    """
+    Immutable and hashable copy of a Benchmark, with precomputed
+    indexes of its items, Values and Profiles. The indexes are
+    read-only mappings.
+    """
+
+    __slots__ = ('items', 'values', 'profiles', 'rules')
+
+    def __init__(self, model, fields, children):
+        """
+        Initializes the frozen Benchmark and its indexes.
+        Use freeze() or Benchmark.freeze() to build it.
+
+        :param type model: Benchmark class.
+        :param tuple fields: Sorted (name, value) pairs of its attributes.
+        :param tuple children: Frozen children.
+        """
+
+        super(FrozenBenchmark, self).__init__(model, fields, children)
+
+        items = dict()
+        values = dict()
+        rules = list()
+
+        pending = list(reversed(children))
+        while len(pending) > 0:
+            child = pending.pop()
+            if issubclass(child.model, (Group, Rule)):
+                items[child.id] = child
+            if issubclass(child.model, Rule):
+                rules.append(child)
+            elif issubclass(child.model, Value):
+                values[child.id] = child
+            elif issubclass(child.model, Group):
+                pending.extend(reversed(child.children))
+
+        profiles = dict((child.id, child)
+                        for child in self.get_children(Profile))
+
+        object.__setattr__(self, 'items', MappingProxyType(items))
+        object.__setattr__(self, 'values', MappingProxyType(values))
+        object.__setattr__(self, 'profiles', MappingProxyType(profiles))
+        object.__setattr__(self, 'rules', tuple(rules))
+
+    def get_item(self, item_id):
+        """
+        Returns a Group or a Rule by id.
+
+        :param str item_id: Id of the item.
+        :returns: Frozen item, None if it doesn't exist.
+        :rtype: xccdf.frozen.FrozenElement or NoneType
+        """
+
+        return self.items.get(item_id)
+
+    def get_value(self, value_id):
+        """
+        Returns a Value by id.
+
+        :param str value_id: Id of the Value.
+        :returns: Frozen Value, None if it doesn't exist.
+        :rtype: xccdf.frozen.FrozenElement or NoneType
+        """
+
+        return self.values.get(value_id)
+
+    def get_profile(self, profile_id):
+        """
+        Returns a Profile by id.
+
+        :param str profile_id: Id of the Profile.
+        :returns: Frozen Profile, None if it doesn't exist.
+        :rtype: xccdf.frozen.FrozenElement or NoneType
+        """
+
+        return self.profiles.get(profile_id)
@@ -0,0 +1,328 @@
+# -*- coding: utf-8 -*-
+
+"""
+xccdf.instrumentation includes the class Instrumentation, to measure
+where the time of loading and serializing the models goes.
+
+While an Instrumentation is enabled, the constructor, import_element,
+load_children, as_dict and update_xml_element of the model classes
+are wrapped, and each call adds to the stats of its model class, tag
+and method: the calls, the cumulative time, the self time (without
+the calls to the methods of other models inside it) and the bytes
+of text and attributes read by import_element or written by
+update_xml_element. The calls of a method to the same method of its
+parent class with super are part of a single call.
+
+The methods are only wrapped while the Instrumentation is enabled,
+so the models cost nothing more when it isn't. The stats can be
+exported as a dict or in the Prometheus text format.
+
+This module is part of the xccdf library.
+
+Author: Rodrigo Núñez <rnunezmujica@icloud.com>
+"""
+
+# Python stdlib
+import functools
+import threading
+import time
+from importlib import import_module
+
+# XCCDF
+from xccdf.models import MODEL_MODULES
+
+#: Methods of the model classes that are instrumented
+INSTRUMENTED_METHODS = (
+    '__init__',
+    'import_element',
+    'load_children',
+    'as_dict',
+    'update_xml_element',
+)
+
+#: Methods whose element bytes are measured, and if they are
+#: measured in the argument or in the returned element
+BYTES_METHODS = {
+    'import_element': 'argument',
+    'update_xml_element': 'result',
+}
+
+#: Prometheus metrics, with their stat and help text
+PROMETHEUS_METRICS = [
+    ('xccdf_model_calls_total', 'calls',
+     'Calls of the model methods.'),
+    ('xccdf_model_seconds_total', 'time',
+     'Cumulative time of the model methods, in seconds.'),
+    ('xccdf_model_self_seconds_total', 'self_time',
+     'Time of the model methods without the calls to other models, '
+     'in seconds.'),
+    ('xccdf_model_bytes_total', 'bytes',
+     'Bytes of text and attributes read or written by the model methods.'),
+]
+
+
+def get_model_classes():
+    """
+    Returns the model classes, with the base classes they inherit
+    the methods from.
+
+    :returns: Model classes.
+    :rtype: list
+    """
+
+    classes = set()
+    for name, module in MODEL_MODULES.items():
+        model = getattr(import_module(module), name)
+        classes.update(cls for cls in model.__mro__ if cls is not object)
+
+    return sorted(classes, key=lambda cls: (cls.__module__, cls.__name__))
+
+
+def get_element_bytes(xml_element):
+    """
+    Measures the text and attributes of an XML element, without
+    its children.
+
+    :param lxml.etree._Element xml_element: XML element.
+    :returns: Size in bytes, encoded as UTF-8.
+    :rtype: int
+    """
+
+    if xml_element is None:
+        return 0
+
+    size = 0
+    if isinstance(xml_element.text, str):
+        size += len(xml_element.text.encode('utf-8'))
+    for value in xml_element.attrib.values():
+        size += len(value.encode('utf-8'))
+
+    return size
+
+
+def escape_label(value):
+    """
+    Escapes a Prometheus label value.
+
+    :param str value: Label value.
+    :returns: Escaped value.
+    :rtype: str
+    """
+
+    return (str(value).replace('\\', '\\\\').replace('"', '\\"')
+            .replace('\n', '\\n'))
+
+
+class Instrumentation(object):
+
+    """
+    Aggregates the calls of the model methods by class, tag and method.
+    """
+
+    def __init__(self):
+        """
+        Initializes the stats, disabled.
+        """
+
+        self.stats = dict()
+        self.patched = list()
+        self.local = threading.local()
+
+    def __str__(self):
+        """
+        String representation of Instrumentation object.
+
+        :returns: Instrumentation object as a string.
+        :rtype: str
+        """
+
+        state = 'enabled' if self.enabled else 'disabled'
+        return 'instrumentation ({state}, {keys} keys)'.format(
+            state=state, keys=len(self.stats))
+
+    def __enter__(self):
+        self.enable()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.disable()
+
+    @property
+    def enabled(self):
+        """
+        If the model methods are instrumented.
+
+        :rtype: bool
+        """
+
+        return len(self.patched) > 0
+
+    def enable(self):
+        """
+        Wraps the methods of the model classes.
+
+        :raises RuntimeError: If an Instrumentation is already enabled.
+        """
+
+        classes = get_model_classes()
+        for cls in classes:
+            for method in INSTRUMENTED_METHODS:
+                function = cls.__dict__.get(method)
+                if getattr(function, 'instrumentation', None) is not None:
+                    raise RuntimeError('an instrumentation is already enabled')
+
+        for cls in classes:
+            for method in INSTRUMENTED_METHODS:
+                function = cls.__dict__.get(method)
+                if function is not None:
+                    setattr(cls, method, self.wrap(method, function))
+                    self.patched.append((cls, method, function))
+
+    def disable(self):
+        """
+        Restores the methods of the model classes. The stats are kept.
+        """
+
+        while len(self.patched) > 0:
+            cls, method, function = self.patched.pop()
+            setattr(cls, method, function)
+
+    def reset(self):
+        """
+        Removes the stats.
+        """
+
+        self.stats = dict()
+
+    def get_stack(self):
+        """
+        Returns the instrumented calls in progress in this thread.
+
+        :returns: Frames, as lists of the call key and the time
+                  of the calls inside it.
+        :rtype: list
+        """
+
+        stack = getattr(self.local, 'stack', None)
+        if stack is None:
+            stack = self.local.stack = list()
+        return stack
+
+    def wrap(self, method, function):
+        """
+        Creates the instrumented version of a method.
+
+        :param str method: Name of the method.
+        :param function function: Method of the model class.
+        :returns: Instrumented method.
+        :rtype: function
+        """
+
+        measure_bytes = BYTES_METHODS.get(method)
+
+        @functools.wraps(function)
+        def wrapper(element, *args, **kwargs):
+            stack = self.get_stack()
+            key = (id(element), method)
+
+            # super calls of a method are part of the outer call
+            if len(stack) > 0 and stack[-1][0] == key:
+                return function(element, *args, **kwargs)
+
+            frame = [key, 0.0]
+            stack.append(frame)
+            start = time.perf_counter()
+            try:
+                result = function(element, *args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                stack.pop()
+                if len(stack) > 0:
+                    stack[-1][1] += elapsed
+
+            size = 0
+            if measure_bytes == 'argument':
+                size = get_element_bytes(args[0] if args else None)
+            elif measure_bytes == 'result':
+                size = get_element_bytes(result)
+
+            self.record(type(element).__name__,
+                        getattr(element, 'name', None), method,
+                        elapsed, elapsed - frame[1], size)
+
+            return result
+
+        wrapper.instrumentation = self
+        return wrapper
+
+    def record(self, model, tag, method, elapsed, self_time, size):
+        """
+        Adds a call to the stats.
+
+        :param str model: Name of the model class.
+        :param str tag: Tag name of the element.
+        :param str method: Name of the method.
+        :param float elapsed: Cumulative time of the call, in seconds.
+        :param float self_time: Time of the call without the calls
+                                to other models, in seconds.
+        :param int size: Bytes read or written.
+        """
+
+        stat = self.stats.get((model, tag, method))
+        if stat is None:
+            stat = self.stats[(model, tag, method)] = [0, 0.0, 0.0, 0]
+
+        stat[0] += 1
+        stat[1] += elapsed
+        stat[2] += self_time
+        stat[3] += size
+
+    def as_dict(self):
+        """
+        Exports the stats.
+
+        :returns: Stats with their calls, time, self_time and bytes,
+                  by model class, tag and method.
+        :rtype: dict
+        """
+
+        stats_dict = dict()
+        for (model, tag, method), stat in sorted(
+                self.stats.items(), key=lambda item: str(item[0])):
+            calls, elapsed, self_time, size = stat
+            stats_dict.setdefault(model, dict()).setdefault(
+                tag, dict())[method] = {
+                    'calls': calls,
+                    'time': elapsed,
+                    'self_time': self_time,
+                    'bytes': size,
+                }
+
+        return stats_dict
+
+    def to_prometheus(self):
+        """
+        Exports the stats in the Prometheus text format.
+
+        :returns: Metrics, labelled by model, tag and method.
+        :rtype: str
+        """
+
+        stats_dict = self.as_dict()
+        lines = list()
+        for metric, stat, help_text in PROMETHEUS_METRICS:
+            lines.append('# HELP {metric} {help}'.format(metric=metric,
+                                                         help=help_text))
+            lines.append('# TYPE {metric} counter'.format(metric=metric))
+            for model, tags in stats_dict.items():
+                for tag, methods in tags.items():
+                    for method, values in methods.items():
+                        lines.append(
+                            '{metric}{{model="{model}",tag="{tag}",'
+                            'method="{method}"}} {value}'.format(
+                                metric=metric, model=escape_label(model),
+                                tag=escape_label(tag or ''),
+                                method=escape_label(method),
+                                value=repr(values[stat])))
+
+        return '\n'.join(lines) + '\n'
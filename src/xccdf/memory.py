@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+
+"""
+xccdf.memory includes the function memory_report, to account the
+memory of a loaded model, like a Benchmark, by model class.
+
+The memory of each model is split in:
+
+- python: the model object, its attribute dict, its lists (like attrs
+  and children) and its other values, like times and numbers.
+- text: the strings of the model, like its text, its HTML content and
+  its attribute values. A string referenced by several models is
+  counted in each of them.
+- lxml: the XML element kept by the model, with its attributes and
+  text, without the elements of its children.
+
+The size of the libxml2 nodes isn't visible from Python, so the lxml
+memory is an estimate from the size of the libxml2 structures on
+64 bit systems. The XML tree is kept as a whole while any of its
+elements is referenced, so the report also estimates the memory of
+the whole tree, with the nodes that aren't kept by any model, like
+the XHTML of the descriptions and the whitespace between elements.
+
+The report walks the models once, counts the nodes of the tree with
+XPath, in libxml2, and adds up the length of their text one node at
+a time, without building the text of the whole document. On large
+Benchmarks, like in a health check, only a sample of the models of
+each class can be measured.
+
+This module is part of the xccdf library.
+
+Author: Rodrigo Núñez <rnunezmujica@icloud.com>
+"""
+
+# Python stdlib
+from itertools import chain
+import sys
+
+#: Estimated size in bytes of a libxml2 node (xmlNode)
+LIBXML2_NODE_SIZE = 120
+
+#: Estimated size in bytes of a libxml2 attribute (xmlAttr), without
+#: the text node of its value
+LIBXML2_ATTR_SIZE = 96
+
+#: Memory categories of the report
+MEMORY_CATEGORIES = ('python', 'text', 'lxml')
+
+
+def get_node_bytes(xml_element):
+    """
+    Estimates the memory of an XML element, with its attributes and
+    text, without its children.
+
+    :param xml_element: XML element.
+    :type xml_element: lxml.etree._Element or
+                       xml.etree.ElementTree.Element
+    :returns: Estimated size in bytes.
+    :rtype: int
+    """
+
+    size = sys.getsizeof(xml_element) + LIBXML2_NODE_SIZE
+
+    attrib = xml_element.attrib
+    if len(attrib) > 0:
+        size += len(attrib) * (LIBXML2_ATTR_SIZE + LIBXML2_NODE_SIZE)
+        for value in attrib.values():
+            size += len(value) + 1
+
+    text = xml_element.text
+    if text is not None:
+        size += LIBXML2_NODE_SIZE + len(text) + 1
+
+    return size
+
+
+def get_document_report(xml_element):
+    """
+    Estimates the memory of the whole XML tree of an lxml element.
+
+    :param lxml.etree._Element xml_element: Element of the tree.
+    :returns: Number of nodes, attributes and text characters of the
+              tree, with the ones of the comments and processing
+              instructions, and its estimated size in bytes.
+    :rtype: dict
+    """
+
+    tree = xml_element.getroottree()
+    nodes = int(tree.xpath('count(//node())'))
+    attributes = int(tree.xpath('count(//@*)'))
+
+    # The comments and processing instructions around the root element
+    # are not part of its iteration
+    root = tree.getroot()
+    text_length = 0
+    for top_node in chain(root.itersiblings(preceding=True), (root,),
+                          root.itersiblings()):
+        for node in top_node.iter():
+            if node.text is not None:
+                text_length += len(node.text)
+            if node.tail is not None and node is not top_node:
+                text_length += len(node.tail)
+
+    return {
+        'nodes': nodes,
+        'attributes': attributes,
+        'text_length': text_length,
+        'bytes': (nodes * LIBXML2_NODE_SIZE
+                  + attributes * (LIBXML2_ATTR_SIZE + LIBXML2_NODE_SIZE)
+                  + text_length + nodes),
+    }
+
+
+def memory_report(element, sample=1):
+    """
+    Accounts the memory of a model and its children by model class.
+
+    :param xccdf.models.element.Element element: Model, like a Benchmark.
+    :param int sample: Measures one of each sample models of a class,
+                       and scales the bytes to the count of the class.
+                       Every model is measured when it is 1. A sample of
+                       10 or more is enough to estimate large Benchmarks,
+                       whose models of a class are alike.
+    :returns: Report with the count of models and their python, text,
+              lxml and total bytes, by model class name in classes,
+              their sums in total, and the estimate of the whole XML
+              tree in document, None if the models don't keep an lxml
+              tree.
+    :rtype: dict
+    :raises ValueError: If sample is lower than 1.
+    """
+
+    if sample < 1:
+        raise ValueError('sample must be at least 1')
+
+    getsizeof = sys.getsizeof
+    classes = dict()
+
+    # The errors list is shared by the models of a non strict load
+    errors = getattr(element, 'errors', None)
+
+    pending = [element]
+    while len(pending) > 0:
+        model = pending.pop()
+        values = model.__dict__
+
+        children = values.get('children')
+        if children is not None:
+            pending.extend(children)
+
+        stat = classes.get(model.__class__)
+        if stat is None:
+            stat = classes[model.__class__] = [0, 0, 0, 0, 0]
+        stat[0] += 1
+        if (stat[0] - 1) % sample != 0:
+            continue
+
+        python = getsizeof(model) + getsizeof(values)
+        text = 0
+        xml_element = values.get('xml_element')
+
+        for value in values.values():
+            value_type = type(value)
+            if value_type is str:
+                text += getsizeof(value)
+            elif value_type is list:
+                if value is errors and model is not element:
+                    continue
+                python += getsizeof(value)
+                if value is not children:
+                    for item in value:
+                        if type(item) is str:
+                            text += getsizeof(item)
+                        else:
+                            python += getsizeof(item)
+            elif value is not None and value is not xml_element:
+                python += getsizeof(value)
+
+        stat[1] += 1
+        stat[2] += python
+        stat[3] += text
+        if xml_element is not None:
+            stat[4] += get_node_bytes(xml_element)
+
+    report = {
+        'classes': dict(),
+        'total': dict((key, 0) for key in ('count', 'total')
+                      + MEMORY_CATEGORIES),
+        'document': None,
+    }
+    for model, (count, measured, python, text, lxml) in sorted(
+            classes.items(), key=lambda item: item[0].__name__):
+        scale = float(count) / measured
+        class_report = {
+            'count': count,
+            'python': int(python * scale),
+            'text': int(text * scale),
+            'lxml': int(lxml * scale),
+        }
+        class_report['total'] = sum(class_report[key]
+                                    for key in MEMORY_CATEGORIES)
+        report['classes'][model.__name__] = class_report
+        for key, value in class_report.items():
+            report['total'][key] += value
+
+    xml_element = getattr(element, 'xml_element', None)
+    if hasattr(xml_element, 'getroottree'):
+        report['document'] = get_document_report(xml_element)
+
+    return report
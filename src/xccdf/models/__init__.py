@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+
+"""
+xccdf.models includes the element models of the XCCDF documents.
+
+The model classes can be imported from this package, like
+``from xccdf.models import Select``. Each model module is imported
+on first use, so only the models that are used are loaded.
+
+This module is part of the xccdf library.
+
+Author: Rodrigo Núñez <rnunezmujica@icloud.com>
+"""
+
+# Python stdlib
+from importlib import import_module
+
+#: Module of each model class, by class name
+MODEL_MODULES = {
+    'Benchmark': 'xccdf.models.benchmark',
+    'Check': 'xccdf.models.check',
+    'CheckContentRef': 'xccdf.models.check_content_ref',
+    'CheckExport': 'xccdf.models.check_export',
+    'ComplexCheck': 'xccdf.models.complex_check',
+    'Conflicts': 'xccdf.models.conflicts',
+    'Description': 'xccdf.models.description',
+    'Element': 'xccdf.models.element',
+    'Fact': 'xccdf.models.target_facts',
+    'FrontMatter': 'xccdf.models.front_matter',
+    'Group': 'xccdf.models.group',
+    'HTMLElement': 'xccdf.models.html_element',
+    'Ident': 'xccdf.models.ident',
+    'Notice': 'xccdf.models.notice',
+    'Platform': 'xccdf.models.platform',
+    'Profile': 'xccdf.models.profile',
+    'RearMatter': 'xccdf.models.rear_matter',
+    'RefineValue': 'xccdf.models.refine_value',
+    'Requires': 'xccdf.models.requires',
+    'Result': 'xccdf.models.rule_result',
+    'Rule': 'xccdf.models.rule',
+    'RuleResult': 'xccdf.models.rule_result',
+    'Score': 'xccdf.models.score',
+    'Select': 'xccdf.models.select',
+    'SelectorValue': 'xccdf.models.value',
+    'SetValue': 'xccdf.models.set_value',
+    'Status': 'xccdf.models.status',
+    'Tailoring': 'xccdf.models.tailoring',
+    'TailoringVersion': 'xccdf.models.version',
+    'TargetFacts': 'xccdf.models.target_facts',
+    'TestResult': 'xccdf.models.test_result',
+    'Title': 'xccdf.models.title',
+    'Value': 'xccdf.models.value',
+    'Version': 'xccdf.models.version',
+}
+
+__all__ = sorted(MODEL_MODULES.keys())
+
+
+def load_attribute(namespace, modules, name):
+    """
+    Imports the module of a lazy attribute, and caches the attribute
+    in the namespace of the package, so it is only imported once.
+
+    :param dict namespace: Globals of the package.
+    :param dict modules: Module of each lazy attribute, by name.
+    :param str name: Name of the attribute.
+    :returns: Value of the attribute.
+    :raises AttributeError: If the attribute isn't lazy.
+    """
+
+    if name not in modules:
+        raise AttributeError('module {module} has no attribute {name}'.format(
+            module=namespace['__name__'], name=name))
+
+    value = getattr(import_module(modules[name]), name)
+    namespace[name] = value
+
+    return value
+
+
+def __getattr__(name):
+    """
+    Imports a model class on first use.
+
+    :param str name: Name of the model class.
+    :returns: Model class.
+    :rtype: type
+    :raises AttributeError: If there is no model with the name.
+    """
+
+    return load_attribute(globals(), MODEL_MODULES, name)
+
+
+def __dir__():
+    """
+    Lists the attributes of the package, with the lazy model classes.
+
+    :returns: Names of the attributes.
+    :rtype: list
+    """
+
+    return sorted(set(globals().keys()) | set(__all__))
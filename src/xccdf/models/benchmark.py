@@ -9,6 +9,9 @@ This module is part of the xccdf library.
 Author: Rodrigo Núñez <rnunezmujica@icloud.com>
 """
 
+# Python stdlib
+from collections import OrderedDict
+
 # lxml
 from lxml import etree
 
@@ -21,8 +24,14 @@ from xccdf.models.description import Description
 from xccdf.models.front_matter import FrontMatter
 from xccdf.models.rear_matter import RearMatter
 from xccdf.models.platform import Platform
+from xccdf.models.value import Value
 from xccdf.models.profile import Profile
+from xccdf.models.select import Select
 from xccdf.models.group import Group
+from xccdf.models.rule import Rule
+from xccdf.models.test_result import TestResult
+from xccdf.frozen import freeze
+from xccdf.frozen import FrozenBenchmark
 from xccdf.constants import NSMAP
 from xccdf.exceptions import RequiredAttributeException
 from xccdf.exceptions import CardinalityException
@@ -34,13 +43,19 @@ class Benchmark(Element):
     Class to parse <xccdf:Benchmark> element.
     """
 
-    def __init__(self, xml_element=None, id=None):
+    def __init__(self, xml_element=None, id=None,
+                 strict=True, errors=None, trusted=False):
         """
         Initializes the attrs attribute to serialize the attributes.
 
         :param lxml.etree._Element xml_element: XML element to load.
         :param str id: Unique ID of the Benchmark.
                        If xml_element is present, this parameter is ignored.
+        :param bool strict: If False, validation errors are collected
+                            instead of raised.
+        :param list errors: List where validation errors are collected.
+        :param bool trusted: If True, the value and cardinality checks
+                             are skipped, for already validated documents.
         :raises ValueError: If no parameter is given.
         :raises RequiredAttributeException: If after importing the xml_element
                                             the id attribute is missing.
@@ -51,12 +66,14 @@ class Benchmark(Element):
 
         self.id = id
         tag_name = 'Benchmark' if xml_element is None else None
-        super(Benchmark, self).__init__(xml_element, tag_name)
+        super(Benchmark, self).__init__(xml_element, tag_name,
+                                        strict, errors, trusted)
 
         if (not hasattr(self, 'id')
                 or self.id == ''
                 or self.id is None):
-            raise RequiredAttributeException('id attribute required')
+            error_msg = 'id attribute required'
+            self.handle_error(RequiredAttributeException(error_msg))
 
         if xml_element is not None:
             self.children = self.load_children()
@@ -74,6 +91,152 @@ class Benchmark(Element):
         string_value = 'Benchmark {id}'.format(id=self.id)
         return string_value
 
+    def iter_items(self):
+        """
+        Iterates the Groups and Rules of the Benchmark, at any depth,
+        in document order.
+
+        :returns: Iterator of the Group and Rule objects.
+        :rtype: generator
+        """
+
+        pending = list(reversed(self.children))
+        while len(pending) > 0:
+            child = pending.pop()
+            if isinstance(child, (Group, Rule)):
+                yield child
+            if isinstance(child, Group):
+                pending.extend(reversed(child.children))
+
+    def get_item_index(self):
+        """
+        Builds the index of the Groups and Rules of the Benchmark by id.
+
+        :returns: Items by id, in document order.
+        :rtype: collections.OrderedDict
+        """
+
+        return OrderedDict((item.id, item) for item in self.iter_items())
+
+    def get_value_index(self):
+        """
+        Builds the index of the Values of the Benchmark and its Groups by id.
+
+        :returns: Values by id, in document order.
+        :rtype: collections.OrderedDict
+        """
+
+        values = OrderedDict()
+        pending = list(reversed(self.children))
+        while len(pending) > 0:
+            child = pending.pop()
+            if isinstance(child, Value):
+                values[child.id] = child
+            elif isinstance(child, Group):
+                pending.extend(reversed(child.children))
+
+        return values
+
+    def get_profiles(self):
+        """
+        Returns the Profiles of the Benchmark.
+
+        :returns: List of Profile objects.
+        :rtype: list
+        """
+
+        return [child for child in self.children if isinstance(child, Profile)]
+
+    def get_selections(self, profile_id=None):
+        """
+        Builds the selection state of the Groups and Rules for a Profile,
+        from their selected attribute and the selects of the Profile and
+        the Profiles it extends. A select idref can be an item id or
+        a cluster id.
+
+        :param str profile_id: Id of the Profile, None for the defaults.
+        :returns: If each Group and Rule is selected, by id.
+        :rtype: dict
+        :raises ValueError: If the profile doesn't exist or
+                            its extends chain has a loop.
+        """
+
+        items = self.get_item_index()
+        selections = dict((item_id, getattr(item, 'selected', 'true')
+                           in ['true', '1'])
+                          for item_id, item in items.items())
+
+        clusters = dict()
+        for item in items.values():
+            if hasattr(item, 'cluster_id'):
+                clusters.setdefault(item.cluster_id, list()).append(item.id)
+
+        profiles = dict((profile.id, profile)
+                        for profile in self.get_profiles())
+        chain = list()
+        while profile_id is not None:
+            if profile_id not in profiles:
+                raise ValueError('profile {id} not found'.format(
+                    id=profile_id))
+            if profile_id in chain:
+                raise ValueError('profile {id} extends itself'.format(
+                    id=profile_id))
+            chain.append(profile_id)
+            profile_id = getattr(profiles[profile_id], 'extends', None)
+
+        for profile_id in reversed(chain):
+            for child in profiles[profile_id].children:
+                if not isinstance(child, Select):
+                    continue
+                if child.idref in items:
+                    selections[child.idref] = child.is_selected()
+                for item_id in clusters.get(child.idref, list()):
+                    selections[item_id] = child.is_selected()
+
+        return selections
+
+    def get_selected_rules(self, profile_id=None):
+        """
+        Returns the Rules selected by a Profile. The Rules of an
+        unselected Group are not selected.
+
+        :param str profile_id: Id of the Profile, None for the defaults.
+        :returns: List of Rule objects, in document order.
+        :rtype: list
+        :raises ValueError: If the profile doesn't exist or
+                            its extends chain has a loop.
+        """
+
+        selections = self.get_selections(profile_id)
+        rules = list()
+
+        pending = list(reversed(self.children))
+        while len(pending) > 0:
+            child = pending.pop()
+            if not isinstance(child, (Group, Rule)):
+                continue
+            if not selections[child.id]:
+                continue
+            if isinstance(child, Rule):
+                rules.append(child)
+            else:
+                pending.extend(reversed(child.children))
+
+        return rules
+
+    def freeze(self):
+        """
+        Builds an immutable and hashable copy of the Benchmark, with
+        indexes of its items, Values and Profiles, that can be read
+        by many threads without locks.
+
+        :returns: Frozen Benchmark. Its thaw method gives back
+                  an editable copy.
+        :rtype: xccdf.frozen.FrozenBenchmark
+        """
+
+        return freeze(self, FrozenBenchmark)
+
     def load_children(self):
         """
         Load the subelements from the xml_element in its correspondent classes.
@@ -95,47 +258,57 @@ class Benchmark(Element):
         platforms = list()
         version = None
         profiles = list()
+        values = list()
         groups = list()
         rules = list()
+        test_results = list()
 
         # Element load
         for element in self.xml_element:
             uri, tag = Element.get_namespace_and_tag(element.tag)
             if tag == 'version':
                 if version is None:
-                    version = Version(element)
-                else:
+                    version = self.load_child(Version, element)
+                elif not self.trusted:
                     error_msg = 'version element found more than once'
-                    raise CardinalityException(error_msg)
+                    self.handle_error(CardinalityException(error_msg),
+                                      element)
             elif tag == 'status':
-                statuses.append(Status(element))
+                statuses.append(self.load_child(Status, element))
             elif tag == 'title':
-                titles.append(Title(element))
+                titles.append(self.load_child(Title, element))
             elif tag == 'description':
-                descriptions.append(Description(element))
+                descriptions.append(self.load_child(Description, element))
             elif tag == 'front-matter':
-                front_matters.append(FrontMatter(element))
+                front_matters.append(self.load_child(FrontMatter, element))
             elif tag == 'rear-matter':
-                rear_matters.append(RearMatter(element))
+                rear_matters.append(self.load_child(RearMatter, element))
             elif tag == 'platform':
-                platforms.append(Platform(element))
+                platforms.append(self.load_child(Platform, element))
             elif tag == 'Profile':
-                profiles.append(Profile(element))
+                profiles.append(self.load_child(Profile, element))
+            elif tag == 'Value':
+                values.append(self.load_child(Value, element))
             elif tag == 'Group':
-                groups.append(Group(element))
-            # elif tag == 'Rule':
-            #     rules.append(Rule(element))
+                groups.append(self.load_child(Group, element))
+            elif tag == 'Rule':
+                rules.append(self.load_child(Rule, element))
+            elif tag == 'TestResult':
+                test_results.append(self.load_child(TestResult, element))
 
         # Element validation
-        if version is None:
-            error_msg = 'a Benchmark must contain a Version element'
-            raise CardinalityException(error_msg)
-        elif len(groups) <= 0 and len(rules) <= 0:
-            error_msg = 'a Benchmark must contain at least a Group or a Rule'
-            raise CardinalityException(error_msg)
-        elif len(statuses) <= 0:
-            error_msg = 'a Benchmark must contain at least a Status element'
-            raise CardinalityException(error_msg)
+        if not self.trusted:
+            if version is None:
+                error_msg = 'a Benchmark must contain a Version element'
+                self.handle_error(CardinalityException(error_msg))
+            if len(groups) <= 0 and len(rules) <= 0:
+                error_msg = 'a Benchmark must contain '\
+                            'at least a Group or a Rule'
+                self.handle_error(CardinalityException(error_msg))
+            if len(statuses) <= 0:
+                error_msg = 'a Benchmark must contain '\
+                            'at least a Status element'
+                self.handle_error(CardinalityException(error_msg))
 
         # List construction
         children.extend(statuses)
@@ -147,8 +320,10 @@ class Benchmark(Element):
         if version is not None:
             children.append(version)
         children.extend(profiles)
+        children.extend(values)
         children.extend(groups)
         children.extend(rules)
+        children.extend(test_results)
 
         return children
 
@@ -202,7 +377,10 @@ class Benchmark(Element):
         platforms = list()
         version = None
         profiles = list()
+        values = list()
         groups = list()
+        rules = list()
+        test_results = list()
 
         for child in self.children:
             if isinstance(child, Version):
@@ -221,8 +399,14 @@ class Benchmark(Element):
                 platforms.append(child.as_dict())
             elif isinstance(child, Profile):
                 profiles.append(child.as_dict())
+            elif isinstance(child, Value):
+                values.append(child.as_dict())
             elif isinstance(child, Group):
                 groups.append(child.as_dict())
+            elif isinstance(child, Rule):
+                rules.append(child.as_dict())
+            elif isinstance(child, TestResult):
+                test_results.append(child.as_dict())
 
         if version is not None:
             result_dict['version'] = version
@@ -240,7 +424,13 @@ class Benchmark(Element):
             result_dict['platforms'] = platforms
         if len(profiles) > 0:
             result_dict['profiles'] = profiles
+        if len(values) > 0:
+            result_dict['values'] = values
         if len(groups) > 0:
             result_dict['groups'] = groups
+        if len(rules) > 0:
+            result_dict['rules'] = rules
+        if len(test_results) > 0:
+            result_dict['test_results'] = test_results
 
         return result_dict
@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+
+"""
+xccdf.models.check includes the class Check
+to create or import a <xccdf:check> element.
+
+This module is part of the xccdf library.
+
+Author: Rodrigo Núñez <rnunezmujica@icloud.com>
+"""
+
+# lxml
+from lxml import etree
+
+# XCCDF
+from xccdf.models.element import Element
+from xccdf.models.check_content_ref import CheckContentRef
+from xccdf.models.check_export import CheckExport
+from xccdf.exceptions import RequiredAttributeException
+from xccdf.constants import NSMAP
+
+
+class Check(Element):
+
+    """
+    Class to implement <xccdf:check> element.
+    """
+
+    def __init__(self, xml_element=None, system=None,
+                 strict=True, errors=None, trusted=False):
+        """
+        Initializes the attrs attribute to serialize the attributes.
+
+        :param lxml.etree._Element xml_element: XML element to load.
+        :param str system: URI of the checking system.
+        :param bool strict: If False, validation errors are collected
+                            instead of raised.
+        :param list errors: List where validation errors are collected.
+        :param bool trusted: If True, the value and cardinality checks
+                             are skipped, for already validated documents.
+        :raises ValueError: If no parameter is given.
+        :raises RequiredAttributeException: If after importing the xml_element
+                                            the system attribute is missing.
+        """
+
+        if xml_element is None and system is None:
+            raise ValueError('either xml_element or system are required')
+
+        tag_name = 'check' if xml_element is None else None
+        self.system = system
+
+        super(Check, self).__init__(xml_element, tag_name,
+                                    strict, errors, trusted)
+
+        if (not hasattr(self, 'system')
+                or self.system == ''
+                or self.system is None):
+            error_msg = 'system attribute required'
+            self.handle_error(RequiredAttributeException(error_msg))
+
+        if xml_element is not None:
+            self.children = self.load_children()
+        else:
+            self.children = list()
+
+    def __str__(self):
+        """
+        String representation of Check object.
+
+        :returns: Check object as a string.
+        :rtype: str
+        """
+
+        string_value = 'check {system}'.format(system=self.system)
+        return string_value
+
+    def load_children(self):
+        """
+        Load the subelements from the xml_element in its correspondent classes.
+
+        The check-import and check-content elements are not loaded.
+
+        :returns: List of child objects.
+        :rtype: list
+        """
+
+        children = list()
+
+        for element in self.xml_element:
+            uri, tag = Element.get_namespace_and_tag(element.tag)
+            if tag == 'check-export':
+                children.append(self.load_child(CheckExport, element))
+            elif tag == 'check-content-ref':
+                children.append(self.load_child(CheckContentRef, element))
+
+        return children
+
+    def get_exports(self):
+        """
+        Returns the Values exported to the checking system.
+
+        :returns: List of CheckExport objects.
+        :rtype: list
+        """
+
+        return [child for child in self.children
+                if isinstance(child, CheckExport)]
+
+    def get_content_refs(self):
+        """
+        Returns the check content references of the check.
+
+        :returns: List of CheckContentRef objects.
+        :rtype: list
+        """
+
+        return [child for child in self.children
+                if isinstance(child, CheckContentRef)]
+
+    def as_dict(self):
+        """
+        Serializes the object necessary data in a dictionary.
+
+        :returns: Serialized data in a dictionary.
+        :rtype: dict
+        """
+
+        result_dict = super(Check, self).as_dict()
+
+        exports = [child.as_dict() for child in self.get_exports()]
+        if len(exports) > 0:
+            result_dict['exports'] = exports
+
+        content_refs = [child.as_dict() for child in self.get_content_refs()]
+        if len(content_refs) > 0:
+            result_dict['content_refs'] = content_refs
+
+        return result_dict
+
+    def update_xml_element(self):
+        """
+        Updates the xml element contents to matches the instance contents.
+
+        :returns: Updated XML element.
+        :rtype: lxml.etree._Element
+        """
+
+        if not hasattr(self, 'xml_element'):
+            self.xml_element = etree.Element(self.name, nsmap=NSMAP)
+
+        self.xml_element.clear()
+
+        if hasattr(self, 'id'):
+            self.xml_element.set('id', self.id)
+        if hasattr(self, 'selector'):
+            self.xml_element.set('selector', self.selector)
+        if hasattr(self, 'negate'):
+            self.xml_element.set('negate', self.negate)
+        if hasattr(self, 'multi_check'):
+            self.xml_element.set('multi-check', self.multi_check)
+        self.xml_element.set('system', self.system)
+
+        # The check-export elements go before the check-content-ref ones
+        for child in self.get_exports() + self.get_content_refs():
+            child.update_xml_element()
+            self.xml_element.append(child.xml_element)
+
+        return self.xml_element
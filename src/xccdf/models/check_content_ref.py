@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+
+"""
+xccdf.models.check_content_ref includes the class CheckContentRef
+to create or import a <xccdf:check-content-ref> element.
+
+This module is part of the xccdf library.
+
+Author: Rodrigo Núñez <rnunezmujica@icloud.com>
+"""
+
+# lxml
+from lxml import etree
+
+# XCCDF
+from xccdf.models.element import Element
+from xccdf.exceptions import RequiredAttributeException
+from xccdf.constants import NSMAP
+
+
+class CheckContentRef(Element):
+
+    """
+    Class to implement <xccdf:check-content-ref> element.
+    """
+
+    def __init__(self, xml_element=None, href=None, name=None,
+                 strict=True, errors=None, trusted=False):
+        """
+        Initializes the attrs attribute to serialize the attributes.
+
+        :param lxml.etree._Element xml_element: XML element to load.
+        :param str href: Location of the check content file.
+        :param str name: Name of the check inside the file.
+        :param bool strict: If False, validation errors are collected
+                            instead of raised.
+        :param list errors: List where validation errors are collected.
+        :param bool trusted: If True, the value and cardinality checks
+                             are skipped, for already validated documents.
+        :raises ValueError: If no parameter is given.
+        :raises RequiredAttributeException: If after importing the xml_element
+                                            the href attribute is missing.
+        """
+
+        if xml_element is None and href is None:
+            raise ValueError('either xml_element or href are required')
+
+        tag_name = 'check-content-ref' if xml_element is None else None
+        self.href = href
+        self.name_ref = name
+
+        super(CheckContentRef, self).__init__(xml_element, tag_name,
+                                              strict, errors, trusted)
+
+        if (not hasattr(self, 'href')
+                or self.href == ''
+                or self.href is None):
+            error_msg = 'href attribute required'
+            self.handle_error(RequiredAttributeException(error_msg))
+
+    def __str__(self):
+        """
+        String representation of CheckContentRef object.
+
+        :returns: CheckContentRef object as a string.
+        :rtype: str
+        """
+
+        string_value = 'check-content-ref {href}'.format(href=self.href)
+        if self.name_ref is not None:
+            string_value += ' {name}'.format(name=self.name_ref)
+        return string_value
+
+    def load_xml_attrs(self):
+        """
+        Load XML attributes as object attributes,
+        except the name attribute, loaded as name_ref.
+
+        :returns: List of parsed attributes.
+        :rtype: list
+        """
+
+        # The name attribute collides with the tag name of the element
+        tag_name = self.name
+        attrs = super(CheckContentRef, self).load_xml_attrs()
+
+        if 'name' in attrs:
+            self.name_ref = self.name
+            attrs[attrs.index('name')] = 'name_ref'
+        self.name = tag_name
+
+        return attrs
+
+    def update_xml_element(self):
+        """
+        Updates the xml element contents to matches the instance contents.
+
+        :returns: Updated XML element.
+        :rtype: lxml.etree._Element
+        """
+
+        if not hasattr(self, 'xml_element'):
+            self.xml_element = etree.Element(self.name, nsmap=NSMAP)
+
+        self.xml_element.set('href', self.href)
+        if self.name_ref is not None:
+            self.xml_element.set('name', self.name_ref)
+
+        return self.xml_element
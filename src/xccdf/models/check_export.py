@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+
+"""
+xccdf.models.check_export includes the class CheckExport
+to create or import a <xccdf:check-export> element.
+
+This module is part of the xccdf library.
+
+Author: Rodrigo Núñez <rnunezmujica@icloud.com>
+"""
+
+# lxml
+from lxml import etree
+
+# XCCDF
+from xccdf.models.element import Element
+from xccdf.exceptions import RequiredAttributeException
+from xccdf.constants import NSMAP
+
+
+class CheckExport(Element):
+
+    """
+    Class to implement <xccdf:check-export> element.
+    """
+
+    def __init__(self, xml_element=None, value_id=None, export_name=None,
+                 strict=True, errors=None, trusted=False):
+        """
+        Initializes the attrs attribute to serialize the attributes.
+
+        :param lxml.etree._Element xml_element: XML element to load.
+        :param str value_id: Id of the exported Value.
+        :param str export_name: Name of the value in the checking system.
+        :param bool strict: If False, validation errors are collected
+                            instead of raised.
+        :param list errors: List where validation errors are collected.
+        :param bool trusted: If True, the value and cardinality checks
+                             are skipped, for already validated documents.
+        :raises ValueError: If no parameter is given.
+        :raises RequiredAttributeException: If after importing the xml_element
+                                            the value-id or export-name
+                                            attributes are missing.
+        """
+
+        if xml_element is None and (value_id is None or export_name is None):
+            raise ValueError(
+                'either xml_element or value_id and export_name are required')
+
+        tag_name = 'check-export' if xml_element is None else None
+        self.value_id = value_id
+        self.export_name = export_name
+
+        super(CheckExport, self).__init__(xml_element, tag_name,
+                                          strict, errors, trusted)
+
+        for attribute in ('value_id', 'export_name'):
+            if getattr(self, attribute, None) in (None, ''):
+                error_msg = '{attribute} attribute required'.format(
+                    attribute=attribute.replace('_', '-'))
+                self.handle_error(RequiredAttributeException(error_msg))
+
+    def __str__(self):
+        """
+        String representation of CheckExport object.
+
+        :returns: CheckExport object as a string.
+        :rtype: str
+        """
+
+        string_value = 'check-export {value_id} as {export_name}'.format(
+            value_id=self.value_id, export_name=self.export_name)
+        return string_value
+
+    def update_xml_element(self):
+        """
+        Updates the xml element contents to matches the instance contents.
+
+        :returns: Updated XML element.
+        :rtype: lxml.etree._Element
+        """
+
+        if not hasattr(self, 'xml_element'):
+            self.xml_element = etree.Element(self.name, nsmap=NSMAP)
+
+        self.xml_element.set('value-id', self.value_id)
+        self.xml_element.set('export-name', self.export_name)
+
+        return self.xml_element
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+
+"""
+xccdf.models.complex_check includes the class ComplexCheck
+to create or import a <xccdf:complex-check> element.
+
+This module is part of the xccdf library.
+
+Author: Rodrigo Núñez <rnunezmujica@icloud.com>
+"""
+
+# lxml
+from lxml import etree
+
+# XCCDF
+from xccdf.models.element import Element
+from xccdf.models.check import Check
+from xccdf.constants.check import CHECK_OPERATOR_CHOICES
+from xccdf.constants import NSMAP
+from xccdf.exceptions import RequiredAttributeException
+from xccdf.exceptions import InvalidValueException
+
+
+class ComplexCheck(Element):
+
+    """
+    Class to implement <xccdf:complex-check> element.
+    """
+
+    def __init__(self, xml_element=None, operator=None,
+                 strict=True, errors=None, trusted=False):
+        """
+        Initializes the attrs attribute to serialize the attributes.
+
+        :param lxml.etree._Element xml_element: XML element to load.
+        :param str operator: Operator to combine the children checks,
+                             AND or OR.
+        :param bool strict: If False, validation errors are collected
+                            instead of raised.
+        :param list errors: List where validation errors are collected.
+        :param bool trusted: If True, the value and cardinality checks
+                             are skipped, for already validated documents.
+        :raises ValueError: If no parameter is given.
+        :raises RequiredAttributeException: If after importing the xml_element
+                                            the operator attribute is missing.
+        :raises InvalidValueException: If the operator is not AND or OR.
+        """
+
+        if xml_element is None and operator is None:
+            raise ValueError('either xml_element or operator are required')
+
+        tag_name = 'complex-check' if xml_element is None else None
+        self.operator = operator
+
+        super(ComplexCheck, self).__init__(xml_element, tag_name,
+                                           strict, errors, trusted)
+
+        if (not hasattr(self, 'operator')
+                or self.operator == ''
+                or self.operator is None):
+            error_msg = 'operator attribute required'
+            self.handle_error(RequiredAttributeException(error_msg))
+        elif (not self.trusted
+                and self.operator not in CHECK_OPERATOR_CHOICES):
+            error_msg = '{val} is not valid. Must be one of '\
+                        'this: {choices}'.format(
+                            val=self.operator,
+                            choices=repr(CHECK_OPERATOR_CHOICES))
+            self.handle_error(InvalidValueException(error_msg))
+
+        if xml_element is not None:
+            self.children = self.load_children()
+        else:
+            self.children = list()
+
+    def __str__(self):
+        """
+        String representation of ComplexCheck object.
+
+        :returns: ComplexCheck object as a string.
+        :rtype: str
+        """
+
+        string_value = 'complex-check {operator}'.format(
+            operator=self.operator)
+        return string_value
+
+    def load_children(self):
+        """
+        Load the subelements from the xml_element in its correspondent classes.
+
+        :returns: List of child objects.
+        :rtype: list
+        """
+
+        children = list()
+
+        for element in self.xml_element:
+            uri, tag = Element.get_namespace_and_tag(element.tag)
+            if tag == 'check':
+                children.append(self.load_child(Check, element))
+            elif tag == 'complex-check':
+                children.append(self.load_child(ComplexCheck, element))
+
+        return children
+
+    def iter_checks(self):
+        """
+        Iterates the checks of the complex check, at any depth.
+
+        :returns: Iterator of the Check objects.
+        :rtype: generator
+        """
+
+        for child in self.children:
+            if isinstance(child, ComplexCheck):
+                for check in child.iter_checks():
+                    yield check
+            else:
+                yield child
+
+    def as_dict(self):
+        """
+        Serializes the object necessary data in a dictionary.
+
+        :returns: Serialized data in a dictionary.
+        :rtype: dict
+        """
+
+        result_dict = super(ComplexCheck, self).as_dict()
+
+        checks = [child.as_dict() for child in self.children]
+        if len(checks) > 0:
+            result_dict['checks'] = checks
+
+        return result_dict
+
+    def update_xml_element(self):
+        """
+        Updates the xml element contents to matches the instance contents.
+
+        :returns: Updated XML element.
+        :rtype: lxml.etree._Element
+        """
+
+        if not hasattr(self, 'xml_element'):
+            self.xml_element = etree.Element(self.name, nsmap=NSMAP)
+
+        self.xml_element.clear()
+
+        self.xml_element.set('operator', self.operator)
+        if hasattr(self, 'negate'):
+            self.xml_element.set('negate', self.negate)
+
+        for child in self.children:
+            child.update_xml_element()
+            self.xml_element.append(child.xml_element)
+
+        return self.xml_element
@@ -22,16 +22,23 @@ class Description(HTMLElement):
     Class to implement <xccdf:description> element.
     """
 
-    def __init__(self, xml_element=None):
+    def __init__(self, xml_element=None,
+                 strict=True, errors=None, trusted=False):
         """
         Initializes the attrs attribute to serialize the attributes.
 
         :param lxml.etree._Element xml_element: XML element to load.
+        :param bool strict: If False, validation errors are collected
+                            instead of raised.
+        :param list errors: List where validation errors are collected.
+        :param bool trusted: If True, the value and cardinality checks
+                             are skipped, for already validated documents.
         """
 
         tag_name = 'description' if xml_element is None else None
 
-        super(Description, self).__init__(xml_element, tag_name)
+        super(Description, self).__init__(xml_element, tag_name,
+                                          strict, errors, trusted)
 
     def __str__(self):
         """
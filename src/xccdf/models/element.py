@@ -16,18 +16,30 @@ class Element(object):
     Generic class to implement a XCCDF element.
     """
 
-    def __init__(self, xml_element=None, tag_name=None):
+    def __init__(self, xml_element=None, tag_name=None,
+                 strict=True, errors=None, trusted=False):
         """
         Initializes the attrs attribute to serialize the attributes.
 
         :param lxml.etree._Element xml_element: XML element to load.
         :param str tag_name: Tag name of the element.
+        :param bool strict: If False, validation errors are collected
+                            in the errors attribute instead of raised.
+        :param list errors: List where the validation errors are collected.
+                            Given by the parent element on non strict loads.
+        :param bool trusted: If True, the value and cardinality checks
+                             are skipped, for already validated documents.
         :raises ValueError: If no parameter is given.
         """
 
         if xml_element is None and tag_name is None:
             raise ValueError('either xml_element or tag_name are required')
 
+        if errors is None and not strict:
+            errors = list()
+        self.errors = errors
+        self.trusted = trusted
+
         if xml_element is not None:
             self.import_element(xml_element)
         else:
@@ -115,6 +127,69 @@ class Element(object):
 
         return self.attrs
 
+    def handle_error(self, exception, xml_element=None):
+        """
+        Raises the validation exception, or collects it in the errors list
+        if the element is being loaded in non strict mode.
+
+        :param xccdf.exceptions.ValidationException exception: Error found.
+        :param lxml.etree._Element xml_element: Offending XML element,
+                                                by default this element.
+        :raises ValidationException: If the element is loaded in strict mode.
+        """
+
+        if self.errors is None:
+            raise exception
+
+        if xml_element is None and hasattr(self, 'xml_element'):
+            xml_element = self.xml_element
+        if xml_element is not None:
+            exception.path = Element.get_element_path(xml_element)
+            exception.sourceline = xml_element.sourceline
+        self.errors.append(exception)
+
+    def load_child(self, model, xml_element):
+        """
+        Creates a child object sharing the load modes of this element.
+
+        :param type model: Element subclass of the child.
+        :param lxml.etree._Element xml_element: XML element of the child.
+        :returns: Child object.
+        :rtype: xccdf.models.element.Element
+        """
+
+        return model(xml_element, errors=self.errors, trusted=self.trusted)
+
+    @staticmethod
+    def get_element_path(xml_element):
+        """
+        Builds a readable path of an element from the root of its document,
+        using the id attribute or the position of the ancestors
+        to identify them.
+
+        :param lxml.etree._Element xml_element: XML element.
+        :returns: Element path, like /Benchmark[@id='b']/Group[@id='g']/title.
+        :rtype: str
+        """
+
+        steps = list()
+        element = xml_element
+        while element is not None:
+            uri, tag = Element.get_namespace_and_tag(element.tag)
+            parent = element.getparent()
+            element_id = element.get('id')
+            if element_id is not None:
+                tag = "{tag}[@id='{id}']".format(tag=tag, id=element_id)
+            elif parent is not None:
+                siblings = [e for e in parent if e.tag == element.tag]
+                if len(siblings) > 1:
+                    tag = '{tag}[{position}]'.format(
+                        tag=tag, position=siblings.index(element) + 1)
+            steps.append(tag)
+            element = parent
+
+        return '/' + '/'.join(reversed(steps))
+
     @staticmethod
     def get_namespace_and_tag(name):
         """
@@ -19,16 +19,23 @@ class FrontMatter(HTMLElement):
     Class to implement <xccdf:front-matter> element.
     """
 
-    def __init__(self, xml_element=None):
+    def __init__(self, xml_element=None,
+                 strict=True, errors=None, trusted=False):
         """
          Initializes the attrs attribute to serialize the attributes.
 
         :param lxml.etree._Element xml_element: XML element to load.
+        :param bool strict: If False, validation errors are collected
+                            instead of raised.
+        :param list errors: List where validation errors are collected.
+        :param bool trusted: If True, the value and cardinality checks
+                             are skipped, for already validated documents.
         """
 
         tag_name = 'front-matter' if xml_element is None else None
 
-        super(FrontMatter, self).__init__(xml_element, tag_name)
+        super(FrontMatter, self).__init__(xml_element, tag_name,
+                                          strict, errors, trusted)
 
     def __str__(self):
         """
@@ -44,3 +51,21 @@ class FrontMatter(HTMLElement):
         if hasattr(self, 'lang'):
             string_value += ' ({lang})'.format(lang=self.lang)
         return string_value
+
+    def update_xml_element(self):
+        """
+        Updates the xml element contents to matches the instance contents.
+
+        :returns: Updated XML element.
+        :rtype: lxml.etree._Element
+        """
+
+        super(FrontMatter, self).update_xml_element()
+
+        if hasattr(self, 'lang'):
+            self.xml_element.set(
+                '{http://www.w3.org/XML/1998/namespace}lang', self.lang)
+        if hasattr(self, 'override'):
+            self.xml_element.set('override', str(self.override))
+
+        return self.xml_element
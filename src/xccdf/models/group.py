@@ -19,6 +19,9 @@ from xccdf.models.status import Status
 from xccdf.models.title import Title
 from xccdf.models.description import Description
 from xccdf.models.platform import Platform
+from xccdf.models.requires import Requires
+from xccdf.models.conflicts import Conflicts
+from xccdf.models.value import Value
 from xccdf.models.rule import Rule
 from xccdf.constants import NSMAP
 from xccdf.exceptions import RequiredAttributeException
@@ -31,13 +34,19 @@ class Group(Element):
     Class to parse <xccdf:Group> element.
     """
 
-    def __init__(self, xml_element=None, id=None):
+    def __init__(self, xml_element=None, id=None,
+                 strict=True, errors=None, trusted=False):
         """
         Initializes the attrs attribute to serialize the attributes.
 
         :param lxml.etree._Element xml_element: XML element to load.
         :param str id: Unique ID of the Group.
                        If xml_element is present, this parameter is ignored.
+        :param bool strict: If False, validation errors are collected
+                            instead of raised.
+        :param list errors: List where validation errors are collected.
+        :param bool trusted: If True, the value and cardinality checks
+                             are skipped, for already validated documents.
         :raises ValueError: If no parameter is given.
         :raises RequiredAttributeException: If after importing the xml_element
                                             the id attribute is missing.
@@ -48,12 +57,14 @@ class Group(Element):
 
         self.id = id
         tag_name = 'Group' if xml_element is None else None
-        super(Group, self).__init__(xml_element, tag_name)
+        super(Group, self).__init__(xml_element, tag_name,
+                                    strict, errors, trusted)
 
         if (not hasattr(self, 'id')
                 or self.id == ''
                 or self.id is None):
-            raise RequiredAttributeException('id attribute required')
+            error_msg = 'id attribute required'
+            self.handle_error(RequiredAttributeException(error_msg))
 
         if xml_element is not None:
             self.children = self.load_children()
@@ -88,6 +99,9 @@ class Group(Element):
         titles = list()
         descriptions = list()
         platforms = list()
+        requires = list()
+        conflicts = list()
+        values = list()
         groups = list()
         rules = list()
 
@@ -96,27 +110,35 @@ class Group(Element):
             uri, tag = Element.get_namespace_and_tag(element.tag)
             if tag == 'version':
                 if version is None:
-                    version = Version(element)
-                else:
+                    version = self.load_child(Version, element)
+                elif not self.trusted:
                     error_msg = 'version element found more than once'
-                    raise CardinalityException(error_msg)
+                    self.handle_error(CardinalityException(error_msg),
+                                      element)
             elif tag == 'status':
-                statuses.append(Status(element))
+                statuses.append(self.load_child(Status, element))
             elif tag == 'title':
-                titles.append(Title(element))
+                titles.append(self.load_child(Title, element))
             elif tag == 'description':
-                descriptions.append(Description(element))
+                descriptions.append(self.load_child(Description, element))
             elif tag == 'platform':
-                platforms.append(Platform(element))
+                platforms.append(self.load_child(Platform, element))
+            elif tag == 'requires':
+                requires.append(self.load_child(Requires, element))
+            elif tag == 'conflicts':
+                conflicts.append(self.load_child(Conflicts, element))
+            elif tag == 'Value':
+                values.append(self.load_child(Value, element))
             elif tag == 'Group':
-                groups.append(Group(element))
+                groups.append(self.load_child(Group, element))
             elif tag == 'Rule':
-                rules.append(Rule(element))
+                rules.append(self.load_child(Rule, element))
 
         # Element validation
-        if len(groups) <= 0 and len(rules) <= 0:
-            error_msg = 'a group must contain at least a group or a rule'
-            raise CardinalityException(error_msg)
+        if not self.trusted:
+            if len(groups) <= 0 and len(rules) <= 0:
+                error_msg = 'a group must contain at least a group or a rule'
+                self.handle_error(CardinalityException(error_msg))
 
         # List construction
         children.extend(statuses)
@@ -125,6 +147,9 @@ class Group(Element):
         children.extend(titles)
         children.extend(descriptions)
         children.extend(platforms)
+        children.extend(requires)
+        children.extend(conflicts)
+        children.extend(values)
         children.extend(groups)
         children.extend(rules)
 
@@ -145,6 +170,9 @@ class Group(Element):
         titles = list()
         descriptions = list()
         platforms = list()
+        requires = list()
+        conflicts = list()
+        values = list()
         groups = list()
         rules = list()
 
@@ -159,6 +187,12 @@ class Group(Element):
                 descriptions.append(child.as_dict())
             elif isinstance(child, Platform):
                 platforms.append(child.as_dict())
+            elif isinstance(child, Requires):
+                requires.append(child.as_dict())
+            elif isinstance(child, Conflicts):
+                conflicts.append(child.as_dict())
+            elif isinstance(child, Value):
+                values.append(child.as_dict())
             elif isinstance(child, Group):
                 groups.append(child.as_dict())
             elif isinstance(child, Rule):
@@ -174,6 +208,12 @@ class Group(Element):
             result_dict['descriptions'] = descriptions
         if len(platforms) > 0:
             result_dict['platforms'] = platforms
+        if len(requires) > 0:
+            result_dict['requires'] = requires
+        if len(conflicts) > 0:
+            result_dict['conflicts'] = conflicts
+        if len(values) > 0:
+            result_dict['values'] = values
         if len(groups) > 0:
             result_dict['groups'] = groups
         if len(rules) > 0:
@@ -10,7 +10,6 @@ Author: Rodrigo Núñez <rnunezmujica@icloud.com>
 """
 
 # Python stdlib
-from xml.etree import ElementTree
 import re
 
 # lxml
@@ -28,18 +27,22 @@ class HTMLElement(Element):
     Generic class to implement a XCCDF element with HTML enabled text.
     """
 
-    def __init__(self, xml_element=None, tag_name=None):
+    def __init__(self, xml_element=None, tag_name=None,
+                 strict=True, errors=None, trusted=False):
         """
         Initializes the attrs attribute to serialize the attributes.
 
         :param lxml.etree._Element xml_element: XML element to load.
         :param str tag_name: Tag name of the element.
+        :param bool strict: If False, validation errors are collected
+                            instead of raised.
+        :param list errors: List where validation errors are collected.
+        :param bool trusted: If True, the value and cardinality checks
+                             are skipped, for already validated documents.
         """
 
-        super(HTMLElement, self).__init__(xml_element, tag_name)
-
-        if xml_element is not None:
-            self.import_element(xml_element)
+        super(HTMLElement, self).__init__(xml_element, tag_name,
+                                          strict, errors, trusted)
 
     def import_element(self, xml_element):
         """
@@ -80,13 +83,19 @@ class HTMLElement(Element):
             xml = self.xml_element
             content_list = ["" if xml.text is None else xml.text]
 
+            # Imported on first use, it isn't needed to load the models
+            from xml.etree import ElementTree
+
             def to_string(xml):
                 if isinstance(xml, _Comment):
                     return str(xml)
+                elif xml.tag is ElementTree.Comment:
+                    # Comments of the expat builder, like the lxml ones
+                    return '<!--{text}-->'.format(text=xml.text)
                 else:
                     return ElementTree.tostring(xml).decode('utf-8')
 
-            content_list += [to_string(e) for e in xml.getchildren()]
+            content_list += [to_string(e) for e in list(xml)]
 
             full_xml_content = "".join(content_list)
 
@@ -24,13 +24,19 @@ class Ident(Element):
     Class to implement <xccdf:ident> element.
     """
 
-    def __init__(self, xml_element=None, ident=None, system=None):
+    def __init__(self, xml_element=None, ident=None, system=None,
+                 strict=True, errors=None, trusted=False):
         """
         Initializes the Ident class and loads its attributes.
 
         :param lxml.etree._Element xml_element: XML element to load.
         :param str ident: Ident string.
         :param str system: System attribute string.
+        :param bool strict: If False, validation errors are collected
+                            instead of raised.
+        :param list errors: List where validation errors are collected.
+        :param bool trusted: If True, the value and cardinality checks
+                             are skipped, for already validated documents.
         :raises ValueError: If no paramenter is given.
         :raises RequiredAttributeException: If after importing the xml_element
                                             the ident attribute is missing.
@@ -46,15 +52,17 @@ class Ident(Element):
         self.text = ident
         self.system = system
 
-        super(Ident, self).__init__(xml_element, tag_name)
+        super(Ident, self).__init__(xml_element, tag_name,
+                                    strict, errors, trusted)
 
         if (not hasattr(self, 'text') or
                 self.text == '' or self.text is None):
-            raise RequiredAttributeException('ident is required')
+            self.handle_error(RequiredAttributeException('ident is required'))
 
         if (not hasattr(self, 'system') or
                 self.system == '' or self.system is None):
-            raise RequiredAttributeException('system attribute is required')
+            error_msg = 'system attribute is required'
+            self.handle_error(RequiredAttributeException(error_msg))
 
     def __str__(self):
         """
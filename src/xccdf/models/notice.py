@@ -20,12 +20,18 @@ class Notice(HTMLElement):
     Class to implement <xccdf:notice> element.
     """
 
-    def __init__(self, xml_element=None, id=None):
+    def __init__(self, xml_element=None, id=None,
+                 strict=True, errors=None, trusted=False):
         """
         Initializes the attrs attribute to serialize the attributes.
 
         :param lxml.etree._Element xml_element: XML element to load.
         :param str id: Id attribute.
+        :param bool strict: If False, validation errors are collected
+                            instead of raised.
+        :param list errors: List where validation errors are collected.
+        :param bool trusted: If True, the value and cardinality checks
+                             are skipped, for already validated documents.
         :raises ValueError: If no parameter is given.
         :raises RequiredAttributeException: If after importing the xml_element
                                             the id attribute is missing.
@@ -37,10 +43,12 @@ class Notice(HTMLElement):
         tag_name = 'notice' if xml_element is None else None
         self.id = id
 
-        super(Notice, self).__init__(xml_element, tag_name)
+        super(Notice, self).__init__(xml_element, tag_name,
+                                     strict, errors, trusted)
 
         if not hasattr(self, 'id') or self.id == '' or self.id is None:
-            raise RequiredAttributeException('id attribute required')
+            error_msg = 'id attribute required'
+            self.handle_error(RequiredAttributeException(error_msg))
 
     def __str__(self):
         """
@@ -54,3 +62,20 @@ class Notice(HTMLElement):
         if hasattr(self, 'lang'):
             string_value += ' ({lang})'.format(lang=self.lang)
         return string_value
+
+    def update_xml_element(self):
+        """
+        Updates the xml element contents to matches the instance contents.
+
+        :returns: Updated XML element.
+        :rtype: lxml.etree._Element
+        """
+
+        super(Notice, self).update_xml_element()
+
+        if hasattr(self, 'lang'):
+            self.xml_element.set(
+                '{http://www.w3.org/XML/1998/namespace}lang', self.lang)
+        self.xml_element.set('id', self.id)
+
+        return self.xml_element
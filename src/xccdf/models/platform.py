@@ -24,12 +24,18 @@ class Platform(Element):
     Class to implement <xccdf:platform> element.
     """
 
-    def __init__(self, xml_element=None, idref=None):
+    def __init__(self, xml_element=None, idref=None,
+                 strict=True, errors=None, trusted=False):
         """
         Initializes the attrs attribute to serialize the attributes.
 
         :param lxml.etree._Element xml_element: XML element to load.
         :param str idref: CPE string or identifier of CPEL expression.
+        :param bool strict: If False, validation errors are collected
+                            instead of raised.
+        :param list errors: List where validation errors are collected.
+        :param bool trusted: If True, the value and cardinality checks
+                             are skipped, for already validated documents.
         :raises ValueError: If no parameter is given.
         :raises RequiredAttributeException: If after importing the xml_element
                                             the idref attribute is missing.
@@ -40,12 +46,14 @@ class Platform(Element):
         tag_name = 'platform' if xml_element is None else None
         self.idref = idref
 
-        super(Platform, self).__init__(xml_element, tag_name)
+        super(Platform, self).__init__(xml_element, tag_name,
+                                       strict, errors, trusted)
 
         if (not hasattr(self, 'idref')
                 or self.idref == ''
                 or self.idref is None):
-            raise RequiredAttributeException('idref attribute required')
+            error_msg = 'idref attribute required'
+            self.handle_error(RequiredAttributeException(error_msg))
 
     def __str__(self):
         """
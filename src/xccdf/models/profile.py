@@ -20,6 +20,8 @@ from xccdf.models.title import Title
 from xccdf.models.description import Description
 from xccdf.models.platform import Platform
 from xccdf.models.select import Select
+from xccdf.models.refine_value import RefineValue
+from xccdf.models.set_value import SetValue
 from xccdf.exceptions import RequiredAttributeException
 from xccdf.exceptions import CardinalityException
 from xccdf.constants import NSMAP
@@ -31,13 +33,19 @@ class Profile(Element):
     Class to implement <xccdf:Profile> element.
     """
 
-    def __init__(self, xml_element=None, id=None):
+    def __init__(self, xml_element=None, id=None,
+                 strict=True, errors=None, trusted=False):
         """
         Initializes the attrs attribute to serialize the attributes.
 
         :param lxml.etree._Element xml_element: XML element to load.
         :param str id: Unique ID of the Profile.
                        If xml_element is present, this parameter is ignored.
+        :param bool strict: If False, validation errors are collected
+                            instead of raised.
+        :param list errors: List where validation errors are collected.
+        :param bool trusted: If True, the value and cardinality checks
+                             are skipped, for already validated documents.
         :raises ValueError: If no parameter is given.
         :raises RequiredAttributeException: If after importing the xml_element
                                             the id attribute is missing.
@@ -48,12 +56,15 @@ class Profile(Element):
         tag_name = 'Profile' if xml_element is None else None
         self.id = id
 
-        super(Profile, self).__init__(xml_element, tag_name=tag_name)
+        super(Profile, self).__init__(xml_element, tag_name=tag_name,
+                                      strict=strict, errors=errors,
+                                      trusted=trusted)
 
         if (not hasattr(self, 'id')
                 or self.id == ''
                 or self.id is None):
-            raise RequiredAttributeException('id attribute required')
+            error_msg = 'id attribute required'
+            self.handle_error(RequiredAttributeException(error_msg))
 
         if xml_element is not None:
             self.children = self.load_children()
@@ -89,31 +100,39 @@ class Profile(Element):
         descriptions = list()
         platforms = list()
         selects = list()
+        refine_values = list()
+        set_values = list()
 
         # Element load
         for element in self.xml_element:
             uri, tag = Element.get_namespace_and_tag(element.tag)
             if tag == 'version':
                 if version is None:
-                    version = Version(element)
-                else:
+                    version = self.load_child(Version, element)
+                elif not self.trusted:
                     error_msg = 'version element found more than once'
-                    raise CardinalityException(error_msg)
+                    self.handle_error(CardinalityException(error_msg),
+                                      element)
             elif tag == 'status':
-                statuses.append(Status(element))
+                statuses.append(self.load_child(Status, element))
             elif tag == 'title':
-                titles.append(Title(element))
+                titles.append(self.load_child(Title, element))
             elif tag == 'description':
-                descriptions.append(Description(element))
+                descriptions.append(self.load_child(Description, element))
             elif tag == 'platform':
-                platforms.append(Platform(element))
+                platforms.append(self.load_child(Platform, element))
             elif tag == 'select':
-                selects.append(Select(element))
+                selects.append(self.load_child(Select, element))
+            elif tag == 'refine-value':
+                refine_values.append(self.load_child(RefineValue, element))
+            elif tag == 'set-value':
+                set_values.append(self.load_child(SetValue, element))
 
         # Element validation
-        if len(titles) <= 0:
-            error_msg = 'title element is required at least once'
-            raise CardinalityException(error_msg)
+        if not self.trusted:
+            if len(titles) <= 0:
+                error_msg = 'title element is required at least once'
+                self.handle_error(CardinalityException(error_msg))
 
         # List construction
         children.extend(statuses)
@@ -123,6 +142,8 @@ class Profile(Element):
         children.extend(descriptions)
         children.extend(platforms)
         children.extend(selects)
+        children.extend(refine_values)
+        children.extend(set_values)
 
         return children
 
@@ -142,6 +163,8 @@ class Profile(Element):
         descriptions = list()
         platforms = list()
         selects = list()
+        refine_values = list()
+        set_values = list()
 
         for child in self.children:
             if isinstance(child, Version):
@@ -156,6 +179,10 @@ class Profile(Element):
                 platforms.append(child.as_dict())
             elif isinstance(child, Select):
                 selects.append(child.as_dict())
+            elif isinstance(child, RefineValue):
+                refine_values.append(child.as_dict())
+            elif isinstance(child, SetValue):
+                set_values.append(child.as_dict())
 
         if version is not None:
             result_dict['version'] = version
@@ -169,6 +196,10 @@ class Profile(Element):
             result_dict['platforms'] = platforms
         if len(selects) > 0:
             result_dict['selects'] = selects
+        if len(refine_values) > 0:
+            result_dict['refine_values'] = refine_values
+        if len(set_values) > 0:
+            result_dict['set_values'] = set_values
 
         return result_dict
 
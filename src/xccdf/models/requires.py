@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+"""
+xccdf.models.requires includes the class Requires
+to create or import a <xccdf:requires> element.
+
+This module is part of the xccdf library.
+
+Author: Rodrigo Núñez <rnunezmujica@icloud.com>
+"""
+
+# lxml
+from lxml import etree
+
+# XCCDF
+from xccdf.models.element import Element
+from xccdf.exceptions import RequiredAttributeException
+from xccdf.constants import NSMAP
+
+
+class Requires(Element):
+
+    """
+    Class to implement <xccdf:requires> element.
+    """
+
+    def __init__(self, xml_element=None, idref=None,
+                 strict=True, errors=None, trusted=False):
+        """
+        Initializes the attrs attribute to serialize the attributes.
+
+        :param lxml.etree._Element xml_element: XML element to load.
+        :param str idref: Ids of the required items, separated by spaces.
+        :param bool strict: If False, validation errors are collected
+                            instead of raised.
+        :param list errors: List where validation errors are collected.
+        :param bool trusted: If True, the value and cardinality checks
+                             are skipped, for already validated documents.
+        :raises ValueError: If no parameter is given.
+        :raises RequiredAttributeException: If after importing the xml_element
+                                            the idref attribute is missing.
+        """
+
+        if xml_element is None and idref is None:
+            raise ValueError('either xml_element or idref are required')
+
+        tag_name = 'requires' if xml_element is None else None
+        self.idref = idref
+
+        super(Requires, self).__init__(xml_element, tag_name,
+                                       strict, errors, trusted)
+
+        if (not hasattr(self, 'idref')
+                or self.idref == ''
+                or self.idref is None):
+            error_msg = 'idref attribute required'
+            self.handle_error(RequiredAttributeException(error_msg))
+
+    def __str__(self):
+        """
+        String representation of Requires object.
+
+        :returns: Requires object as a string.
+        :rtype: str
+        """
+
+        string_value = 'requires {idref}'.format(idref=self.idref)
+        return string_value
+
+    def get_idrefs(self):
+        """
+        Returns the ids of the required items. The requirement is met
+        if any of them is selected.
+
+        :returns: List of item ids.
+        :rtype: list
+        """
+
+        return self.idref.split()
+
+    def update_xml_element(self):
+        """
+        Updates the xml element contents to matches the instance contents.
+
+        :returns: Updated XML element.
+        :rtype: lxml.etree._Element
+        """
+
+        if not hasattr(self, 'xml_element'):
+            self.xml_element = etree.Element(self.name, nsmap=NSMAP)
+
+        self.xml_element.set('idref', self.idref)
+
+        return self.xml_element
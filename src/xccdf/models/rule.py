@@ -19,7 +19,11 @@ from xccdf.models.status import Status
 from xccdf.models.title import Title
 from xccdf.models.description import Description
 from xccdf.models.platform import Platform
+from xccdf.models.requires import Requires
+from xccdf.models.conflicts import Conflicts
 from xccdf.models.ident import Ident
+from xccdf.models.check import Check
+from xccdf.models.complex_check import ComplexCheck
 from xccdf.constants import NSMAP
 from xccdf.exceptions import RequiredAttributeException
 from xccdf.exceptions import CardinalityException
@@ -31,13 +35,19 @@ class Rule(Element):
     Class to parse <xccdf:Rule> element.
     """
 
-    def __init__(self, xml_element=None, id=None):
+    def __init__(self, xml_element=None, id=None,
+                 strict=True, errors=None, trusted=False):
         """
         Initializes the attrs attribute to serialize the attributes.
 
         :param lxml.etree._Element xml_element: XML element to load.
         :param str id: Unique ID of the Rule.
                        If xml_element is present, this parameter is ignored.
+        :param bool strict: If False, validation errors are collected
+                            instead of raised.
+        :param list errors: List where validation errors are collected.
+        :param bool trusted: If True, the value and cardinality checks
+                             are skipped, for already validated documents.
         :raises ValueError: If no parameter is given.
         :raises RequiredAttributeException: If after importing the xml_element
                                             the id attribute is missing.
@@ -48,12 +58,14 @@ class Rule(Element):
 
         self.id = id
         tag_name = 'Rule' if xml_element is None else None
-        super(Rule, self).__init__(xml_element, tag_name)
+        super(Rule, self).__init__(xml_element, tag_name,
+                                   strict, errors, trusted)
 
         if (not hasattr(self, 'id')
                 or self.id == ''
                 or self.id is None):
-            raise RequiredAttributeException('id attribute required')
+            error_msg = 'id attribute required'
+            self.handle_error(RequiredAttributeException(error_msg))
 
         if xml_element is not None:
             self.children = self.load_children()
@@ -78,6 +90,8 @@ class Rule(Element):
         :returns: List of child objects.
         :rtype: list
         :raises CardinalityException: If there is more than one Version child.
+        :raises CardinalityException: If there is more than one ComplexCheck
+                                      child.
         """
 
         # Containers
@@ -87,27 +101,45 @@ class Rule(Element):
         titles = list()
         descriptions = list()
         platforms = list()
+        requires = list()
+        conflicts = list()
         idents = list()
+        checks = list()
+        complex_check = None
 
         # Element load
         for element in self.xml_element:
             uri, tag = Element.get_namespace_and_tag(element.tag)
             if tag == 'version':
                 if version is None:
-                    version = Version(element)
-                else:
+                    version = self.load_child(Version, element)
+                elif not self.trusted:
                     error_msg = 'version element found more than once'
-                    raise CardinalityException(error_msg)
+                    self.handle_error(CardinalityException(error_msg),
+                                      element)
             elif tag == 'status':
-                statuses.append(Status(element))
+                statuses.append(self.load_child(Status, element))
             elif tag == 'title':
-                titles.append(Title(element))
+                titles.append(self.load_child(Title, element))
             elif tag == 'description':
-                descriptions.append(Description(element))
+                descriptions.append(self.load_child(Description, element))
             elif tag == 'platform':
-                platforms.append(Platform(element))
+                platforms.append(self.load_child(Platform, element))
+            elif tag == 'requires':
+                requires.append(self.load_child(Requires, element))
+            elif tag == 'conflicts':
+                conflicts.append(self.load_child(Conflicts, element))
             elif tag == 'ident':
-                idents.append(Ident(element))
+                idents.append(self.load_child(Ident, element))
+            elif tag == 'check':
+                checks.append(self.load_child(Check, element))
+            elif tag == 'complex-check':
+                if complex_check is None:
+                    complex_check = self.load_child(ComplexCheck, element)
+                elif not self.trusted:
+                    error_msg = 'complex-check element found more than once'
+                    self.handle_error(CardinalityException(error_msg),
+                                      element)
 
         # List construction
         children.extend(statuses)
@@ -116,10 +148,31 @@ class Rule(Element):
         children.extend(titles)
         children.extend(descriptions)
         children.extend(platforms)
+        children.extend(requires)
+        children.extend(conflicts)
         children.extend(idents)
+        children.extend(checks)
+        if complex_check is not None:
+            children.append(complex_check)
 
         return children
 
+    def iter_checks(self):
+        """
+        Iterates the checks of the Rule, including the ones
+        of its complex check at any depth.
+
+        :returns: Iterator of the Check objects.
+        :rtype: generator
+        """
+
+        for child in self.children:
+            if isinstance(child, Check):
+                yield child
+            elif isinstance(child, ComplexCheck):
+                for check in child.iter_checks():
+                    yield check
+
     def as_dict(self):
         """
         Serializes the object necessary data in a dictionary.
@@ -135,7 +188,11 @@ class Rule(Element):
         titles = list()
         descriptions = list()
         platforms = list()
+        requires = list()
+        conflicts = list()
         idents = list()
+        checks = list()
+        complex_check = None
 
         for child in self.children:
             if isinstance(child, Version):
@@ -148,8 +205,16 @@ class Rule(Element):
                 descriptions.append(child.as_dict())
             elif isinstance(child, Platform):
                 platforms.append(child.as_dict())
+            elif isinstance(child, Requires):
+                requires.append(child.as_dict())
+            elif isinstance(child, Conflicts):
+                conflicts.append(child.as_dict())
             elif isinstance(child, Ident):
                 idents.append(child.as_dict())
+            elif isinstance(child, Check):
+                checks.append(child.as_dict())
+            elif isinstance(child, ComplexCheck):
+                complex_check = child.as_dict()
 
         if version is not None:
             result_dict['version'] = version
@@ -161,8 +226,16 @@ class Rule(Element):
             result_dict['descriptions'] = descriptions
         if len(platforms) > 0:
             result_dict['platforms'] = platforms
+        if len(requires) > 0:
+            result_dict['requires'] = requires
+        if len(conflicts) > 0:
+            result_dict['conflicts'] = conflicts
         if len(idents) > 0:
             result_dict['idents'] = idents
+        if len(checks) > 0:
+            result_dict['checks'] = checks
+        if complex_check is not None:
+            result_dict['complex_check'] = complex_check
 
         return result_dict
 
@@ -186,7 +259,9 @@ class Rule(Element):
         if hasattr(self, 'hidden'):
             self.xml_element.set('hidden', self.hidden)
         if hasattr(self, 'role'):
-            self.xml_element.set('severity', self.hidden)
+            self.xml_element.set('role', self.role)
+        if hasattr(self, 'severity'):
+            self.xml_element.set('severity', self.severity)
         if hasattr(self, 'selected'):
             self.xml_element.set('selected', self.selected)
         if hasattr(self, 'weight'):
@@ -0,0 +1,258 @@
+# -*- coding: utf-8 -*-
+
+"""
+xccdf.models.rule_result includes the class RuleResult
+to create or import a <xccdf:rule-result> element.
+
+Also includes the class Result to create or import
+the <xccdf:result> element of the rule result.
+
+This module is part of the xccdf library.
+
+Author: Rodrigo Núñez <rnunezmujica@icloud.com>
+"""
+
+# lxml
+from lxml import etree
+
+# XCCDF
+from xccdf.models.element import Element
+from xccdf.models.ident import Ident
+from xccdf.constants.result import RESULT_VALUE_CHOICES
+from xccdf.constants import NSMAP
+from xccdf.exceptions import RequiredAttributeException
+from xccdf.exceptions import CardinalityException
+from xccdf.exceptions import InvalidValueException
+
+
+class Result(Element):
+
+    """
+    Class to implement <xccdf:result> element.
+    """
+
+    def __init__(self, xml_element=None, result=None,
+                 strict=True, errors=None, trusted=False):
+        """
+        Initializes the attrs attribute to serialize the attributes.
+
+        :param lxml.etree._Element xml_element: XML element to load.
+        :param str result: Result string.
+        :param bool strict: If False, validation errors are collected
+                            instead of raised.
+        :param list errors: List where validation errors are collected.
+        :param bool trusted: If True, the value and cardinality checks
+                             are skipped, for already validated documents.
+        :raises ValueError: If no parameter is given.
+        :raises InvalidValueException: If the imported result string is not
+                                       one of the valid result strings.
+        """
+
+        if xml_element is None and result is None:
+            raise ValueError('either xml_element or result are required')
+
+        self.text = result
+        tag_name = 'result' if xml_element is None else None
+
+        super(Result, self).__init__(xml_element, tag_name,
+                                     strict, errors, trusted)
+
+        if not self.trusted and self.text not in RESULT_VALUE_CHOICES:
+            val = '{val} is not valid. Must '\
+                  'be one of this: {choices}'.format(
+                      val=self.text, choices=repr(RESULT_VALUE_CHOICES))
+            self.handle_error(InvalidValueException(val))
+
+    def __str__(self):
+        """
+        String representation of Result object.
+
+        :returns: Result object as a string.
+        :rtype: str
+        """
+
+        string_value = 'result {result}'.format(result=self.text)
+        return string_value
+
+    def update_xml_element(self):
+        """
+        Updates the xml element contents to matches the instance contents.
+
+        :returns: Updated XML element.
+        :rtype: lxml.etree._Element
+        """
+
+        if not hasattr(self, 'xml_element'):
+            self.xml_element = etree.Element(self.name, nsmap=NSMAP)
+
+        self.xml_element.text = self.text
+
+        return self.xml_element
+
+
+class RuleResult(Element):
+
+    """
+    Class to implement <xccdf:rule-result> element.
+    """
+
+    def __init__(self, xml_element=None, idref=None,
+                 strict=True, errors=None, trusted=False):
+        """
+        Initializes the attrs attribute to serialize the attributes.
+
+        :param lxml.etree._Element xml_element: XML element to load.
+        :param str idref: Id of the Rule of this result.
+        :param bool strict: If False, validation errors are collected
+                            instead of raised.
+        :param list errors: List where validation errors are collected.
+        :param bool trusted: If True, the value and cardinality checks
+                             are skipped, for already validated documents.
+        :raises ValueError: If no parameter is given.
+        :raises RequiredAttributeException: If after importing the xml_element
+                                            the idref attribute is missing.
+        """
+
+        if xml_element is None and idref is None:
+            raise ValueError('either xml_element or idref are required')
+
+        tag_name = 'rule-result' if xml_element is None else None
+        self.idref = idref
+
+        super(RuleResult, self).__init__(xml_element, tag_name,
+                                         strict, errors, trusted)
+
+        if (not hasattr(self, 'idref')
+                or self.idref == ''
+                or self.idref is None):
+            error_msg = 'idref attribute required'
+            self.handle_error(RequiredAttributeException(error_msg))
+
+        if xml_element is not None:
+            self.children = self.load_children()
+        else:
+            self.children = list()
+
+    def __str__(self):
+        """
+        String representation of RuleResult object.
+
+        :returns: RuleResult object as a string.
+        :rtype: str
+        """
+
+        string_value = 'rule-result {idref} {result}'.format(
+            idref=self.idref, result=self.get_result())
+        return string_value
+
+    def load_children(self):
+        """
+        Load the subelements from the xml_element in its correspondent classes.
+
+        :returns: List of child objects.
+        :rtype: list
+        :raises CardinalityException: If there is more than one Result child.
+        :raises CardinalityException: If there is no Result child.
+        """
+
+        # Containers
+        children = list()
+        result = None
+        idents = list()
+
+        # Element load
+        for element in self.xml_element:
+            uri, tag = Element.get_namespace_and_tag(element.tag)
+            if tag == 'result':
+                if result is None:
+                    result = self.load_child(Result, element)
+                elif not self.trusted:
+                    error_msg = 'result element found more than once'
+                    self.handle_error(CardinalityException(error_msg),
+                                      element)
+            elif tag == 'ident':
+                idents.append(self.load_child(Ident, element))
+
+        # Element validation
+        if not self.trusted:
+            if result is None:
+                error_msg = 'result element is required'
+                self.handle_error(CardinalityException(error_msg))
+
+        # List construction
+        if result is not None:
+            children.append(result)
+        children.extend(idents)
+
+        return children
+
+    def get_result(self):
+        """
+        Returns the result string of the rule result.
+
+        :returns: Result string if the Result child exists.
+        :rtype: str or NoneType
+        """
+
+        for child in self.children:
+            if isinstance(child, Result):
+                return child.text
+
+        return None
+
+    def as_dict(self):
+        """
+        Serializes the object necessary data in a dictionary.
+
+        :returns: Serialized data in a dictionary.
+        :rtype: dict
+        """
+
+        result_dict = super(RuleResult, self).as_dict()
+
+        result = None
+        idents = list()
+
+        for child in self.children:
+            if isinstance(child, Result):
+                result = child.as_dict()
+            elif isinstance(child, Ident):
+                idents.append(child.as_dict())
+
+        if result is not None:
+            result_dict['result'] = result
+        if len(idents) > 0:
+            result_dict['idents'] = idents
+
+        return result_dict
+
+    def update_xml_element(self):
+        """
+        Updates the xml element contents to matches the instance contents.
+
+        :returns: Updated XML element.
+        :rtype: lxml.etree._Element
+        """
+
+        if not hasattr(self, 'xml_element'):
+            self.xml_element = etree.Element(self.name, nsmap=NSMAP)
+
+        self.xml_element.clear()
+
+        if hasattr(self, 'role'):
+            self.xml_element.set('role', self.role)
+        if hasattr(self, 'severity'):
+            self.xml_element.set('severity', self.severity)
+        if hasattr(self, 'time'):
+            self.xml_element.set('time', self.time)
+        if hasattr(self, 'version'):
+            self.xml_element.set('version', self.version)
+        if hasattr(self, 'weight'):
+            self.xml_element.set('weight', self.weight)
+        self.xml_element.set('idref', self.idref)
+
+        for child in self.children:
+            child.update_xml_element()
+            self.xml_element.append(child.xml_element)
+
+        return self.xml_element
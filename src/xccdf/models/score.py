@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+
+"""
+xccdf.models.score includes the class Score
+to create or import a <xccdf:score> element.
+
+This module is part of the xccdf library.
+
+Author: Rodrigo Núñez <rnunezmujica@icloud.com>
+"""
+
+# lxml
+from lxml import etree
+
+# XCCDF
+from xccdf.models.element import Element
+from xccdf.exceptions import InvalidValueException
+from xccdf.constants import NSMAP
+
+#: Scoring model used when the system attribute is missing
+DEFAULT_SCORING_SYSTEM = 'urn:xccdf:scoring:default'
+
+
+class Score(Element):
+
+    """
+    Class to implement <xccdf:score> element.
+    """
+
+    def __init__(self, xml_element=None, score=None, system=None,
+                 strict=True, errors=None, trusted=False):
+        """
+        Initializes the attrs attribute to serialize the attributes.
+
+        :param lxml.etree._Element xml_element: XML element to load.
+        :param float score: Score value.
+        :param str system: URI of the scoring model.
+        :param bool strict: If False, validation errors are collected
+                            instead of raised.
+        :param list errors: List where validation errors are collected.
+        :param bool trusted: If True, the value and cardinality checks
+                             are skipped, for already validated documents.
+        :raises ValueError: If no parameter is given.
+        :raises InvalidValueException: If the score is not a number.
+        """
+
+        if xml_element is None and score is None:
+            raise ValueError('either xml_element or score are required')
+
+        tag_name = 'score' if xml_element is None else None
+        self.text = None if score is None else str(score)
+        if system is not None:
+            self.system = system
+
+        super(Score, self).__init__(xml_element, tag_name,
+                                    strict, errors, trusted)
+
+        if not self.trusted:
+            try:
+                float(self.text)
+            except ValueError:
+                error_msg = '{val} is not a valid score'.format(val=self.text)
+                self.handle_error(InvalidValueException(error_msg))
+
+    def __str__(self):
+        """
+        String representation of Score object.
+
+        :returns: Score object as a string.
+        :rtype: str
+        """
+
+        string_value = 'score {score} ({system})'.format(
+            score=self.text, system=self.get_system())
+        return string_value
+
+    def get_score(self):
+        """
+        Returns the score value as a number.
+
+        :returns: Score value.
+        :rtype: float
+        """
+
+        return float(self.text)
+
+    def get_system(self):
+        """
+        Returns the scoring model of the score.
+
+        :returns: URI of the scoring model.
+        :rtype: str
+        """
+
+        return getattr(self, 'system', DEFAULT_SCORING_SYSTEM)
+
+    def update_xml_element(self):
+        """
+        Updates the xml element contents to matches the instance contents.
+
+        :returns: Updated XML element.
+        :rtype: lxml.etree._Element
+        """
+
+        if not hasattr(self, 'xml_element'):
+            self.xml_element = etree.Element(self.name, nsmap=NSMAP)
+
+        if hasattr(self, 'system'):
+            self.xml_element.set('system', self.system)
+        if hasattr(self, 'maximum'):
+            self.xml_element.set('maximum', str(self.maximum))
+        self.xml_element.text = self.text
+
+        return self.xml_element
+
+    def to_xml_string(self):
+        """
+        Exports the element in XML format.
+
+        :returns: element in XML format.
+        :rtype: str
+        """
+
+        self.update_xml_element()
+        xml = self.xml_element
+
+        return etree.tostring(xml, pretty_print=True).decode('utf-8')
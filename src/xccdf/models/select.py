@@ -24,13 +24,19 @@ class Select(Element):
     Class to implement <xccdf:select> element.
     """
 
-    def __init__(self, xml_element=None, idref=None, selected=False):
+    def __init__(self, xml_element=None, idref=None, selected=False,
+                 strict=True, errors=None, trusted=False):
         """
         Initializes the attrs attribute to serialize the attributes.
 
         :param lxml.etree._Element xml_element: XML element to load.
         :param str idref: Unique identifier of a Select element.
         :param bool selected: Mark the Select element as selected.
+        :param bool strict: If False, validation errors are collected
+                            instead of raised.
+        :param list errors: List where validation errors are collected.
+        :param bool trusted: If True, the value and cardinality checks
+                             are skipped, for already validated documents.
         :raises ValueError: If no parameter is given.
         :raises RequiredAttributeException: If after importing the xml_element
                                             the idref attribute is missing.
@@ -47,16 +53,18 @@ class Select(Element):
         else:
             self.selected = 'false'
 
-        super(Select, self).__init__(xml_element, tag_name)
+        super(Select, self).__init__(xml_element, tag_name,
+                                     strict, errors, trusted)
 
         if (not hasattr(self, 'idref')
                 or self.idref == ''
                 or self.idref is None):
-            raise RequiredAttributeException('idref attribute required')
+            error_msg = 'idref attribute required'
+            self.handle_error(RequiredAttributeException(error_msg))
 
         if self.selected not in ['true', '1', 'false', '0']:
-            raise InvalidValueException(
-                'selected attribute has a invalid value')
+            self.handle_error(InvalidValueException(
+                'selected attribute has a invalid value'))
 
     def __str__(self):
         """
@@ -28,12 +28,18 @@ class Status(Element):
     Class to implement <xccdf:status> element.
     """
 
-    def __init__(self, xml_element=None, state=None):
+    def __init__(self, xml_element=None, state=None,
+                 strict=True, errors=None, trusted=False):
         """
         Initializes the attrs attribute to serialize the attributes.
 
         :param lxml.etree._Element xml_element: XML element to load_xml_attrs.
         :param str state: State string of this status
+        :param bool strict: If False, validation errors are collected
+                            instead of raised.
+        :param list errors: List where validation errors are collected.
+        :param bool trusted: If True, the value and cardinality checks
+                             are skipped, for already validated documents.
         :raises ValueError: If no parameter is given.
         :raises InvalidValueException: If the imported state string is not
                                        one of the valid state strings.
@@ -45,13 +51,14 @@ class Status(Element):
         self.text = state
         tag_name = 'status' if xml_element is None else None
 
-        super(Status, self).__init__(xml_element, tag_name)
+        super(Status, self).__init__(xml_element, tag_name,
+                                     strict, errors, trusted)
 
-        if self.text not in STATUS_VALUE_CHOICES:
+        if not self.trusted and self.text not in STATUS_VALUE_CHOICES:
             val = '{val} is not valid. Must '\
                   'be one of this: {choices}'.format(
                       val=self.text, choices=repr(STATUS_VALUE_CHOICES))
-            raise InvalidValueException(val)
+            self.handle_error(InvalidValueException(val))
 
     def __str__(self):
         """
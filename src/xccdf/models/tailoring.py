@@ -32,13 +32,19 @@ class Tailoring(Element):
     Class to implement <xccdf:Tailoring> element.
     """
 
-    def __init__(self, xml_element=None, id=None):
+    def __init__(self, xml_element=None, id=None,
+                 strict=True, errors=None, trusted=False):
         """
         Initializes the attrs attribute to serialize the attributes.
 
         :param lxml.etree._Element xml_element: XML element to load.
         :param str id: Unique ID of the Tailoring.
                        If xml_element is present, this parameter is ignored.
+        :param bool strict: If False, validation errors are collected
+                            instead of raised.
+        :param list errors: List where validation errors are collected.
+        :param bool trusted: If True, the value and cardinality checks
+                             are skipped, for already validated documents.
         :raises ValueError: If no parameter is given.
         :raises RequiredAttributeException: If after importing the xml_element
                                             the id attribute is missing.
@@ -51,15 +57,18 @@ class Tailoring(Element):
         tag_name = 'Tailoring' if xml_element is None else None
         self.id = id
 
-        super(Tailoring, self).__init__(xml_element, tag_name=tag_name)
+        super(Tailoring, self).__init__(xml_element, tag_name=tag_name,
+                                        strict=strict, errors=errors,
+                                        trusted=trusted)
 
         if (not hasattr(self, 'id')
                 or self.id == ''
                 or self.id is None):
-            raise RequiredAttributeException('id attribute required')
-
-        if re.match(r'xccdf_(\w+)_tailoring_(\w+)', self.id) is None:
-            raise InvalidValueException('id invalid format')
+            error_msg = 'id attribute required'
+            self.handle_error(RequiredAttributeException(error_msg))
+        elif (not self.trusted
+              and re.match(r'xccdf_(\w+)_tailoring_(\w+)', self.id) is None):
+            self.handle_error(InvalidValueException('id invalid format'))
 
         if xml_element is not None:
             self.children = self.load_children()
@@ -98,22 +107,24 @@ class Tailoring(Element):
             uri, tag = Element.get_namespace_and_tag(element.tag)
             if tag == 'version':
                 if version is None:
-                    version = TailoringVersion(element)
-                else:
+                    version = self.load_child(TailoringVersion, element)
+                elif not self.trusted:
                     error_msg = 'version element found more than once'
-                    raise CardinalityException(error_msg)
+                    self.handle_error(CardinalityException(error_msg),
+                                      element)
             elif tag == 'status':
-                statuses.append(Status(element))
+                statuses.append(self.load_child(Status, element))
             elif tag == 'Profile':
-                profiles.append(Profile(element))
+                profiles.append(self.load_child(Profile, element))
 
         # Element validation
-        if version is None:
-            error_msg = 'version element is required'
-            raise CardinalityException(error_msg)
-        if len(profiles) <= 0:
-            error_msg = 'Profile element is required at least once'
-            raise CardinalityException(error_msg)
+        if not self.trusted:
+            if version is None:
+                error_msg = 'version element is required'
+                self.handle_error(CardinalityException(error_msg))
+            if len(profiles) <= 0:
+                error_msg = 'Profile element is required at least once'
+                self.handle_error(CardinalityException(error_msg))
 
         # List construction
         children.extend(statuses)
@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+
+"""
+xccdf.models.target_facts includes the class TargetFacts
+to create or import a <xccdf:target-facts> element.
+
+Also includes the class Fact to create or import
+the <xccdf:fact> elements of the target facts.
+
+This module is part of the xccdf library.
+
+Author: Rodrigo Núñez <rnunezmujica@icloud.com>
+"""
+
+# lxml
+from lxml import etree
+
+# XCCDF
+from xccdf.models.element import Element
+from xccdf.exceptions import RequiredAttributeException
+from xccdf.constants import NSMAP
+
+
+class Fact(Element):
+
+    """
+    Class to implement <xccdf:fact> element.
+    """
+
+    def __init__(self, xml_element=None, name=None, value=None,
+                 strict=True, errors=None, trusted=False):
+        """
+        Initializes the attrs attribute to serialize the attributes.
+
+        :param lxml.etree._Element xml_element: XML element to load.
+        :param str name: URI of the fact.
+        :param str value: Value of the fact.
+        :param bool strict: If False, validation errors are collected
+                            instead of raised.
+        :param list errors: List where validation errors are collected.
+        :param bool trusted: If True, the value and cardinality checks
+                             are skipped, for already validated documents.
+        :raises ValueError: If no parameter is given.
+        :raises RequiredAttributeException: If after importing the xml_element
+                                            the name attribute is missing.
+        """
+
+        if xml_element is None and name is None:
+            raise ValueError('either xml_element or name are required')
+
+        tag_name = 'fact' if xml_element is None else None
+        self.name_uri = name
+        self.text = value
+
+        super(Fact, self).__init__(xml_element, tag_name,
+                                   strict, errors, trusted)
+
+        if self.name_uri == '' or self.name_uri is None:
+            error_msg = 'name attribute required'
+            self.handle_error(RequiredAttributeException(error_msg))
+
+    def __str__(self):
+        """
+        String representation of Fact object.
+
+        :returns: Fact object as a string.
+        :rtype: str
+        """
+
+        string_value = 'fact {name} {value}'.format(name=self.name_uri,
+                                                    value=self.text)
+        return string_value
+
+    def load_xml_attrs(self):
+        """
+        Load XML attributes as object attributes,
+        except the name attribute, loaded as name_uri.
+
+        :returns: List of parsed attributes.
+        :rtype: list
+        """
+
+        # The name attribute collides with the tag name of the element
+        tag_name = self.name
+        attrs = super(Fact, self).load_xml_attrs()
+
+        if 'name' in attrs:
+            self.name_uri = self.name
+            attrs[attrs.index('name')] = 'name_uri'
+        self.name = tag_name
+
+        return attrs
+
+    def update_xml_element(self):
+        """
+        Updates the xml element contents to matches the instance contents.
+
+        :returns: Updated XML element.
+        :rtype: lxml.etree._Element
+        """
+
+        if not hasattr(self, 'xml_element'):
+            self.xml_element = etree.Element(self.name, nsmap=NSMAP)
+
+        self.xml_element.set('name', self.name_uri)
+        if hasattr(self, 'type'):
+            self.xml_element.set('type', self.type)
+        self.xml_element.text = self.text
+
+        return self.xml_element
+
+
+class TargetFacts(Element):
+
+    """
+    Class to implement <xccdf:target-facts> element.
+    """
+
+    def __init__(self, xml_element=None,
+                 strict=True, errors=None, trusted=False):
+        """
+        Initializes the attrs attribute to serialize the attributes.
+
+        :param lxml.etree._Element xml_element: XML element to load.
+        :param bool strict: If False, validation errors are collected
+                            instead of raised.
+        :param list errors: List where validation errors are collected.
+        :param bool trusted: If True, the value and cardinality checks
+                             are skipped, for already validated documents.
+        """
+
+        tag_name = 'target-facts' if xml_element is None else None
+
+        super(TargetFacts, self).__init__(xml_element, tag_name,
+                                          strict, errors, trusted)
+
+        if xml_element is not None:
+            self.children = self.load_children()
+        else:
+            self.children = list()
+
+    def __str__(self):
+        """
+        String representation of TargetFacts object.
+
+        :returns: TargetFacts object as a string.
+        :rtype: str
+        """
+
+        string_value = 'target-facts ({facts} facts)'.format(
+            facts=len(self.children))
+        return string_value
+
+    def load_children(self):
+        """
+        Load the subelements from the xml_element in its correspondent classes.
+
+        :returns: List of child objects.
+        :rtype: list
+        """
+
+        children = list()
+
+        for element in self.xml_element:
+            uri, tag = Element.get_namespace_and_tag(element.tag)
+            if tag == 'fact':
+                children.append(self.load_child(Fact, element))
+
+        return children
+
+    def get_facts(self):
+        """
+        Returns the facts as a dictionary. If a fact is repeated,
+        the last value is kept.
+
+        :returns: Fact values by name.
+        :rtype: dict
+        """
+
+        return dict((fact.name_uri, fact.text) for fact in self.children)
+
+    def as_dict(self):
+        """
+        Serializes the object necessary data in a dictionary.
+
+        :returns: Serialized data in a dictionary.
+        :rtype: dict
+        """
+
+        result_dict = super(TargetFacts, self).as_dict()
+
+        facts = [child.as_dict() for child in self.children]
+        if len(facts) > 0:
+            result_dict['facts'] = facts
+
+        return result_dict
+
+    def update_xml_element(self):
+        """
+        Updates the xml element contents to matches the instance contents.
+
+        :returns: Updated XML element.
+        :rtype: lxml.etree._Element
+        """
+
+        if not hasattr(self, 'xml_element'):
+            self.xml_element = etree.Element(self.name, nsmap=NSMAP)
+
+        self.xml_element.clear()
+
+        for child in self.children:
+            child.update_xml_element()
+            self.xml_element.append(child.xml_element)
+
+        return self.xml_element
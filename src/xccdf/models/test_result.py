@@ -0,0 +1,254 @@
+# -*- coding: utf-8 -*-
+
+"""
+xccdf.models.test_result includes the class TestResult
+to create or import a <xccdf:TestResult> element.
+
+This module is part of the xccdf library.
+
+Author: Rodrigo Núñez <rnunezmujica@icloud.com>
+"""
+
+# lxml
+from lxml import etree
+
+# XCCDF
+from xccdf.models.element import Element
+from xccdf.models.title import Title
+from xccdf.models.platform import Platform
+from xccdf.models.target_facts import TargetFacts
+from xccdf.models.rule_result import RuleResult
+from xccdf.models.score import Score
+from xccdf.constants import NSMAP
+from xccdf.exceptions import RequiredAttributeException
+from xccdf.exceptions import CardinalityException
+
+
+class TestResult(Element):
+
+    """
+    Class to implement <xccdf:TestResult> element.
+    """
+
+    def __init__(self, xml_element=None, id=None,
+                 strict=True, errors=None, trusted=False):
+        """
+        Initializes the attrs attribute to serialize the attributes.
+
+        :param lxml.etree._Element xml_element: XML element to load.
+        :param str id: Unique ID of the TestResult.
+                       If xml_element is present, this parameter is ignored.
+        :param bool strict: If False, validation errors are collected
+                            instead of raised.
+        :param list errors: List where validation errors are collected.
+        :param bool trusted: If True, the value and cardinality checks
+                             are skipped, for already validated documents.
+        :raises ValueError: If no parameter is given.
+        :raises RequiredAttributeException: If after importing the xml_element
+                                            the id attribute is missing.
+        """
+
+        if xml_element is None and id is None:
+            raise ValueError('either xml_element or id are required')
+
+        self.id = id
+        self.targets = list()
+        tag_name = 'TestResult' if xml_element is None else None
+        super(TestResult, self).__init__(xml_element, tag_name,
+                                         strict, errors, trusted)
+
+        if (not hasattr(self, 'id')
+                or self.id == ''
+                or self.id is None):
+            error_msg = 'id attribute required'
+            self.handle_error(RequiredAttributeException(error_msg))
+
+        if xml_element is not None:
+            self.children = self.load_children()
+        else:
+            self.children = list()
+
+    def __str__(self):
+        """
+        String representation of TestResult object.
+
+        :returns: TestResult object as a string.
+        :rtype: str
+        """
+
+        string_value = 'TestResult {id}'.format(id=self.id)
+        return string_value
+
+    def load_children(self):
+        """
+        Load the subelements from the xml_element in its correspondent classes.
+
+        The target names, the benchmark reference and the profile reference
+        are loaded in the targets, benchmark_href and profile_idref
+        attributes.
+
+        :returns: List of child objects.
+        :rtype: list
+        :raises CardinalityException: If there is no target child.
+        :raises CardinalityException: If there is no score child.
+        """
+
+        # Containers
+        children = list()
+        titles = list()
+        target_facts = list()
+        platforms = list()
+        rule_results = list()
+        scores = list()
+
+        # Element load
+        for element in self.xml_element:
+            uri, tag = Element.get_namespace_and_tag(element.tag)
+            if tag == 'benchmark':
+                self.benchmark_href = element.get('href')
+            elif tag == 'title':
+                titles.append(self.load_child(Title, element))
+            elif tag == 'profile':
+                self.profile_idref = element.get('idref')
+            elif tag == 'target':
+                self.targets.append(element.text)
+            elif tag == 'target-facts':
+                target_facts.append(self.load_child(TargetFacts, element))
+            elif tag == 'platform':
+                platforms.append(self.load_child(Platform, element))
+            elif tag == 'rule-result':
+                rule_results.append(self.load_child(RuleResult, element))
+            elif tag == 'score':
+                scores.append(self.load_child(Score, element))
+
+        # Element validation
+        if not self.trusted:
+            if len(self.targets) <= 0:
+                error_msg = 'target element is required at least once'
+                self.handle_error(CardinalityException(error_msg))
+            if len(scores) <= 0:
+                error_msg = 'score element is required at least once'
+                self.handle_error(CardinalityException(error_msg))
+
+        # List construction
+        children.extend(titles)
+        children.extend(target_facts)
+        children.extend(platforms)
+        children.extend(rule_results)
+        children.extend(scores)
+
+        return children
+
+    def get_rule_results(self):
+        """
+        Returns the rule results of the TestResult.
+
+        :returns: List of RuleResult objects.
+        :rtype: list
+        """
+
+        return [child for child in self.children
+                if isinstance(child, RuleResult)]
+
+    def get_scores(self):
+        """
+        Returns the scores of the TestResult by scoring model.
+
+        :returns: Score values by scoring model URI.
+        :rtype: dict
+        """
+
+        return dict((child.get_system(), child.get_score())
+                    for child in self.children if isinstance(child, Score))
+
+    def as_dict(self):
+        """
+        Serializes the object necessary data in a dictionary.
+
+        :returns: Serialized data in a dictionary.
+        :rtype: dict
+        """
+
+        result_dict = super(TestResult, self).as_dict()
+
+        titles = list()
+        target_facts = None
+        platforms = list()
+        rule_results = list()
+        scores = list()
+
+        for child in self.children:
+            if isinstance(child, Title):
+                titles.append(child.as_dict())
+            elif isinstance(child, TargetFacts):
+                target_facts = child.as_dict()
+            elif isinstance(child, Platform):
+                platforms.append(child.as_dict())
+            elif isinstance(child, RuleResult):
+                rule_results.append(child.as_dict())
+            elif isinstance(child, Score):
+                scores.append(child.as_dict())
+
+        if hasattr(self, 'benchmark_href'):
+            result_dict['benchmark_href'] = self.benchmark_href
+        if hasattr(self, 'profile_idref'):
+            result_dict['profile_idref'] = self.profile_idref
+        if len(self.targets) > 0:
+            result_dict['targets'] = self.targets
+        if len(titles) > 0:
+            result_dict['titles'] = titles
+        if target_facts is not None:
+            result_dict['target_facts'] = target_facts
+        if len(platforms) > 0:
+            result_dict['platforms'] = platforms
+        if len(rule_results) > 0:
+            result_dict['rule_results'] = rule_results
+        if len(scores) > 0:
+            result_dict['scores'] = scores
+
+        return result_dict
+
+    def update_xml_element(self):
+        """
+        Updates the xml element contents to matches the instance contents.
+
+        :returns: Updated XML element.
+        :rtype: lxml.etree._Element
+        """
+
+        if not hasattr(self, 'xml_element'):
+            self.xml_element = etree.Element(self.name, nsmap=NSMAP)
+
+        self.xml_element.clear()
+
+        if hasattr(self, 'start_time'):
+            self.xml_element.set('start-time', self.start_time)
+        if hasattr(self, 'end_time'):
+            self.xml_element.set('end-time', self.end_time)
+        if hasattr(self, 'test_system'):
+            self.xml_element.set('test-system', self.test_system)
+        if hasattr(self, 'version'):
+            self.xml_element.set('version', self.version)
+        self.xml_element.set('id', self.id)
+
+        if hasattr(self, 'benchmark_href'):
+            benchmark = etree.SubElement(self.xml_element, 'benchmark')
+            benchmark.set('href', self.benchmark_href)
+
+        for child in self.children:
+            if isinstance(child, Title):
+                child.update_xml_element()
+                self.xml_element.append(child.xml_element)
+
+        if hasattr(self, 'profile_idref'):
+            profile = etree.SubElement(self.xml_element, 'profile')
+            profile.set('idref', self.profile_idref)
+        for target in self.targets:
+            etree.SubElement(self.xml_element, 'target').text = target
+
+        for child in self.children:
+            if not isinstance(child, Title):
+                child.update_xml_element()
+                self.xml_element.append(child.xml_element)
+
+        return self.xml_element
@@ -17,6 +17,18 @@ from xccdf.models.tests import test_ident
 from xccdf.models.tests import test_rule
 from xccdf.models.tests import test_group
 from xccdf.models.tests import test_benchmark
+from xccdf.models.tests import test_score
+from xccdf.models.tests import test_target_facts
+from xccdf.models.tests import test_rule_result
+from xccdf.models.tests import test_test_result
+from xccdf.models.tests import test_value
+from xccdf.models.tests import test_refine_value
+from xccdf.models.tests import test_set_value
+from xccdf.models.tests import test_check_content_ref
+from xccdf.models.tests import test_check
+from xccdf.models.tests import test_complex_check
+from xccdf.models.tests import test_requires
+from xccdf.models.tests import test_conflicts
 
 
 def suite():
@@ -38,6 +50,18 @@ def suite():
     suite.addTests(test_rule.suite())
     suite.addTests(test_group.suite())
     suite.addTests(test_benchmark.suite())
+    suite.addTests(test_score.suite())
+    suite.addTests(test_target_facts.suite())
+    suite.addTests(test_rule_result.suite())
+    suite.addTests(test_test_result.suite())
+    suite.addTests(test_value.suite())
+    suite.addTests(test_refine_value.suite())
+    suite.addTests(test_set_value.suite())
+    suite.addTests(test_check_content_ref.suite())
+    suite.addTests(test_check.suite())
+    suite.addTests(test_complex_check.suite())
+    suite.addTests(test_requires.suite())
+    suite.addTests(test_conflicts.suite())
     return suite
 
 if __name__ == '__main__':
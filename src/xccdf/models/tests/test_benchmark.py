@@ -170,6 +170,20 @@ class BenchmarkTestCase(unittest.TestCase):
                                          error_msg):
                 self.create_benchmark_object('no_status')
 
+    def test_init_no_status_trusted(self):
+        """
+        Tests the class constructor with no status on a trusted load
+        """
+
+        xml_element = self.load_example_element('no_status')
+        xccdf_benchmark = Benchmark(xml_element, trusted=True)
+
+        self.assertTrue(xccdf_benchmark.trusted,
+                        'Benchmark must be trusted')
+        for child in xccdf_benchmark.children:
+            self.assertTrue(child.trusted,
+                            'Benchmark children must be trusted')
+
     def test_init_no_benchmarks_or_rules(self):
         """
         Tests the class constructor with no children benchmarks or rules
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+
+# Python stdlib
+import unittest
+import os
+import io
+import sys
+
+# lxml
+from lxml import etree
+
+# XCCDF
+from xccdf.models.check import Check
+from xccdf.exceptions import RequiredAttributeException
+
+
+class CheckTestCase(unittest.TestCase):
+
+    """
+    Test cases for Check class
+    """
+
+    def load_example_element(self, xml_file_type='ok'):
+        """
+        Helper method to load an XML element
+        """
+
+        file_name = 'example_xccdf_check_{type}.xml'.format(
+            type=xml_file_type)
+
+        xml_path = os.path.abspath(os.path.dirname(__file__))
+        xml_file = io.open(os.path.join(
+            xml_path,
+            'examples',
+            file_name))
+
+        xml_string = xml_file.read()
+        xml_file.close()
+
+        element_tree = etree.fromstring(xml_string.encode('utf-8'))
+
+        return element_tree[0]
+
+    def create_check_object(self, object_type='ok'):
+        """
+        Helper method to create the Check object
+
+        :returns: Check object
+        :rtype: xccdf.models.check.Check
+        """
+
+        xml_element = self.load_example_element(object_type)
+
+        return Check(xml_element)
+
+    def assert_raises_message(self, exception, error_msg, object_type):
+        """
+        Helper method to check the exception raised by the constructor
+        """
+
+        if sys.version_info[0] >= 3 and sys.version_info[1] >= 2:
+            with self.assertRaisesRegex(exception, error_msg):
+                self.create_check_object(object_type)
+        else:
+            with self.assertRaisesRegexp(exception, error_msg):
+                self.create_check_object(object_type)
+
+    def test_init_all_ok(self):
+        """
+        Tests the class constructor
+        """
+
+        xccdf_check = self.create_check_object('ok')
+
+        self.assertEqual(xccdf_check.name, 'check',
+                         'check tag name does not match')
+        self.assertEqual(xccdf_check.system,
+                         'http://oval.mitre.org/XMLSchema/oval-definitions-5',
+                         'check system does not match')
+        self.assertEqual([ref.href for ref in xccdf_check.get_content_refs()],
+                         ['test-oval.xml', 'test-oval-2.xml'],
+                         'check content references do not match')
+        self.assertEqual([(export.value_id, export.export_name)
+                          for export in xccdf_check.get_exports()],
+                         [('test-value', 'oval:test:var:1')],
+                         'check exports do not match')
+
+    def test_init_no_system(self):
+        """
+        Tests the class constructor without a system
+        """
+
+        self.assert_raises_message(RequiredAttributeException,
+                                   'system attribute required', 'no_system')
+
+    def test_print_object(self):
+        """
+        Tests the string representation of a Check object
+        """
+
+        xccdf_check = self.create_check_object('ok')
+
+        self.assertEqual(
+            str(xccdf_check),
+            'check http://oval.mitre.org/XMLSchema/oval-definitions-5',
+            'String representation does not match')
+
+    def test_method_as_dict(self):
+        """
+        Tests the as_dict method
+        """
+
+        xccdf_check = self.create_check_object('ok')
+
+        content_refs = xccdf_check.as_dict()['content_refs']
+
+        self.assertEqual(content_refs[0]['attrs']['name_ref'],
+                         'oval:test:def:1',
+                         'check content reference does not match')
+        exports = xccdf_check.as_dict()['exports']
+        self.assertEqual(exports[0]['attrs']['export_name'],
+                         'oval:test:var:1',
+                         'check export does not match')
+
+    def test_method_update_xml_element(self):
+        """
+        Tests the update_xml_element method
+        """
+
+        xccdf_check = self.create_check_object('ok')
+        xccdf_check.system = 'http://open-scap.org/page/SCE'
+
+        xml_element = xccdf_check.update_xml_element()
+        new_xccdf_check = Check(xml_element)
+
+        self.assertEqual(new_xccdf_check.system,
+                         'http://open-scap.org/page/SCE',
+                         'check system does not match')
+        self.assertEqual(len(new_xccdf_check.get_content_refs()), 2,
+                         'check content references do not match')
+        self.assertEqual(len(new_xccdf_check.get_exports()), 1,
+                         'check exports do not match')
+
+
+def suite():
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+    suite.addTest(loader.loadTestsFromTestCase(CheckTestCase))
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.TextTestRunner(verbosity=2).run(suite())
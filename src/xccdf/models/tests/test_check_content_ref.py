@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+
+# Python stdlib
+import unittest
+import os
+import io
+import sys
+
+# lxml
+from lxml import etree
+
+# XCCDF
+from xccdf.models.check_content_ref import CheckContentRef
+from xccdf.exceptions import RequiredAttributeException
+
+
+class CheckContentRefTestCase(unittest.TestCase):
+
+    """
+    Test cases for CheckContentRef class
+    """
+
+    def load_example_element(self, xml_file_type='ok'):
+        """
+        Helper method to load an XML element
+        """
+
+        file_name = 'example_xccdf_check_content_ref_{type}.xml'.format(
+            type=xml_file_type)
+
+        xml_path = os.path.abspath(os.path.dirname(__file__))
+        xml_file = io.open(os.path.join(
+            xml_path,
+            'examples',
+            file_name))
+
+        xml_string = xml_file.read()
+        xml_file.close()
+
+        element_tree = etree.fromstring(xml_string.encode('utf-8'))
+
+        return element_tree[0]
+
+    def create_check_content_ref_object(self, object_type='ok'):
+        """
+        Helper method to create the CheckContentRef object
+
+        :returns: CheckContentRef object
+        :rtype: xccdf.models.check_content_ref.CheckContentRef
+        """
+
+        xml_element = self.load_example_element(object_type)
+
+        return CheckContentRef(xml_element)
+
+    def assert_raises_message(self, exception, error_msg, object_type):
+        """
+        Helper method to check the exception raised by the constructor
+        """
+
+        if sys.version_info[0] >= 3 and sys.version_info[1] >= 2:
+            with self.assertRaisesRegex(exception, error_msg):
+                self.create_check_content_ref_object(object_type)
+        else:
+            with self.assertRaisesRegexp(exception, error_msg):
+                self.create_check_content_ref_object(object_type)
+
+    def test_init_all_ok(self):
+        """
+        Tests the class constructor
+        """
+
+        xccdf_content_ref = self.create_check_content_ref_object('ok')
+
+        self.assertEqual(xccdf_content_ref.name, 'check-content-ref',
+                         'check-content-ref tag name does not match')
+        self.assertEqual(xccdf_content_ref.href, 'test-oval.xml',
+                         'check-content-ref href does not match')
+        self.assertEqual(xccdf_content_ref.name_ref, 'oval:test:def:1',
+                         'check-content-ref name does not match')
+
+    def test_init_no_href(self):
+        """
+        Tests the class constructor without an href
+        """
+
+        self.assert_raises_message(RequiredAttributeException,
+                                   'href attribute required', 'no_href')
+
+    def test_print_object(self):
+        """
+        Tests the string representation of a CheckContentRef object
+        """
+
+        xccdf_content_ref = self.create_check_content_ref_object('ok')
+
+        self.assertEqual(str(xccdf_content_ref),
+                         'check-content-ref test-oval.xml oval:test:def:1',
+                         'String representation does not match')
+
+    def test_method_update_xml_element(self):
+        """
+        Tests the update_xml_element method
+        """
+
+        xccdf_content_ref = CheckContentRef(href='test-oval.xml',
+                                            name='oval:test:def:3')
+
+        xml_element = xccdf_content_ref.update_xml_element()
+
+        self.assertEqual(xml_element.get('href'), 'test-oval.xml',
+                         'XML href does not match')
+        self.assertEqual(xml_element.get('name'), 'oval:test:def:3',
+                         'XML name does not match')
+
+
+def suite():
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+    suite.addTest(loader.loadTestsFromTestCase(CheckContentRefTestCase))
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.TextTestRunner(verbosity=2).run(suite())
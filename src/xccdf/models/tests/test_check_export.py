@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+
+# Python stdlib
+import unittest
+import os
+import io
+import sys
+
+# lxml
+from lxml import etree
+
+# XCCDF
+from xccdf.models.check_export import CheckExport
+from xccdf.exceptions import RequiredAttributeException
+
+
+class CheckExportTestCase(unittest.TestCase):
+
+    """
+    Test cases for CheckExport class
+    """
+
+    def load_example_element(self, xml_file_type='ok'):
+        """
+        Helper method to load an XML element
+        """
+
+        file_name = 'example_xccdf_check_export_{type}.xml'.format(
+            type=xml_file_type)
+
+        xml_path = os.path.abspath(os.path.dirname(__file__))
+        xml_file = io.open(os.path.join(
+            xml_path,
+            'examples',
+            file_name))
+
+        xml_string = xml_file.read()
+        xml_file.close()
+
+        element_tree = etree.fromstring(xml_string.encode('utf-8'))
+
+        return element_tree[0]
+
+    def create_check_export_object(self, object_type='ok'):
+        """
+        Helper method to create the CheckExport object
+
+        :returns: CheckExport object
+        :rtype: xccdf.models.check_export.CheckExport
+        """
+
+        xml_element = self.load_example_element(object_type)
+
+        return CheckExport(xml_element)
+
+    def assert_raises_message(self, exception, error_msg, object_type):
+        """
+        Helper method to check the exception raised by the constructor
+        """
+
+        if sys.version_info[0] >= 3 and sys.version_info[1] >= 2:
+            with self.assertRaisesRegex(exception, error_msg):
+                self.create_check_export_object(object_type)
+        else:
+            with self.assertRaisesRegexp(exception, error_msg):
+                self.create_check_export_object(object_type)
+
+    def test_init_all_ok(self):
+        """
+        Tests the class constructor
+        """
+
+        xccdf_export = self.create_check_export_object('ok')
+
+        self.assertEqual(xccdf_export.name, 'check-export',
+                         'check-export tag name does not match')
+        self.assertEqual(xccdf_export.value_id, 'test-value',
+                         'check-export value-id does not match')
+        self.assertEqual(xccdf_export.export_name, 'oval:test:var:1',
+                         'check-export export-name does not match')
+
+    def test_init_no_export_name(self):
+        """
+        Tests the class constructor without an export-name
+        """
+
+        self.assert_raises_message(RequiredAttributeException,
+                                   'export-name attribute required',
+                                   'no_export_name')
+
+    def test_init_no_parameters(self):
+        """
+        Tests the class constructor without an export-name parameter
+        """
+
+        with self.assertRaises(ValueError):
+            CheckExport(value_id='test-value')
+
+    def test_print_object(self):
+        """
+        Tests the string representation of a CheckExport object
+        """
+
+        xccdf_export = self.create_check_export_object('ok')
+
+        self.assertEqual(str(xccdf_export),
+                         'check-export test-value as oval:test:var:1',
+                         'String representation does not match')
+
+    def test_method_update_xml_element(self):
+        """
+        Tests the update_xml_element method
+        """
+
+        xccdf_export = CheckExport(value_id='test-value',
+                                   export_name='oval:test:var:2')
+
+        xml_element = xccdf_export.update_xml_element()
+
+        self.assertEqual(xml_element.get('value-id'), 'test-value',
+                         'XML value-id does not match')
+        self.assertEqual(xml_element.get('export-name'), 'oval:test:var:2',
+                         'XML export-name does not match')
+
+
+def suite():
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+    suite.addTest(loader.loadTestsFromTestCase(CheckExportTestCase))
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.TextTestRunner(verbosity=2).run(suite())
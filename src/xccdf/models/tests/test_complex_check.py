@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+
+# Python stdlib
+import unittest
+import os
+import io
+import sys
+
+# lxml
+from lxml import etree
+
+# XCCDF
+from xccdf.models.complex_check import ComplexCheck
+from xccdf.exceptions import RequiredAttributeException
+from xccdf.exceptions import InvalidValueException
+
+
+class ComplexCheckTestCase(unittest.TestCase):
+
+    """
+    Test cases for ComplexCheck class
+    """
+
+    def load_example_element(self, xml_file_type='ok'):
+        """
+        Helper method to load an XML element
+        """
+
+        file_name = 'example_xccdf_complex_check_{type}.xml'.format(
+            type=xml_file_type)
+
+        xml_path = os.path.abspath(os.path.dirname(__file__))
+        xml_file = io.open(os.path.join(
+            xml_path,
+            'examples',
+            file_name))
+
+        xml_string = xml_file.read()
+        xml_file.close()
+
+        element_tree = etree.fromstring(xml_string.encode('utf-8'))
+
+        return element_tree[0]
+
+    def create_complex_check_object(self, object_type='ok'):
+        """
+        Helper method to create the ComplexCheck object
+
+        :returns: ComplexCheck object
+        :rtype: xccdf.models.complex_check.ComplexCheck
+        """
+
+        xml_element = self.load_example_element(object_type)
+
+        return ComplexCheck(xml_element)
+
+    def assert_raises_message(self, exception, error_msg, object_type):
+        """
+        Helper method to check the exception raised by the constructor
+        """
+
+        if sys.version_info[0] >= 3 and sys.version_info[1] >= 2:
+            with self.assertRaisesRegex(exception, error_msg):
+                self.create_complex_check_object(object_type)
+        else:
+            with self.assertRaisesRegexp(exception, error_msg):
+                self.create_complex_check_object(object_type)
+
+    def test_init_all_ok(self):
+        """
+        Tests the class constructor
+        """
+
+        xccdf_complex_check = self.create_complex_check_object('ok')
+
+        self.assertEqual(xccdf_complex_check.name, 'complex-check',
+                         'complex-check tag name does not match')
+        self.assertEqual(xccdf_complex_check.operator, 'AND',
+                         'complex-check operator does not match')
+        self.assertIsInstance(xccdf_complex_check.children[1], ComplexCheck,
+                              'Nested complex-check not loaded')
+
+    def test_init_no_operator(self):
+        """
+        Tests the class constructor without an operator
+        """
+
+        self.assert_raises_message(RequiredAttributeException,
+                                   'operator attribute required',
+                                   'no_operator')
+
+    def test_init_invalid_operator(self):
+        """
+        Tests the class constructor with an invalid operator
+        """
+
+        self.assert_raises_message(InvalidValueException,
+                                   'XOR is not valid', 'invalid_operator')
+
+    def test_print_object(self):
+        """
+        Tests the string representation of a ComplexCheck object
+        """
+
+        xccdf_complex_check = self.create_complex_check_object('ok')
+
+        self.assertEqual(str(xccdf_complex_check), 'complex-check AND',
+                         'String representation does not match')
+
+    def test_method_iter_checks(self):
+        """
+        Tests the iter_checks method
+        """
+
+        xccdf_complex_check = self.create_complex_check_object('ok')
+
+        systems = [check.system
+                   for check in xccdf_complex_check.iter_checks()]
+
+        self.assertEqual(len(systems), 3, 'Checks do not match')
+        self.assertEqual(systems[2], 'http://open-scap.org/page/SCE',
+                         'Nested check does not match')
+
+    def test_method_update_xml_element(self):
+        """
+        Tests the update_xml_element method
+        """
+
+        xccdf_complex_check = self.create_complex_check_object('ok')
+        xccdf_complex_check.operator = 'OR'
+
+        xml_element = xccdf_complex_check.update_xml_element()
+        new_xccdf_complex_check = ComplexCheck(xml_element)
+
+        self.assertEqual(new_xccdf_complex_check.operator, 'OR',
+                         'complex-check operator does not match')
+        self.assertEqual(len(list(new_xccdf_complex_check.iter_checks())), 3,
+                         'Checks do not match')
+
+
+def suite():
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+    suite.addTest(loader.loadTestsFromTestCase(ComplexCheckTestCase))
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.TextTestRunner(verbosity=2).run(suite())
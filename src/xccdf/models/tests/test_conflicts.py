@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+
+# Python stdlib
+import unittest
+import os
+import io
+import sys
+
+# lxml
+from lxml import etree
+
+# XCCDF
+from xccdf.models.conflicts import Conflicts
+from xccdf.exceptions import RequiredAttributeException
+
+
+class ConflictsTestCase(unittest.TestCase):
+
+    """
+    Test cases for Conflicts class
+    """
+
+    def load_example_element(self, xml_file_type='ok'):
+        """
+        Helper method to load an XML element
+        """
+
+        file_name = 'example_xccdf_conflicts_{type}.xml'.format(
+            type=xml_file_type)
+
+        xml_path = os.path.abspath(os.path.dirname(__file__))
+        xml_file = io.open(os.path.join(
+            xml_path,
+            'examples',
+            file_name))
+
+        xml_string = xml_file.read()
+        xml_file.close()
+
+        element_tree = etree.fromstring(xml_string.encode('utf-8'))
+
+        return element_tree[0]
+
+    def create_conflicts_object(self, object_type='ok'):
+        """
+        Helper method to create the Conflicts object
+
+        :returns: Conflicts object
+        :rtype: xccdf.models.conflicts.Conflicts
+        """
+
+        xml_element = self.load_example_element(object_type)
+
+        return Conflicts(xml_element)
+
+    def assert_raises_message(self, exception, error_msg, object_type):
+        """
+        Helper method to check the exception raised by the constructor
+        """
+
+        if sys.version_info[0] >= 3 and sys.version_info[1] >= 2:
+            with self.assertRaisesRegex(exception, error_msg):
+                self.create_conflicts_object(object_type)
+        else:
+            with self.assertRaisesRegexp(exception, error_msg):
+                self.create_conflicts_object(object_type)
+
+    def test_init_all_ok(self):
+        """
+        Tests the class constructor
+        """
+
+        xccdf_conflicts = self.create_conflicts_object('ok')
+
+        self.assertEqual(xccdf_conflicts.name, 'conflicts',
+                         'conflicts tag name does not match')
+        self.assertEqual(xccdf_conflicts.idref, 'test-rule-1',
+                         'conflicts idref does not match')
+
+    def test_init_no_idref(self):
+        """
+        Tests the class constructor without an idref
+        """
+
+        self.assert_raises_message(RequiredAttributeException,
+                                   'idref attribute required', 'no_idref')
+
+    def test_print_object(self):
+        """
+        Tests the string representation of a Conflicts object
+        """
+
+        xccdf_conflicts = self.create_conflicts_object('ok')
+
+        self.assertEqual(str(xccdf_conflicts), 'conflicts test-rule-1',
+                         'String representation does not match')
+
+    def test_method_update_xml_element(self):
+        """
+        Tests the update_xml_element method
+        """
+
+        xccdf_conflicts = Conflicts(idref='test-rule-3')
+
+        xml_element = xccdf_conflicts.update_xml_element()
+
+        self.assertEqual(xml_element.get('idref'), 'test-rule-3',
+                         'XML idref does not match')
+
+
+def suite():
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+    suite.addTest(loader.loadTestsFromTestCase(ConflictsTestCase))
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.TextTestRunner(verbosity=2).run(suite())
@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+
+# Python stdlib
+import unittest
+import os
+import io
+import sys
+
+# lxml
+from lxml import etree
+
+# XCCDF
+from xccdf.models.refine_value import RefineValue
+from xccdf.exceptions import RequiredAttributeException
+
+
+class RefineValueTestCase(unittest.TestCase):
+
+    """
+    Test cases for RefineValue class
+    """
+
+    def load_example_element(self, xml_file_type='ok'):
+        """
+        Helper method to load an XML element
+        """
+
+        file_name = 'example_xccdf_refine_value_{type}.xml'.format(
+            type=xml_file_type)
+
+        xml_path = os.path.abspath(os.path.dirname(__file__))
+        xml_file = io.open(os.path.join(
+            xml_path,
+            'examples',
+            file_name))
+
+        xml_string = xml_file.read()
+        xml_file.close()
+
+        element_tree = etree.fromstring(xml_string.encode('utf-8'))
+
+        return element_tree[0]
+
+    def create_refine_value_object(self, object_type='ok'):
+        """
+        Helper method to create the RefineValue object
+
+        :returns: RefineValue object
+        :rtype: xccdf.models.refine_value.RefineValue
+        """
+
+        xml_element = self.load_example_element(object_type)
+
+        return RefineValue(xml_element)
+
+    def assert_raises_message(self, exception, error_msg, object_type):
+        """
+        Helper method to check the exception raised by the constructor
+        """
+
+        if sys.version_info[0] >= 3 and sys.version_info[1] >= 2:
+            with self.assertRaisesRegex(exception, error_msg):
+                self.create_refine_value_object(object_type)
+        else:
+            with self.assertRaisesRegexp(exception, error_msg):
+                self.create_refine_value_object(object_type)
+
+    def test_init_all_ok(self):
+        """
+        Tests the class constructor
+        """
+
+        xccdf_refine_value = self.create_refine_value_object('ok')
+
+        self.assertEqual(xccdf_refine_value.name, 'refine-value',
+                         'refine-value tag name does not match')
+        self.assertEqual(xccdf_refine_value.idref, 'test-value-1',
+                         'refine-value idref does not match')
+        self.assertEqual(xccdf_refine_value.get_selector(), 'strict',
+                         'refine-value selector does not match')
+
+    def test_init_no_idref(self):
+        """
+        Tests the class constructor without an idref
+        """
+
+        self.assert_raises_message(RequiredAttributeException,
+                                   'idref attribute required', 'no_idref')
+
+    def test_init_no_xml_element(self):
+        """
+        Tests the class constructor from an empty instance
+        """
+
+        xccdf_refine_value = RefineValue(idref='test-value-1')
+
+        self.assertIsNone(xccdf_refine_value.get_selector(),
+                          'refine-value selector must be None')
+
+    def test_print_object(self):
+        """
+        Tests the string representation of a RefineValue object
+        """
+
+        xccdf_refine_value = self.create_refine_value_object('ok')
+
+        self.assertEqual(str(xccdf_refine_value),
+                         'refine-value test-value-1 strict',
+                         'String representation does not match')
+
+    def test_method_update_xml_element(self):
+        """
+        Tests the update_xml_element method
+        """
+
+        xccdf_refine_value = RefineValue(idref='test-value-1',
+                                         selector='relaxed')
+
+        xml_element = xccdf_refine_value.update_xml_element()
+
+        self.assertEqual(xml_element.get('idref'), 'test-value-1',
+                         'XML idref does not match')
+        self.assertEqual(xml_element.get('selector'), 'relaxed',
+                         'XML selector does not match')
+
+
+def suite():
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+    suite.addTest(loader.loadTestsFromTestCase(RefineValueTestCase))
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.TextTestRunner(verbosity=2).run(suite())
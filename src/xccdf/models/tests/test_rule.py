@@ -135,6 +135,33 @@ class RuleTestCase(unittest.TestCase):
                                          error_msg):
                 self.create_rule_object('duplicated_version')
 
+    def test_init_duplicated_complex_check(self):
+        """
+        Tests the class constructor with more than one complex-check
+        """
+
+        error_msg = 'complex-check element found more than once'
+        if sys.version_info[0] >= 3 and sys.version_info[1] >= 2:
+            with self.assertRaisesRegex(CardinalityException, error_msg):
+                self.create_rule_object('duplicated_complex_check')
+        else:
+            with self.assertRaisesRegexp(CardinalityException, error_msg):
+                self.create_rule_object('duplicated_complex_check')
+
+    def test_method_iter_checks(self):
+        """
+        Tests the iter_checks method
+        """
+
+        xccdf_rule = self.create_rule_object('checks')
+
+        hrefs = [check.get_content_refs()[0].href
+                 for check in xccdf_rule.iter_checks()]
+
+        self.assertEqual(hrefs, ['test-oval.xml', 'test-oval.xml',
+                                 'test-script.sh'],
+                         'Checks do not match')
+
     def test_print_object(self):
         """
         Tests the string representation of an Rule object
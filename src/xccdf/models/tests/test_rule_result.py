@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+
+# Python stdlib
+import unittest
+import os
+import io
+import sys
+
+# lxml
+from lxml import etree
+
+# XCCDF
+from xccdf.models.rule_result import RuleResult
+from xccdf.models.rule_result import Result
+from xccdf.exceptions import RequiredAttributeException
+from xccdf.exceptions import CardinalityException
+from xccdf.exceptions import InvalidValueException
+
+
+class RuleResultTestCase(unittest.TestCase):
+
+    """
+    Test cases for RuleResult class
+    """
+
+    def load_example_element(self, xml_file_type='ok'):
+        """
+        Helper method to load an XML element
+        """
+
+        file_name = 'example_xccdf_rule_result_{type}.xml'.format(
+            type=xml_file_type)
+
+        xml_path = os.path.abspath(os.path.dirname(__file__))
+        xml_file = io.open(os.path.join(
+            xml_path,
+            'examples',
+            file_name))
+
+        xml_string = xml_file.read()
+        xml_file.close()
+
+        element_tree = etree.fromstring(xml_string.encode('utf-8'))
+
+        return element_tree[0]
+
+    def create_rule_result_object(self, object_type='ok'):
+        """
+        Helper method to create the RuleResult object
+
+        :returns: RuleResult object
+        :rtype: xccdf.models.rule_result.RuleResult
+        """
+
+        xml_element = self.load_example_element(object_type)
+
+        return RuleResult(xml_element)
+
+    def assert_raises_message(self, exception, error_msg, object_type):
+        """
+        Helper method to check the exception raised by the constructor
+        """
+
+        if sys.version_info[0] >= 3 and sys.version_info[1] >= 2:
+            with self.assertRaisesRegex(exception, error_msg):
+                self.create_rule_result_object(object_type)
+        else:
+            with self.assertRaisesRegexp(exception, error_msg):
+                self.create_rule_result_object(object_type)
+
+    def test_init_all_ok(self):
+        """
+        Tests the class constructor
+        """
+
+        xccdf_rule_result = self.create_rule_result_object('ok')
+
+        self.assertEqual(xccdf_rule_result.name, 'rule-result',
+                         'rule-result tag name does not match')
+        self.assertEqual(xccdf_rule_result.idref, 'test-rule-1',
+                         'rule-result idref does not match')
+        self.assertEqual(xccdf_rule_result.get_result(), 'pass',
+                         'rule-result result does not match')
+
+    def test_init_no_idref(self):
+        """
+        Tests the class constructor without an idref
+        """
+
+        self.assert_raises_message(RequiredAttributeException,
+                                   'idref attribute required', 'no_idref')
+
+    def test_init_no_result(self):
+        """
+        Tests the class constructor without a result
+        """
+
+        self.assert_raises_message(CardinalityException,
+                                   'result element is required', 'no_result')
+
+    def test_init_duplicated_result(self):
+        """
+        Tests the class constructor with more than one result
+        """
+
+        self.assert_raises_message(CardinalityException,
+                                   'result element found more than once',
+                                   'duplicated_result')
+
+    def test_init_invalid_result(self):
+        """
+        Tests the class constructor with an invalid result
+        """
+
+        self.assert_raises_message(InvalidValueException,
+                                   'passed is not valid', 'invalid_result')
+
+    def test_init_invalid_result_trusted(self):
+        """
+        Tests the class constructor with an invalid result on a trusted load
+        """
+
+        xml_element = self.load_example_element('invalid_result')
+        xccdf_rule_result = RuleResult(xml_element, trusted=True)
+
+        self.assertEqual(xccdf_rule_result.get_result(), 'passed',
+                         'rule-result result does not match')
+
+    def test_init_no_xml_element(self):
+        """
+        Tests the class constructor from an empty instance
+        """
+
+        xccdf_rule_result = RuleResult(idref='test-rule-1')
+
+        self.assertEqual(xccdf_rule_result.children, list(),
+                         'rule-result children list must be empty')
+        self.assertIsNone(xccdf_rule_result.get_result(),
+                          'rule-result result must be None')
+
+    def test_print_object(self):
+        """
+        Tests the string representation of a RuleResult object
+        """
+
+        xccdf_rule_result = self.create_rule_result_object('ok')
+
+        self.assertEqual(str(xccdf_rule_result),
+                         'rule-result test-rule-1 pass',
+                         'String representation does not match')
+
+    def test_method_as_dict(self):
+        """
+        Tests the as_dict method
+        """
+
+        xccdf_rule_result = self.create_rule_result_object('ok')
+
+        result_dict = xccdf_rule_result.as_dict()
+
+        self.assertEqual(result_dict['result']['text'], 'pass',
+                         'Result text does not match')
+        self.assertEqual(len(result_dict['idents']), 1,
+                         'Idents do not match')
+        self.assertEqual(result_dict['attrs']['severity'], 'high',
+                         'Severity does not match')
+
+    def test_method_update_xml_element(self):
+        """
+        Tests the update_xml_element method
+        """
+
+        xccdf_rule_result = RuleResult(idref='test-rule-1')
+        xccdf_rule_result.children.append(Result(result='fail'))
+
+        xml_element = xccdf_rule_result.update_xml_element()
+        new_xccdf_rule_result = RuleResult(xml_element)
+
+        self.assertEqual(new_xccdf_rule_result.get_result(), 'fail',
+                         'rule-result result does not match')
+
+
+def suite():
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+    suite.addTest(loader.loadTestsFromTestCase(RuleResultTestCase))
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.TextTestRunner(verbosity=2).run(suite())
@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+
+# Python stdlib
+import unittest
+import os
+import io
+import sys
+
+# lxml
+from lxml import etree
+
+# XCCDF
+from xccdf.models.score import Score
+from xccdf.models.score import DEFAULT_SCORING_SYSTEM
+from xccdf.exceptions import InvalidValueException
+
+
+class ScoreTestCase(unittest.TestCase):
+
+    """
+    Test cases for Score class
+    """
+
+    def load_example_element(self, xml_file_type='ok'):
+        """
+        Helper method to load an XML element
+        """
+
+        file_name = 'example_xccdf_score_{type}.xml'.format(
+            type=xml_file_type)
+
+        xml_path = os.path.abspath(os.path.dirname(__file__))
+        xml_file = io.open(os.path.join(
+            xml_path,
+            'examples',
+            file_name))
+
+        xml_string = xml_file.read()
+        xml_file.close()
+
+        element_tree = etree.fromstring(xml_string.encode('utf-8'))
+
+        return element_tree[0]
+
+    def create_score_object(self, object_type='ok'):
+        """
+        Helper method to create the Score object
+
+        :returns: Score object
+        :rtype: xccdf.models.score.Score
+        """
+
+        xml_element = self.load_example_element(object_type)
+
+        return Score(xml_element)
+
+    def assert_raises_message(self, exception, error_msg, object_type):
+        """
+        Helper method to check the exception raised by the constructor
+        """
+
+        if sys.version_info[0] >= 3 and sys.version_info[1] >= 2:
+            with self.assertRaisesRegex(exception, error_msg):
+                self.create_score_object(object_type)
+        else:
+            with self.assertRaisesRegexp(exception, error_msg):
+                self.create_score_object(object_type)
+
+    def test_init_all_ok(self):
+        """
+        Tests the class constructor
+        """
+
+        xccdf_score = self.create_score_object('ok')
+
+        self.assertEqual(xccdf_score.name, 'score',
+                         'score tag name does not match')
+        self.assertEqual(xccdf_score.get_score(), 2.0,
+                         'score value does not match')
+        self.assertEqual(xccdf_score.get_system(), 'urn:xccdf:scoring:flat',
+                         'score system does not match')
+
+    def test_init_no_system(self):
+        """
+        Tests the class constructor without a system
+        """
+
+        xccdf_score = self.create_score_object('no_system')
+
+        self.assertEqual(xccdf_score.get_system(), DEFAULT_SCORING_SYSTEM,
+                         'score system must be the default one')
+
+    def test_init_invalid(self):
+        """
+        Tests the class constructor with an invalid score
+        """
+
+        self.assert_raises_message(InvalidValueException,
+                                   'high is not a valid score', 'invalid')
+
+    def test_init_no_xml_element(self):
+        """
+        Tests the class constructor from an empty instance
+        """
+
+        xccdf_score = Score(score=75.5)
+
+        self.assertEqual(xccdf_score.name, 'score',
+                         'score tag name does not match')
+        self.assertEqual(xccdf_score.get_score(), 75.5,
+                         'score value does not match')
+
+    def test_init_with_empty_instance(self):
+        """
+        Tests the class constructor from an empty instance
+        """
+
+        with self.assertRaises(ValueError):
+            Score()
+
+    def test_print_object(self):
+        """
+        Tests the string representation of a Score object
+        """
+
+        xccdf_score = self.create_score_object('ok')
+
+        self.assertEqual(str(xccdf_score), 'score 2 (urn:xccdf:scoring:flat)',
+                         'String representation does not match')
+
+    def test_method_to_xml_string(self):
+        """
+        Tests the to_xml_string method
+        """
+
+        xccdf_score = Score(score=50, system='urn:xccdf:scoring:absolute')
+
+        xml_content = xccdf_score.to_xml_string()
+        new_xccdf_score = Score(etree.fromstring(xml_content.encode('utf-8')))
+
+        self.assertEqual(new_xccdf_score.get_score(), 50.0,
+                         'Score value does not match')
+        self.assertEqual(new_xccdf_score.get_system(),
+                         'urn:xccdf:scoring:absolute',
+                         'Score system does not match')
+
+
+def suite():
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+    suite.addTest(loader.loadTestsFromTestCase(ScoreTestCase))
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.TextTestRunner(verbosity=2).run(suite())
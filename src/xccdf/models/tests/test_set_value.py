@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+
+# Python stdlib
+import unittest
+import os
+import io
+import sys
+
+# lxml
+from lxml import etree
+
+# XCCDF
+from xccdf.models.set_value import SetValue
+from xccdf.exceptions import RequiredAttributeException
+
+
+class SetValueTestCase(unittest.TestCase):
+
+    """
+    Test cases for SetValue class
+    """
+
+    def load_example_element(self, xml_file_type='ok'):
+        """
+        Helper method to load an XML element
+        """
+
+        file_name = 'example_xccdf_set_value_{type}.xml'.format(
+            type=xml_file_type)
+
+        xml_path = os.path.abspath(os.path.dirname(__file__))
+        xml_file = io.open(os.path.join(
+            xml_path,
+            'examples',
+            file_name))
+
+        xml_string = xml_file.read()
+        xml_file.close()
+
+        element_tree = etree.fromstring(xml_string.encode('utf-8'))
+
+        return element_tree[0]
+
+    def create_set_value_object(self, object_type='ok'):
+        """
+        Helper method to create the SetValue object
+
+        :returns: SetValue object
+        :rtype: xccdf.models.set_value.SetValue
+        """
+
+        xml_element = self.load_example_element(object_type)
+
+        return SetValue(xml_element)
+
+    def assert_raises_message(self, exception, error_msg, object_type):
+        """
+        Helper method to check the exception raised by the constructor
+        """
+
+        if sys.version_info[0] >= 3 and sys.version_info[1] >= 2:
+            with self.assertRaisesRegex(exception, error_msg):
+                self.create_set_value_object(object_type)
+        else:
+            with self.assertRaisesRegexp(exception, error_msg):
+                self.create_set_value_object(object_type)
+
+    def test_init_all_ok(self):
+        """
+        Tests the class constructor
+        """
+
+        xccdf_set_value = self.create_set_value_object('ok')
+
+        self.assertEqual(xccdf_set_value.name, 'set-value',
+                         'set-value tag name does not match')
+        self.assertEqual(xccdf_set_value.idref, 'test-value-1',
+                         'set-value idref does not match')
+        self.assertEqual(xccdf_set_value.text, '20',
+                         'set-value value does not match')
+
+    def test_init_no_idref(self):
+        """
+        Tests the class constructor without an idref
+        """
+
+        self.assert_raises_message(RequiredAttributeException,
+                                   'idref attribute required', 'no_idref')
+
+    def test_print_object(self):
+        """
+        Tests the string representation of a SetValue object
+        """
+
+        xccdf_set_value = self.create_set_value_object('ok')
+
+        self.assertEqual(str(xccdf_set_value), 'set-value test-value-1 20',
+                         'String representation does not match')
+
+    def test_method_update_xml_element(self):
+        """
+        Tests the update_xml_element method
+        """
+
+        xccdf_set_value = SetValue(idref='test-value-1', value='24')
+
+        xml_element = xccdf_set_value.update_xml_element()
+
+        self.assertEqual(xml_element.get('idref'), 'test-value-1',
+                         'XML idref does not match')
+        self.assertEqual(xml_element.text, '24',
+                         'XML value does not match')
+
+
+def suite():
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+    suite.addTest(loader.loadTestsFromTestCase(SetValueTestCase))
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.TextTestRunner(verbosity=2).run(suite())
@@ -84,6 +84,17 @@ class StatusTestCase(unittest.TestCase):
                                          error_msg):
                 Status(xml_element)
 
+    def test_init_wrong_state_trusted(self):
+        """
+        Tests the class constructor with a wrong state on a trusted load
+        """
+
+        xml_element = self.load_example_element('ko')
+        xccdf_status = Status(xml_element, trusted=True)
+
+        self.assertEqual(xccdf_status.text, 'not a valid state',
+                         'Status state does not match')
+
     def test_init_no_date(self):
         """
         Tests the class constructor without a date
@@ -98,6 +98,17 @@ class ProfileTestCase(unittest.TestCase):
                                          error_msg):
                 self.create_tailoring_element('invalid_id')
 
+    def test_init_invalid_id_trusted(self):
+        """
+        Tests the class constructor with an invalid id on a trusted load
+        """
+
+        xml_element = self.load_example_element('invalid_id')
+        xccdf_tailoring = Tailoring(xml_element, trusted=True)
+
+        self.assertEqual(xccdf_tailoring.id, xml_element.attrib['id'],
+                         'Tailoring id does not match')
+
     def test_init_with_empty_instance(self):
         """
         Tests the class constructor with an empty instance
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+
+# Python stdlib
+import unittest
+import os
+import io
+import sys
+
+# lxml
+from lxml import etree
+
+# XCCDF
+from xccdf.models.target_facts import TargetFacts
+from xccdf.models.target_facts import Fact
+from xccdf.exceptions import RequiredAttributeException
+
+
+class TargetFactsTestCase(unittest.TestCase):
+
+    """
+    Test cases for TargetFacts class
+    """
+
+    def load_example_element(self, xml_file_type='ok'):
+        """
+        Helper method to load an XML element
+        """
+
+        file_name = 'example_xccdf_target_facts_{type}.xml'.format(
+            type=xml_file_type)
+
+        xml_path = os.path.abspath(os.path.dirname(__file__))
+        xml_file = io.open(os.path.join(
+            xml_path,
+            'examples',
+            file_name))
+
+        xml_string = xml_file.read()
+        xml_file.close()
+
+        element_tree = etree.fromstring(xml_string.encode('utf-8'))
+
+        return element_tree[0]
+
+    def create_target_facts_object(self, object_type='ok'):
+        """
+        Helper method to create the TargetFacts object
+
+        :returns: TargetFacts object
+        :rtype: xccdf.models.target_facts.TargetFacts
+        """
+
+        xml_element = self.load_example_element(object_type)
+
+        return TargetFacts(xml_element)
+
+    def assert_raises_message(self, exception, error_msg, object_type):
+        """
+        Helper method to check the exception raised by the constructor
+        """
+
+        if sys.version_info[0] >= 3 and sys.version_info[1] >= 2:
+            with self.assertRaisesRegex(exception, error_msg):
+                self.create_target_facts_object(object_type)
+        else:
+            with self.assertRaisesRegexp(exception, error_msg):
+                self.create_target_facts_object(object_type)
+
+    def test_init_all_ok(self):
+        """
+        Tests the class constructor
+        """
+
+        xccdf_target_facts = self.create_target_facts_object('ok')
+
+        self.assertEqual(xccdf_target_facts.name, 'target-facts',
+                         'target-facts tag name does not match')
+        self.assertEqual(len(xccdf_target_facts.children), 2,
+                         'target-facts must have two facts')
+        for fact in xccdf_target_facts.children:
+            self.assertEqual(fact.name, 'fact',
+                             'fact tag name does not match')
+
+    def test_init_no_name(self):
+        """
+        Tests the class constructor with a fact without name
+        """
+
+        self.assert_raises_message(RequiredAttributeException,
+                                   'name attribute required', 'no_name')
+
+    def test_method_get_facts(self):
+        """
+        Tests the get_facts method
+        """
+
+        xccdf_target_facts = self.create_target_facts_object('ok')
+
+        facts = xccdf_target_facts.get_facts()
+
+        self.assertEqual(
+            facts['urn:xccdf:fact:asset:identifier:ipv4'], '192.168.1.10',
+            'Fact value does not match')
+
+    def test_method_as_dict(self):
+        """
+        Tests the as_dict method
+        """
+
+        xccdf_target_facts = self.create_target_facts_object('ok')
+
+        facts = xccdf_target_facts.as_dict()['facts']
+
+        self.assertEqual(facts[0]['name'], 'fact',
+                         'Fact tag name does not match')
+        self.assertEqual(facts[0]['attrs']['name_uri'],
+                         'urn:xccdf:fact:asset:identifier:host_name',
+                         'Fact name does not match')
+
+    def test_method_update_xml_element_empty_instance(self):
+        """
+        Tests the update_xml_element method with an empty instance
+        """
+
+        xccdf_target_facts = TargetFacts()
+        xccdf_target_facts.children.append(
+            Fact(name='urn:xccdf:fact:asset:identifier:fqdn',
+                 value='host.example.com'))
+
+        xml_element = xccdf_target_facts.update_xml_element()
+
+        self.assertEqual(xml_element[0].get('name'),
+                         'urn:xccdf:fact:asset:identifier:fqdn',
+                         'XML fact name does not match')
+        self.assertEqual(xml_element[0].text, 'host.example.com',
+                         'XML fact value does not match')
+
+
+def suite():
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+    suite.addTest(loader.loadTestsFromTestCase(TargetFactsTestCase))
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.TextTestRunner(verbosity=2).run(suite())
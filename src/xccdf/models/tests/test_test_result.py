@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+
+# Python stdlib
+import unittest
+import os
+import io
+import sys
+
+# lxml
+from lxml import etree
+
+# XCCDF
+from xccdf.models.test_result import TestResult
+from xccdf.models.rule_result import RuleResult
+from xccdf.exceptions import RequiredAttributeException
+from xccdf.exceptions import CardinalityException
+
+
+class TestResultTestCase(unittest.TestCase):
+
+    """
+    Test cases for TestResult class
+    """
+
+    def load_example_element(self, xml_file_type='ok'):
+        """
+        Helper method to load an XML element
+        """
+
+        file_name = 'example_xccdf_test_result_{type}.xml'.format(
+            type=xml_file_type)
+
+        xml_path = os.path.abspath(os.path.dirname(__file__))
+        xml_file = io.open(os.path.join(
+            xml_path,
+            'examples',
+            file_name))
+
+        xml_string = xml_file.read()
+        xml_file.close()
+
+        element_tree = etree.fromstring(xml_string.encode('utf-8'))
+
+        return element_tree[0]
+
+    def create_test_result_object(self, object_type='ok'):
+        """
+        Helper method to create the TestResult object
+
+        :returns: TestResult object
+        :rtype: xccdf.models.test_result.TestResult
+        """
+
+        xml_element = self.load_example_element(object_type)
+
+        return TestResult(xml_element)
+
+    def assert_raises_message(self, exception, error_msg, object_type):
+        """
+        Helper method to check the exception raised by the constructor
+        """
+
+        if sys.version_info[0] >= 3 and sys.version_info[1] >= 2:
+            with self.assertRaisesRegex(exception, error_msg):
+                self.create_test_result_object(object_type)
+        else:
+            with self.assertRaisesRegexp(exception, error_msg):
+                self.create_test_result_object(object_type)
+
+    def test_init_all_ok(self):
+        """
+        Tests the class constructor
+        """
+
+        xccdf_test_result = self.create_test_result_object('ok')
+
+        self.assertEqual(xccdf_test_result.name, 'TestResult',
+                         'TestResult tag name does not match')
+        self.assertEqual(xccdf_test_result.targets, ['host.example.com'],
+                         'TestResult targets do not match')
+        self.assertEqual(xccdf_test_result.profile_idref, 'test-profile',
+                         'TestResult profile does not match')
+        self.assertEqual(xccdf_test_result.benchmark_href,
+                         'example_xccdf.xml',
+                         'TestResult benchmark does not match')
+
+    def test_init_no_id(self):
+        """
+        Tests the class constructor without an id
+        """
+
+        self.assert_raises_message(RequiredAttributeException,
+                                   'id attribute required', 'no_id')
+
+    def test_init_no_target(self):
+        """
+        Tests the class constructor without a target
+        """
+
+        self.assert_raises_message(CardinalityException,
+                                   'target element is required at least once',
+                                   'no_target')
+
+    def test_init_no_score(self):
+        """
+        Tests the class constructor without a score
+        """
+
+        self.assert_raises_message(CardinalityException,
+                                   'score element is required at least once',
+                                   'no_score')
+
+    def test_init_no_xml_element(self):
+        """
+        Tests the class constructor from an empty instance
+        """
+
+        id = 'xccdf_test_testresult_test'
+        xccdf_test_result = TestResult(id=id)
+
+        self.assertEqual(xccdf_test_result.id, id,
+                         'TestResult id does not match')
+        self.assertEqual(xccdf_test_result.children, list(),
+                         'TestResult children list must be empty')
+
+    def test_print_object(self):
+        """
+        Tests the string representation of a TestResult object
+        """
+
+        xccdf_test_result = self.create_test_result_object('ok')
+
+        self.assertEqual(str(xccdf_test_result),
+                         'TestResult xccdf_test_testresult_test',
+                         'String representation does not match')
+
+    def test_method_get_rule_results(self):
+        """
+        Tests the get_rule_results method
+        """
+
+        xccdf_test_result = self.create_test_result_object('ok')
+
+        rule_results = xccdf_test_result.get_rule_results()
+
+        self.assertEqual([r.idref for r in rule_results],
+                         ['test-rule-1', 'test-rule-2'],
+                         'Rule results do not match')
+        for rule_result in rule_results:
+            self.assertIsInstance(rule_result, RuleResult)
+
+    def test_method_get_scores(self):
+        """
+        Tests the get_scores method
+        """
+
+        xccdf_test_result = self.create_test_result_object('ok')
+
+        scores = xccdf_test_result.get_scores()
+
+        self.assertEqual(scores['urn:xccdf:scoring:flat'], 2.0,
+                         'Flat score does not match')
+
+    def test_method_as_dict(self):
+        """
+        Tests the as_dict method
+        """
+
+        xccdf_test_result = self.create_test_result_object('ok')
+
+        result_dict = xccdf_test_result.as_dict()
+
+        self.assertEqual(len(result_dict['rule_results']), 2,
+                         'Rule results do not match')
+        self.assertEqual(len(result_dict['scores']), 2,
+                         'Scores do not match')
+        self.assertEqual(result_dict['targets'], ['host.example.com'],
+                         'Targets do not match')
+
+    def test_method_update_xml_element(self):
+        """
+        Tests the update_xml_element method
+        """
+
+        xccdf_test_result = self.create_test_result_object('ok')
+        xccdf_test_result.targets.append('other.example.com')
+
+        xml_element = xccdf_test_result.update_xml_element()
+        new_xccdf_test_result = TestResult(xml_element)
+
+        self.assertEqual(new_xccdf_test_result.targets,
+                         ['host.example.com', 'other.example.com'],
+                         'TestResult targets do not match')
+        self.assertEqual(len(new_xccdf_test_result.get_rule_results()), 2,
+                         'Rule results do not match')
+
+
+def suite():
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+    suite.addTest(loader.loadTestsFromTestCase(TestResultTestCase))
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.TextTestRunner(verbosity=2).run(suite())
@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+
+# Python stdlib
+import unittest
+import os
+import io
+import sys
+
+# lxml
+from lxml import etree
+
+# XCCDF
+from xccdf.models.value import Value
+from xccdf.models.value import SelectorValue
+from xccdf.exceptions import RequiredAttributeException
+from xccdf.exceptions import CardinalityException
+from xccdf.exceptions import InvalidValueException
+
+
+class ValueTestCase(unittest.TestCase):
+
+    """
+    Test cases for Value class
+    """
+
+    def load_example_element(self, xml_file_type='ok'):
+        """
+        Helper method to load an XML element
+        """
+
+        file_name = 'example_xccdf_value_{type}.xml'.format(
+            type=xml_file_type)
+
+        xml_path = os.path.abspath(os.path.dirname(__file__))
+        xml_file = io.open(os.path.join(
+            xml_path,
+            'examples',
+            file_name))
+
+        xml_string = xml_file.read()
+        xml_file.close()
+
+        element_tree = etree.fromstring(xml_string.encode('utf-8'))
+
+        return element_tree[0]
+
+    def create_value_object(self, object_type='ok'):
+        """
+        Helper method to create the Value object
+
+        :returns: Value object
+        :rtype: xccdf.models.value.Value
+        """
+
+        xml_element = self.load_example_element(object_type)
+
+        return Value(xml_element)
+
+    def assert_raises_message(self, exception, error_msg, object_type):
+        """
+        Helper method to check the exception raised by the constructor
+        """
+
+        if sys.version_info[0] >= 3 and sys.version_info[1] >= 2:
+            with self.assertRaisesRegex(exception, error_msg):
+                self.create_value_object(object_type)
+        else:
+            with self.assertRaisesRegexp(exception, error_msg):
+                self.create_value_object(object_type)
+
+    def test_init_all_ok(self):
+        """
+        Tests the class constructor
+        """
+
+        xccdf_value = self.create_value_object('ok')
+
+        self.assertEqual(xccdf_value.name, 'Value',
+                         'Value tag name does not match')
+        self.assertEqual(xccdf_value.id, 'test-value-1',
+                         'Value id does not match')
+        self.assertEqual(xccdf_value.type, 'number',
+                         'Value type does not match')
+        self.assertEqual(len(xccdf_value.children), 7,
+                         'Value children do not match')
+
+    def test_init_no_id(self):
+        """
+        Tests the class constructor without an id
+        """
+
+        self.assert_raises_message(RequiredAttributeException,
+                                   'id attribute required', 'no_id')
+
+    def test_init_no_value(self):
+        """
+        Tests the class constructor without a value
+        """
+
+        self.assert_raises_message(CardinalityException,
+                                   'value element is required at least once',
+                                   'no_value')
+
+    def test_init_invalid_type(self):
+        """
+        Tests the class constructor with an invalid type
+        """
+
+        self.assert_raises_message(InvalidValueException,
+                                   'integer is not a valid type',
+                                   'invalid_type')
+
+    def test_init_invalid_type_trusted(self):
+        """
+        Tests the class constructor with an invalid type on a trusted load
+        """
+
+        xml_element = self.load_example_element('invalid_type')
+        xccdf_value = Value(xml_element, trusted=True)
+
+        self.assertEqual(xccdf_value.type, 'integer',
+                         'Value type does not match')
+
+    def test_init_no_xml_element(self):
+        """
+        Tests the class constructor from an empty instance
+        """
+
+        xccdf_value = Value(id='test-value-1')
+
+        self.assertEqual(xccdf_value.children, list(),
+                         'Value children list must be empty')
+        self.assertIsNone(xccdf_value.get_value(),
+                          'Value must be None')
+
+    def test_print_object(self):
+        """
+        Tests the string representation of a Value object
+        """
+
+        xccdf_value = self.create_value_object('ok')
+
+        self.assertEqual(str(xccdf_value), 'Value test-value-1',
+                         'String representation does not match')
+
+    def test_method_get_value(self):
+        """
+        Tests the get_value method
+        """
+
+        xccdf_value = self.create_value_object('ok')
+
+        self.assertEqual(xccdf_value.get_value(), '12',
+                         'Default value does not match')
+        self.assertEqual(xccdf_value.get_value('strict'), '16',
+                         'Selected value does not match')
+        self.assertEqual(xccdf_value.get_value('unknown'), '12',
+                         'Unknown selectors must return the default value')
+        self.assertEqual(xccdf_value.get_value(tag_name='lower-bound'), '6',
+                         'Lower bound does not match')
+
+    def test_method_as_dict(self):
+        """
+        Tests the as_dict method
+        """
+
+        xccdf_value = self.create_value_object('ok')
+
+        value_dict = xccdf_value.as_dict()
+
+        self.assertEqual(len(value_dict['values']), 5,
+                         'Values do not match')
+        self.assertEqual(value_dict['values'][1]['attrs']['selector'],
+                         'strict', 'Selector does not match')
+
+    def test_method_update_xml_element(self):
+        """
+        Tests the update_xml_element method
+        """
+
+        xccdf_value = Value(id='test-value-1')
+        xccdf_value.type = 'string'
+        xccdf_value.children.append(SelectorValue(tag_name='value',
+                                                  value='root'))
+        xccdf_value.children.append(SelectorValue(tag_name='value',
+                                                  value='admin',
+                                                  selector='admin'))
+
+        xml_element = xccdf_value.update_xml_element()
+        new_xccdf_value = Value(xml_element)
+
+        self.assertEqual(new_xccdf_value.type, 'string',
+                         'Value type does not match')
+        self.assertEqual(new_xccdf_value.get_value('admin'), 'admin',
+                         'Selected value does not match')
+
+
+def suite():
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+    suite.addTest(loader.loadTestsFromTestCase(ValueTestCase))
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.TextTestRunner(verbosity=2).run(suite())
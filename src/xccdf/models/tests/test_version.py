@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
 # Python stdlib
+from datetime import timezone
 import unittest
 import os
 import io
@@ -12,6 +13,7 @@ from lxml import etree
 # XCCDF
 from xccdf.models.version import Version, TailoringVersion
 from xccdf.exceptions import RequiredAttributeException
+from xccdf.exceptions import InvalidValueException
 
 
 class VersionTestCase(unittest.TestCase):
@@ -143,6 +145,59 @@ class VersionTestCase(unittest.TestCase):
                          xccdf_version.xml_element.attrib['time'],
                          'time_to_str timestamp string does not match')
 
+    def test_method_time_to_str_trusted(self):
+        """
+        Tests the time_to_str method on a trusted load
+        """
+
+        xml_element = self.load_example_element('ok')
+        xccdf_version = Version(xml_element, trusted=True)
+
+        self.assertEqual(xccdf_version.time, xml_element.attrib['time'],
+                         'Trusted load must not parse the time')
+        self.assertEqual(xccdf_version.time_to_str(),
+                         xml_element.attrib['time'],
+                         'time_to_str timestamp string does not match')
+
+    def test_method_str_to_time_timezone(self):
+        """
+        Tests the str_to_time method with a timezone
+        """
+
+        xml_element = self.load_example_element('ok')
+
+        for time_string, utc_time in (
+                ('2014-01-01T00:00:00Z', '2014-01-01 00:00:00'),
+                ('2014-01-01T06:05:05.5-05:30', '2014-01-01 11:35:05.500000')):
+            xml_element.set('time', time_string)
+            xccdf_version = Version(xml_element)
+
+            self.assertEqual(str(xccdf_version.time.astimezone(timezone.utc)
+                                 .replace(tzinfo=None)), utc_time,
+                             'Parsed time does not match')
+            self.assertEqual(xccdf_version.time_to_str(), time_string,
+                             'time_to_str timestamp string does not match')
+
+    def test_init_invalid_time(self):
+        """
+        Tests the class constructor with an invalid time attribute
+        """
+
+        xml_element = self.load_example_element('ok')
+        xml_element.set('time', 'yesterday')
+
+        with self.assertRaises(InvalidValueException):
+            Version(xml_element)
+
+        errors = list()
+        xccdf_version = Version(xml_element, strict=False, errors=errors)
+
+        self.assertEqual(len(errors), 1, 'Invalid time not reported')
+        self.assertEqual(errors[0].sourceline, xml_element.sourceline,
+                         'Error line does not match')
+        self.assertEqual(xccdf_version.time_to_str(), 'yesterday',
+                         'Invalid time not kept')
+
     def test_method_update_xml_element(self):
         """
         Tests the update_xml_element method
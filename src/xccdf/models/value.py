@@ -0,0 +1,310 @@
+# -*- coding: utf-8 -*-
+
+"""
+xccdf.models.value includes the class Value
+to create or import a <xccdf:Value> element.
+
+Also includes the class SelectorValue to create or import
+the <xccdf:value>, <xccdf:default>, <xccdf:lower-bound>
+and <xccdf:upper-bound> elements of the Value.
+
+This module is part of the xccdf library.
+
+Author: Rodrigo Núñez <rnunezmujica@icloud.com>
+"""
+
+# lxml
+from lxml import etree
+
+# XCCDF
+from xccdf.models.element import Element
+from xccdf.models.title import Title
+from xccdf.models.description import Description
+from xccdf.constants.value import VALUE_TYPE_CHOICES
+from xccdf.constants.value import VALUE_OPERATOR_CHOICES
+from xccdf.constants import NSMAP
+from xccdf.exceptions import RequiredAttributeException
+from xccdf.exceptions import CardinalityException
+from xccdf.exceptions import InvalidValueException
+
+#: Tag names of the selectable children of a Value
+SELECTOR_TAGS = ['value', 'default', 'lower-bound', 'upper-bound']
+
+
+class SelectorValue(Element):
+
+    """
+    Class to implement the selectable <xccdf:value>, <xccdf:default>,
+    <xccdf:lower-bound> and <xccdf:upper-bound> elements.
+    """
+
+    def __init__(self, xml_element=None, tag_name=None, value=None,
+                 selector=None, strict=True, errors=None, trusted=False):
+        """
+        Initializes the attrs attribute to serialize the attributes.
+
+        :param lxml.etree._Element xml_element: XML element to load.
+        :param str tag_name: Tag name of the element.
+        :param str value: Value string.
+        :param str selector: Selector of the value.
+        :param bool strict: If False, validation errors are collected
+                            instead of raised.
+        :param list errors: List where validation errors are collected.
+        :param bool trusted: If True, the value and cardinality checks
+                             are skipped, for already validated documents.
+        :raises ValueError: If no parameter is given.
+        """
+
+        self.text = '' if value is None else value
+        if selector is not None:
+            self.selector = selector
+
+        super(SelectorValue, self).__init__(xml_element, tag_name,
+                                            strict, errors, trusted)
+
+    def __str__(self):
+        """
+        String representation of SelectorValue object.
+
+        :returns: SelectorValue object as a string.
+        :rtype: str
+        """
+
+        string_value = '{tag} {value}'.format(tag=self.name, value=self.text)
+        if self.get_selector() is not None:
+            string_value += ' ({selector})'.format(
+                selector=self.get_selector())
+        return string_value
+
+    def get_selector(self):
+        """
+        Returns the selector of the value.
+
+        :returns: Selector of the value, None if it's the default one.
+        :rtype: str or NoneType
+        """
+
+        selector = getattr(self, 'selector', None)
+        if selector == '':
+            return None
+        return selector
+
+    def update_xml_element(self):
+        """
+        Updates the xml element contents to matches the instance contents.
+
+        :returns: Updated XML element.
+        :rtype: lxml.etree._Element
+        """
+
+        if not hasattr(self, 'xml_element'):
+            self.xml_element = etree.Element(self.name, nsmap=NSMAP)
+
+        if hasattr(self, 'selector'):
+            self.xml_element.set('selector', self.selector)
+        self.xml_element.text = self.text
+
+        return self.xml_element
+
+
+class Value(Element):
+
+    """
+    Class to implement <xccdf:Value> element.
+    """
+
+    def __init__(self, xml_element=None, id=None,
+                 strict=True, errors=None, trusted=False):
+        """
+        Initializes the attrs attribute to serialize the attributes.
+
+        :param lxml.etree._Element xml_element: XML element to load.
+        :param str id: Unique ID of the Value.
+                       If xml_element is present, this parameter is ignored.
+        :param bool strict: If False, validation errors are collected
+                            instead of raised.
+        :param list errors: List where validation errors are collected.
+        :param bool trusted: If True, the value and cardinality checks
+                             are skipped, for already validated documents.
+        :raises ValueError: If no parameter is given.
+        :raises RequiredAttributeException: If after importing the xml_element
+                                            the id attribute is missing.
+        :raises InvalidValueException: If the type or the operator
+                                       attributes have an invalid value.
+        """
+
+        if xml_element is None and id is None:
+            raise ValueError('either xml_element or id are required')
+
+        self.id = id
+        tag_name = 'Value' if xml_element is None else None
+        super(Value, self).__init__(xml_element, tag_name,
+                                    strict, errors, trusted)
+
+        if (not hasattr(self, 'id')
+                or self.id == ''
+                or self.id is None):
+            error_msg = 'id attribute required'
+            self.handle_error(RequiredAttributeException(error_msg))
+
+        if not self.trusted:
+            if (hasattr(self, 'type')
+                    and self.type not in VALUE_TYPE_CHOICES):
+                error_msg = '{val} is not a valid type. Must be one of '\
+                            'this: {choices}'.format(
+                                val=self.type,
+                                choices=repr(VALUE_TYPE_CHOICES))
+                self.handle_error(InvalidValueException(error_msg))
+            if (hasattr(self, 'operator')
+                    and self.operator not in VALUE_OPERATOR_CHOICES):
+                error_msg = '{val} is not a valid operator. Must be one of '\
+                            'this: {choices}'.format(
+                                val=self.operator,
+                                choices=repr(VALUE_OPERATOR_CHOICES))
+                self.handle_error(InvalidValueException(error_msg))
+
+        if xml_element is not None:
+            self.children = self.load_children()
+        else:
+            self.children = list()
+
+    def __str__(self):
+        """
+        String representation of Value object.
+
+        :returns: Value object as a string.
+        :rtype: str
+        """
+
+        string_value = 'Value {id}'.format(id=self.id)
+        return string_value
+
+    def load_children(self):
+        """
+        Load the subelements from the xml_element in its correspondent classes.
+
+        The choices, match and complex-value elements are not loaded.
+
+        :returns: List of child objects.
+        :rtype: list
+        :raises CardinalityException: If there is no value child.
+        """
+
+        # Containers
+        children = list()
+        titles = list()
+        descriptions = list()
+        values = list()
+        selector_values = list()
+
+        # Element load
+        for element in self.xml_element:
+            uri, tag = Element.get_namespace_and_tag(element.tag)
+            if tag == 'title':
+                titles.append(self.load_child(Title, element))
+            elif tag == 'description':
+                descriptions.append(self.load_child(Description, element))
+            elif tag == 'value':
+                values.append(self.load_child(SelectorValue, element))
+            elif tag in SELECTOR_TAGS:
+                selector_values.append(self.load_child(SelectorValue,
+                                                       element))
+
+        # Element validation
+        if not self.trusted:
+            if len(values) <= 0:
+                error_msg = 'value element is required at least once'
+                self.handle_error(CardinalityException(error_msg))
+
+        # List construction
+        children.extend(titles)
+        children.extend(descriptions)
+        children.extend(values)
+        children.extend(selector_values)
+
+        return children
+
+    def get_value(self, selector=None, tag_name='value'):
+        """
+        Returns the value string for a selector. If no value has the
+        selector, the value without selector is returned.
+
+        :param str selector: Selector of the value, None for the default one.
+        :param str tag_name: Tag name of the selectable children to search,
+                             like default or lower-bound.
+        :returns: Value string, None if there is no value for the selector.
+        :rtype: str or NoneType
+        """
+
+        default = None
+        for child in self.children:
+            if isinstance(child, SelectorValue) and child.name == tag_name:
+                child_selector = child.get_selector()
+                if child_selector == selector:
+                    return child.text
+                elif child_selector is None and default is None:
+                    default = child.text
+
+        return default
+
+    def as_dict(self):
+        """
+        Serializes the object necessary data in a dictionary.
+
+        :returns: Serialized data in a dictionary.
+        :rtype: dict
+        """
+
+        result_dict = super(Value, self).as_dict()
+
+        titles = list()
+        descriptions = list()
+        values = list()
+
+        for child in self.children:
+            if isinstance(child, Title):
+                titles.append(child.as_dict())
+            elif isinstance(child, Description):
+                descriptions.append(child.as_dict())
+            elif isinstance(child, SelectorValue):
+                values.append(child.as_dict())
+
+        if len(titles) > 0:
+            result_dict['titles'] = titles
+        if len(descriptions) > 0:
+            result_dict['descriptions'] = descriptions
+        if len(values) > 0:
+            result_dict['values'] = values
+
+        return result_dict
+
+    def update_xml_element(self):
+        """
+        Updates the xml element contents to matches the instance contents.
+
+        :returns: Updated XML element.
+        :rtype: lxml.etree._Element
+        """
+
+        if not hasattr(self, 'xml_element'):
+            self.xml_element = etree.Element(self.name, nsmap=NSMAP)
+
+        self.xml_element.clear()
+
+        if hasattr(self, 'type'):
+            self.xml_element.set('type', self.type)
+        if hasattr(self, 'operator'):
+            self.xml_element.set('operator', self.operator)
+        if hasattr(self, 'interactive'):
+            self.xml_element.set('interactive', self.interactive)
+        if hasattr(self, 'hidden'):
+            self.xml_element.set('hidden', self.hidden)
+        if hasattr(self, 'prohibitChanges'):
+            self.xml_element.set('prohibitChanges', self.prohibitChanges)
+        self.xml_element.set('id', self.id)
+
+        for child in self.children:
+            child.update_xml_element()
+            self.xml_element.append(child.xml_element)
+
+        return self.xml_element
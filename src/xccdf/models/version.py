@@ -14,6 +14,8 @@ Author: Rodrigo Núñez <rnunezmujica@icloud.com>
 
 # Python stdlib
 from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
 import re
 
 # lxml
@@ -22,8 +24,15 @@ from lxml import etree
 # XCCDF
 from xccdf.models.element import Element
 from xccdf.exceptions import RequiredAttributeException
+from xccdf.exceptions import InvalidValueException
 from xccdf.constants import NSMAP
 
+#: xs:dateTime format: date, time, optional fraction of seconds
+#: and optional timezone
+DATETIME_PATTERN = re.compile(
+    r'^(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})(\.\d+)?'
+    r'(Z|[+-]\d{2}:\d{2})?$')
+
 
 class Version(Element):
 
@@ -31,13 +40,21 @@ class Version(Element):
     Class to implement <xccdf:version> element.
     """
 
-    def __init__(self, xml_element=None, version=None):
+    def __init__(self, xml_element=None, version=None,
+                 strict=True, errors=None, trusted=False):
         """
         Initializes the Version class and loads its attributes.
 
         :param lxml.etree._Element xml_element: XML element to load.
         :param str version: Version string.
+        :param bool strict: If False, validation errors are collected
+                            instead of raised.
+        :param list errors: List where validation errors are collected.
+        :param bool trusted: If True, the value and cardinality checks
+                             are skipped, for already validated documents.
         :raises ValueError: If no parameter is given.
+        :raises InvalidValueException: If the time attribute is not
+                                       a valid xs:dateTime.
         """
 
         if xml_element is None and version is None:
@@ -46,10 +63,17 @@ class Version(Element):
         tag_name = 'version' if xml_element is None else None
         self.text = version
 
-        super(Version, self).__init__(xml_element, tag_name)
+        super(Version, self).__init__(xml_element, tag_name,
+                                      strict, errors, trusted)
 
-        if hasattr(self, 'time') and isinstance(self.time, str):
-            self.time = self.str_to_time()
+        if (not self.trusted
+                and hasattr(self, 'time') and isinstance(self.time, str)):
+            try:
+                self.time = self.str_to_time()
+            except ValueError:
+                error_msg = '{time} is not a valid xs:dateTime'.format(
+                    time=self.time)
+                self.handle_error(InvalidValueException(error_msg))
 
     def __str__(self):
         """
@@ -65,22 +89,72 @@ class Version(Element):
     def time_to_str(self):
         """
         Formats time attribute to the XCCDF dateTime format.
+        On trusted loads the time attribute is kept as the original string.
 
         :returns: time formatted string.
         :rtype: str
         """
 
-        return '{time:%Y-%m-%dT%H:%M:%S}'.format(time=self.time)
+        if isinstance(self.time, str):
+            return self.time
+
+        time_string = '{time:%Y-%m-%dT%H:%M:%S}'.format(time=self.time)
+        if self.time.microsecond:
+            time_string += '.{time:%f}'.format(time=self.time).rstrip('0')
+
+        offset = self.time.utcoffset()
+        if offset is not None:
+            if offset == timedelta(0):
+                time_string += 'Z'
+            else:
+                minutes = int(offset.total_seconds()) // 60
+                time_string += '{sign}{hours:02d}:{minutes:02d}'.format(
+                    sign='-' if minutes < 0 else '+',
+                    hours=abs(minutes) // 60, minutes=abs(minutes) % 60)
+
+        return time_string
 
     def str_to_time(self):
         """
         Formats a XCCDF dateTime string to a datetime object.
+        The time is timezone aware if the string has a timezone.
 
         :returns: datetime object.
         :rtype: datetime.datetime
+        :raises ValueError: If the string is not a valid xs:dateTime.
         """
 
-        return datetime(*list(map(int, re.split(r'-|:|T', self.time))))
+        match = DATETIME_PATTERN.match(self.time)
+        if match is None:
+            raise ValueError('invalid xs:dateTime {time}'.format(
+                time=self.time))
+
+        year, month, day, hour, minute, second = map(int, match.groups()[:6])
+        fraction, zone = match.groups()[6:]
+
+        microsecond = 0
+        if fraction is not None:
+            microsecond = int(fraction[1:7].ljust(6, '0'))
+
+        tzinfo = None
+        if zone == 'Z':
+            tzinfo = timezone.utc
+        elif zone is not None:
+            offset = timedelta(hours=int(zone[1:3]), minutes=int(zone[4:6]))
+            tzinfo = timezone(-offset if zone[0] == '-' else offset)
+
+        # 24:00:00 is the first instant of the next day
+        end_of_day = hour == 24 and minute == second == microsecond == 0
+        if end_of_day:
+            hour = 0
+
+        time = datetime(year, month, day, hour, minute, second,
+                        microsecond, tzinfo)
+
+        if end_of_day:
+            time += timedelta(days=1)
+
+        return time
 
     def update_xml_element(self):
         """
@@ -122,21 +196,27 @@ class TailoringVersion(Version):
     specific to the <xccdf:Tailoring> element.
     """
 
-    def __init__(self, xml_element=None, version=None,
-                 time=None):
+    def __init__(self, xml_element=None, version=None, time=None,
+                 strict=True, errors=None, trusted=False):
         """
         Initializes the TailoringVersion class and loads its attributes.
 
         :param lxml.etree._Element xml_element: XML element to load.
         :param str version: Version string.
         :param datetime.datetime time: Timestamp of this version.
+        :param bool strict: If False, validation errors are collected
+                            instead of raised.
+        :param list errors: List where validation errors are collected.
+        :param bool trusted: If True, the value and cardinality checks
+                             are skipped, for already validated documents.
         :raises RequiredAttributeException: If the time attribute is missing.
         """
 
         self.time = time
 
-        super(TailoringVersion, self).__init__(xml_element, version)
+        super(TailoringVersion, self).__init__(xml_element, version,
+                                               strict, errors, trusted)
 
         if (not hasattr(self, 'time') or
                 self.time == '' or self.time is None):
-            raise RequiredAttributeException('time is required')
+            self.handle_error(RequiredAttributeException('time is required'))
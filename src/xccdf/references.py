@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+
+"""
+xccdf.references includes the function check_references, to check that
+every reference between the elements of a Benchmark, and of its
+Tailorings, matches an existing element.
+
+This module is part of the xccdf library.
+
+Author: Rodrigo Núñez <rnunezmujica@icloud.com>
+"""
+
+# XCCDF
+from xccdf.models.element import Element
+from xccdf.models.platform import Platform
+from xccdf.models.profile import Profile
+from xccdf.models.select import Select
+from xccdf.exceptions import ReferenceException
+
+#: Tag of the CPE applicability language platforms
+CPE_PLATFORM_TAG = '{http://cpe.mitre.org/language/2.0}platform'
+
+
+class ReferenceReport(object):
+
+    """
+    Result of the reference check of a Benchmark.
+    """
+
+    def __init__(self):
+        """
+        Initializes the lists of the report.
+        """
+
+        #: References that don't match any element
+        self.dangling = list()
+
+        #: Groups and Rules not selected by any Profile
+        self.unselected = list()
+
+    def __str__(self):
+        """
+        String representation of ReferenceReport object.
+
+        :returns: ReferenceReport object as a string.
+        :rtype: str
+        """
+
+        string_value = 'references {dangling} dangling {unselected} '\
+                       'unselected'.format(dangling=len(self.dangling),
+                                           unselected=len(self.unselected))
+        return string_value
+
+    def add_dangling(self, message, element):
+        """
+        Adds a dangling reference to the report.
+
+        :param str message: Error message.
+        :param xccdf.models.element.Element element: Referencing element.
+        """
+
+        error = ReferenceException(message)
+        if hasattr(element, 'xml_element'):
+            error.path = Element.get_element_path(element.xml_element)
+            error.sourceline = element.xml_element.sourceline
+        self.dangling.append(error)
+
+
+def get_cpe_platform_ids(benchmark):
+    """
+    Returns the ids of the CPE applicability language platforms
+    defined in the Benchmark XML element.
+
+    :param xccdf.models.benchmark.Benchmark benchmark: Benchmark object.
+    :returns: Platform ids.
+    :rtype: set
+    """
+
+    if not hasattr(benchmark, 'xml_element'):
+        return set()
+
+    return set(platform.get('id')
+               for platform in benchmark.xml_element.iter(CPE_PLATFORM_TAG))
+
+
+def check_references(benchmark, tailoring=None):
+    """
+    Checks the references of the Benchmark, and optionally of a Tailoring
+    of the Benchmark, in a single pass over their elements.
+
+    The select idrefs must match a Group, a Rule or a cluster id,
+    the Profile extends attributes must match a Profile
+    and the local platform idrefs (#id) must match a CPE platform.
+
+    :param xccdf.models.benchmark.Benchmark benchmark: Benchmark object.
+    :param xccdf.models.tailoring.Tailoring tailoring: Tailoring object.
+    :returns: Dangling references, sorted by source line,
+              and unselected items.
+    :rtype: ReferenceReport
+    """
+
+    report = ReferenceReport()
+
+    items = benchmark.get_item_index()
+    clusters = dict()
+    for item in items.values():
+        if hasattr(item, 'cluster_id'):
+            clusters.setdefault(item.cluster_id, list()).append(item)
+    platform_ids = get_cpe_platform_ids(benchmark)
+
+    profiles = benchmark.get_profiles()
+    profile_ids = set(profile.id for profile in profiles)
+    if tailoring is not None:
+        tailoring_profiles = [child for child in tailoring.children
+                              if isinstance(child, Profile)]
+        profiles.extend(tailoring_profiles)
+        profile_ids.update(profile.id for profile in tailoring_profiles)
+
+    selected = set()
+
+    def check_platforms(element):
+        for child in element.children:
+            if (isinstance(child, Platform) and child.idref.startswith('#')
+                    and child.idref[1:] not in platform_ids):
+                report.add_dangling(
+                    'platform {idref} does not match any CPE '
+                    'platform'.format(idref=child.idref), child)
+
+    check_platforms(benchmark)
+    for item in items.values():
+        check_platforms(item)
+
+    for profile in profiles:
+        check_platforms(profile)
+        if (hasattr(profile, 'extends')
+                and profile.extends not in profile_ids):
+            report.add_dangling(
+                'Profile {id} extends {extends}, which does not match '
+                'any Profile'.format(id=profile.id, extends=profile.extends),
+                profile)
+
+        for child in profile.children:
+            if not isinstance(child, Select):
+                continue
+            if child.idref in items:
+                if child.is_selected():
+                    selected.add(child.idref)
+            elif child.idref in clusters:
+                if child.is_selected():
+                    selected.update(item.id for item in clusters[child.idref])
+            else:
+                report.add_dangling(
+                    'select {idref} does not match any Group, Rule or '
+                    'cluster'.format(idref=child.idref), child)
+
+    report.dangling.sort(key=lambda error: error.sourceline or 0)
+    report.unselected = [item for item in items.values()
+                         if item.id not in selected]
+
+    return report
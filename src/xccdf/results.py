@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+
+"""
+xccdf.results includes the function iter_rule_results, to read the
+<xccdf:rule-result> elements of large result documents as compact records,
+without loading the whole document in memory.
+
+This module is part of the xccdf library.
+
+Author: Rodrigo Núñez <rnunezmujica@icloud.com>
+"""
+
+# Python stdlib
+from collections import namedtuple
+
+# lxml
+from lxml import etree
+
+#: Compact record of a <xccdf:rule-result> element
+RuleResultRecord = namedtuple('RuleResultRecord', [
+    'idref', 'result', 'severity', 'weight', 'time', 'idents'])
+
+#: Default values of the rule-result attributes
+DEFAULT_SEVERITY = 'unknown'
+DEFAULT_WEIGHT = 1.0
+
+
+def iter_rule_results(source):
+    """
+    Reads the rule results of a result document, one at a time.
+
+    Each rule-result element is released as soon as its record is built,
+    so the memory used doesn't depend on the size of the document.
+
+    :param source: Path or file object of the result document.
+    :returns: Iterator of the rule results, in document order.
+              The idents of each record are (system, ident) tuples.
+    :rtype: generator of RuleResultRecord
+    """
+
+    context = etree.iterparse(source, events=('end',),
+                              tag='{*}rule-result')
+
+    for event, element in context:
+        result = None
+        for child in element.iterchildren('{*}result'):
+            result = child.text
+        idents = tuple((child.get('system'), child.text)
+                       for child in element.iterchildren('{*}ident'))
+
+        yield RuleResultRecord(
+            element.get('idref'),
+            result,
+            element.get('severity', DEFAULT_SEVERITY),
+            float(element.get('weight', DEFAULT_WEIGHT)),
+            element.get('time'),
+            idents)
+
+        # Release the element and the already read siblings
+        element.clear()
+        parent = element.getparent()
+        while element.getprevious() is not None:
+            del parent[0]
+
+    del context
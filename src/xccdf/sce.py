@@ -0,0 +1,464 @@
+# -*- coding: utf-8 -*-
+
+"""
+xccdf.sce includes the class SCEExecutor, to run the script checks
+(Script Check Engine) of the Rules selected by a Profile of a Benchmark
+and to build a TestResult with their results.
+
+Each script runs in its own process. A bounded pool of workers waits
+for them, so up to the given number of scripts run at the same time,
+each one with a timeout and its output captured. With a ResultCache
+(see xccdf.cache), the scripts whose content, profile values and host
+facts did not change are not run again.
+
+Like in the SCE of OpenSCAP, the Values exported by the check-export
+elements of a check are given to its script in the environment
+variables XCCDF_VALUE_<export-name>, with their types in
+XCCDF_TYPE_<export-name>.
+
+This module is part of the xccdf library.
+
+Author: Rodrigo Núñez <rnunezmujica@icloud.com>
+"""
+
+# Python stdlib
+from collections import namedtuple
+from multiprocessing import cpu_count
+from multiprocessing.pool import ThreadPool
+import datetime
+import io
+import os
+import platform
+import signal
+import socket
+import subprocess
+import time
+
+# XCCDF
+from xccdf.models.check import Check
+from xccdf.models.rule_result import Result
+from xccdf.models.rule_result import RuleResult
+from xccdf.models.score import Score
+from xccdf.models.test_result import TestResult
+from xccdf.scoring import ScoringTree
+from xccdf.scoring import SCORING_DEFAULT
+from xccdf.substitution import Substitution
+from xccdf.cache import get_cache_key
+from xccdf.checks import get_local_path
+from xccdf.constants.check import CHECK_SYSTEM_SCE
+from xccdf.constants.check import SCE_EXIT_CODES
+from xccdf.constants.result import RESULT_VALUE_ERROR
+from xccdf.constants.result import RESULT_VALUE_NOTCHECKED
+
+#: Default timeout of each script, in seconds
+DEFAULT_TIMEOUT = 60
+
+#: Result values by SCE exit code
+SCE_RESULTS = dict((code, result) for result, code in SCE_EXIT_CODES.items())
+
+#: Environment variables with the exit codes, given to every script
+SCE_ENVIRONMENT = dict(
+    ('XCCDF_RESULT_{result}'.format(result=result.upper()), str(code))
+    for result, code in SCE_EXIT_CODES.items())
+
+#: Type of the Values without a type attribute
+DEFAULT_VALUE_TYPE = 'string'
+
+#: Date format of the time attributes of the results
+TIME_FORMAT = '%Y-%m-%dT%H:%M:%S'
+
+#: Execution of the script check of a Rule
+CheckRun = namedtuple('CheckRun', ['rule_id', 'script', 'result',
+                                   'exit_code', 'stdout', 'stderr',
+                                   'duration'])
+
+
+def get_time():
+    """
+    Returns the current local time in the format of the time attributes.
+
+    :returns: Current time.
+    :rtype: str
+    """
+
+    return datetime.datetime.now().strftime(TIME_FORMAT)
+
+
+def get_host_facts():
+    """
+    Returns the default facts of the local host, to detect
+    when it changes between scans.
+
+    :returns: Facts by name.
+    :rtype: dict
+    """
+
+    uname = platform.uname()
+    return {
+        'hostname': socket.gethostname(),
+        'system': uname[0],
+        'release': uname[2],
+        'version': uname[3],
+        'machine': uname[4],
+    }
+
+
+class SCEExecutor(object):
+
+    """
+    Runner of the script checks of a Benchmark.
+    """
+
+    def __init__(self, benchmark, content_dir, processes=None,
+                 timeout=DEFAULT_TIMEOUT, cache=None, facts=None):
+        """
+        Initializes the executor.
+
+        :param xccdf.models.benchmark.Benchmark benchmark: Benchmark.
+        :param str content_dir: Directory the check content hrefs are
+                                relative to, usually the one of the
+                                Benchmark file.
+        :param int processes: Number of scripts run at the same time.
+                              None to use the number of CPUs.
+        :param float timeout: Seconds before a script is killed,
+                              None to wait for it.
+        :param xccdf.cache.ResultCache cache: Cache of the results,
+                                              None to always run the scripts.
+        :param dict facts: Facts of the host for the cache keys.
+                           By default, the ones of get_host_facts.
+        """
+
+        self.benchmark = benchmark
+        self.content_dir = content_dir
+        self.processes = cpu_count() if processes is None else processes
+        self.timeout = timeout
+        self.cache = cache
+        self.facts = get_host_facts() if facts is None else facts
+
+        self.environment = dict(os.environ)
+        self.environment.update(SCE_ENVIRONMENT)
+
+    def __str__(self):
+        """
+        String representation of SCEExecutor object.
+
+        :returns: SCEExecutor object as a string.
+        :rtype: str
+        """
+
+        string_value = 'SCE executor {id} ({processes} processes)'.format(
+            id=self.benchmark.id, processes=self.processes)
+        return string_value
+
+    def get_sce_check(self, rule):
+        """
+        Returns the first SCE check of a Rule.
+        The checks of a complex check are not used.
+
+        :param xccdf.models.rule.Rule rule: Rule.
+        :returns: SCE check, None if the Rule has none.
+        :rtype: xccdf.models.check.Check or NoneType
+        """
+
+        for child in rule.children:
+            if isinstance(child, Check) and child.system == CHECK_SYSTEM_SCE:
+                return child
+
+        return None
+
+    def get_script(self, rule):
+        """
+        Returns the script of the first SCE check of a Rule.
+        A script outside of the content directory, like an absolute
+        href or one with .., is not run.
+
+        :param xccdf.models.rule.Rule rule: Rule.
+        :returns: Path of the script, None if the Rule has no SCE check
+                  or its script is outside of the content directory.
+        :rtype: str or NoneType
+        """
+
+        check = self.get_sce_check(rule)
+        if check is not None:
+            for content_ref in check.get_content_refs():
+                try:
+                    return get_local_path(self.content_dir, content_ref.href)
+                except ValueError:
+                    return None
+
+        return None
+
+    def get_exported_values(self, rule, substitution, profile_id=None):
+        """
+        Returns the environment variables of the Values exported
+        by the SCE check of a Rule.
+
+        :param xccdf.models.rule.Rule rule: Rule.
+        :param xccdf.substitution.Substitution substitution: Substitution
+                                                             of the Benchmark.
+        :param str profile_id: Id of the Profile, None for the defaults.
+        :returns: Environment variables by name.
+        :rtype: dict
+        :raises ValueError: If the profile doesn't exist.
+        """
+
+        check = self.get_sce_check(rule)
+        exports = list() if check is None else check.get_exports()
+        if len(exports) == 0:
+            return dict()
+
+        values = substitution.get_value_map(profile_id)
+        exported = dict()
+        for export in exports:
+            value = values.get(export.value_id)
+            if value is None:
+                continue
+            exported['XCCDF_VALUE_{name}'.format(
+                name=export.export_name)] = value
+            exported['XCCDF_TYPE_{name}'.format(
+                name=export.export_name)] = getattr(
+                    substitution.values[export.value_id], 'type',
+                    DEFAULT_VALUE_TYPE)
+
+        return exported
+
+    def get_check_environment(self, rule, substitution, profile_id=None):
+        """
+        Returns the environment of the script of a Rule, with the
+        Values exported by its SCE check.
+
+        :param xccdf.models.rule.Rule rule: Rule.
+        :param xccdf.substitution.Substitution substitution: Substitution
+                                                             of the Benchmark.
+        :param str profile_id: Id of the Profile, None for the defaults.
+        :returns: Environment variables by name.
+        :rtype: dict
+        :raises ValueError: If the profile doesn't exist.
+        """
+
+        exported = self.get_exported_values(rule, substitution, profile_id)
+        if len(exported) == 0:
+            return self.environment
+
+        environment = dict(self.environment)
+        environment.update(exported)
+
+        return environment
+
+    def get_script_checks(self, profile_id=None):
+        """
+        Returns the scripts of the Rules selected by a profile.
+
+        :param str profile_id: Id of the Profile, None for the defaults.
+        :returns: (rule id, script path) tuples in document order.
+                  The path is None if the Rule has no SCE check.
+        :rtype: list
+        :raises ValueError: If the profile doesn't exist.
+        """
+
+        return [(rule.id, self.get_script(rule))
+                for rule in self.benchmark.get_selected_rules(profile_id)]
+
+    def run_check(self, script_check, environment=None):
+        """
+        Runs the script of a Rule and maps its exit code to a result.
+        A script that can't be run or that times out is an error.
+
+        :param tuple script_check: Rule id and script path.
+        :param dict environment: Environment of the script. By default,
+                                 the one of the executor, without Values.
+        :returns: Execution of the script.
+        :rtype: xccdf.sce.CheckRun
+        """
+
+        rule_id, script = script_check
+        if script is None:
+            return CheckRun(rule_id, None, RESULT_VALUE_NOTCHECKED,
+                            None, '', '', 0.0)
+
+        if environment is None:
+            environment = self.environment
+
+        start = time.time()
+        try:
+            process = subprocess.Popen(
+                [script], stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                cwd=os.path.dirname(script), env=environment,
+                universal_newlines=True, start_new_session=True)
+        except OSError as error:
+            return CheckRun(rule_id, script, RESULT_VALUE_ERROR, None,
+                            '', str(error), time.time() - start)
+
+        try:
+            stdout, stderr = process.communicate(timeout=self.timeout)
+        except subprocess.TimeoutExpired:
+            # Kill the children of the script too, they keep its output open
+            try:
+                os.killpg(process.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                # The script and its children exited after the timeout
+                pass
+            stdout, stderr = process.communicate()
+            stderr += 'timed out after {timeout} seconds'.format(
+                timeout=self.timeout)
+            return CheckRun(rule_id, script, RESULT_VALUE_ERROR, None,
+                            stdout, stderr, time.time() - start)
+
+        result = SCE_RESULTS.get(process.returncode, RESULT_VALUE_ERROR)
+        return CheckRun(rule_id, script, result, process.returncode,
+                        stdout, stderr, time.time() - start)
+
+    def get_cache_keys(self, script_checks, profile_id=None):
+        """
+        Builds the cache keys of the scripts from their content, their
+        Rule, the effective and exported values of the profile and the
+        host facts.
+
+        :param list script_checks: (rule id, script path) tuples.
+        :param str profile_id: Id of the Profile, None for the defaults.
+        :returns: Cache keys, None for the Rules without a readable script.
+        :rtype: list
+        """
+
+        substitution = Substitution(self.benchmark)
+        values = substitution.get_value_map(profile_id)
+        items = self.benchmark.get_item_index()
+        keys = list()
+
+        for rule_id, script in script_checks:
+            key = None
+            if script is not None:
+                exported = self.get_exported_values(
+                    items[rule_id], substitution, profile_id)
+                try:
+                    with io.open(script, 'rb') as script_file:
+                        key = get_cache_key(script_file.read(), values,
+                                            self.facts, rule_id, exported)
+                except IOError:
+                    pass
+            keys.append(key)
+
+        return keys
+
+    def execute(self, profile_id=None):
+        """
+        Runs the scripts of the Rules selected by a profile.
+        Cached results are used instead of running their scripts,
+        and the new results, except the errors, are cached.
+
+        :param str profile_id: Id of the Profile, None for the defaults.
+        :returns: Executions of the scripts, in document order.
+        :rtype: list
+        :raises ValueError: If the profile doesn't exist.
+        """
+
+        rules = self.benchmark.get_selected_rules(profile_id)
+        script_checks = [(rule.id, self.get_script(rule)) for rule in rules]
+        runs = [None] * len(script_checks)
+
+        if self.cache is not None:
+            keys = self.get_cache_keys(script_checks, profile_id)
+            for index, (rule_id, script) in enumerate(script_checks):
+                if keys[index] is None:
+                    continue
+                cached = self.cache.get(keys[index], rule_id)
+                if cached is not None:
+                    runs[index] = CheckRun(rule_id, script, cached[0],
+                                           cached[1], cached[2], cached[3],
+                                           0.0)
+
+        pending = [index for index, run in enumerate(runs) if run is None]
+        substitution = Substitution(self.benchmark)
+        pending_checks = [
+            (script_checks[index], self.get_check_environment(
+                rules[index], substitution, profile_id))
+            for index in pending]
+
+        if self.processes <= 1:
+            pending_runs = [self.run_check(script_check, environment)
+                            for script_check, environment in pending_checks]
+        else:
+            pool = ThreadPool(self.processes)
+            try:
+                pending_runs = pool.starmap(self.run_check, pending_checks,
+                                            chunksize=1)
+            finally:
+                pool.close()
+                pool.join()
+
+        for index, run in zip(pending, pending_runs):
+            runs[index] = run
+            if (self.cache is not None and keys[index] is not None
+                    and run.result != RESULT_VALUE_ERROR):
+                self.cache.set(keys[index], run.rule_id, run.result,
+                               run.exit_code, run.stdout, run.stderr)
+
+        return runs
+
+    def build_test_result(self, runs, profile_id=None, test_result_id=None,
+                          start_time=None, end_time=None):
+        """
+        Builds the TestResult of the executions of the scripts,
+        with the default model score.
+
+        :param list runs: Executions of the scripts.
+        :param str profile_id: Id of the Profile, None for the defaults.
+        :param str test_result_id: Id of the TestResult. By default,
+                                   it is built from the Benchmark id.
+        :param str start_time: Start time of the executions.
+        :param str end_time: End time of the executions.
+        :returns: TestResult of the executions.
+        :rtype: xccdf.models.test_result.TestResult
+        """
+
+        end_time = get_time() if end_time is None else end_time
+        if test_result_id is None:
+            test_result_id = 'xccdf_{id}_testresult'.format(
+                id=self.benchmark.id)
+
+        test_result = TestResult(id=test_result_id)
+        test_result.end_time = end_time
+        if start_time is not None:
+            test_result.start_time = start_time
+        if profile_id is not None:
+            test_result.profile_idref = profile_id
+        test_result.targets.append(socket.gethostname())
+
+        items = self.benchmark.get_item_index()
+        results = dict()
+        for run in runs:
+            rule = items[run.rule_id]
+            rule_result = RuleResult(idref=run.rule_id)
+            rule_result.time = end_time
+            if hasattr(rule, 'severity'):
+                rule_result.severity = rule.severity
+            if hasattr(rule, 'weight'):
+                rule_result.weight = rule.weight
+            rule_result.children.append(Result(result=run.result))
+            test_result.children.append(rule_result)
+            results[run.rule_id] = run.result
+
+        tree = ScoringTree(self.benchmark)
+        score, maximum = tree.score_host(tree.encode(results))
+        score = Score(score=score, system=SCORING_DEFAULT)
+        score.maximum = str(maximum)
+        test_result.children.append(score)
+
+        return test_result
+
+    def run(self, profile_id=None):
+        """
+        Runs the scripts of the Rules selected by a profile
+        and builds their TestResult.
+
+        :param str profile_id: Id of the Profile, None for the defaults.
+        :returns: TestResult of the executions.
+        :rtype: xccdf.models.test_result.TestResult
+        :raises ValueError: If the profile doesn't exist.
+        """
+
+        start_time = get_time()
+        runs = self.execute(profile_id)
+
+        return self.build_test_result(runs, profile_id,
+                                      start_time=start_time)
@@ -0,0 +1,729 @@
+# -*- coding: utf-8 -*-
+
+"""
+xccdf.scoring includes the class ScoringTree, to compute the XCCDF scores
+of many TestResults of the same Benchmark at once, and the class
+IncrementalScore, to update the default model score of a single host
+when some of its rules are checked again.
+
+The results are given as a hosts x rules matrix of result codes
+(see xccdf.constants.result.RESULT_CODES). If NumPy is installed, every
+scoring model is computed in a single pass vectorized over the hosts.
+Otherwise, each host is scored in pure Python. Both ways add the weights
+in the same order, so their scores are exactly the same.
+
+The default model adds the weighted scores of the children of a group in
+pairs (see pairwise_sum), so IncrementalScore can add again only the
+pairs of a changed child and still round every sum as a full recompute.
+
+This module is part of the xccdf library.
+
+Author: Rodrigo Núñez <rnunezmujica@icloud.com>
+"""
+
+# Python stdlib
+import heapq
+
+# NumPy
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+# XCCDF
+from xccdf.models.group import Group
+from xccdf.models.rule import Rule
+from xccdf.models.score import DEFAULT_SCORING_SYSTEM
+from xccdf.constants.result import RESULT_CODES
+from xccdf.constants.result import RESULT_CODE_NONE
+from xccdf.results import DEFAULT_WEIGHT
+
+#: URIs of the scoring models
+SCORING_DEFAULT = DEFAULT_SCORING_SYSTEM
+SCORING_FLAT = 'urn:xccdf:scoring:flat'
+SCORING_FLAT_UNWEIGHTED = 'urn:xccdf:scoring:flat-unweighted'
+SCORING_ABSOLUTE = 'urn:xccdf:scoring:absolute'
+
+SCORING_SYSTEMS = [
+    SCORING_DEFAULT,
+    SCORING_FLAT,
+    SCORING_FLAT_UNWEIGHTED,
+    SCORING_ABSOLUTE,
+]
+
+#: Result codes of the rules that pass
+PASS_CODES = (RESULT_CODES['pass'], RESULT_CODES['fixed'])
+
+#: Result codes of the rules taken into account by the scoring models.
+#: notapplicable, notchecked, notselected and informational are excluded.
+SCORED_CODES = PASS_CODES + (RESULT_CODES['fail'],
+                             RESULT_CODES['error'],
+                             RESULT_CODES['unknown'])
+
+#: Kinds of the children of a node of the tree
+CHILD_RULE = 0
+CHILD_GROUP = 1
+
+
+def pairwise_sum(values):
+    """
+    Adds values in pairs, level by level: the first and second values,
+    the third and fourth values and so on, then the pairs of those sums
+    the same way, until a single sum is left. The last value of a level
+    with an odd number of values goes up to the next level as it is.
+
+    :param list values: Floats to add.
+    :returns: Sum of the values.
+    :rtype: float
+    """
+
+    if len(values) == 0:
+        return 0.0
+
+    while len(values) > 1:
+        paired = [first + second
+                  for first, second in zip(values[0::2], values[1::2])]
+        if len(values) % 2 == 1:
+            paired.append(values[-1])
+        values = paired
+
+    return values[0]
+
+
+class PairwiseStack(object):
+
+    """
+    Sum of values added one at a time, like NumPy arrays, in the same
+    pairs as pairwise_sum, keeping only one sum of each size.
+    """
+
+    def __init__(self):
+        """
+        Initializes the empty stack of sums.
+        """
+
+        self.sums = list()
+        self.sizes = list()
+
+    def add(self, value):
+        """
+        Adds the next value, and the pairs of sums it completes.
+
+        :param value: Value to add.
+        """
+
+        size = 1
+        while len(self.sizes) > 0 and self.sizes[-1] == size:
+            value = self.sums.pop() + value
+            size += self.sizes.pop()
+        self.sums.append(value)
+        self.sizes.append(size)
+
+    def get_sum(self):
+        """
+        Returns the sum of the values added, adding the sums of the
+        stack from the last one, as the values of odd levels go up.
+
+        :returns: Sum of the values, 0.0 if none was added.
+        """
+
+        if len(self.sums) == 0:
+            return 0.0
+
+        value = self.sums[-1]
+        for first in reversed(self.sums[:-1]):
+            value = first + value
+
+        return value
+
+
+class PairwiseSums(object):
+
+    """
+    Sums of values added by pairwise_sum, kept for every level, so a
+    changed value only adds again the pairs that contain it.
+    """
+
+    def __init__(self, values):
+        """
+        Adds the values.
+
+        :param list values: Floats to add.
+        """
+
+        self.levels = [list(values)]
+        while len(self.levels[-1]) > 1:
+            values = self.levels[-1]
+            paired = [first + second
+                      for first, second in zip(values[0::2], values[1::2])]
+            if len(values) % 2 == 1:
+                paired.append(values[-1])
+            self.levels.append(paired)
+
+    def get_sum(self):
+        """
+        Returns the sum of the values.
+
+        :returns: Sum of the values, 0.0 if there is none.
+        :rtype: float
+        """
+
+        return self.levels[-1][0] if len(self.levels[0]) > 0 else 0.0
+
+    def update(self, position, value):
+        """
+        Changes a value and adds again the pairs that contain it.
+
+        :param int position: Position of the value.
+        :param float value: New value.
+        """
+
+        self.levels[0][position] = value
+        for level in range(1, len(self.levels)):
+            values = self.levels[level - 1]
+            position //= 2
+            first = 2 * position
+            if first + 1 < len(values):
+                value = values[first] + values[first + 1]
+            else:
+                value = values[first]
+            self.levels[level][position] = value
+
+
+class ScoringTree(object):
+
+    """
+    Group and Rule weight tree of a Benchmark, in flat lists.
+
+    The Benchmark itself is the group 0. Groups are stored in document
+    order, so every group comes after its parent.
+    """
+
+    def __init__(self, benchmark):
+        """
+        Builds the weight tree of the benchmark.
+
+        :param xccdf.models.benchmark.Benchmark benchmark: Benchmark to score.
+        """
+
+        self.rule_ids = list()
+        self.rule_weights = list()
+        self.rule_parents = list()
+
+        self.group_ids = [benchmark.id]
+        self.group_weights = [DEFAULT_WEIGHT]
+        self.group_parents = [-1]
+        self.group_children = [list()]
+
+        self.load_items(benchmark, 0)
+
+        self.rule_index = dict((rule_id, index)
+                               for index, rule_id in enumerate(self.rule_ids))
+
+    def __str__(self):
+        """
+        String representation of ScoringTree object.
+
+        :returns: ScoringTree object as a string.
+        :rtype: str
+        """
+
+        string_value = 'scoring tree {id} ({groups} groups, '\
+                       '{rules} rules)'.format(id=self.group_ids[0],
+                                               groups=len(self.group_ids) - 1,
+                                               rules=len(self.rule_ids))
+        return string_value
+
+    @staticmethod
+    def get_weight(item):
+        """
+        Returns the weight of a Group or a Rule.
+
+        :param xccdf.models.element.Element item: Group or Rule object.
+        :returns: Weight of the item, 1.0 if not set.
+        :rtype: float
+        """
+
+        return float(getattr(item, 'weight', DEFAULT_WEIGHT))
+
+    def load_items(self, parent, group_index):
+        """
+        Adds the Groups and Rules children of parent to the tree.
+
+        :param xccdf.models.element.Element parent: Benchmark or Group object.
+        :param int group_index: Index of the parent in the tree.
+        """
+
+        for child in parent.children:
+            if isinstance(child, Rule):
+                self.group_children[group_index].append(
+                    (CHILD_RULE, len(self.rule_ids)))
+                self.rule_ids.append(child.id)
+                self.rule_weights.append(self.get_weight(child))
+                self.rule_parents.append(group_index)
+            elif isinstance(child, Group):
+                child_index = len(self.group_ids)
+                self.group_children[group_index].append(
+                    (CHILD_GROUP, child_index))
+                self.group_ids.append(child.id)
+                self.group_weights.append(self.get_weight(child))
+                self.group_parents.append(group_index)
+                self.group_children.append(list())
+                self.load_items(child, child_index)
+
+    def encode(self, results):
+        """
+        Builds the row of result codes of a host.
+
+        :param dict results: Result strings by Rule id.
+                             Results of unknown rules are ignored.
+        :returns: Result codes in the order of rule_ids.
+        :rtype: list
+        """
+
+        codes = [RESULT_CODE_NONE] * len(self.rule_ids)
+
+        for rule_id, result in results.items():
+            index = self.rule_index.get(rule_id)
+            if index is not None:
+                codes[index] = RESULT_CODES[result]
+
+        return codes
+
+    def encode_test_result(self, test_result):
+        """
+        Builds the row of result codes of a TestResult.
+
+        :param xccdf.models.test_result.TestResult test_result: TestResult.
+        :returns: Result codes in the order of rule_ids.
+        :rtype: list
+        """
+
+        results = dict((rule_result.idref, rule_result.get_result())
+                       for rule_result in test_result.get_rule_results())
+
+        return self.encode(results)
+
+    def get_child_terms(self, child, passed, scored, scores, counted):
+        """
+        Returns the terms a child adds to the sums of its group.
+
+        :param tuple child: Kind and index of the child.
+        :param list passed: If each rule passed, in the order of rule_ids.
+        :param list scored: If each rule is scored, in the order of rule_ids.
+        :param list scores: Scores of the groups, of the child at least.
+        :param list counted: If each group has scored rules,
+                             of the child at least.
+        :returns: Weighted score, weight and number of scored children.
+        :rtype: tuple
+        """
+
+        kind, index = child
+        if kind == CHILD_RULE:
+            if not scored[index]:
+                return 0.0, 0.0, 0
+            child_score = 100.0 if passed[index] else 0.0
+            child_weight = self.rule_weights[index]
+        else:
+            if not counted[index]:
+                return 0.0, 0.0, 0
+            child_score = scores[index]
+            child_weight = self.group_weights[index]
+
+        return child_score * child_weight, child_weight, 1
+
+    def score_group(self, group_index, passed, scored, scores, counted):
+        """
+        Computes the default model score of a group from its children.
+
+        :param int group_index: Index of the group in the tree.
+        :param list passed: If each rule passed, in the order of rule_ids.
+        :param list scored: If each rule is scored, in the order of rule_ids.
+        :param list scores: Scores of the groups, of the children at least.
+        :param list counted: If each group has scored rules,
+                             of the children at least.
+        :returns: Score of the group and if it has scored rules.
+        :rtype: tuple
+        """
+
+        # The children that aren't scored add 0.0 to the sums, so every
+        # child keeps its place in the pairs, as in IncrementalScore
+        totals = list()
+        weights = list()
+        group_counted = False
+        for kind, index in self.group_children[group_index]:
+            if kind == CHILD_RULE:
+                if not scored[index]:
+                    totals.append(0.0)
+                    weights.append(0.0)
+                    continue
+                child_score = 100.0 if passed[index] else 0.0
+                child_weight = self.rule_weights[index]
+            else:
+                if not counted[index]:
+                    totals.append(0.0)
+                    weights.append(0.0)
+                    continue
+                child_score = scores[index]
+                child_weight = self.group_weights[index]
+            totals.append(child_score * child_weight)
+            weights.append(child_weight)
+            group_counted = True
+
+        total = pairwise_sum(totals)
+        weight = pairwise_sum(weights)
+
+        return (total / weight if weight > 0 else 0.0), group_counted
+
+    def score_host(self, codes, system=SCORING_DEFAULT):
+        """
+        Computes the score of a single host, in pure Python.
+
+        :param list codes: Result codes in the order of rule_ids.
+        :param str system: URI of the scoring model.
+        :returns: Score and maximum score.
+        :rtype: tuple
+        :raises ValueError: If the scoring model is not supported.
+        """
+
+        passed = [code in PASS_CODES for code in codes]
+        scored = [code in SCORED_CODES for code in codes]
+
+        if system == SCORING_DEFAULT:
+            scores = [0.0] * len(self.group_ids)
+            counted = [False] * len(self.group_ids)
+
+            # Children groups come after their parents
+            for group_index in reversed(range(len(self.group_ids))):
+                scores[group_index], counted[group_index] = self.score_group(
+                    group_index, passed, scored, scores, counted)
+
+            return scores[0], 100.0
+
+        elif system in (SCORING_FLAT, SCORING_FLAT_UNWEIGHTED,
+                        SCORING_ABSOLUTE):
+            score = 0.0
+            maximum = 0.0
+            for index in range(len(self.rule_ids)):
+                if not scored[index]:
+                    continue
+                if system == SCORING_FLAT:
+                    weight = self.rule_weights[index]
+                else:
+                    weight = 1.0
+                maximum += weight
+                if passed[index]:
+                    score += weight
+
+            if system == SCORING_ABSOLUTE:
+                return (1.0 if score == maximum else 0.0), 1.0
+            return score, maximum
+
+        else:
+            raise ValueError('{system} is not a supported scoring '
+                             'model'.format(system=system))
+
+    def get_column_terms(self, child, codes, passed, scored, scores,
+                         counted):
+        """
+        Returns the terms a child adds to the sums of its group,
+        vectorized over the hosts.
+
+        :param tuple child: Kind and index of the child.
+        :param numpy.ndarray codes: Hosts x rules matrix of result codes.
+        :param numpy.ndarray passed: If each result code passes.
+        :param numpy.ndarray scored: If each result code is scored.
+        :param list scores: Score arrays of the groups,
+                            of the child at least.
+        :param list counted: Arrays of the hosts with scored rules of each
+                             group, of the child at least.
+        :returns: Weighted score, weight and scored arrays.
+        :rtype: tuple
+        """
+
+        kind, index = child
+        if kind == CHILD_RULE:
+            column = codes[:, index]
+            child_weight = self.rule_weights[index]
+            mask = scored[column]
+            return (passed[column] * (100.0 * child_weight),
+                    mask * child_weight, mask)
+
+        mask = counted[index]
+        child_weight = self.group_weights[index]
+        terms = (numpy.where(mask, scores[index] * child_weight, 0.0),
+                 numpy.where(mask, child_weight, 0.0), mask)
+        # Only the parent of a group uses its scores
+        scores[index] = counted[index] = None
+
+        return terms
+
+    def score(self, matrix, system=SCORING_DEFAULT, use_numpy=None):
+        """
+        Computes the scores of many hosts.
+
+        :param matrix: Hosts x rules matrix of result codes, with the
+                       columns in the order of rule_ids.
+        :type matrix: list of lists or numpy.ndarray
+        :param str system: URI of the scoring model.
+        :param bool use_numpy: If False, scores each host in pure Python.
+                               By default NumPy is used when installed.
+        :returns: Scores and maximum scores of the hosts, as NumPy arrays
+                  or as lists.
+        :rtype: tuple
+        :raises ValueError: If the scoring model is not supported.
+        :raises ImportError: If use_numpy is True and NumPy is not installed.
+        """
+
+        if use_numpy is None:
+            use_numpy = numpy is not None
+        elif use_numpy and numpy is None:
+            raise ImportError('NumPy is required to score with use_numpy')
+
+        if not use_numpy:
+            scores = list()
+            maximums = list()
+            for codes in matrix:
+                score, maximum = self.score_host(codes, system)
+                scores.append(score)
+                maximums.append(maximum)
+            return scores, maximums
+
+        if system not in SCORING_SYSTEMS:
+            raise ValueError('{system} is not a supported scoring '
+                             'model'.format(system=system))
+
+        # The input is not copied, only converted if it isn't already
+        # an array of codes. The rules are read one column at a time.
+        codes = numpy.asarray(matrix, dtype=numpy.uint8)
+        if codes.ndim != 2 or codes.shape[1] != len(self.rule_ids):
+            raise ValueError('the result matrix must have one column '
+                             'per rule')
+        hosts = codes.shape[0]
+
+        # Lookup tables of the codes, indexed by each column
+        passed = numpy.zeros(256, dtype=bool)
+        passed[list(PASS_CODES)] = True
+        scored = numpy.zeros(256, dtype=bool)
+        scored[list(SCORED_CODES)] = True
+
+        # The weights are added column by column, in the same pairs
+        # as score_host, so the sums round exactly the same way.
+        if system == SCORING_DEFAULT:
+            scores = [None] * len(self.group_ids)
+            counted = [None] * len(self.group_ids)
+
+            for group_index in reversed(range(len(self.group_ids))):
+                total = PairwiseStack()
+                weight = PairwiseStack()
+                group_counted = numpy.zeros(hosts, dtype=bool)
+                for child in self.group_children[group_index]:
+                    child_total, child_weight, mask = self.get_column_terms(
+                        child, codes, passed, scored, scores, counted)
+                    total.add(child_total)
+                    weight.add(child_weight)
+                    group_counted |= mask
+                total = total.get_sum()
+                weight = weight.get_sum()
+                if isinstance(weight, float):
+                    # A group without children
+                    scores[group_index] = numpy.zeros(hosts)
+                else:
+                    with numpy.errstate(divide='ignore', invalid='ignore'):
+                        scores[group_index] = numpy.where(
+                            weight > 0, total / weight, 0.0)
+                counted[group_index] = group_counted
+
+            return scores[0], numpy.full(hosts, 100.0)
+
+        score = numpy.zeros(hosts)
+        maximum = numpy.zeros(hosts)
+        for index in range(len(self.rule_ids)):
+            if system == SCORING_FLAT:
+                weight = self.rule_weights[index]
+            else:
+                weight = 1.0
+            column = codes[:, index]
+            maximum += scored[column] * weight
+            score += passed[column] * weight
+
+        if system == SCORING_ABSOLUTE:
+            return ((score == maximum).astype(float),
+                    numpy.ones(hosts))
+        return score, maximum
+
+
+class IncrementalScore(object):
+
+    """
+    Default model score of a host, updated with rule result changes.
+
+    Every group keeps the pairs of the weighted scores and the weights of
+    its children added by pairwise_sum. A change only adds again the
+    pairs of its group that contain the changed child, and then the ones
+    of each ancestor whose score changed, so an update costs a few
+    additions per group on the path from the rule to the Benchmark. The
+    additions are the ones of a full recompute, so the scores are exactly
+    the ones of ScoringTree.score_host.
+    """
+
+    def __init__(self, tree, codes):
+        """
+        Computes the sums and scores of every group of the tree.
+
+        :param xccdf.scoring.ScoringTree tree: Scoring tree of the Benchmark.
+        :param list codes: Result codes in the order of the tree rule_ids.
+        """
+
+        self.tree = tree
+        self.codes = list(codes)
+        self.passed = [code in PASS_CODES for code in self.codes]
+        self.scored = [code in SCORED_CODES for code in self.codes]
+        self.scores = [0.0] * len(tree.group_ids)
+        self.counted = [False] * len(tree.group_ids)
+        self.totals = [None] * len(tree.group_ids)
+        self.weights = [None] * len(tree.group_ids)
+        self.children = [0] * len(tree.group_ids)
+
+        # Position of each rule and group in the children of its parent
+        self.rule_positions = [0] * len(tree.rule_ids)
+        self.group_positions = [0] * len(tree.group_ids)
+        for children in tree.group_children:
+            for position, (kind, index) in enumerate(children):
+                if kind == CHILD_RULE:
+                    self.rule_positions[index] = position
+                else:
+                    self.group_positions[index] = position
+
+        # Children groups come after their parents
+        for group_index in reversed(range(len(tree.group_ids))):
+            terms = [self.get_child_terms(child)
+                     for child in tree.group_children[group_index]]
+            self.totals[group_index] = PairwiseSums(
+                [total for total, weight, scored in terms])
+            self.weights[group_index] = PairwiseSums(
+                [weight for total, weight, scored in terms])
+            self.children[group_index] = sum(
+                scored for total, weight, scored in terms)
+            self.rescore_group(group_index)
+
+    def __str__(self):
+        """
+        String representation of IncrementalScore object.
+
+        :returns: IncrementalScore object as a string.
+        :rtype: str
+        """
+
+        string_value = 'incremental score {id} {score}'.format(
+            id=self.tree.group_ids[0], score=self.get_score())
+        return string_value
+
+    def get_score(self):
+        """
+        Returns the default model score of the Benchmark.
+
+        :returns: Score of the host.
+        :rtype: float
+        """
+
+        return self.scores[0]
+
+    def get_child_terms(self, child):
+        """
+        Returns the terms a child adds to the sums of its group.
+
+        :param tuple child: Kind and index of the child.
+        :returns: Weighted score, weight and number of scored children.
+        :rtype: tuple
+        """
+
+        return self.tree.get_child_terms(child, self.passed, self.scored,
+                                         self.scores, self.counted)
+
+    def update_child(self, group_index, position, child):
+        """
+        Changes the terms of a child in the sums of its group.
+
+        :param int group_index: Index of the group in the tree.
+        :param int position: Position of the child in the group.
+        :param tuple child: Kind and index of the child.
+        """
+
+        total, weight, scored = self.get_child_terms(child)
+        self.totals[group_index].update(position, total)
+        self.weights[group_index].update(position, weight)
+
+    def rescore_group(self, group_index):
+        """
+        Recomputes the score of a group from its sums.
+
+        :param int group_index: Index of the group in the tree.
+        :returns: True if the score of the group changed.
+        :rtype: bool
+        """
+
+        weight = self.weights[group_index].get_sum()
+        if weight > 0:
+            score = self.totals[group_index].get_sum() / weight
+        else:
+            score = 0.0
+        counted = self.children[group_index] > 0
+
+        changed = (score != self.scores[group_index]
+                   or counted != self.counted[group_index])
+        self.scores[group_index] = score
+        self.counted[group_index] = counted
+
+        return changed
+
+    def update(self, results):
+        """
+        Applies rule result changes and updates the affected groups.
+
+        :param dict results: New result strings by Rule id.
+                             Results of unknown rules are ignored.
+        :returns: New score of the host.
+        :rtype: float
+        """
+
+        # Max-heap of the groups to recompute, children groups have
+        # greater indexes than their parents so they are recomputed first
+        pending = list()
+        queued = set()
+
+        for rule_id, result in results.items():
+            index = self.tree.rule_index.get(rule_id)
+            if index is None:
+                continue
+            code = RESULT_CODES[result]
+            passed = code in PASS_CODES
+            scored = code in SCORED_CODES
+            self.codes[index] = code
+            if passed == self.passed[index] and scored == self.scored[index]:
+                continue
+            self.passed[index] = passed
+            group_index = self.tree.rule_parents[index]
+            self.children[group_index] += scored - self.scored[index]
+            self.scored[index] = scored
+            self.update_child(group_index, self.rule_positions[index],
+                              (CHILD_RULE, index))
+            if group_index not in queued:
+                queued.add(group_index)
+                heapq.heappush(pending, -group_index)
+
+        while len(pending) > 0:
+            group_index = -heapq.heappop(pending)
+            parent_index = self.tree.group_parents[group_index]
+            counted = self.counted[group_index]
+            if self.rescore_group(group_index) and parent_index >= 0:
+                self.children[parent_index] += (self.counted[group_index]
+                                                - counted)
+                self.update_child(parent_index,
+                                  self.group_positions[group_index],
+                                  (CHILD_GROUP, group_index))
+                if parent_index not in queued:
+                    queued.add(parent_index)
+                    heapq.heappush(pending, -parent_index)
+
+        return self.get_score()
@@ -0,0 +1,659 @@
+# -*- coding: utf-8 -*-
+
+"""
+xccdf.shared includes the class SharedBenchmarkStore and the function
+pack_benchmark, to share a Benchmark between processes as one packed,
+read-only buffer: a shared memory segment or a memory mapped file.
+
+The buffer holds a string table, a table of fixed size item records
+(Groups, Rules, Values and Profiles, in document order), an index of
+the records sorted by id and the selects of the Profiles. Nothing is
+unpacked when a process attaches, so the pages stay shared between
+forked workers: the queries read the records in place, and the models
+are only built, from the stored XML of each item, when requested.
+
+Layout, all integers little endian::
+
+    header          magic, version and the counts of each table
+    string offsets  string count + 1 uint32
+    string data     UTF-8 bytes
+    items           ITEM_RECORD per item
+    id index        uint32 record number per item, sorted by id
+    selects         SELECT_RECORD per select, grouped by Profile
+
+This module is part of the xccdf library.
+
+Author: Rodrigo Núñez <rnunezmujica@icloud.com>
+"""
+
+# Python stdlib
+import struct
+import mmap
+import sys
+import io
+
+# Shared memory
+try:
+    from multiprocessing import resource_tracker
+    from multiprocessing import shared_memory
+except ImportError:  # pragma: no cover
+    resource_tracker = None
+    shared_memory = None
+
+# lxml
+from lxml import etree
+
+# XCCDF
+from xccdf.models.group import Group
+from xccdf.models.rule import Rule
+from xccdf.models.value import Value
+from xccdf.models.profile import Profile
+from xccdf.models.select import Select
+
+#: Names of the shared memory segments created by this process. Its
+#: forked children inherit them, with the resource tracker of the process.
+CREATED_SEGMENTS = set()
+
+#: Magic bytes of a packed Benchmark
+MAGIC = b'XCSB'
+
+#: Version of the packed layout
+LAYOUT_VERSION = 1
+
+#: Header: magic, version, string count, item count, select count
+HEADER = struct.Struct('<4sHxxIII')
+
+#: Item record: kind, selected, id, parent record, cluster id,
+#: extends, stored XML, first select and select count.
+#: Missing strings and records are -1.
+ITEM_RECORD = struct.Struct('<BBxxiiiiiii')
+
+#: Select record: idref and selected
+SELECT_RECORD = struct.Struct('<iBxxx')
+
+#: Unsigned 32 bits integer of the offset and index tables
+UINT32 = struct.Struct('<I')
+
+#: Kinds of the item records
+KIND_GROUP = 1
+KIND_RULE = 2
+KIND_VALUE = 3
+KIND_PROFILE = 4
+
+#: Model of each kind of item record
+KIND_MODELS = {
+    KIND_GROUP: Group,
+    KIND_RULE: Rule,
+    KIND_VALUE: Value,
+    KIND_PROFILE: Profile,
+}
+
+
+def get_item_xml(element):
+    """
+    Serializes an item without its nested Groups, Rules and Values,
+    which have their own records.
+
+    :param xccdf.models.element.Element element: Item to serialize.
+    :returns: XML of the item.
+    :rtype: bytes
+    """
+
+    xml_element = getattr(element, 'xml_element', None)
+    if xml_element is None:
+        xml_element = element.update_xml_element()
+
+    if isinstance(element, Group):
+        xml_element = etree.fromstring(etree.tostring(xml_element))
+        for child in list(xml_element):
+            if etree.QName(child).localname in ['Group', 'Rule', 'Value']:
+                xml_element.remove(child)
+
+    return etree.tostring(xml_element, with_tail=False)
+
+
+def pack_benchmark(benchmark):
+    """
+    Packs the items of a Benchmark in the layout read by
+    SharedBenchmarkStore.
+
+    :param xccdf.models.benchmark.Benchmark benchmark: Benchmark to pack.
+    :returns: Packed Benchmark.
+    :rtype: bytes
+    """
+
+    strings = list()
+    string_index = dict()
+
+    def add_string(value):
+        if value is None:
+            return -1
+        if isinstance(value, bytes):
+            value = value.decode('utf-8')
+        if value not in string_index:
+            string_index[value] = len(strings)
+            strings.append(value)
+        return string_index[value]
+
+    # Items in document order, with the record of their parent
+    records = list()
+    pending = [(child, -1) for child in reversed(benchmark.children)]
+    while len(pending) > 0:
+        child, parent = pending.pop()
+        if isinstance(child, Group):
+            kind = KIND_GROUP
+        elif isinstance(child, Rule):
+            kind = KIND_RULE
+        elif isinstance(child, Value):
+            kind = KIND_VALUE
+        else:
+            continue
+        records.append((kind, child, parent))
+        if kind == KIND_GROUP:
+            pending.extend((grandchild, len(records) - 1)
+                           for grandchild in reversed(child.children))
+    records.extend((KIND_PROFILE, profile, -1)
+                   for profile in benchmark.get_profiles())
+
+    items = list()
+    selects = list()
+    for kind, element, parent in records:
+        select_start = len(selects)
+        if kind == KIND_PROFILE:
+            selects.extend(SELECT_RECORD.pack(add_string(child.idref),
+                                              child.is_selected())
+                           for child in element.children
+                           if isinstance(child, Select))
+        items.append(ITEM_RECORD.pack(
+            kind,
+            getattr(element, 'selected', 'true') in ['true', '1'],
+            add_string(element.id),
+            parent,
+            add_string(getattr(element, 'cluster_id', None)),
+            add_string(getattr(element, 'extends', None)),
+            add_string(get_item_xml(element)),
+            select_start,
+            len(selects) - select_start))
+
+    encoded = [string.encode('utf-8') for string in strings]
+    offsets = [0]
+    for value in encoded:
+        offsets.append(offsets[-1] + len(value))
+
+    id_index = sorted(range(len(records)),
+                      key=lambda record: encoded[string_index[
+                          records[record][1].id]])
+
+    buffer = io.BytesIO()
+    buffer.write(HEADER.pack(MAGIC, LAYOUT_VERSION, len(strings),
+                             len(items), len(selects)))
+    buffer.write(b''.join(UINT32.pack(offset) for offset in offsets))
+    buffer.write(b''.join(encoded))
+    buffer.write(b''.join(items))
+    buffer.write(b''.join(UINT32.pack(record) for record in id_index))
+    buffer.write(b''.join(selects))
+
+    return buffer.getvalue()
+
+
+class SharedBenchmarkStore(object):
+
+    """
+    Read-only view of a packed Benchmark, with the query methods
+    of the Benchmark model.
+    """
+
+    def __init__(self, buffer, shm=None, mapped_file=None):
+        """
+        Attaches to a packed Benchmark. Use create, attach, open or
+        from_benchmark to build it.
+
+        :param buffer: Packed Benchmark (bytes, memoryview or mmap).
+        :param shm: Shared memory segment of the buffer, if any.
+        :type shm: multiprocessing.shared_memory.SharedMemory
+        :param mmap.mmap mapped_file: Mapped file of the buffer, if any.
+        :raises ValueError: If the buffer is not a packed Benchmark.
+        """
+
+        self.shm = shm
+        self.mapped_file = mapped_file
+        self.buffer = memoryview(buffer)
+
+        magic, version, self.string_count, self.item_count, \
+            self.select_count = HEADER.unpack_from(self.buffer, 0)
+        if magic != MAGIC:
+            raise ValueError('buffer is not a packed Benchmark')
+        if version != LAYOUT_VERSION:
+            error_msg = 'unsupported packed Benchmark version {version}'
+            raise ValueError(error_msg.format(version=version))
+
+        self.offsets_pos = HEADER.size
+        self.strings_pos = self.offsets_pos + \
+            (self.string_count + 1) * UINT32.size
+        self.items_pos = self.strings_pos + UINT32.unpack_from(
+            self.buffer, self.offsets_pos + self.string_count * UINT32.size)[0]
+        self.index_pos = self.items_pos + self.item_count * ITEM_RECORD.size
+        self.selects_pos = self.index_pos + self.item_count * UINT32.size
+
+    def __str__(self):
+        """
+        String representation of SharedBenchmarkStore object.
+
+        :returns: SharedBenchmarkStore object as a string.
+        :rtype: str
+        """
+
+        string_value = 'shared Benchmark ({items} items, {size} bytes)'.format(
+            items=self.item_count, size=self.buffer.nbytes)
+        return string_value
+
+    def __len__(self):
+        """
+        Number of items of the packed Benchmark.
+
+        :returns: Number of Groups, Rules, Values and Profiles.
+        :rtype: int
+        """
+
+        return self.item_count
+
+    def __contains__(self, item_id):
+        """
+        Tells if the packed Benchmark has an item.
+
+        :param str item_id: Id of the item.
+        :returns: If any item has the id.
+        :rtype: bool
+        """
+
+        return self.find_record(item_id) is not None
+
+    @classmethod
+    def from_benchmark(cls, benchmark):
+        """
+        Packs a Benchmark in a private buffer.
+
+        :param xccdf.models.benchmark.Benchmark benchmark: Benchmark.
+        :returns: Store of the packed Benchmark.
+        :rtype: xccdf.shared.SharedBenchmarkStore
+        """
+
+        return cls(pack_benchmark(benchmark))
+
+    @classmethod
+    def create(cls, benchmark, name=None):
+        """
+        Packs a Benchmark in a new shared memory segment. The creator
+        must unlink it when no process needs it anymore.
+
+        :param xccdf.models.benchmark.Benchmark benchmark: Benchmark.
+        :param str name: Name of the segment, random by default.
+        :returns: Store of the packed Benchmark.
+        :rtype: xccdf.shared.SharedBenchmarkStore
+        :raises ImportError: If shared memory is not available.
+        """
+
+        if shared_memory is None:
+            raise ImportError('multiprocessing.shared_memory is required '
+                              'to share a Benchmark')
+
+        packed = pack_benchmark(benchmark)
+        shm = shared_memory.SharedMemory(name=name, create=True,
+                                         size=len(packed))
+        shm.buf[:len(packed)] = packed
+        CREATED_SEGMENTS.add(shm.name)
+
+        return cls(shm.buf[:len(packed)].toreadonly(), shm=shm)
+
+    @classmethod
+    def attach(cls, name):
+        """
+        Attaches to a Benchmark packed in a shared memory segment.
+
+        :param str name: Name of the segment.
+        :returns: Read-only store of the packed Benchmark.
+        :rtype: xccdf.shared.SharedBenchmarkStore
+        :raises ImportError: If shared memory is not available.
+        """
+
+        if shared_memory is None:
+            raise ImportError('multiprocessing.shared_memory is required '
+                              'to share a Benchmark')
+
+        # The creator owns the segment, not the attached processes
+        if sys.version_info >= (3, 13):
+            shm = shared_memory.SharedMemory(name=name, track=False)
+        else:
+            # The segment is registered with the resource tracker of the
+            # process, which would unlink it when the process exits. The
+            # creator and its forked children share the tracker of the
+            # creator, where the segment stays registered.
+            shm = shared_memory.SharedMemory(name=name)
+            if shm.name not in CREATED_SEGMENTS:
+                resource_tracker.unregister(shm._name, 'shared_memory')
+
+        return cls(shm.buf.toreadonly(), shm=shm)
+
+    @staticmethod
+    def save(benchmark, path):
+        """
+        Packs a Benchmark in a file, to be mapped by open.
+
+        :param xccdf.models.benchmark.Benchmark benchmark: Benchmark.
+        :param str path: Path of the file.
+        """
+
+        with io.open(path, 'wb') as packed_file:
+            packed_file.write(pack_benchmark(benchmark))
+
+    @classmethod
+    def open(cls, path):
+        """
+        Maps a file written by save, read-only.
+
+        :param str path: Path of the file.
+        :returns: Read-only store of the packed Benchmark.
+        :rtype: xccdf.shared.SharedBenchmarkStore
+        """
+
+        with io.open(path, 'rb') as packed_file:
+            mapped_file = mmap.mmap(packed_file.fileno(), 0,
+                                    access=mmap.ACCESS_READ)
+
+        return cls(mapped_file, mapped_file=mapped_file)
+
+    def close(self):
+        """
+        Detaches from the shared memory segment or mapped file.
+        """
+
+        self.buffer.release()
+        if self.shm is not None:
+            self.shm.close()
+        if self.mapped_file is not None:
+            self.mapped_file.close()
+
+    def unlink(self):
+        """
+        Destroys the shared memory segment. Only the creator should
+        call it, after the other processes have detached.
+        """
+
+        if self.shm is not None:
+            if sys.version_info < (3, 13):
+                # A process sharing the resource tracker of the creator
+                # may have unregistered the segment when attaching
+                resource_tracker.register(self.shm._name, 'shared_memory')
+            self.shm.unlink()
+            CREATED_SEGMENTS.discard(self.shm.name)
+
+    def get_string_bytes(self, index):
+        """
+        Returns the encoded bytes of a string of the string table.
+
+        :param int index: Index of the string.
+        :returns: UTF-8 bytes, None for the missing string (-1).
+        :rtype: bytes or NoneType
+        """
+
+        if index < 0:
+            return None
+
+        start, end = struct.unpack_from(
+            '<II', self.buffer, self.offsets_pos + index * UINT32.size)
+        return self.buffer[self.strings_pos + start:
+                           self.strings_pos + end].tobytes()
+
+    def get_string(self, index):
+        """
+        Returns a string of the string table.
+
+        :param int index: Index of the string.
+        :returns: String, None for the missing string (-1).
+        :rtype: str or NoneType
+        """
+
+        value = self.get_string_bytes(index)
+        return None if value is None else value.decode('utf-8')
+
+    def get_record(self, record):
+        """
+        Unpacks an item record.
+
+        :param int record: Number of the record.
+        :returns: Tuple of the ITEM_RECORD fields.
+        :rtype: tuple
+        """
+
+        return ITEM_RECORD.unpack_from(
+            self.buffer, self.items_pos + record * ITEM_RECORD.size)
+
+    def find_record(self, item_id, kind=None):
+        """
+        Finds the record of an item by id, with a binary search
+        of the id index.
+
+        :param str item_id: Id of the item.
+        :param int kind: Kind of the item, any by default.
+        :returns: Number of the record, None if it doesn't exist.
+        :rtype: int or NoneType
+        """
+
+        key = item_id.encode('utf-8')
+        low = 0
+        high = self.item_count
+        while low < high:
+            middle = (low + high) // 2
+            record = UINT32.unpack_from(
+                self.buffer, self.index_pos + middle * UINT32.size)[0]
+            record_id = self.get_string_bytes(self.get_record(record)[2])
+            if record_id < key:
+                low = middle + 1
+            elif record_id > key:
+                high = middle
+            elif kind is None or self.get_record(record)[0] == kind:
+                return record
+            else:
+                return None
+
+        return None
+
+    def iter_records(self, kinds):
+        """
+        Iterates the item records of some kinds, in document order.
+
+        :param list kinds: Kinds of the items.
+        :returns: Iterator of (record number, record fields) tuples.
+        :rtype: generator
+        """
+
+        for record in range(self.item_count):
+            fields = self.get_record(record)
+            if fields[0] in kinds:
+                yield record, fields
+
+    def load_record(self, record):
+        """
+        Builds the model of an item from its stored XML. The item was
+        validated when the Benchmark was loaded, so it is trusted.
+
+        :param int record: Number of the record.
+        :returns: Group, Rule, Value or Profile. Groups don't
+                  include their nested Groups, Rules and Values.
+        :rtype: xccdf.models.element.Element
+        """
+
+        fields = self.get_record(record)
+        xml_element = etree.fromstring(self.get_string_bytes(fields[6]))
+
+        return KIND_MODELS[fields[0]](xml_element, trusted=True)
+
+    def get_item_ids(self):
+        """
+        Returns the ids of the Groups and Rules, in document order.
+
+        :returns: List of ids.
+        :rtype: list
+        """
+
+        return [self.get_string(fields[2]) for record, fields
+                in self.iter_records([KIND_GROUP, KIND_RULE])]
+
+    def get_parent_id(self, item_id):
+        """
+        Returns the id of the Group that contains an item.
+
+        :param str item_id: Id of the Group, Rule or Value.
+        :returns: Id of the Group, None for top level items.
+        :rtype: str or NoneType
+        :raises KeyError: If the item doesn't exist.
+        """
+
+        record = self.find_record(item_id)
+        if record is None:
+            raise KeyError(item_id)
+
+        parent = self.get_record(record)[3]
+        return None if parent < 0 else self.get_string(
+            self.get_record(parent)[2])
+
+    def get_item(self, item_id):
+        """
+        Builds a Group or a Rule by id.
+
+        :param str item_id: Id of the item.
+        :returns: Group or Rule, None if it doesn't exist.
+        :rtype: xccdf.models.group.Group or xccdf.models.rule.Rule
+                or NoneType
+        """
+
+        record = self.find_record(item_id)
+        if record is None or self.get_record(record)[0] not in [KIND_GROUP,
+                                                                KIND_RULE]:
+            return None
+
+        return self.load_record(record)
+
+    def get_value(self, value_id):
+        """
+        Builds a Value by id.
+
+        :param str value_id: Id of the Value.
+        :returns: Value, None if it doesn't exist.
+        :rtype: xccdf.models.value.Value or NoneType
+        """
+
+        record = self.find_record(value_id, KIND_VALUE)
+        return None if record is None else self.load_record(record)
+
+    def get_profile(self, profile_id):
+        """
+        Builds a Profile by id.
+
+        :param str profile_id: Id of the Profile.
+        :returns: Profile, None if it doesn't exist.
+        :rtype: xccdf.models.profile.Profile or NoneType
+        """
+
+        record = self.find_record(profile_id, KIND_PROFILE)
+        return None if record is None else self.load_record(record)
+
+    def get_profiles(self):
+        """
+        Builds the Profiles of the Benchmark.
+
+        :returns: List of Profile objects.
+        :rtype: list
+        """
+
+        return [self.load_record(record) for record, fields
+                in self.iter_records([KIND_PROFILE])]
+
+    def get_selections(self, profile_id=None):
+        """
+        Builds the selection state of the Groups and Rules for a Profile,
+        like xccdf.models.benchmark.Benchmark.get_selections, from the
+        packed records.
+
+        :param str profile_id: Id of the Profile, None for the defaults.
+        :returns: If each Group and Rule is selected, by id.
+        :rtype: dict
+        :raises ValueError: If the profile doesn't exist or
+                            its extends chain has a loop.
+        """
+
+        selections = dict()
+        clusters = dict()
+        for record, fields in self.iter_records([KIND_GROUP, KIND_RULE]):
+            item_id = self.get_string(fields[2])
+            selections[item_id] = bool(fields[1])
+            if fields[4] >= 0:
+                clusters.setdefault(self.get_string(fields[4]),
+                                    list()).append(item_id)
+
+        chain = list()
+        while profile_id is not None:
+            record = self.find_record(profile_id, KIND_PROFILE)
+            if record is None:
+                raise ValueError('profile {id} not found'.format(
+                    id=profile_id))
+            if record in chain:
+                raise ValueError('profile {id} extends itself'.format(
+                    id=profile_id))
+            chain.append(record)
+            profile_id = self.get_string(self.get_record(record)[5])
+
+        for record in reversed(chain):
+            fields = self.get_record(record)
+            for select in range(fields[7], fields[7] + fields[8]):
+                position = self.selects_pos + select * SELECT_RECORD.size
+                idref, selected = SELECT_RECORD.unpack_from(self.buffer,
+                                                            position)
+                idref = self.get_string(idref)
+                if idref in selections:
+                    selections[idref] = bool(selected)
+                for item_id in clusters.get(idref, list()):
+                    selections[item_id] = bool(selected)
+
+        return selections
+
+    def get_selected_rule_ids(self, profile_id=None):
+        """
+        Returns the ids of the Rules selected by a Profile, without
+        building their models. The Rules of an unselected Group
+        are not selected.
+
+        :param str profile_id: Id of the Profile, None for the defaults.
+        :returns: List of Rule ids, in document order.
+        :rtype: list
+        :raises ValueError: If the profile doesn't exist or
+                            its extends chain has a loop.
+        """
+
+        selections = self.get_selections(profile_id)
+        effective = dict()
+        rule_ids = list()
+
+        # Parents come before their children
+        for record, fields in self.iter_records([KIND_GROUP, KIND_RULE]):
+            selected = (selections[self.get_string(fields[2])]
+                        and (fields[3] < 0 or effective[fields[3]]))
+            effective[record] = selected
+            if selected and fields[0] == KIND_RULE:
+                rule_ids.append(self.get_string(fields[2]))
+
+        return rule_ids
+
+    def get_selected_rules(self, profile_id=None):
+        """
+        Builds the Rules selected by a Profile.
+
+        :param str profile_id: Id of the Profile, None for the defaults.
+        :returns: List of Rule objects, in document order.
+        :rtype: list
+        :raises ValueError: If the profile doesn't exist or
+                            its extends chain has a loop.
+        """
+
+        return [self.get_item(rule_id)
+                for rule_id in self.get_selected_rule_ids(profile_id)]
@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+
+"""
+xccdf.substitution includes the class Substitution, to resolve the
+effective Values of each Profile of a Benchmark and to replace the
+<xccdf:sub> references of the descriptions with them.
+
+This module is part of the xccdf library.
+
+Author: Rodrigo Núñez <rnunezmujica@icloud.com>
+"""
+
+# Python stdlib
+from xml.sax.saxutils import escape
+import re
+
+# XCCDF
+from xccdf.models.description import Description
+from xccdf.models.refine_value import RefineValue
+from xccdf.models.set_value import SetValue
+
+#: Regular expression of a <xccdf:sub> element in the HTML content
+#: of a description, capturing its idref
+SUB_REGEX = re.compile(
+    r'<(?:[\w.-]+:)?sub\s[^>]*?\bidref=["\']([^"\']*)["\'][^>]*/>')
+
+
+class Substitution(object):
+
+    """
+    Value resolver and <xccdf:sub> substitution engine of a Benchmark.
+
+    The value map of each profile is computed once, each description is
+    split in a template once, and the rendered descriptions are cached
+    by profile and item.
+    """
+
+    def __init__(self, benchmark):
+        """
+        Indexes the Values and the Profiles of the benchmark.
+
+        :param xccdf.models.benchmark.Benchmark benchmark: Benchmark.
+        """
+
+        self.values = benchmark.get_value_index()
+        self.profiles = dict((profile.id, profile)
+                             for profile in benchmark.get_profiles())
+
+        self.value_maps = dict()
+        self.templates = dict()
+        self.rendered = dict()
+
+    def __str__(self):
+        """
+        String representation of Substitution object.
+
+        :returns: Substitution object as a string.
+        :rtype: str
+        """
+
+        string_value = 'substitution ({values} values, '\
+                       '{profiles} profiles)'.format(
+                           values=len(self.values),
+                           profiles=len(self.profiles))
+        return string_value
+
+    def get_value_map(self, profile_id=None, extending=None):
+        """
+        Returns the effective value of every Value for a profile.
+
+        The values of the extended profile are applied first, then the
+        refine-value selectors and then the set-value values.
+
+        :param str profile_id: Id of the Profile, None for the defaults.
+        :param set extending: Ids of the profiles being resolved,
+                              to detect extends loops.
+        :returns: Value strings by Value id.
+        :rtype: dict
+        :raises ValueError: If the profile doesn't exist or
+                            its extends chain has a loop.
+        """
+
+        if profile_id in self.value_maps:
+            return self.value_maps[profile_id]
+
+        if profile_id is None:
+            value_map = dict((value_id, value.get_value())
+                             for value_id, value in self.values.items())
+        else:
+            if profile_id not in self.profiles:
+                raise ValueError('profile {id} not found'.format(
+                    id=profile_id))
+            extending = set() if extending is None else extending
+            if profile_id in extending:
+                raise ValueError('profile {id} extends itself'.format(
+                    id=profile_id))
+            extending.add(profile_id)
+
+            profile = self.profiles[profile_id]
+            value_map = dict(self.get_value_map(
+                getattr(profile, 'extends', None), extending))
+
+            for child in profile.children:
+                if (isinstance(child, RefineValue)
+                        and child.idref in self.values):
+                    value_map[child.idref] = self.values[
+                        child.idref].get_value(child.get_selector())
+            for child in profile.children:
+                if isinstance(child, SetValue) and child.idref in self.values:
+                    value_map[child.idref] = child.text
+
+        self.value_maps[profile_id] = value_map
+
+        return value_map
+
+    def get_template(self, description):
+        """
+        Splits the content of a description in its text parts and
+        the idrefs of its <xccdf:sub> elements.
+
+        :param xccdf.models.description.Description description: Description.
+        :returns: Text parts at even positions and idrefs at odd positions.
+        :rtype: list
+        """
+
+        if description not in self.templates:
+            content = getattr(description, 'content', '')
+            self.templates[description] = SUB_REGEX.split(content)
+
+        return self.templates[description]
+
+    def render_description(self, description, profile_id=None):
+        """
+        Replaces the <xccdf:sub> elements of a description with
+        the values of a profile. The values are inserted as text, with
+        their markup characters escaped. Unknown Values are replaced
+        with an empty string.
+
+        :param xccdf.models.description.Description description: Description.
+        :param str profile_id: Id of the Profile, None for the defaults.
+        :returns: Rendered HTML content.
+        :rtype: str
+        """
+
+        template = self.get_template(description)
+        if len(template) == 1:
+            return template[0]
+
+        value_map = self.get_value_map(profile_id)
+        parts = list(template)
+        for index in range(1, len(parts), 2):
+            value = value_map.get(parts[index])
+            parts[index] = '' if value is None else escape(value)
+
+        return ''.join(parts)
+
+    def render(self, item, profile_id=None):
+        """
+        Renders the descriptions of an item for a profile.
+
+        :param xccdf.models.element.Element item: Item with descriptions,
+                                                  like a Rule or a Group.
+        :param str profile_id: Id of the Profile, None for the defaults.
+        :returns: Rendered HTML content of each description.
+        :rtype: list
+        """
+
+        key = (profile_id, item.id)
+        if key not in self.rendered:
+            self.rendered[key] = [
+                self.render_description(child, profile_id)
+                for child in item.children if isinstance(child, Description)]
+
+        return self.rendered[key]
@@ -0,0 +1,11 @@
+# -*- coding: utf-8 -*-
+
+"""
+xccdf.testing includes the tools to test the library and the
+applications using it, like the synthetic document generator
+of xccdf.testing.generate.
+
+This module is part of the xccdf library.
+
+Author: Rodrigo Núñez <rnunezmujica@icloud.com>
+"""
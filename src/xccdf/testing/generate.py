@@ -0,0 +1,531 @@
+# -*- coding: utf-8 -*-
+
+"""
+xccdf.testing.generate includes the class DocumentGenerator and the
+functions generate_benchmark, generate_tailoring and generate_test_result,
+to produce large synthetic XCCDF documents for load and scale testing.
+
+The documents are deterministic: the same options and seed always
+produce the same bytes. The number of Rules, the depth of the Group
+tree, the length of the descriptions, the idents of each Rule, the
+number of Profiles and the density of their selects are configurable.
+The Rule ids only depend on their number, so the Tailoring and
+TestResult generated with the same options refer to the Rules
+of the Benchmark.
+
+The documents are streamed to the destination with lxml.etree.xmlfile,
+one Rule or select at a time, so the memory used doesn't depend on
+their size.
+
+This module is part of the xccdf library.
+
+Author: Rodrigo Núñez <rnunezmujica@icloud.com>
+"""
+
+# Python stdlib
+import random
+
+# lxml
+from lxml import etree
+
+# XCCDF
+from xccdf.constants import NSMAP
+from xccdf.constants.result import RESULT_VALUE_PASS
+from xccdf.constants.result import RESULT_VALUE_FAIL
+from xccdf.constants.result import RESULT_VALUE_NOTAPPLICABLE
+from xccdf.constants.result import RESULT_VALUE_NOTCHECKED
+from xccdf.constants.result import RESULT_VALUE_ERROR
+from xccdf.constants.status import STATUS_VALUE_ACCEPTED
+
+#: Namespace of the generated elements
+XCCDF_NAMESPACE = NSMAP[None]
+
+#: Namespaces declared in the root element of the generated documents
+GENERATED_NSMAP = {None: XCCDF_NAMESPACE, 'xhtml': NSMAP['xhtml']}
+
+#: Prefix of the ids of the generated elements
+ID_PREFIX = 'generated'
+
+#: Date and time written in the generated documents
+GENERATED_DATE = '2014-07-01'
+GENERATED_TIME = '2014-07-01T10:00:00'
+
+#: Systems of the generated idents and checks
+IDENT_SYSTEM = 'http://cce.mitre.org'
+CHECK_SYSTEM = 'http://oval.mitre.org/XMLSchema/oval-definitions-5'
+CHECK_HREF = 'generated-oval.xml'
+
+#: Severities of the generated Rules
+SEVERITY_CHOICES = ['low', 'medium', 'high']
+
+#: Results of the generated rule-results, with their weights
+RESULT_WEIGHTS = [
+    (RESULT_VALUE_PASS, 70),
+    (RESULT_VALUE_FAIL, 20),
+    (RESULT_VALUE_NOTAPPLICABLE, 6),
+    (RESULT_VALUE_NOTCHECKED, 3),
+    (RESULT_VALUE_ERROR, 1),
+]
+
+#: Words of the generated descriptions
+DESCRIPTION_WORDS = [
+    'access', 'account', 'audit', 'authentication', 'boot', 'configure',
+    'daemon', 'default', 'directory', 'disable', 'enable', 'ensure',
+    'file', 'firewall', 'group', 'kernel', 'log', 'mount', 'network',
+    'option', 'package', 'partition', 'password', 'permission', 'policy',
+    'remote', 'restrict', 'root', 'service', 'setting', 'should', 'system',
+    'the', 'user', 'value', 'verify', 'with',
+]
+
+
+def get_tag(tag):
+    """
+    Returns the tag of a generated element, with the XCCDF namespace.
+
+    :param str tag: Tag name.
+    :returns: Tag in Clark notation.
+    :rtype: str
+    """
+
+    return '{{{uri}}}{tag}'.format(uri=XCCDF_NAMESPACE, tag=tag)
+
+
+def new_element(tag, text=None, attrib=None):
+    """
+    Creates a generated element, declaring the XCCDF namespace as the
+    default one, so it is written without prefix.
+
+    :param str tag: Tag name.
+    :param str text: Text of the element.
+    :param dict attrib: Attributes of the element.
+    :returns: New element.
+    :rtype: lxml.etree._Element
+    """
+
+    element = etree.Element(get_tag(tag), attrib or dict(),
+                            nsmap=GENERATED_NSMAP)
+    element.text = text
+    return element
+
+
+def add_child(parent, tag, text=None, attrib=None):
+    """
+    Creates a generated element as the last child of another.
+
+    :param lxml.etree._Element parent: Parent element.
+    :param str tag: Tag name.
+    :param str text: Text of the element.
+    :param dict attrib: Attributes of the element.
+    :returns: New element.
+    :rtype: lxml.etree._Element
+    """
+
+    child = etree.SubElement(parent, get_tag(tag), attrib or dict())
+    child.text = text
+    return child
+
+
+class DocumentGenerator(object):
+
+    """
+    Generates synthetic Benchmark, Tailoring and TestResult documents.
+    """
+
+    def __init__(self, rules=1000, depth=3, branching=4, rules_per_group=10,
+                 description_words=40, idents=1, profiles=2,
+                 select_density=0.5, html=True, seed=0):
+        """
+        Initializes the options of the documents.
+
+        :param int rules: Number of Rules, at least 1.
+        :param int depth: Nesting depth of the Groups. The Rules are
+                          in the Groups of the last level, or in the
+                          Benchmark when it is 0.
+        :param int branching: Maximum number of child Groups of a Group.
+        :param int rules_per_group: Rules in each Group of the last level,
+                                    more when branching and depth don't
+                                    allow as many Groups.
+        :param int description_words: Words of each description.
+        :param int idents: Idents of each Rule.
+        :param int profiles: Number of Profiles.
+        :param float select_density: Fraction of the Rules selected
+                                     by each Profile, from 0 to 1.
+        :param bool html: If the descriptions of the Rules have XHTML
+                          markup, like most real Benchmarks.
+        :param int seed: Seed of the random choices.
+        :raises ValueError: If an option is out of range.
+        """
+
+        if rules < 1 or branching < 1 or rules_per_group < 1:
+            raise ValueError('rules, branching and rules_per_group '
+                             'must be positive')
+        if depth < 0 or description_words < 0 or idents < 0 or profiles < 0:
+            raise ValueError('depth, description_words, idents and profiles '
+                             'must not be negative')
+        if not 0 <= select_density <= 1:
+            raise ValueError('select_density must be between 0 and 1')
+
+        self.rules = rules
+        self.depth = depth
+        self.branching = branching
+        self.rules_per_group = rules_per_group
+        self.description_words = description_words
+        self.idents = idents
+        self.profiles = profiles
+        self.select_density = select_density
+        self.html = html
+        self.seed = seed
+
+    def __str__(self):
+        """
+        String representation of DocumentGenerator object.
+
+        :returns: DocumentGenerator object as a string.
+        :rtype: str
+        """
+
+        return 'generator of {rules} rules, depth {depth}'.format(
+            rules=self.rules, depth=self.depth)
+
+    def get_random(self, document):
+        """
+        Creates the random generator of a document, so each document
+        is the same whatever documents were generated before.
+
+        :param str document: Name of the document.
+        :returns: Random generator.
+        :rtype: random.Random
+        """
+
+        return random.Random('{seed}-{document}'.format(seed=self.seed,
+                                                        document=document))
+
+    @staticmethod
+    def get_rule_id(number):
+        """
+        Returns the id of a generated Rule.
+
+        :param int number: Number of the Rule, from 0.
+        :returns: Rule id.
+        :rtype: str
+        """
+
+        return '{prefix}-rule-{number}'.format(prefix=ID_PREFIX,
+                                               number=number)
+
+    @staticmethod
+    def get_profile_id(number):
+        """
+        Returns the id of a generated Profile.
+
+        :param int number: Number of the Profile, from 0.
+        :returns: Profile id.
+        :rtype: str
+        """
+
+        return '{prefix}-profile-{number}'.format(prefix=ID_PREFIX,
+                                                  number=number)
+
+    def iter_rule_ids(self):
+        """
+        Iterates the ids of the generated Rules, in document order.
+
+        :returns: Iterator of the Rule ids.
+        :rtype: generator
+        """
+
+        for number in range(self.rules):
+            yield self.get_rule_id(number)
+
+    def get_description(self, rng):
+        """
+        Generates the text of a description.
+
+        :param random.Random rng: Random generator.
+        :returns: Text.
+        :rtype: str
+        """
+
+        words = [rng.choice(DESCRIPTION_WORDS)
+                 for index in range(self.description_words)]
+        return ' '.join(words).capitalize() + '.'
+
+    def add_description(self, parent, rng):
+        """
+        Adds a generated description to an element. With XHTML markup,
+        the first word is in a xhtml:code element and the description
+        ends with a xhtml:br element.
+
+        :param lxml.etree._Element parent: Parent element.
+        :param random.Random rng: Random generator.
+        :returns: Description XML element.
+        :rtype: lxml.etree._Element
+        """
+
+        text = self.get_description(rng)
+        if not self.html:
+            return add_child(parent, 'description', text)
+
+        first_word, _, rest = text.partition(' ')
+        description = add_child(parent, 'description')
+        code = etree.SubElement(description, '{{{uri}}}code'.format(
+            uri=NSMAP['xhtml']))
+        code.text = first_word
+        code.tail = ' ' + rest
+        etree.SubElement(description, '{{{uri}}}br'.format(uri=NSMAP['xhtml']))
+
+        return description
+
+    def build_rule(self, number, rng):
+        """
+        Builds the XML element of a generated Rule.
+
+        :param int number: Number of the Rule, from 0.
+        :param random.Random rng: Random generator.
+        :returns: Rule XML element.
+        :rtype: lxml.etree._Element
+        """
+
+        rule = new_element('Rule', attrib={
+            'id': self.get_rule_id(number),
+            'selected': 'true',
+            'severity': rng.choice(SEVERITY_CHOICES),
+        })
+        add_child(rule, 'title', 'Generated rule {number}'.format(
+            number=number))
+        if self.description_words > 0:
+            self.add_description(rule, rng)
+        for index in range(self.idents):
+            add_child(rule, 'ident', 'CCE-{number}-{index}'.format(
+                number=number, index=index), {'system': IDENT_SYSTEM})
+
+        check = add_child(rule, 'check', attrib={'system': CHECK_SYSTEM})
+        add_child(check, 'check-content-ref', attrib={
+            'href': CHECK_HREF,
+            'name': 'oval:{prefix}:def:{number}'.format(prefix=ID_PREFIX,
+                                                        number=number),
+        })
+
+        return rule
+
+    def write_profile(self, xf, number, rng):
+        """
+        Writes a generated Profile, one select at a time.
+
+        :param lxml.etree.xmlfile xf: Incremental XML writer.
+        :param int number: Number of the Profile, from 0.
+        :param random.Random rng: Random generator.
+        """
+
+        with xf.element(get_tag('Profile'),
+                        {'id': self.get_profile_id(number)}):
+            xf.write(new_element('title', 'Generated profile {number}'.format(
+                number=number)))
+
+            for rule_id in self.iter_rule_ids():
+                if rng.random() < self.select_density:
+                    xf.write(new_element('select', attrib={
+                        'idref': rule_id,
+                        'selected': 'true',
+                    }))
+
+    def write_items(self, xf, path, level, leaves, first_rule, rules, rng):
+        """
+        Writes the child Groups of the Benchmark or a Group, or their
+        Rules in the last level.
+
+        :param lxml.etree.xmlfile xf: Incremental XML writer.
+        :param str path: Position of the parent Group, None for the
+                         Benchmark.
+        :param int level: Level of the parent, 0 for the Benchmark.
+        :param int leaves: Groups of the last level under the parent.
+        :param int first_rule: Number of the first Rule under the parent.
+        :param int rules: Number of Rules under the parent.
+        :param random.Random rng: Random generator.
+        """
+
+        if level == self.depth:
+            for number in range(first_rule, first_rule + rules):
+                xf.write(self.build_rule(number, rng))
+            return
+
+        children = min(self.branching, leaves)
+        first_leaf = 0
+        for index in range(children):
+            # The leaves, and the Rules of the leaves, are shared
+            # as evenly as possible
+            child_leaves = (leaves // children
+                            + (1 if index < leaves % children else 0))
+            child_first_rule = first_rule + rules * first_leaf // leaves
+            first_leaf += child_leaves
+            child_rules = (first_rule + rules * first_leaf // leaves
+                           - child_first_rule)
+
+            if path is None:
+                child_path = str(index)
+            else:
+                child_path = '{path}.{index}'.format(path=path, index=index)
+
+            group_id = '{prefix}-group-{path}'.format(prefix=ID_PREFIX,
+                                                      path=child_path)
+            with xf.element(get_tag('Group'), {'id': group_id}):
+                xf.write(new_element('title', 'Generated group {path}'.format(
+                    path=child_path)))
+                self.write_items(xf, child_path, level + 1, child_leaves,
+                                 child_first_rule, child_rules, rng)
+
+    def write_benchmark(self, destination):
+        """
+        Writes a generated Benchmark.
+
+        :param destination: Path or binary file object.
+        :type destination: str or file
+        """
+
+        rng = self.get_random('benchmark')
+
+        with etree.xmlfile(destination, encoding='utf-8') as xf:
+            xf.write_declaration()
+            with xf.element(get_tag('Benchmark'), {
+                    'id': '{prefix}-benchmark'.format(prefix=ID_PREFIX),
+                    'resolved': 'true',
+                    }, nsmap=GENERATED_NSMAP):
+                header = new_element('Benchmark')
+                add_child(header, 'status', STATUS_VALUE_ACCEPTED,
+                          {'date': GENERATED_DATE})
+                add_child(header, 'title', 'Generated benchmark')
+                add_child(header, 'description', self.get_description(rng))
+                add_child(header, 'version', '1.0')
+                for element in header:
+                    xf.write(element)
+
+                for number in range(self.profiles):
+                    self.write_profile(xf, number, rng)
+
+                # The Groups of the last level hold rules_per_group Rules,
+                # or more when there can't be as many Groups
+                leaves = min(-(-self.rules // self.rules_per_group),
+                             self.branching ** self.depth)
+                self.write_items(xf, None, 0, leaves, 0, self.rules, rng)
+
+    def write_tailoring(self, destination):
+        """
+        Writes a generated Tailoring, with Profiles selecting
+        the Rules of the generated Benchmark.
+
+        :param destination: Path or binary file object.
+        :type destination: str or file
+        """
+
+        rng = self.get_random('tailoring')
+
+        with etree.xmlfile(destination, encoding='utf-8') as xf:
+            xf.write_declaration()
+            with xf.element(get_tag('Tailoring'), {
+                    'id': 'xccdf_{prefix}_tailoring_{seed}'.format(
+                        prefix=ID_PREFIX, seed=self.seed),
+                    }, nsmap=GENERATED_NSMAP):
+                header = new_element('Tailoring')
+                add_child(header, 'version', '1.0', {'time': GENERATED_TIME})
+                add_child(header, 'status', STATUS_VALUE_ACCEPTED,
+                          {'date': GENERATED_DATE})
+                for element in header:
+                    xf.write(element)
+
+                # A Tailoring requires at least one Profile
+                for number in range(max(self.profiles, 1)):
+                    self.write_profile(xf, number, rng)
+
+    def write_test_result(self, destination):
+        """
+        Writes a generated TestResult, with a rule-result for each
+        Rule of the generated Benchmark.
+
+        :param destination: Path or binary file object.
+        :type destination: str or file
+        """
+
+        rng = self.get_random('test-result')
+        results = [result for result, weight in RESULT_WEIGHTS]
+        weights = [weight for result, weight in RESULT_WEIGHTS]
+        passed = 0
+
+        with etree.xmlfile(destination, encoding='utf-8') as xf:
+            xf.write_declaration()
+            with xf.element(get_tag('TestResult'), {
+                    'id': '{prefix}-testresult'.format(prefix=ID_PREFIX),
+                    'start-time': GENERATED_TIME,
+                    'end-time': GENERATED_TIME,
+                    }, nsmap=GENERATED_NSMAP):
+                header = new_element('TestResult')
+                add_child(header, 'benchmark', attrib={
+                    'href': '{prefix}-benchmark.xml'.format(prefix=ID_PREFIX),
+                })
+                add_child(header, 'title', 'Generated test result')
+                if self.profiles > 0:
+                    add_child(header, 'profile',
+                              attrib={'idref': self.get_profile_id(0)})
+                add_child(header, 'target', 'host.example.com')
+                facts = add_child(header, 'target-facts')
+                add_child(facts, 'fact', 'host.example.com', {
+                    'name': 'urn:xccdf:fact:asset:identifier:host_name',
+                    'type': 'string',
+                })
+                for element in header:
+                    xf.write(element)
+
+                for number in range(self.rules):
+                    result = rng.choices(results, weights)[0]
+                    passed += result == RESULT_VALUE_PASS
+
+                    rule_result = new_element('rule-result', attrib={
+                        'idref': self.get_rule_id(number),
+                        'time': GENERATED_TIME,
+                    })
+                    add_child(rule_result, 'result', result)
+                    for index in range(self.idents):
+                        add_child(rule_result, 'ident',
+                                  'CCE-{number}-{index}'.format(
+                                      number=number, index=index),
+                                  {'system': IDENT_SYSTEM})
+                    xf.write(rule_result)
+
+                score = 100.0 * passed / self.rules
+                xf.write(new_element('score', '{score:.6f}'.format(
+                    score=score), {'maximum': '100'}))
+
+
+def generate_benchmark(destination, **options):
+    """
+    Writes a generated Benchmark.
+
+    :param destination: Path or binary file object.
+    :type destination: str or file
+    :param options: Options of DocumentGenerator.
+    """
+
+    DocumentGenerator(**options).write_benchmark(destination)
+
+
+def generate_tailoring(destination, **options):
+    """
+    Writes a generated Tailoring.
+
+    :param destination: Path or binary file object.
+    :type destination: str or file
+    :param options: Options of DocumentGenerator.
+    """
+
+    DocumentGenerator(**options).write_tailoring(destination)
+
+
+def generate_test_result(destination, **options):
+    """
+    Writes a generated TestResult.
+
+    :param destination: Path or binary file object.
+    :type destination: str or file
+    :param options: Options of DocumentGenerator.
+    """
+
+    DocumentGenerator(**options).write_test_result(destination)
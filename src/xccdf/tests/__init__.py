@@ -1,10 +1,52 @@
 from xccdf.models import tests
+from xccdf.tests import test_validation
+from xccdf.tests import test_references
+from xccdf.tests import test_results
+from xccdf.tests import test_scoring
+from xccdf.tests import test_fleet
+from xccdf.tests import test_diff
+from xccdf.tests import test_substitution
+from xccdf.tests import test_checks
+from xccdf.tests import test_sce
+from xccdf.tests import test_cache
+from xccdf.tests import test_cpe
+from xccdf.tests import test_dependencies
+from xccdf.tests import test_frozen
+from xccdf.tests import test_shared
+from xccdf.tests import test_aio
+from xccdf.tests import test_cli
+from xccdf.tests import test_package
+from xccdf.tests import test_builder
+from xccdf.tests import test_generate
+from xccdf.tests import test_instrumentation
+from xccdf.tests import test_memory
 import unittest
 
 
 def suite():
     suite = unittest.TestSuite()
     suite.addTests(tests.suite())
+    suite.addTests(test_validation.suite())
+    suite.addTests(test_references.suite())
+    suite.addTests(test_results.suite())
+    suite.addTests(test_scoring.suite())
+    suite.addTests(test_fleet.suite())
+    suite.addTests(test_diff.suite())
+    suite.addTests(test_substitution.suite())
+    suite.addTests(test_checks.suite())
+    suite.addTests(test_sce.suite())
+    suite.addTests(test_cache.suite())
+    suite.addTests(test_cpe.suite())
+    suite.addTests(test_dependencies.suite())
+    suite.addTests(test_frozen.suite())
+    suite.addTests(test_shared.suite())
+    suite.addTests(test_aio.suite())
+    suite.addTests(test_cli.suite())
+    suite.addTests(test_package.suite())
+    suite.addTests(test_builder.suite())
+    suite.addTests(test_generate.suite())
+    suite.addTests(test_instrumentation.suite())
+    suite.addTests(test_memory.suite())
     return suite
 
 if __name__ == '__main__':
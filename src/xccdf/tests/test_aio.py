@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+
+# Python stdlib
+import unittest
+import os
+import io
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor
+
+# lxml
+from lxml import etree
+
+# XCCDF
+from xccdf import aio
+from xccdf.aio import AsyncLoader
+from xccdf.models.benchmark import Benchmark
+from xccdf.models.tailoring import Tailoring
+from xccdf.models.test_result import TestResult
+
+
+class AsyncLoaderTestCase(unittest.TestCase):
+
+    """
+    Test cases for AsyncLoader class
+    """
+
+    def get_example_path(self, file_name):
+        """
+        Helper method to get the path of an example document
+        """
+
+        return os.path.join(os.path.abspath(os.path.dirname(__file__)),
+                            'examples', file_name)
+
+    def setUp(self):
+        """
+        Paths of the example documents
+        """
+
+        self.benchmark_path = self.get_example_path(
+            'example_xccdf_substitution_benchmark.xml')
+        self.tailoring_path = self.get_example_path(
+            'example_xccdf_references_tailoring.xml')
+        self.results_path = os.path.join(
+            os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+            'models', 'tests', 'examples', 'example_xccdf_test_result_ok.xml')
+
+        self.benchmark = Benchmark(etree.parse(self.benchmark_path).getroot())
+
+    def test_init(self):
+        """
+        Tests the loader options
+        """
+
+        self.assertEqual(str(AsyncLoader(limit=2)),
+                         'async loader (threads, limit 2)',
+                         'String representation does not match')
+        with self.assertRaises(ValueError):
+            AsyncLoader(limit=0)
+
+    def test_method_load(self):
+        """
+        Tests loading documents in threads
+        """
+
+        async def load():
+            loader = AsyncLoader(limit=2)
+            return await asyncio.gather(
+                aio.load_benchmark(self.benchmark_path, loader),
+                aio.load_tailoring(self.tailoring_path, loader),
+                aio.load_results(self.results_path, loader))
+
+        benchmark, tailoring, results = asyncio.run(load())
+
+        self.assertIsInstance(benchmark, Benchmark, 'Benchmark not loaded')
+        self.assertEqual(benchmark.as_dict(), self.benchmark.as_dict(),
+                         'Benchmark does not match')
+        self.assertIsInstance(tailoring, Tailoring, 'Tailoring not loaded')
+        self.assertEqual([type(result) for result in results], [TestResult],
+                         'TestResults not loaded')
+
+    def test_method_load_processes(self):
+        """
+        Tests loading documents in processes
+        """
+
+        async def load(loader):
+            with io.open(self.benchmark_path, 'rb') as benchmark_file:
+                content = benchmark_file.read()
+            return await asyncio.gather(
+                aio.load_benchmark(content, loader),
+                aio.load_results(self.results_path, loader))
+
+        with ProcessPoolExecutor(2) as executor:
+            loader = AsyncLoader(executor)
+            self.assertTrue(loader.uses_processes(), 'Executor not detected')
+            benchmark, results = asyncio.run(load(loader))
+            content = asyncio.run(aio.dump(benchmark,
+                                           loader=AsyncLoader(executor)))
+
+        self.assertEqual(benchmark.as_dict(), self.benchmark.as_dict(),
+                         'Thawed Benchmark does not match')
+        self.assertEqual(results[0].id, 'xccdf_test_testresult_test',
+                         'Thawed TestResult does not match')
+        dumped = Benchmark(etree.fromstring(content))
+        self.assertEqual(list(dumped.get_item_index().keys()),
+                         list(self.benchmark.get_item_index().keys()),
+                         'Dumped Benchmark does not match')
+        self.assertEqual(dumped.get_selections('custom-profile'),
+                         self.benchmark.get_selections('custom-profile'),
+                         'Dumped Benchmark does not match')
+
+    def test_method_dump(self):
+        """
+        Tests the dump method
+        """
+
+        content = asyncio.run(aio.dump(self.benchmark, pretty_print=True))
+
+        self.assertTrue(content.startswith(b'<?xml'),
+                        'XML declaration not found')
+        dumped = Benchmark(etree.fromstring(content))
+        self.assertEqual(list(dumped.get_item_index().keys()),
+                         list(self.benchmark.get_item_index().keys()),
+                         'Dumped Benchmark does not match')
+        self.assertEqual(dumped.get_selections('custom-profile'),
+                         self.benchmark.get_selections('custom-profile'),
+                         'Dumped Benchmark does not match')
+
+    def test_method_run(self):
+        """
+        Tests the concurrency limit and the cancellation
+        """
+
+        lock = threading.Lock()
+        running = [0, 0]
+        released = threading.Event()
+        started = list()
+
+        def work(index):
+            with lock:
+                started.append(index)
+                running[0] += 1
+                running[1] = max(running)
+            released.wait(5)
+            with lock:
+                running[0] -= 1
+            return index
+
+        async def run(loader):
+            tasks = [asyncio.ensure_future(loader.run(work, index))
+                     for index in range(6)]
+            await asyncio.sleep(0.1)
+            tasks[-1].cancel()
+            released.set()
+            return await asyncio.gather(*tasks, return_exceptions=True)
+
+        with ThreadPoolExecutor(6) as executor:
+            results = asyncio.run(run(AsyncLoader(executor, limit=2)))
+
+        self.assertEqual(running[1], 2, 'Concurrency limit exceeded')
+        self.assertEqual(results[:5], [0, 1, 2, 3, 4],
+                         'Results do not match')
+        self.assertIsInstance(results[5], asyncio.CancelledError,
+                              'Task not cancelled')
+        self.assertNotIn(5, started, 'Cancelled work must not start')
+
+    def test_method_run_cancel_running(self):
+        """
+        Tests that cancelled work keeps its slot until it finishes
+        """
+
+        released = threading.Event()
+        started = list()
+
+        def work(index):
+            started.append(index)
+            if index == 0:
+                released.wait(5)
+            return index
+
+        async def run(loader):
+            first = asyncio.ensure_future(loader.run(work, 0))
+            await asyncio.sleep(0.1)
+            first.cancel()
+            second = asyncio.ensure_future(loader.run(work, 1))
+            await asyncio.sleep(0.1)
+            waiting = list(started)
+            released.set()
+            result = await second
+            return waiting, result, first.cancelled()
+
+        with ThreadPoolExecutor(2) as executor:
+            waiting, result, cancelled = asyncio.run(
+                run(AsyncLoader(executor, limit=1)))
+
+        self.assertTrue(cancelled, 'Task not cancelled')
+        self.assertEqual(waiting, [0], 'Slot freed before the work finished')
+        self.assertEqual(result, 1, 'Result does not match')
+
+    def test_default_loader(self):
+        """
+        Tests the loader shared by the module coroutines
+        """
+
+        async def get_loaders():
+            return aio.get_default_loader(), aio.get_default_loader()
+
+        first, second = asyncio.run(get_loaders())
+        other, _ = asyncio.run(get_loaders())
+
+        self.assertIs(first, second, 'Loader not shared in the event loop')
+        self.assertIsNot(first, other, 'Loader shared between event loops')
+        self.assertEqual(first.limit, aio.DEFAULT_LIMIT,
+                         'Limit does not match')
+
+
+def suite():
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+    suite.addTest(loader.loadTestsFromTestCase(AsyncLoaderTestCase))
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.TextTestRunner(verbosity=2).run(suite())
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+
+# Python stdlib
+import unittest
+import os
+import io
+
+# lxml
+from lxml import etree
+
+# XCCDF
+from xccdf.builder import load
+from xccdf.builder import ExpatBuilder
+from xccdf.builder import BUILDER_EXPAT
+from xccdf.models.benchmark import Benchmark
+from xccdf.exceptions import InvalidValueException
+
+
+class ExpatBuilderTestCase(unittest.TestCase):
+
+    """
+    Test cases for the expat builder
+    """
+
+    def get_example_path(self, file_name, models=False):
+        """
+        Helper method to get the path of an example file
+        """
+
+        tests_dir = os.path.abspath(os.path.dirname(__file__))
+        if models:
+            tests_dir = os.path.join(os.path.dirname(tests_dir),
+                                     'models', 'tests')
+
+        return os.path.join(tests_dir, 'examples', file_name)
+
+    def test_same_as_dict(self):
+        """
+        Tests that both builders load the same models
+        """
+
+        paths = [
+            self.get_example_path('example_xccdf_substitution_benchmark.xml'),
+            self.get_example_path('example_xccdf_dependencies_benchmark.xml'),
+            self.get_example_path('example_xccdf.xml', models=True),
+        ]
+
+        for path in paths:
+            benchmark = load(path)
+            expat_benchmark = load(path, builder=BUILDER_EXPAT)
+
+            self.assertIsInstance(expat_benchmark, Benchmark,
+                                  'Root model does not match')
+            self.assertEqual(benchmark.as_dict(), expat_benchmark.as_dict(),
+                             'as_dict does not match for {path}'.format(
+                                 path=path))
+
+    def test_sources(self):
+        """
+        Tests loading from a path, a file object and bytes
+        """
+
+        path = self.get_example_path(
+            'example_xccdf_substitution_benchmark.xml')
+        benchmark = load(path, builder=BUILDER_EXPAT)
+
+        with io.open(path, 'rb') as xml_file:
+            from_file = load(xml_file, builder=BUILDER_EXPAT)
+        with io.open(path, 'rb') as xml_file:
+            from_bytes = load(xml_file.read(), builder=BUILDER_EXPAT)
+
+        self.assertEqual(benchmark.as_dict(), from_file.as_dict(),
+                         'File object load does not match')
+        self.assertEqual(benchmark.as_dict(), from_bytes.as_dict(),
+                         'Bytes load does not match')
+
+    def test_errors(self):
+        """
+        Tests that non strict loads locate the errors in the same way
+        """
+
+        path = self.get_example_path('example_xccdf_validation_errors.xml')
+        benchmark = load(path, strict=False)
+        expat_benchmark = load(path, builder=BUILDER_EXPAT, strict=False)
+
+        errors = [(str(error), error.path, error.sourceline)
+                  for error in benchmark.errors]
+        expat_errors = [(str(error), error.path, error.sourceline)
+                        for error in expat_benchmark.errors]
+
+        self.assertGreater(len(expat_errors), 0, 'Errors not collected')
+        self.assertEqual(errors, expat_errors, 'Errors do not match')
+
+        with self.assertRaises(InvalidValueException):
+            load(path, builder=BUILDER_EXPAT)
+
+    def test_no_xml_element(self):
+        """
+        Tests that the models don't keep the XML elements
+        """
+
+        path = self.get_example_path(
+            'example_xccdf_substitution_benchmark.xml')
+        benchmark = load(path, builder=BUILDER_EXPAT)
+
+        self.assertFalse(hasattr(benchmark, 'xml_element'),
+                         'XML element kept')
+        self.assertFalse(hasattr(benchmark.children[0], 'xml_element'),
+                         'XML element kept in the children')
+
+        xml_element = benchmark.update_xml_element()
+        self.assertEqual(etree.QName(xml_element).localname, 'Benchmark',
+                         'XML element not rebuilt')
+
+    def test_parse(self):
+        """
+        Tests the elements built by ExpatBuilder
+        """
+
+        xml_string = (b'<a xmlns="urn:test" id="1">text<b/>tail'
+                      b'<!--comment--></a>')
+
+        for track_lines in (False, True):
+            builder = ExpatBuilder(track_lines=track_lines)
+            root = builder.parse(xml_string)
+
+            self.assertEqual(root.tag, '{urn:test}a', 'Tag does not match')
+            self.assertEqual(root.get('id'), '1', 'Attribute does not match')
+            self.assertEqual(root.text, 'text', 'Text does not match')
+            self.assertEqual(root[0].tail, 'tail', 'Tail does not match')
+            self.assertEqual(root[1].text, 'comment', 'Comment not kept')
+
+        self.assertEqual(root[0].sourceline, 1, 'Line does not match')
+        self.assertIs(root[0].getparent(), root, 'Parent does not match')
+
+        builder.release()
+        self.assertIsNone(root[0].getparent(), 'Parent not released')
+
+    def test_invalid_load(self):
+        """
+        Tests the load errors
+        """
+
+        path = self.get_example_path(
+            'example_xccdf_substitution_benchmark.xml')
+
+        with self.assertRaises(ValueError):
+            load(path, builder='dom')
+
+        with self.assertRaises(ValueError):
+            load(b'<Unknown/>', builder=BUILDER_EXPAT)
+
+
+def suite():
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+    suite.addTest(loader.loadTestsFromTestCase(ExpatBuilderTestCase))
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.TextTestRunner(verbosity=2).run(suite())
@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+
+# Python stdlib
+import unittest
+import os
+import shutil
+import tempfile
+
+# XCCDF
+from xccdf.cache import ResultCache
+from xccdf.cache import get_cache_key
+from xccdf.cache import get_fingerprint
+
+
+class ResultCacheTestCase(unittest.TestCase):
+
+    """
+    Test cases for ResultCache class
+    """
+
+    def setUp(self):
+        """
+        Creates an in memory cache with a fake clock
+        """
+
+        self.now = 1000.0
+        self.cache = ResultCache(ttl=60, max_entries=2)
+        self.cache.clock = lambda: self.now
+
+    def tearDown(self):
+        """
+        Closes the cache
+        """
+
+        self.cache.close()
+
+    def test_function_get_cache_key(self):
+        """
+        Tests the get_fingerprint and get_cache_key functions
+        """
+
+        self.assertEqual(get_fingerprint({'a': 1, 'b': 2}),
+                         get_fingerprint({'b': 2, 'a': 1}),
+                         'Fingerprints must not depend on the key order')
+
+        key = get_cache_key(b'exit 101', {'value-1': '5'}, {'host': 'a'})
+        self.assertEqual(len(key), 64, 'Key is not a SHA-256 digest')
+        self.assertEqual(key, get_cache_key(b'exit 101', {'value-1': '5'},
+                                            {'host': 'a'}),
+                         'Keys must be stable')
+        self.assertNotEqual(key, get_cache_key(b'exit 102', {'value-1': '5'},
+                                               {'host': 'a'}),
+                            'Keys must depend on the content')
+        self.assertNotEqual(key, get_cache_key(b'exit 101', {'value-1': '6'},
+                                               {'host': 'a'}),
+                            'Keys must depend on the values')
+        self.assertNotEqual(key, get_cache_key(b'exit 101', {'value-1': '5'},
+                                               {'host': 'b'}),
+                            'Keys must depend on the facts')
+        self.assertNotEqual(key, get_cache_key(b'exit 101', {'value-1': '5'},
+                                               {'host': 'a'}, 'rule-2'),
+                            'Keys must depend on the rule')
+        self.assertNotEqual(key, get_cache_key(b'exit 101', {'value-1': '5'},
+                                               {'host': 'a'},
+                                               exports={'VALUE': '1'}),
+                            'Keys must depend on the exported values')
+
+    def test_method_get(self):
+        """
+        Tests the get and set methods
+        """
+
+        self.assertIsNone(self.cache.get('key-1', 'rule-1'),
+                          'Unknown keys must not be cached')
+
+        self.cache.set('key-1', 'rule-1', 'pass', 101, 'out', 'err')
+        self.assertEqual(self.cache.get('key-1', 'rule-1'),
+                         ('pass', 101, 'out', 'err'),
+                         'Cached result does not match')
+        self.assertEqual(str(self.cache), 'result cache :memory: (1 entries)',
+                         'String representation does not match')
+
+    def test_ttl(self):
+        """
+        Tests the expiration of the results
+        """
+
+        self.cache.set('key-1', 'rule-1', 'pass')
+        self.now += 59
+        self.assertIsNotNone(self.cache.get('key-1', 'rule-1'),
+                             'Result must not be expired yet')
+        self.now += 1
+        self.assertIsNone(self.cache.get('key-1', 'rule-1'),
+                          'Result must be expired')
+        self.assertEqual(len(self.cache), 0,
+                         'Expired result must be removed')
+
+    def test_lru(self):
+        """
+        Tests the eviction of the least recently used results
+        """
+
+        self.cache.set('key-1', 'rule-1', 'pass')
+        self.now += 1
+        self.cache.set('key-2', 'rule-2', 'fail')
+        self.now += 1
+        self.cache.get('key-1', 'rule-1')
+        self.now += 1
+        self.cache.set('key-3', 'rule-3', 'pass')
+
+        self.assertEqual(len(self.cache), 2, 'Cache must be full')
+        self.assertIsNone(self.cache.get('key-2', 'rule-2'),
+                          'Least recently used result must be evicted')
+        self.assertIsNotNone(self.cache.get('key-1', 'rule-1'),
+                             'Recently used result must be kept')
+
+    def test_method_get_hit_rates(self):
+        """
+        Tests the get_hit_rates and clear methods
+        """
+
+        self.cache.set('key-1', 'rule-1', 'pass')
+        self.cache.get('key-1', 'rule-1')
+        self.cache.get('key-2', 'rule-1')
+        self.cache.get('key-3', 'rule-2')
+
+        self.assertEqual(list(self.cache.get_hit_rates().items()),
+                         [('rule-1', 0.5), ('rule-2', 0.0)],
+                         'Hit rates do not match')
+
+        self.cache.clear()
+        self.assertEqual(len(self.cache), 0, 'Results not cleared')
+        self.assertEqual(len(self.cache.get_hit_rates()), 0,
+                         'Metrics not cleared')
+
+    def test_file_backend(self):
+        """
+        Tests that the results are kept in the database file
+        """
+
+        cache_dir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(cache_dir, 'results.sqlite')
+            cache = ResultCache(path)
+            cache.set('key-1', 'rule-1', 'fail', 102)
+            cache.close()
+
+            cache = ResultCache(path)
+            self.assertEqual(cache.get('key-1', 'rule-1'),
+                             ('fail', 102, '', ''),
+                             'Result not kept in the file')
+            cache.close()
+        finally:
+            shutil.rmtree(cache_dir)
+
+
+def suite():
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+    suite.addTest(loader.loadTestsFromTestCase(ResultCacheTestCase))
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.TextTestRunner(verbosity=2).run(suite())
@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+
+# Python stdlib
+import unittest
+import os
+import io
+import shutil
+import tempfile
+
+# lxml
+from lxml import etree
+
+# XCCDF
+from xccdf.checks import CheckIndex
+from xccdf.models.benchmark import Benchmark
+from xccdf.constants.check import CHECK_SYSTEM_OVAL
+from xccdf.constants.check import CHECK_SYSTEM_SCE
+
+
+class CheckIndexTestCase(unittest.TestCase):
+
+    """
+    Test cases for CheckIndex class
+    """
+
+    def get_examples_dir(self):
+        """
+        Helper method to get the path of the examples directory
+        """
+
+        return os.path.join(os.path.abspath(os.path.dirname(__file__)),
+                            'examples')
+
+    def load_example_element(self, xml_file_type='benchmark'):
+        """
+        Helper method to load an XML element
+        """
+
+        file_name = 'example_xccdf_checks_{type}.xml'.format(
+            type=xml_file_type)
+
+        xml_file = io.open(os.path.join(self.get_examples_dir(), file_name))
+
+        xml_string = xml_file.read()
+        xml_file.close()
+
+        element_tree = etree.fromstring(xml_string.encode('utf-8'))
+
+        return element_tree
+
+    def setUp(self):
+        """
+        Builds the check index of the example Benchmark
+        """
+
+        self.index = CheckIndex(Benchmark(self.load_example_element()))
+
+    def test_init(self):
+        """
+        Tests the indexed checks
+        """
+
+        self.assertEqual(str(self.index), 'check index (4 checks, 3 rules)',
+                         'String representation does not match')
+
+    def test_method_get_rules(self):
+        """
+        Tests the get_rules method
+        """
+
+        self.assertEqual(self.index.get_rules(CHECK_SYSTEM_OVAL,
+                                              'test-oval.xml',
+                                              'oval:test:def:1'),
+                         ['test-rule-1', 'test-rule-2'],
+                         'Rules do not match')
+        self.assertEqual(self.index.get_rules(CHECK_SYSTEM_SCE,
+                                              'test-oval.xml'),
+                         list(), 'Unknown checks must have no rules')
+
+    def test_method_get_checks(self):
+        """
+        Tests the get_checks method
+        """
+
+        self.assertEqual(self.index.get_checks('test-rule-2'),
+                         [(CHECK_SYSTEM_OVAL, 'test-oval.xml',
+                           'oval:test:def:1'),
+                          (CHECK_SYSTEM_SCE, 'scripts/test-script.sh', None)],
+                         'Checks do not match')
+
+    def test_method_get_content_files(self):
+        """
+        Tests the get_content_files method
+        """
+
+        content_files = self.index.get_content_files(CHECK_SYSTEM_OVAL)
+
+        self.assertEqual(list(content_files.items()),
+                         [('test-oval.xml', ['oval:test:def:1',
+                                             'oval:test:def:2']),
+                          ('https://example.com/remote-oval.xml', None)],
+                         'Content files do not match')
+        self.assertEqual(len(self.index.get_content_files()), 3,
+                         'Content files do not match')
+
+    def test_method_export_content_files(self):
+        """
+        Tests the export_content_files method
+        """
+
+        target_dir = tempfile.mkdtemp()
+        try:
+            copied = self.index.export_content_files(
+                os.path.join(self.get_examples_dir(), 'checks'), target_dir)
+
+            self.assertEqual(copied, [
+                os.path.join(target_dir, 'test-oval.xml'),
+                os.path.join(target_dir, 'scripts/test-script.sh')],
+                'Copied files do not match')
+            for path in copied:
+                self.assertTrue(os.path.isfile(path),
+                                'File not copied')
+        finally:
+            shutil.rmtree(target_dir)
+
+    def test_method_export_content_files_outside(self):
+        """
+        Tests the export_content_files method with an href
+        outside of the directories
+        """
+
+        index = CheckIndex(Benchmark(self.load_example_element('traversal')))
+        target_dir = tempfile.mkdtemp()
+        try:
+            with self.assertRaises(ValueError):
+                index.export_content_files(
+                    os.path.join(self.get_examples_dir(), 'checks'),
+                    os.path.join(target_dir, 'export'))
+
+            self.assertEqual(os.listdir(target_dir), list(),
+                             'Files copied')
+        finally:
+            shutil.rmtree(target_dir)
+
+
+def suite():
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+    suite.addTest(loader.loadTestsFromTestCase(CheckIndexTestCase))
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.TextTestRunner(verbosity=2).run(suite())
@@ -0,0 +1,244 @@
+# -*- coding: utf-8 -*-
+
+# Python stdlib
+import unittest
+import os
+import io
+import json
+import shutil
+import tempfile
+
+# lxml
+from lxml import etree
+
+# XCCDF
+from xccdf.cli import main
+from xccdf.cli import find_input_files
+from xccdf.cli import format_throughput
+from xccdf.cli import MANIFEST_NAME
+
+
+class CommandLineTestCase(unittest.TestCase):
+
+    """
+    Test cases for the xccdf command
+    """
+
+    def get_example_path(self, file_name):
+        """
+        Helper method to get the path of an example document
+        """
+
+        return os.path.join(os.path.abspath(os.path.dirname(__file__)),
+                            'examples', file_name)
+
+    def run_command(self, argv):
+        """
+        Helper method to run the command, returning its status and output
+        """
+
+        stream = io.StringIO()
+        status = main(argv + ['--processes', '2'], stream)
+
+        return status, stream.getvalue().splitlines()
+
+    def setUp(self):
+        """
+        Creates an input directory with copies of the examples
+        """
+
+        self.temp_dir = tempfile.mkdtemp()
+        self.input_dir = os.path.join(self.temp_dir, 'input')
+        self.output_dir = os.path.join(self.temp_dir, 'output')
+
+        os.makedirs(os.path.join(self.input_dir, 'nested'))
+        shutil.copy(self.get_example_path(
+            'example_xccdf_dependencies_benchmark.xml'),
+            os.path.join(self.input_dir, 'benchmark.xml'))
+        shutil.copy(self.get_example_path(
+            'example_xccdf_references_tailoring.xml'),
+            os.path.join(self.input_dir, 'nested', 'tailoring.xml'))
+
+    def tearDown(self):
+        """
+        Removes the input and output directories
+        """
+
+        shutil.rmtree(self.temp_dir)
+
+    def test_find_input_files(self):
+        """
+        Tests the find_input_files function
+        """
+
+        files = find_input_files([self.input_dir], self.output_dir)
+
+        self.assertEqual(files, [
+            (os.path.join(self.input_dir, 'benchmark.xml'),
+             os.path.join(self.output_dir, 'benchmark')),
+            (os.path.join(self.input_dir, 'nested', 'tailoring.xml'),
+             os.path.join(self.output_dir, 'nested', 'tailoring'))],
+            'Input files do not match')
+
+        benchmark_path = os.path.join(self.input_dir, 'benchmark.xml')
+        self.assertEqual(
+            find_input_files([benchmark_path, benchmark_path],
+                             self.output_dir),
+            [(benchmark_path, os.path.join(self.output_dir, 'benchmark'))],
+            'Repeated input not merged')
+
+    def test_find_input_files_same_output(self):
+        """
+        Tests the find_input_files function with inputs
+        that have the same output
+        """
+
+        other_path = os.path.join(self.input_dir, 'nested', 'benchmark.xml')
+        shutil.copy(os.path.join(self.input_dir, 'benchmark.xml'), other_path)
+
+        with self.assertRaises(ValueError):
+            find_input_files([os.path.join(self.input_dir, 'benchmark.xml'),
+                              other_path], self.output_dir)
+
+        status, lines = self.run_command([
+            'convert', '-f', 'json', '-o', self.output_dir,
+            os.path.join(self.input_dir, 'benchmark.xml'), other_path])
+
+        self.assertEqual(status, 2, 'Same output not reported')
+        self.assertFalse(os.path.exists(self.output_dir),
+                         'Files converted')
+
+    def test_format_throughput(self):
+        """
+        Tests the format_throughput function
+        """
+
+        self.assertEqual(format_throughput(10, 5000000, 2.0),
+                         '10 files, 5.00 MB in 2.00 s '
+                         '(5.0 files/s, 2.50 MB/s)',
+                         'Throughput does not match')
+
+    def test_convert_json(self):
+        """
+        Tests the convert subcommand to JSON, skipping unchanged files
+        """
+
+        argv = ['convert', '-f', 'json', '-o', self.output_dir,
+                self.input_dir]
+        status, lines = self.run_command(argv)
+
+        self.assertEqual(status, 0, 'Conversion failed')
+        self.assertEqual(len(lines), 2, 'Output lines do not match')
+
+        json_path = os.path.join(self.output_dir, 'nested', 'tailoring.json')
+        with io.open(json_path, encoding='utf-8') as json_file:
+            self.assertEqual(json.load(json_file)['name'], 'Tailoring',
+                             'JSON does not match')
+
+        manifest_path = os.path.join(self.output_dir, MANIFEST_NAME)
+        with io.open(manifest_path, encoding='utf-8') as manifest_file:
+            self.assertEqual(len(json.load(manifest_file)), 2,
+                             'Manifest does not match')
+
+        # Only the changed file is converted again
+        with io.open(os.path.join(self.input_dir, 'benchmark.xml'),
+                     'ab') as benchmark_file:
+            benchmark_file.write(b'\n')
+        status, lines = self.run_command(argv)
+        self.assertEqual(sorted(line.split()[0] for line in lines),
+                         ['ok', 'skipped'], 'Unchanged file not skipped')
+
+    def test_convert_csv(self):
+        """
+        Tests the convert subcommand to CSV and trimmed XML
+        """
+
+        benchmark_path = os.path.join(self.input_dir, 'benchmark.xml')
+        status, lines = self.run_command(['convert', '-f', 'csv', '-o',
+                                          self.output_dir, benchmark_path])
+
+        self.assertEqual(status, 0, 'Conversion failed')
+        csv_path = os.path.join(self.output_dir, 'benchmark.csv')
+        with io.open(csv_path, encoding='utf-8') as csv_file:
+            rows = csv_file.read().splitlines()
+        self.assertEqual(rows[0], 'id,kind,parent,selected,severity,title',
+                         'CSV header does not match')
+        self.assertEqual(rows[2], 'test-rule-1,Rule,test-group-a,true,,'
+                         'Rule requiring an unselected rule',
+                         'CSV row does not match')
+
+        tailoring_path = os.path.join(self.input_dir, 'nested',
+                                      'tailoring.xml')
+        status, lines = self.run_command(['convert', '-f', 'csv', '-o',
+                                          self.output_dir, tailoring_path])
+        self.assertEqual(status, 1, 'Unsupported conversion must fail')
+
+        status, lines = self.run_command(['convert', '-f', 'xml', '-o',
+                                          self.output_dir, benchmark_path])
+        xml_path = os.path.join(self.output_dir, 'benchmark.xml')
+        with io.open(xml_path, 'rb') as xml_file:
+            content = xml_file.read()
+        self.assertNotIn(b'\n    <', content, 'XML not trimmed')
+        self.assertEqual(len(etree.fromstring(content).findall('.//{*}Rule')),
+                         8, 'Trimmed XML does not match')
+
+    def test_stats(self):
+        """
+        Tests the stats subcommand
+        """
+
+        status, lines = self.run_command(['stats', self.input_dir])
+
+        self.assertEqual(status, 0, 'Stats failed')
+        stats = dict((line.split('\t')[0], json.loads(line.split('\t')[1]))
+                     for line in lines)
+        benchmark_stats = stats[os.path.join(self.input_dir,
+                                             'benchmark.xml')]
+        self.assertEqual((benchmark_stats['root'], benchmark_stats['Group'],
+                          benchmark_stats['Rule']),
+                         ('Benchmark', 2, 8), 'Stats do not match')
+
+    def test_validate(self):
+        """
+        Tests the validate subcommand
+        """
+
+        xsd_path = self.get_example_path(
+            'example_xccdf_validation_schema.xsd')
+        status, lines = self.run_command([
+            'validate', '--xsd', xsd_path,
+            self.get_example_path('example_xccdf_validation_ok.xml'),
+            self.get_example_path('example_xccdf_validation_no_id.xml')])
+
+        self.assertEqual(status, 1, 'Invalid file not reported')
+        self.assertEqual(sorted(line.split()[0] for line in lines
+                                if not line.startswith('  ')),
+                         ['error', 'ok'], 'Errors not listed')
+
+        status, lines = self.run_command([
+            'validate', '--xsd', os.path.join(self.temp_dir, 'none.xsd'),
+            self.get_example_path('example_xccdf_validation_ok.xml')])
+        self.assertEqual(status, 2, 'Missing schema not reported')
+
+        status, lines = self.run_command([
+            'validate', '--schematron',
+            self.get_example_path('example_xccdf_validation_1.2_ok.xml')])
+        self.assertEqual(status, 0, 'Bundled schemas not used')
+
+        status, lines = self.run_command([
+            'validate',
+            self.get_example_path('example_xccdf_validation_ok.xml')])
+        self.assertEqual(status, 1, 'XCCDF 1.1 document not reported')
+        self.assertIn('unsupported namespace', lines[0],
+                      'Unsupported namespace not reported')
+
+
+def suite():
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+    suite.addTest(loader.loadTestsFromTestCase(CommandLineTestCase))
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.TextTestRunner(verbosity=2).run(suite())
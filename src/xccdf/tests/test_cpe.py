@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+
+# Python stdlib
+import unittest
+import os
+import io
+
+# lxml
+from lxml import etree
+
+# XCCDF
+from xccdf.cpe import ApplicabilityEvaluator
+from xccdf.cpe import parse_cpe_name
+from xccdf.cpe import match_cpe_name
+from xccdf.models.benchmark import Benchmark
+
+#: Inventory of a RHEL 7 server with SSH
+RHEL_SERVER = ['cpe:/o:redhat:enterprise_linux:7::server',
+               'cpe:2.3:a:openbsd:openssh:7.4:*:*:*:*:*:*:*']
+
+#: Inventory of a RHEL 7 workstation
+RHEL_WORKSTATION = ['cpe:/o:redhat:enterprise_linux:7::workstation']
+
+#: Inventory of a Windows host
+WINDOWS = ['cpe:/o:microsoft:windows_10', 'cpe:/o:microsoft:windows']
+
+
+class CPETestCase(unittest.TestCase):
+
+    """
+    Test cases for the CPE name functions
+    """
+
+    def test_function_parse_cpe_name(self):
+        """
+        Tests the parse_cpe_name function
+        """
+
+        self.assertEqual(parse_cpe_name('cpe:/o:RedHat:enterprise_linux:5'),
+                         ('o', 'redhat', 'enterprise_linux', '5', '*', '*',
+                          '*', '*', '*', '*', '*'),
+                         'CPE 2.2 URI components do not match')
+        self.assertEqual(parse_cpe_name('cpe:/o:redhat:enterprise_linux:5::'
+                                        'client')[4:6],
+                         ('*', 'client'),
+                         'Empty components must match any value')
+        self.assertEqual(parse_cpe_name('cpe:2.3:a:vendor:prod\\:uct:1.0:-:'
+                                        '*:*:*:*:*:*')[:5],
+                         ('a', 'vendor', 'prod\\:uct', '1.0', '-'),
+                         'CPE 2.3 components do not match')
+
+        with self.assertRaises(ValueError):
+            parse_cpe_name('redhat:enterprise_linux')
+
+    def test_function_match_cpe_name(self):
+        """
+        Tests the match_cpe_name function
+        """
+
+        name = parse_cpe_name('cpe:/o:redhat:enterprise_linux:7::server')
+
+        self.assertTrue(match_cpe_name(
+            parse_cpe_name('cpe:/o:redhat:enterprise_linux'), name),
+            'Shorter patterns must match')
+        pattern = parse_cpe_name(
+            'cpe:2.3:o:redhat:enterprise_linux:7*:*:*:*:*:*:*:*')
+        self.assertTrue(match_cpe_name(pattern, name),
+                        'Wildcards must match')
+        self.assertFalse(match_cpe_name(
+            parse_cpe_name('cpe:/o:redhat:enterprise_linux:6'), name),
+            'Other versions must not match')
+        self.assertFalse(match_cpe_name(
+            name, parse_cpe_name('cpe:/o:redhat:enterprise_linux')),
+            'Longer patterns must not match')
+
+
+class ApplicabilityEvaluatorTestCase(unittest.TestCase):
+
+    """
+    Test cases for ApplicabilityEvaluator class
+    """
+
+    def load_example_element(self, xml_file_type='benchmark'):
+        """
+        Helper method to load an XML element
+        """
+
+        file_name = 'example_xccdf_cpe_{type}.xml'.format(type=xml_file_type)
+
+        xml_file = io.open(os.path.join(
+            os.path.abspath(os.path.dirname(__file__)),
+            'examples', file_name))
+
+        xml_string = xml_file.read()
+        xml_file.close()
+
+        element_tree = etree.fromstring(xml_string.encode('utf-8'))
+
+        return element_tree
+
+    def setUp(self):
+        """
+        Builds the evaluator of the example Benchmark
+        """
+
+        self.evaluator = ApplicabilityEvaluator(
+            Benchmark(self.load_example_element()))
+
+    def test_init(self):
+        """
+        Tests the compiled platforms
+        """
+
+        self.assertEqual(sorted(self.evaluator.platforms.keys()),
+                         ['not-windows', 'rhel-server'],
+                         'Platforms do not match')
+        self.assertEqual(str(self.evaluator),
+                         'applicability evaluator (2 platforms, '
+                         '0 inventories)',
+                         'String representation does not match')
+
+    def test_method_is_platform_applicable(self):
+        """
+        Tests the is_platform_applicable method
+        """
+
+        self.assertTrue(self.evaluator.is_platform_applicable(
+            '#rhel-server', RHEL_SERVER), 'Platform must apply')
+        self.assertFalse(self.evaluator.is_platform_applicable(
+            '#rhel-server', RHEL_WORKSTATION), 'Platform must not apply')
+        self.assertFalse(self.evaluator.is_platform_applicable(
+            '#not-windows', WINDOWS), 'Negated platform must not apply')
+        self.assertTrue(self.evaluator.is_platform_applicable(
+            'cpe:/o:microsoft', WINDOWS), 'CPE name must apply')
+        self.assertFalse(self.evaluator.is_platform_applicable(
+            '#unknown-platform', WINDOWS),
+            'Unknown platforms must not apply')
+
+    def test_method_get_applicability(self):
+        """
+        Tests the get_applicability method
+        """
+
+        self.assertEqual(list(self.evaluator.get_applicability(
+            RHEL_SERVER).items()),
+            [('test-benchmark', True), ('test-group-rhel', True),
+             ('test-rule-server', True), ('test-rule-rhel', True),
+             ('test-rule-any', True), ('test-rule-unknown', False)],
+            'Server applicability does not match')
+        self.assertEqual(list(self.evaluator.get_applicability(
+            RHEL_WORKSTATION).values()),
+            [True, True, False, True, True, False],
+            'Workstation applicability does not match')
+        self.assertEqual(list(self.evaluator.get_applicability(
+            WINDOWS).values()),
+            [False, False, False, False, False, False],
+            'Items of a not applicable parent must not apply')
+
+    def test_memoization(self):
+        """
+        Tests that each distinct inventory is evaluated once
+        """
+
+        first = self.evaluator.get_applicability(RHEL_SERVER)
+        second = self.evaluator.get_applicability(list(reversed(RHEL_SERVER)))
+
+        self.assertIs(first, second,
+                      'Same inventories must share the applicability')
+        self.assertTrue(self.evaluator.is_applicable('test-rule-server',
+                                                     RHEL_SERVER),
+                        'Rule must apply')
+        self.assertEqual(len(self.evaluator.applicability), 1,
+                         'Inventory evaluated more than once')
+
+
+def suite():
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+    suite.addTest(loader.loadTestsFromTestCase(CPETestCase))
+    suite.addTest(loader.loadTestsFromTestCase(
+        ApplicabilityEvaluatorTestCase))
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.TextTestRunner(verbosity=2).run(suite())
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+
+# Python stdlib
+import unittest
+import os
+import io
+
+# lxml
+from lxml import etree
+
+# XCCDF
+from xccdf.dependencies import DependencyGraph
+from xccdf.dependencies import DependencyProblem
+from xccdf.dependencies import SelectionStep
+from xccdf.models.benchmark import Benchmark
+
+
+class DependencyGraphTestCase(unittest.TestCase):
+
+    """
+    Test cases for DependencyGraph class
+    """
+
+    def load_example_element(self, xml_file_type='benchmark'):
+        """
+        Helper method to load an XML element
+        """
+
+        file_name = 'example_xccdf_dependencies_{type}.xml'.format(
+            type=xml_file_type)
+
+        xml_file = io.open(os.path.join(
+            os.path.abspath(os.path.dirname(__file__)),
+            'examples', file_name))
+
+        xml_string = xml_file.read()
+        xml_file.close()
+
+        element_tree = etree.fromstring(xml_string.encode('utf-8'))
+
+        return element_tree
+
+    def setUp(self):
+        """
+        Builds the dependency graph of the example Benchmark
+        """
+
+        self.graph = DependencyGraph(Benchmark(self.load_example_element()))
+
+    def test_init(self):
+        """
+        Tests the indexed dependencies
+        """
+
+        self.assertEqual(str(self.graph),
+                         'dependency graph (10 items, 4 requires, '
+                         '1 conflicts)',
+                         'String representation does not match')
+        self.assertEqual(self.graph.requires['test-rule-6'],
+                         [['test-rule-unknown', 'test-rule-5']],
+                         'Requirements do not match')
+        self.assertEqual(self.graph.parents['test-rule-4'], 'test-group-b',
+                         'Parent does not match')
+
+    def test_method_find_cycles(self):
+        """
+        Tests the find_cycles method
+        """
+
+        self.assertEqual(self.graph.find_cycles(),
+                         [['test-rule-7', 'test-rule-8']],
+                         'Cycles do not match')
+
+    def test_method_validate(self):
+        """
+        Tests the validate method
+        """
+
+        problems = [
+            DependencyProblem('missing', 'test-rule-1', ['test-rule-2']),
+            DependencyProblem('unknown', 'test-rule-6', ['test-rule-unknown']),
+            DependencyProblem('missing', 'test-rule-6',
+                              ['test-rule-unknown', 'test-rule-5']),
+            DependencyProblem('cycle', 'test-rule-7',
+                              ['test-rule-7', 'test-rule-8'])]
+        self.assertEqual(self.graph.validate(), problems,
+                         'Default problems do not match')
+
+        self.assertEqual([problem.kind for problem in
+                          self.graph.validate('test-profile')],
+                         ['unknown', 'cycle'],
+                         'Profile problems do not match')
+
+        selections = self.graph.benchmark.get_selections()
+        selections['test-group-b'] = True
+        self.assertIn(DependencyProblem('conflict', 'test-rule-3',
+                                        ['test-rule-4']),
+                      self.graph.validate(selections=selections),
+                      'Conflict not found')
+
+    def test_method_propagate(self):
+        """
+        Tests the propagate method
+        """
+
+        selections, trace = self.graph.propagate()
+
+        steps = [
+            SelectionStep('test-rule-2', 'test-rule-1', ['test-rule-2']),
+            SelectionStep('test-group-b', 'test-rule-6',
+                          ['test-rule-unknown', 'test-rule-5']),
+            SelectionStep('test-rule-5', 'test-rule-6',
+                          ['test-rule-unknown', 'test-rule-5'])]
+        self.assertEqual(trace, steps, 'Trace does not match')
+        self.assertEqual(DependencyGraph.explain(trace)[0],
+                         'test-rule-2 selected: required by test-rule-1 '
+                         '(test-rule-2)',
+                         'Explanation does not match')
+
+        # Selecting the group makes its other rule conflict
+        self.assertEqual([problem.kind for problem in
+                          self.graph.validate(selections=selections)],
+                         ['conflict', 'unknown', 'cycle'],
+                         'Problems after propagation do not match')
+
+        selections, trace = self.graph.propagate('test-profile')
+        self.assertEqual(trace, list(), 'Nothing must be selected')
+
+
+def suite():
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+    suite.addTest(loader.loadTestsFromTestCase(DependencyGraphTestCase))
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.TextTestRunner(verbosity=2).run(suite())
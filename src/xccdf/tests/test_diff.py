@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+
+# Python stdlib
+import unittest
+import os
+
+# XCCDF
+from xccdf.diff import diff_results
+from xccdf.diff import iter_sorted_results
+from xccdf.diff import RuleResultChange
+
+
+class DiffTestCase(unittest.TestCase):
+
+    """
+    Test cases for diff_results function
+    """
+
+    def get_example_path(self, xml_file_type='old'):
+        """
+        Helper method to get the path of a result document
+        """
+
+        file_name = 'example_xccdf_diff_{type}.xml'.format(
+            type=xml_file_type)
+
+        xml_path = os.path.abspath(os.path.dirname(__file__))
+
+        return os.path.join(xml_path, 'examples', file_name)
+
+    def setUp(self):
+        """
+        Changes between the old and the new example documents
+        """
+
+        self.changes = [
+            RuleResultChange('regression', 'test-rule-1', 'pass', 'fail'),
+            RuleResultChange('fix', 'test-rule-3', 'fail', 'pass'),
+            RuleResultChange('changed', 'test-rule-4',
+                             'notchecked', 'notapplicable'),
+            RuleResultChange('removed', 'test-rule-5', 'pass', None),
+            RuleResultChange('new', 'test-rule-6', None, 'pass'),
+        ]
+
+    def test_iter_sorted_results(self):
+        """
+        Tests the sorted rule results, keeping the last repeated result
+        """
+
+        pairs = list(iter_sorted_results(self.get_example_path('old')))
+
+        self.assertEqual(pairs, [('test-rule-1', 'pass'),
+                                 ('test-rule-2', 'pass'),
+                                 ('test-rule-3', 'fail'),
+                                 ('test-rule-4', 'notchecked'),
+                                 ('test-rule-5', 'pass')],
+                         'Sorted rule results do not match')
+
+    def test_diff_results(self):
+        """
+        Tests the changes between two documents
+        """
+
+        changes = list(diff_results(self.get_example_path('old'),
+                                    self.get_example_path('new')))
+
+        self.assertEqual(changes, self.changes, 'Changes do not match')
+
+    def test_diff_results_external_sort(self):
+        """
+        Tests the changes with the results sorted in several runs
+        """
+
+        changes = list(diff_results(self.get_example_path('old'),
+                                    self.get_example_path('new'),
+                                    chunk_size=2))
+
+        self.assertEqual(changes, self.changes, 'Changes do not match')
+
+    def test_diff_results_presorted(self):
+        """
+        Tests the changes between two sorted documents
+        """
+
+        changes = list(diff_results(self.get_example_path('sorted'),
+                                    self.get_example_path('sorted'),
+                                    presorted=True))
+
+        self.assertEqual(changes, list(), 'There must be no changes')
+
+    def test_diff_results_same_results(self):
+        """
+        Tests the changes between documents with the same results
+        """
+
+        changes = list(diff_results(self.get_example_path('sorted'),
+                                    self.get_example_path('old')))
+
+        self.assertEqual(changes, list(), 'There must be no changes')
+
+    def test_diff_results_presorted_not_sorted(self):
+        """
+        Tests the changes with a document not sorted as expected
+        """
+
+        with self.assertRaises(ValueError):
+            list(diff_results(self.get_example_path('sorted'),
+                              self.get_example_path('new'),
+                              presorted=True))
+
+
+def suite():
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+    suite.addTest(loader.loadTestsFromTestCase(DiffTestCase))
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.TextTestRunner(verbosity=2).run(suite())
@@ -0,0 +1,252 @@
+# -*- coding: utf-8 -*-
+
+# Python stdlib
+import unittest
+import os
+import io
+import shutil
+import tempfile
+
+# lxml
+from lxml import etree
+
+# XCCDF
+from xccdf.fleet import ResultMatrix
+from xccdf.fleet import build_matrix
+from xccdf.fleet import numpy
+from xccdf.scoring import ScoringTree
+from xccdf.models.benchmark import Benchmark
+from xccdf.constants.result import RESULT_CODES
+from xccdf.exceptions import InvalidValueException
+
+#: Template of the result documents of the tests
+RESULT_TEMPLATE = '''<?xml version="1.0" encoding="UTF-8"?>
+<Benchmark xmlns="http://checklists.nist.gov/xccdf/1.1" id="test-benchmark">
+    <TestResult id="xccdf_test_testresult_{host}">
+        <target>{host}</target>
+        {rule_results}
+        <score>0</score>
+    </TestResult>
+</Benchmark>
+'''
+
+
+@unittest.skipIf(numpy is None, 'NumPy is not installed')
+class FleetTestCase(unittest.TestCase):
+
+    """
+    Test cases for ResultMatrix class and build_matrix function
+    """
+
+    def load_example_element(self, xml_file_type='benchmark'):
+        """
+        Helper method to load an XML element
+        """
+
+        file_name = 'example_xccdf_scoring_{type}.xml'.format(
+            type=xml_file_type)
+
+        xml_path = os.path.abspath(os.path.dirname(__file__))
+        xml_file = io.open(os.path.join(
+            xml_path,
+            'examples',
+            file_name))
+
+        xml_string = xml_file.read()
+        xml_file.close()
+
+        element_tree = etree.fromstring(xml_string.encode('utf-8'))
+
+        return element_tree
+
+    def write_result_file(self, host, results):
+        """
+        Helper method to write a result document
+        """
+
+        rule_results = ''.join(
+            '<rule-result idref="{idref}"><result>{result}</result>'
+            '</rule-result>'.format(idref=idref, result=result)
+            for idref, result in results)
+
+        path = os.path.join(self.directory, '{host}.xml'.format(host=host))
+        with io.open(path, 'w') as result_file:
+            result_file.write(RESULT_TEMPLATE.format(
+                host=host, rule_results=rule_results))
+
+        return path
+
+    def setUp(self):
+        """
+        Writes the result documents of three hosts
+        """
+
+        self.tree = ScoringTree(Benchmark(self.load_example_element()))
+        self.directory = tempfile.mkdtemp()
+        self.hosts = ['host-1', 'host-2', 'host-3']
+        self.paths = [
+            self.write_result_file('host-1', [('test-rule-1', 'pass'),
+                                              ('test-rule-2', 'fail'),
+                                              ('test-rule-3', 'pass'),
+                                              ('missing-rule', 'fail')]),
+            self.write_result_file('host-2', [('test-rule-1', 'fail'),
+                                              ('test-rule-4', 'pass')]),
+            self.write_result_file('host-3', list()),
+        ]
+
+    def tearDown(self):
+        """
+        Removes the result documents
+        """
+
+        shutil.rmtree(self.directory)
+
+    def test_build_matrix(self):
+        """
+        Tests the codes of the matrix
+        """
+
+        matrix = build_matrix(self.tree, self.paths, self.hosts, processes=1)
+
+        self.assertEqual(matrix.codes.dtype, numpy.uint8,
+                         'Result codes must be bytes')
+        self.assertEqual(matrix.get_host('host-1').tolist(),
+                         self.tree.encode({'test-rule-1': 'pass',
+                                           'test-rule-2': 'fail',
+                                           'test-rule-3': 'pass'}),
+                         'Result codes do not match')
+        self.assertEqual(matrix.get_rule('test-rule-1').tolist(),
+                         [RESULT_CODES['pass'], RESULT_CODES['fail'], 0],
+                         'Result codes do not match')
+        self.assertEqual(str(matrix), 'result matrix (3 hosts, 4 rules)',
+                         'String representation does not match')
+
+    def test_build_matrix_pool(self):
+        """
+        Tests that the process pool builds the same matrix
+        """
+
+        matrix = build_matrix(self.tree, self.paths, self.hosts, processes=1)
+        pool_matrix = build_matrix(self.tree, self.paths, processes=2)
+
+        self.assertEqual(pool_matrix.hosts, self.paths,
+                         'Default host names must be the paths')
+        self.assertTrue(numpy.array_equal(matrix.codes, pool_matrix.codes),
+                        'Result codes do not match')
+
+    def test_build_matrix_invalid_result(self):
+        """
+        Tests the error of a missing or invalid rule result
+        """
+
+        for result in ('maybe', ''):
+            path = self.write_result_file('host-4', [('test-rule-2', result)])
+            if result == '':
+                with io.open(path) as result_file:
+                    content = result_file.read()
+                with io.open(path, 'w') as result_file:
+                    result_file.write(content.replace('<result></result>',
+                                                      ''))
+
+            for processes in (1, 2):
+                with self.assertRaises(InvalidValueException) as context:
+                    build_matrix(self.tree, self.paths + [path],
+                                 processes=processes)
+
+                self.assertIn(path, str(context.exception),
+                              'Path not in the error')
+                self.assertIn('test-rule-2', str(context.exception),
+                              'Rule not in the error')
+
+    def test_aggregations(self):
+        """
+        Tests the per rule and per host counts
+        """
+
+        matrix = build_matrix(self.tree, self.paths, self.hosts, processes=1)
+
+        self.assertEqual(matrix.count_by_rule('pass').tolist(),
+                         [1, 1, 0, 1], 'Pass counts do not match')
+        self.assertEqual(matrix.count_by_host('fail').tolist(),
+                         [1, 1, 0], 'Fail counts do not match')
+        self.assertEqual(matrix.count_by_host(None).tolist(),
+                         [1, 2, 4], 'Missing counts do not match')
+
+        summary = matrix.get_rule_summary()
+        self.assertEqual(summary.sum(axis=1).tolist(), [3, 3, 3, 3],
+                         'Every host must be counted once per rule')
+        self.assertEqual(summary[:, RESULT_CODES['pass']].tolist(),
+                         [1, 1, 0, 1], 'Pass counts do not match')
+
+    def test_save_and_load(self):
+        """
+        Tests the memory-mapped matrix files
+        """
+
+        filename = os.path.join(self.directory, 'matrix.npy')
+        build_matrix(self.tree, self.paths, self.hosts, processes=1,
+                     filename=filename)
+
+        matrix = ResultMatrix.load(filename)
+        self.assertIsInstance(matrix.codes, numpy.memmap,
+                              'Result codes must be memory-mapped')
+        self.assertEqual(matrix.hosts, self.hosts, 'Hosts do not match')
+
+        copy_filename = os.path.join(self.directory, 'copy.npy')
+        matrix.save(copy_filename)
+        copy = ResultMatrix.load(copy_filename, mmap_mode=None)
+        self.assertTrue(numpy.array_equal(matrix.codes, copy.codes),
+                        'Result codes do not match')
+        self.assertEqual(copy.rule_ids, self.tree.rule_ids,
+                         'Rule ids do not match')
+
+    def test_save_without_extension(self):
+        """
+        Tests saving and loading a matrix at a path without .npy
+        """
+
+        matrix = build_matrix(self.tree, self.paths, self.hosts, processes=1)
+
+        filename = os.path.join(self.directory, 'matrix')
+        matrix.save(filename)
+        self.assertFalse(os.path.exists(filename + '.npy'),
+                         'Matrix file name does not match')
+
+        copy = ResultMatrix.load(filename, mmap_mode=None)
+        self.assertTrue(numpy.array_equal(matrix.codes, copy.codes),
+                        'Result codes do not match')
+        self.assertEqual(copy.hosts, self.hosts, 'Hosts do not match')
+
+    def test_build_matrix_invalid_hosts(self):
+        """
+        Tests that the hosts are checked before reading the documents
+        """
+
+        filename = os.path.join(self.directory, 'matrix.npy')
+        paths = [os.path.join(self.directory, 'missing.xml')] * 2
+
+        with self.assertRaises(ValueError):
+            build_matrix(self.tree, paths, ['host-1'], processes=1,
+                         filename=filename)
+        self.assertFalse(os.path.exists(filename),
+                         'Matrix file must not be created')
+
+    def test_invalid_shape(self):
+        """
+        Tests the class constructor with codes of a wrong shape
+        """
+
+        with self.assertRaises(ValueError):
+            ResultMatrix(['host-1'], ['test-rule-1'],
+                         numpy.zeros((2, 2), dtype=numpy.uint8))
+
+
+def suite():
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+    suite.addTest(loader.loadTestsFromTestCase(FleetTestCase))
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.TextTestRunner(verbosity=2).run(suite())
@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+
+# Python stdlib
+import unittest
+import os
+import io
+import copy
+import pickle
+from multiprocessing.pool import ThreadPool
+
+# lxml
+from lxml import etree
+
+# XCCDF
+from xccdf.frozen import FrozenBenchmark
+from xccdf.models.benchmark import Benchmark
+from xccdf.models.rule import Rule
+from xccdf.models.title import Title
+from xccdf.exceptions import FrozenElementException
+
+
+class FrozenBenchmarkTestCase(unittest.TestCase):
+
+    """
+    Test cases for FrozenBenchmark class
+    """
+
+    def load_example_element(self, xml_file_type='benchmark'):
+        """
+        Helper method to load an XML element
+        """
+
+        file_name = 'example_xccdf_substitution_{type}.xml'.format(
+            type=xml_file_type)
+
+        xml_file = io.open(os.path.join(
+            os.path.abspath(os.path.dirname(__file__)),
+            'examples', file_name))
+
+        xml_string = xml_file.read()
+        xml_file.close()
+
+        element_tree = etree.fromstring(xml_string.encode('utf-8'))
+
+        return element_tree
+
+    def setUp(self):
+        """
+        Freezes the example Benchmark
+        """
+
+        self.benchmark = Benchmark(self.load_example_element())
+        self.frozen = self.benchmark.freeze()
+
+    def test_init(self):
+        """
+        Tests the frozen attributes and indexes
+        """
+
+        self.assertIsInstance(self.frozen, FrozenBenchmark,
+                              'Benchmark not frozen')
+        self.assertEqual(str(self.frozen), 'frozen Benchmark test-benchmark',
+                         'String representation does not match')
+        self.assertEqual(self.frozen.id, 'test-benchmark',
+                         'Attribute does not match')
+        self.assertEqual(sorted(self.frozen.items.keys()),
+                         ['test-group', 'test-rule-1', 'test-rule-2'],
+                         'Item index does not match')
+        self.assertEqual(sorted(self.frozen.values.keys()),
+                         ['test-value-age', 'test-value-length'],
+                         'Value index does not match')
+        self.assertEqual(self.frozen.get_profile('custom-profile').extends,
+                         'strict-profile',
+                         'Profile index does not match')
+        self.assertEqual([rule.id for rule in self.frozen.rules],
+                         ['test-rule-1', 'test-rule-2'],
+                         'Rules do not match')
+        self.assertIsNone(self.frozen.get_item('unknown-item'),
+                          'Unknown items must not exist')
+
+        rule = self.frozen.get_item('test-rule-1')
+        self.assertIs(rule.model, Rule, 'Model does not match')
+        self.assertEqual(len(rule.get_children(Title)), 1,
+                         'Children do not match')
+
+    def test_immutable(self):
+        """
+        Tests that the frozen elements can't be modified
+        """
+
+        with self.assertRaises(FrozenElementException):
+            self.frozen.id = 'other-benchmark'
+        with self.assertRaises(FrozenElementException):
+            del self.frozen.get_item('test-rule-1').id
+        with self.assertRaises(AttributeError):
+            self.frozen.get_item('test-rule-1').children.append(None)
+
+        for index in (self.frozen.items, self.frozen.values,
+                      self.frozen.profiles):
+            with self.assertRaises(TypeError):
+                index['test-rule-1'] = None
+            with self.assertRaises(TypeError):
+                del index['test-rule-1']
+            with self.assertRaises(AttributeError):
+                index.clear()
+
+        self.assertIs(copy.deepcopy(self.frozen), self.frozen,
+                      'Frozen elements must be their own copy')
+
+    def test_hash(self):
+        """
+        Tests the equality and hash of the frozen elements
+        """
+
+        other = Benchmark(self.load_example_element()).freeze()
+
+        self.assertEqual(other, self.frozen, 'Frozen copies must be equal')
+        self.assertEqual(hash(other), hash(self.frozen),
+                         'Hashes must be equal')
+        self.assertEqual(pickle.loads(pickle.dumps(self.frozen)),
+                         self.frozen, 'Pickled copy must be equal')
+
+        self.benchmark.get_item_index()['test-rule-1'].severity = 'high'
+        self.assertNotEqual(self.benchmark.freeze(), self.frozen,
+                            'Changed copies must be different')
+
+    def test_method_thaw(self):
+        """
+        Tests the thaw method
+        """
+
+        thawed = self.frozen.thaw()
+
+        self.assertIsInstance(thawed, Benchmark, 'Benchmark not thawed')
+        self.assertEqual(thawed.as_dict(), self.benchmark.as_dict(),
+                         'Thawed Benchmark does not match')
+
+        thawed.get_item_index()['test-rule-1'].severity = 'high'
+        self.assertFalse(hasattr(self.frozen.get_item('test-rule-1'),
+                                 'severity'),
+                         'Thawed copies must not change the frozen one')
+
+        xml_element = thawed.update_xml_element()
+        self.assertEqual(xml_element.find('.//Rule').get('severity'),
+                         'high', 'Thawed Benchmark does not serialize')
+
+    def test_concurrent_reads(self):
+        """
+        Tests reading the frozen Benchmark from many threads
+        """
+
+        def read(index):
+            rule = self.frozen.rules[index % len(self.frozen.rules)]
+            return self.frozen.get_item(rule.id).id
+
+        pool = ThreadPool(8)
+        try:
+            results = pool.map(read, range(200))
+        finally:
+            pool.close()
+            pool.join()
+
+        self.assertEqual(results[:2], ['test-rule-1', 'test-rule-2'],
+                         'Concurrent reads do not match')
+
+
+def suite():
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+    suite.addTest(loader.loadTestsFromTestCase(FrozenBenchmarkTestCase))
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.TextTestRunner(verbosity=2).run(suite())
@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+
+# Python stdlib
+import unittest
+import io
+import os
+import shutil
+import tempfile
+
+# XCCDF
+from xccdf.builder import load
+from xccdf.models.benchmark import Benchmark
+from xccdf.models.group import Group
+from xccdf.models.tailoring import Tailoring
+from xccdf.models.test_result import TestResult
+from xccdf.testing.generate import DocumentGenerator
+from xccdf.testing.generate import generate_benchmark
+from xccdf.testing.generate import generate_tailoring
+from xccdf.testing.generate import generate_test_result
+
+
+class DocumentGeneratorTestCase(unittest.TestCase):
+
+    """
+    Test cases for the synthetic document generator
+    """
+
+    def generate(self, function, **options):
+        """
+        Helper method to generate a document in memory
+        """
+
+        destination = io.BytesIO()
+        function(destination, **options)
+        return destination.getvalue()
+
+    def get_max_depth(self, element, depth=0):
+        """
+        Helper method to get the nesting depth of the Groups
+        """
+
+        return max([depth] + [self.get_max_depth(child, depth + 1)
+                              for child in element.children
+                              if isinstance(child, Group)])
+
+    def test_benchmark(self):
+        """
+        Tests the size and shape of a generated Benchmark
+        """
+
+        document = self.generate(generate_benchmark, rules=50, depth=3,
+                                 branching=2, rules_per_group=4, idents=2,
+                                 profiles=3, select_density=0.5)
+        benchmark = load(document, strict=False)
+
+        self.assertIsInstance(benchmark, Benchmark, 'Model does not match')
+        self.assertEqual(benchmark.errors, list(), 'Invalid document')
+
+        rules = [item for item in benchmark.iter_items()
+                 if not isinstance(item, Group)]
+        self.assertEqual(len(rules), 50, 'Number of rules does not match')
+        self.assertEqual(self.get_max_depth(benchmark), 3,
+                         'Depth does not match')
+        self.assertEqual(len(benchmark.get_profiles()), 3,
+                         'Number of profiles does not match')
+
+        idents = [child for child in rules[0].children
+                  if child.name == 'ident']
+        self.assertEqual(len(idents), 2, 'Number of idents does not match')
+
+        selections = benchmark.get_selections('generated-profile-0')
+        self.assertGreater(len(selections), 0, 'No selections')
+
+    def test_deep_nesting(self):
+        """
+        Tests a Benchmark with deeply nested Groups
+        """
+
+        document = self.generate(generate_benchmark, rules=2, depth=20,
+                                 rules_per_group=1)
+        benchmark = load(document)
+
+        self.assertEqual(self.get_max_depth(benchmark), 20,
+                         'Depth does not match')
+
+        document = self.generate(generate_benchmark, rules=5, depth=0)
+        benchmark = load(document)
+
+        self.assertEqual(self.get_max_depth(benchmark), 0,
+                         'Rules not in the Benchmark')
+
+    def test_select_density(self):
+        """
+        Tests the select density of the Profiles
+        """
+
+        for density, expected in ((0, 0), (1, 40)):
+            document = self.generate(generate_benchmark, rules=40,
+                                     profiles=1, select_density=density)
+            profile = load(document).get_profiles()[0]
+            selects = [child for child in profile.children
+                       if child.name == 'select']
+
+            self.assertEqual(len(selects), expected,
+                             'Number of selects does not match')
+
+    def test_html_descriptions(self):
+        """
+        Tests the XHTML markup of the descriptions
+        """
+
+        for html in (True, False):
+            document = self.generate(generate_benchmark, rules=1, depth=0,
+                                     html=html)
+            rule = list(load(document).iter_items())[0]
+            description = [child for child in rule.children
+                           if child.name == 'description'][0]
+
+            self.assertEqual('<' in description.get_html_content(), html,
+                             'Markup does not match')
+
+    def test_tailoring_and_test_result(self):
+        """
+        Tests the generated Tailoring and TestResult
+        """
+
+        tailoring = load(self.generate(generate_tailoring, rules=30))
+        self.assertIsInstance(tailoring, Tailoring, 'Model does not match')
+
+        test_result = load(self.generate(generate_test_result, rules=30))
+        self.assertIsInstance(test_result, TestResult,
+                              'Model does not match')
+
+        rule_results = [child for child in test_result.children
+                        if child.name == 'rule-result']
+        self.assertEqual(len(rule_results), 30,
+                         'Number of rule results does not match')
+        self.assertEqual(rule_results[0].idref,
+                         DocumentGenerator.get_rule_id(0),
+                         'Rule id does not match')
+
+    def test_deterministic(self):
+        """
+        Tests that the same options produce the same documents
+        """
+
+        first = self.generate(generate_benchmark, rules=20, seed=3)
+        second = self.generate(generate_benchmark, rules=20, seed=3)
+        other = self.generate(generate_benchmark, rules=20, seed=4)
+
+        self.assertEqual(first, second, 'Documents do not match')
+        self.assertNotEqual(first, other, 'Seed not used')
+
+    def test_write_to_path(self):
+        """
+        Tests writing a document to a path
+        """
+
+        target_dir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(target_dir, 'benchmark.xml')
+            generate_benchmark(path, rules=10)
+
+            self.assertGreater(len(list(load(path).iter_items())), 10,
+                               'Items not written')
+        finally:
+            shutil.rmtree(target_dir)
+
+    def test_invalid_options(self):
+        """
+        Tests the option checks
+        """
+
+        with self.assertRaises(ValueError):
+            DocumentGenerator(rules=0)
+        with self.assertRaises(ValueError):
+            DocumentGenerator(depth=-1)
+        with self.assertRaises(ValueError):
+            DocumentGenerator(select_density=2)
+
+
+def suite():
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+    suite.addTest(loader.loadTestsFromTestCase(DocumentGeneratorTestCase))
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.TextTestRunner(verbosity=2).run(suite())
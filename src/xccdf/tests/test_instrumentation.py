@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+
+# Python stdlib
+import unittest
+import io
+import os
+
+# lxml
+from lxml import etree
+
+# XCCDF
+from xccdf.instrumentation import Instrumentation
+from xccdf.models.benchmark import Benchmark
+from xccdf.models.element import Element
+from xccdf.models.html_element import HTMLElement
+from xccdf.models.rule import Rule
+
+
+class InstrumentationTestCase(unittest.TestCase):
+
+    """
+    Test cases for the Instrumentation class
+    """
+
+    def load_example_element(self):
+        """
+        Helper method to load an XML element
+        """
+
+        xml_file = io.open(os.path.join(
+            os.path.abspath(os.path.dirname(__file__)),
+            'examples', 'example_xccdf_dependencies_benchmark.xml'))
+
+        xml_string = xml_file.read()
+        xml_file.close()
+        return etree.fromstring(xml_string.encode('utf-8'))
+
+    def test_enable_and_disable(self):
+        """
+        Tests that the methods are only wrapped while enabled
+        """
+
+        methods = (Benchmark.__init__, Rule.load_children, Element.as_dict)
+        instrumentation = Instrumentation()
+
+        with instrumentation:
+            self.assertTrue(instrumentation.enabled, 'Not enabled')
+            self.assertIsNot(Rule.load_children, methods[1],
+                             'Method not wrapped')
+
+            with self.assertRaises(RuntimeError):
+                Instrumentation().enable()
+
+        self.assertFalse(instrumentation.enabled, 'Not disabled')
+        self.assertEqual(
+            (Benchmark.__init__, Rule.load_children, Element.as_dict),
+            methods, 'Methods not restored')
+        self.assertEqual(instrumentation.stats, dict(),
+                         'Calls recorded while disabled')
+
+    def test_stats(self):
+        """
+        Tests the stats of a load, as_dict and update_xml_element
+        """
+
+        xml_element = self.load_example_element()
+        instrumentation = Instrumentation()
+
+        with instrumentation:
+            benchmark = Benchmark(xml_element)
+            benchmark.as_dict()
+            benchmark.update_xml_element()
+
+        stats = instrumentation.as_dict()
+        rules = [item for item in benchmark.iter_items()
+                 if isinstance(item, Rule)]
+
+        self.assertEqual(stats['Rule']['Rule']['import_element']['calls'],
+                         len(rules), 'Calls do not match')
+        self.assertEqual(stats['Benchmark']['Benchmark']['__init__']['calls'],
+                         1, 'Calls do not match')
+        self.assertNotIn(HTMLElement.__name__, stats,
+                         'super calls counted as calls')
+        self.assertNotIn(Element.__name__, stats,
+                         'super calls counted as calls')
+
+        load = stats['Benchmark']['Benchmark']['load_children']
+        self.assertGreaterEqual(load['time'], load['self_time'],
+                                'Self time greater than time')
+        self.assertGreater(
+            stats['Rule']['Rule']['import_element']['bytes'], 0,
+            'Bytes not measured')
+        self.assertGreater(
+            stats['Rule']['Rule']['update_xml_element']['bytes'], 0,
+            'Bytes not measured')
+
+        instrumentation.reset()
+        self.assertEqual(instrumentation.as_dict(), dict(), 'Stats not reset')
+
+    def test_prometheus(self):
+        """
+        Tests the Prometheus text format
+        """
+
+        instrumentation = Instrumentation()
+        with instrumentation:
+            Benchmark(self.load_example_element())
+
+        lines = instrumentation.to_prometheus().splitlines()
+
+        self.assertIn('# TYPE xccdf_model_calls_total counter', lines,
+                      'Metric type not found')
+        self.assertIn('xccdf_model_calls_total{model="Benchmark",'
+                      'tag="Benchmark",method="__init__"} 1', lines,
+                      'Metric not found')
+        self.assertTrue(any(line.startswith('xccdf_model_bytes_total{')
+                            for line in lines), 'Metric not found')
+
+
+def suite():
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+    suite.addTest(loader.loadTestsFromTestCase(InstrumentationTestCase))
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.TextTestRunner(verbosity=2).run(suite())
@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+
+# Python stdlib
+import unittest
+import io
+import os
+
+# lxml
+from lxml import etree
+
+# XCCDF
+from xccdf.builder import load
+from xccdf.builder import BUILDER_EXPAT
+from xccdf.memory import get_document_report
+from xccdf.memory import memory_report
+from xccdf.memory import MEMORY_CATEGORIES
+from xccdf.testing.generate import generate_benchmark
+
+
+class MemoryReportTestCase(unittest.TestCase):
+
+    """
+    Test cases for memory_report function
+    """
+
+    def get_example_path(self):
+        """
+        Helper method to get the path of the example benchmark
+        """
+
+        return os.path.join(os.path.abspath(os.path.dirname(__file__)),
+                            'examples',
+                            'example_xccdf_substitution_benchmark.xml')
+
+    def count_models(self, element):
+        """
+        Helper method to count the models of a tree
+        """
+
+        return 1 + sum(self.count_models(child)
+                       for child in getattr(element, 'children', list()))
+
+    def test_report(self):
+        """
+        Tests the report of a Benchmark loaded with lxml
+        """
+
+        benchmark = load(self.get_example_path())
+        report = memory_report(benchmark)
+
+        self.assertEqual(report['total']['count'],
+                         self.count_models(benchmark),
+                         'Count does not match')
+        self.assertEqual(report['classes']['Benchmark']['count'], 1,
+                         'Count does not match')
+
+        for category in MEMORY_CATEGORIES + ('total',):
+            self.assertEqual(
+                report['total'][category],
+                sum(class_report[category]
+                    for class_report in report['classes'].values()),
+                'Total does not match for {category}'.format(
+                    category=category))
+            self.assertGreater(report['total'][category], 0,
+                               '{category} not measured'.format(
+                                   category=category))
+
+        document = report['document']
+        self.assertGreater(document['nodes'], report['total']['count'],
+                           'Document nodes not counted')
+        self.assertGreater(document['bytes'], 0, 'Document not measured')
+
+    def test_document_text_length(self):
+        """
+        Tests the text length of a document with comments
+        """
+
+        xml_element = etree.fromstring(
+            '<!-- head --><?test data?>'
+            '<root>ab<child>cd</child>ef<!-- note -->gh</root>'
+            '<!-- tail -->')
+        document = get_document_report(xml_element)
+
+        self.assertEqual(document['text_length'],
+                         len('abcdefgh') + len(' note ')
+                         + len(' head ') + len('data') + len(' tail '),
+                         'Text length does not match')
+
+        tree = load(self.get_example_path()).xml_element.getroottree()
+        self.assertGreaterEqual(
+            get_document_report(tree.getroot())['text_length'],
+            int(tree.xpath('string-length(/)')),
+            'Text of the document not counted')
+
+    def test_without_lxml_tree(self):
+        """
+        Tests the report of models without XML elements
+        """
+
+        benchmark = load(self.get_example_path(), builder=BUILDER_EXPAT)
+        report = memory_report(benchmark)
+
+        self.assertEqual(report['total']['lxml'], 0, 'lxml memory found')
+        self.assertIsNone(report['document'], 'Document report found')
+        self.assertGreater(report['total']['text'], 0, 'Text not measured')
+
+    def test_sample(self):
+        """
+        Tests the estimate measuring a sample of the models
+        """
+
+        document = io.BytesIO()
+        generate_benchmark(document, rules=200)
+        benchmark = load(document.getvalue())
+
+        report = memory_report(benchmark)
+        sampled = memory_report(benchmark, sample=10)
+
+        self.assertEqual(
+            dict((name, class_report['count'])
+                 for name, class_report in sampled['classes'].items()),
+            dict((name, class_report['count'])
+                 for name, class_report in report['classes'].items()),
+            'Counts do not match')
+        self.assertEqual(sampled['total']['count'], report['total']['count'],
+                         'Count does not match')
+        self.assertAlmostEqual(
+            float(sampled['total']['total']) / report['total']['total'], 1,
+            delta=0.05, msg='Estimate too far from the measure')
+
+        with self.assertRaises(ValueError):
+            memory_report(benchmark, sample=0)
+
+
+def suite():
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+    suite.addTest(loader.loadTestsFromTestCase(MemoryReportTestCase))
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.TextTestRunner(verbosity=2).run(suite())
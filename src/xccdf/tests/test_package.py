@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+
+# Python stdlib
+import unittest
+import os
+import subprocess
+import sys
+
+# XCCDF
+import xccdf
+import xccdf.models
+from xccdf.models.select import Select
+from xccdf.validation import validate
+
+#: Prints the xccdf and XML modules loaded by a statement
+LOADED_MODULES = '''
+import sys
+{statement}
+print(' '.join(sorted(module for module in sys.modules
+                      if module.startswith(('xccdf', 'xml.')))))
+'''
+
+
+class PackageTestCase(unittest.TestCase):
+
+    """
+    Test cases for the lazy package API
+    """
+
+    def get_loaded_modules(self, statement):
+        """
+        Helper method to get the modules loaded by a statement
+        in a new interpreter
+        """
+
+        src_path = os.path.dirname(os.path.dirname(os.path.dirname(
+            os.path.abspath(__file__))))
+        environment = dict(os.environ, PYTHONPATH=src_path)
+        output = subprocess.check_output(
+            [sys.executable, '-c', LOADED_MODULES.format(statement=statement)],
+            env=environment)
+
+        return output.decode('utf-8').split()
+
+    def test_getattr(self):
+        """
+        Tests the lazy attributes of the packages
+        """
+
+        self.assertIs(xccdf.Select, Select, 'Model does not match')
+        self.assertIs(xccdf.models.Select, Select, 'Model does not match')
+        self.assertIs(xccdf.validate, validate, 'Function does not match')
+        self.assertIn('Select', dir(xccdf), 'Lazy attribute not listed')
+
+        for name in xccdf.__all__:
+            self.assertIsNotNone(getattr(xccdf, name),
+                                 '{name} not found'.format(name=name))
+
+        with self.assertRaises(AttributeError):
+            xccdf.Unknown
+        with self.assertRaises(AttributeError):
+            xccdf.models.validate
+
+    def test_lazy_imports(self):
+        """
+        Tests that only the used modules are imported
+        """
+
+        modules = self.get_loaded_modules('import xccdf')
+        self.assertEqual(modules, ['xccdf', 'xccdf.models'],
+                         'Modules imported eagerly')
+
+        modules = self.get_loaded_modules('from xccdf import Select')
+        self.assertIn('xccdf.models.select', modules, 'Model not imported')
+        self.assertNotIn('xccdf.models.benchmark', modules,
+                         'Unused model imported')
+        self.assertNotIn('xml.etree.ElementTree', modules,
+                         'ElementTree imported eagerly')
+
+
+def suite():
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+    suite.addTest(loader.loadTestsFromTestCase(PackageTestCase))
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.TextTestRunner(verbosity=2).run(suite())
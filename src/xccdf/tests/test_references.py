@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+
+# Python stdlib
+import unittest
+import os
+import io
+
+# lxml
+from lxml import etree
+
+# XCCDF
+from xccdf.references import check_references
+from xccdf.models.benchmark import Benchmark
+from xccdf.models.tailoring import Tailoring
+from xccdf.exceptions import ReferenceException
+
+
+class ReferencesTestCase(unittest.TestCase):
+
+    """
+    Test cases for check_references function
+    """
+
+    def load_example_element(self, xml_file_type='benchmark'):
+        """
+        Helper method to load an XML element
+        """
+
+        file_name = 'example_xccdf_references_{type}.xml'.format(
+            type=xml_file_type)
+
+        xml_path = os.path.abspath(os.path.dirname(__file__))
+        xml_file = io.open(os.path.join(
+            xml_path,
+            'examples',
+            file_name))
+
+        xml_string = xml_file.read()
+        xml_file.close()
+
+        element_tree = etree.fromstring(xml_string.encode('utf-8'))
+
+        return element_tree
+
+    def setUp(self):
+        """
+        Loads the Benchmark and the Tailoring
+        """
+
+        self.benchmark = Benchmark(self.load_example_element('benchmark'))
+        self.tailoring = Tailoring(self.load_example_element('tailoring'))
+
+    def test_item_index(self):
+        """
+        Tests the item index of the Benchmark
+        """
+
+        items = self.benchmark.get_item_index()
+
+        self.assertEqual(list(items.keys()),
+                         ['test-group', 'test-rule-1', 'test-rule-2',
+                          'test-rule-3', 'test-rule-4'],
+                         'Item index does not match')
+
+    def test_dangling_references(self):
+        """
+        Tests the dangling references of a Benchmark
+        """
+
+        report = check_references(self.benchmark)
+        found = [error.sourceline for error in report.dangling]
+
+        self.assertEqual(found, [17, 19, 21],
+                         'Dangling references do not match')
+        for error in report.dangling:
+            self.assertIsInstance(error, ReferenceException)
+
+    def test_unselected_items(self):
+        """
+        Tests the items not selected by any Profile
+        """
+
+        report = check_references(self.benchmark)
+        unselected = [item.id for item in report.unselected]
+
+        self.assertEqual(unselected,
+                         ['test-group', 'test-rule-3', 'test-rule-4'],
+                         'Unselected items do not match')
+
+    def test_tailoring_references(self):
+        """
+        Tests the references of a Tailoring of the Benchmark
+        """
+
+        report = check_references(self.benchmark, self.tailoring)
+        messages = [str(error) for error in report.dangling]
+        unselected = [item.id for item in report.unselected]
+
+        self.assertEqual(len(report.dangling), 4,
+                         'Dangling references do not match')
+        self.assertIn('select removed-rule does not match any Group, '
+                      'Rule or cluster', messages,
+                      'Tailoring dangling select not found')
+        self.assertEqual(unselected, ['test-group', 'test-rule-4'],
+                         'Unselected items do not match')
+
+    def test_print_report(self):
+        """
+        Tests the string representation of a ReferenceReport object
+        """
+
+        report = check_references(self.benchmark)
+
+        self.assertEqual(str(report), 'references 3 dangling 3 unselected',
+                         'String representation does not match')
+
+
+def suite():
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+    suite.addTest(loader.loadTestsFromTestCase(ReferencesTestCase))
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.TextTestRunner(verbosity=2).run(suite())
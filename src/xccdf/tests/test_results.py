@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+
+# Python stdlib
+import unittest
+import os
+import io
+
+# XCCDF
+from xccdf.results import iter_rule_results
+from xccdf.results import RuleResultRecord
+
+
+class ResultsTestCase(unittest.TestCase):
+
+    """
+    Test cases for iter_rule_results function
+    """
+
+    def get_example_path(self):
+        """
+        Helper method to get the path of the result document
+        """
+
+        xml_path = os.path.abspath(os.path.dirname(__file__))
+
+        return os.path.join(xml_path, '..', 'models', 'tests', 'examples',
+                            'example_xccdf_test_result_ok.xml')
+
+    def test_iter_rule_results(self):
+        """
+        Tests the records read from a result document
+        """
+
+        records = list(iter_rule_results(self.get_example_path()))
+
+        self.assertEqual(len(records), 2, 'Rule results do not match')
+        self.assertEqual(records[0], RuleResultRecord(
+            'test-rule-1', 'pass', 'high', 2.0, '2014-07-01T10:01:00',
+            (('http://cce.mitre.org', 'CCE-1234-5'),)),
+            'First record does not match')
+
+    def test_iter_rule_results_defaults(self):
+        """
+        Tests the default values of the missing attributes
+        """
+
+        records = list(iter_rule_results(self.get_example_path()))
+
+        self.assertEqual(records[1].result, 'fail',
+                         'Result does not match')
+        self.assertEqual(records[1].severity, 'unknown',
+                         'Default severity does not match')
+        self.assertEqual(records[1].weight, 1.0,
+                         'Default weight does not match')
+        self.assertEqual(records[1].idents, tuple(),
+                         'Idents must be empty')
+
+    def test_iter_rule_results_file_object(self):
+        """
+        Tests the records read from a file object
+        """
+
+        with io.open(self.get_example_path(), 'rb') as xml_file:
+            idrefs = [record.idref for record in iter_rule_results(xml_file)]
+
+        self.assertEqual(idrefs, ['test-rule-1', 'test-rule-2'],
+                         'Rule results do not match')
+
+
+def suite():
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+    suite.addTest(loader.loadTestsFromTestCase(ResultsTestCase))
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.TextTestRunner(verbosity=2).run(suite())
@@ -0,0 +1,374 @@
+# -*- coding: utf-8 -*-
+
+# Python stdlib
+import unittest
+import os
+import io
+import shutil
+import stat
+import tempfile
+
+# lxml
+from lxml import etree
+
+# XCCDF
+from xccdf.sce import SCEExecutor
+from xccdf.sce import CheckRun
+from xccdf.cache import ResultCache
+from xccdf.models.benchmark import Benchmark
+from xccdf.models.test_result import TestResult
+from xccdf.substitution import Substitution
+from xccdf.scoring import SCORING_DEFAULT
+
+#: Contents of the example scripts
+SCRIPTS = {
+    'pass.sh': '#!/bin/sh\n'
+               'echo passed${XCCDF_VALUE_attempts:+ $XCCDF_VALUE_attempts}\n'
+               'exit $XCCDF_RESULT_PASS\n',
+    'fail.sh': '#!/bin/sh\necho failed >&2\nexit $XCCDF_RESULT_FAIL\n',
+    'slow.sh': '#!/bin/sh\nsleep 5\nexit $XCCDF_RESULT_PASS\n',
+    'other.sh': '#!/bin/sh\nexit 3\n',
+    'shared.sh': '#!/bin/sh\n'
+                 'test "$XCCDF_VALUE_expected" = 1 '
+                 '|| exit $XCCDF_RESULT_FAIL\n'
+                 'exit $XCCDF_RESULT_PASS\n',
+}
+
+
+class SCEExecutorTestCase(unittest.TestCase):
+
+    """
+    Test cases for SCEExecutor class
+    """
+
+    def load_example_element(self, xml_file_type='benchmark'):
+        """
+        Helper method to load an XML element
+        """
+
+        file_name = 'example_xccdf_sce_{type}.xml'.format(type=xml_file_type)
+
+        xml_file = io.open(os.path.join(
+            os.path.abspath(os.path.dirname(__file__)),
+            'examples', file_name))
+
+        xml_string = xml_file.read()
+        xml_file.close()
+
+        element_tree = etree.fromstring(xml_string.encode('utf-8'))
+
+        return element_tree
+
+    def setUp(self):
+        """
+        Writes the example scripts and loads the example Benchmark
+        """
+
+        self.content_dir = tempfile.mkdtemp()
+        for file_name, content in SCRIPTS.items():
+            path = os.path.join(self.content_dir, file_name)
+            with io.open(path, 'w') as script:
+                script.write(content)
+            os.chmod(path, stat.S_IRWXU)
+
+        self.benchmark = Benchmark(self.load_example_element())
+        self.executor = SCEExecutor(self.benchmark, self.content_dir,
+                                    processes=4, timeout=1)
+
+    def tearDown(self):
+        """
+        Removes the example scripts
+        """
+
+        shutil.rmtree(self.content_dir)
+
+    def test_init(self):
+        """
+        Tests the executor attributes
+        """
+
+        self.assertEqual(str(self.executor),
+                         'SCE executor test-benchmark (4 processes)',
+                         'String representation does not match')
+
+    def test_method_get_selected_rules(self):
+        """
+        Tests the get_selected_rules method of the Benchmark
+        """
+
+        def get_ids(profile_id=None):
+            return [rule.id for rule in
+                    self.benchmark.get_selected_rules(profile_id)]
+
+        self.assertEqual(get_ids(), ['test-rule-pass', 'test-rule-fail',
+                                     'test-rule-slow', 'test-rule-oval'],
+                         'Default selected rules do not match')
+        self.assertEqual(get_ids('test-profile'),
+                         ['test-rule-pass', 'test-rule-fail',
+                          'test-rule-oval', 'test-rule-cluster'],
+                         'Profile selected rules do not match')
+        self.assertEqual(get_ids('test-profile-slow'),
+                         ['test-rule-pass', 'test-rule-fail',
+                          'test-rule-slow', 'test-rule-oval',
+                          'test-rule-cluster'],
+                         'Extended profile selected rules do not match')
+
+        with self.assertRaises(ValueError):
+            self.benchmark.get_selected_rules('unknown-profile')
+
+    def test_method_get_script_checks(self):
+        """
+        Tests the get_script_checks method
+        """
+
+        self.assertEqual(self.executor.get_script_checks('test-profile'), [
+            ('test-rule-pass', os.path.join(self.content_dir, 'pass.sh')),
+            ('test-rule-fail', os.path.join(self.content_dir, 'fail.sh')),
+            ('test-rule-oval', None),
+            ('test-rule-cluster', os.path.join(self.content_dir,
+                                               'other.sh'))],
+            'Script checks do not match')
+
+    def test_method_get_script_outside(self):
+        """
+        Tests that the scripts outside of the content directory are not run
+        """
+
+        rule = self.benchmark.get_item_index()['test-rule-pass']
+        content_ref = self.executor.get_sce_check(rule).get_content_refs()[0]
+        os.symlink(os.path.join(os.sep, 'bin', 'true'),
+                   os.path.join(self.content_dir, 'link.sh'))
+
+        for href in ('../pass.sh', os.path.join(self.content_dir, 'pass.sh'),
+                     'link.sh'):
+            content_ref.href = href
+            self.assertIsNone(self.executor.get_script(rule),
+                              '{href} must not be run'.format(href=href))
+
+        self.assertEqual(self.executor.execute('test-profile')[0].result,
+                         'notchecked', 'Script outside must not be run')
+
+    def test_method_run_check(self):
+        """
+        Tests the run_check method
+        """
+
+        run = self.executor.run_check(
+            ('test-rule-pass', os.path.join(self.content_dir, 'pass.sh')))
+        self.assertEqual((run.result, run.exit_code, run.stdout),
+                         ('pass', 101, 'passed\n'),
+                         'Passing script run does not match')
+
+        run = self.executor.run_check(
+            ('test-rule-fail', os.path.join(self.content_dir, 'fail.sh')))
+        self.assertEqual((run.result, run.exit_code, run.stderr),
+                         ('fail', 102, 'failed\n'),
+                         'Failing script run does not match')
+
+        run = self.executor.run_check(
+            ('test-rule-cluster', os.path.join(self.content_dir, 'other.sh')))
+        self.assertEqual((run.result, run.exit_code), ('error', 3),
+                         'Unknown exit codes must be errors')
+
+        run = self.executor.run_check(
+            ('test-rule-slow', os.path.join(self.content_dir, 'slow.sh')))
+        self.assertEqual((run.result, run.exit_code), ('error', None),
+                         'Timed out scripts must be errors')
+        self.assertIn('timed out', run.stderr,
+                      'Timeout must be reported')
+
+        # The script exits between the timeout and the kill
+        killpg = os.killpg
+
+        def kill_exited(pid, signal_number):
+            killpg(pid, signal_number)
+            raise ProcessLookupError(pid)
+
+        os.killpg = kill_exited
+        try:
+            run = self.executor.run_check(
+                ('test-rule-slow', os.path.join(self.content_dir, 'slow.sh')))
+        finally:
+            os.killpg = killpg
+        self.assertEqual((run.result, run.exit_code), ('error', None),
+                         'Exited scripts must be errors after a timeout')
+
+        run = self.executor.run_check(
+            ('test-rule-pass', os.path.join(self.content_dir, 'missing.sh')))
+        self.assertEqual(run.result, 'error',
+                         'Missing scripts must be errors')
+
+        run = self.executor.run_check(('test-rule-oval', None))
+        self.assertEqual(run.result, 'notchecked',
+                         'Rules without script must not be checked')
+
+    def test_method_get_check_environment(self):
+        """
+        Tests the get_check_environment method
+        """
+
+        substitution = Substitution(self.benchmark)
+        items = self.benchmark.get_item_index()
+
+        environment = self.executor.get_check_environment(
+            items['test-rule-pass'], substitution, 'test-profile')
+        self.assertEqual(environment['XCCDF_VALUE_attempts'], '5',
+                         'Profile value not exported')
+        self.assertEqual(environment['XCCDF_TYPE_attempts'], 'number',
+                         'Value type not exported')
+        self.assertEqual(environment['XCCDF_RESULT_PASS'], '101',
+                         'Exit codes not exported')
+        self.assertNotIn('XCCDF_VALUE_missing', environment,
+                         'Missing Values must not be exported')
+
+        environment = self.executor.get_check_environment(
+            items['test-rule-pass'], substitution)
+        self.assertEqual(environment['XCCDF_VALUE_attempts'], '3',
+                         'Default value not exported')
+
+        environment = self.executor.get_check_environment(
+            items['test-rule-fail'], substitution)
+        self.assertNotIn('XCCDF_VALUE_attempts', environment,
+                         'Values exported to other checks')
+        self.assertNotIn('XCCDF_VALUE_attempts', self.executor.environment,
+                         'Executor environment changed')
+
+    def test_method_execute(self):
+        """
+        Tests the execute method
+        """
+
+        runs = self.executor.execute('test-profile-slow')
+
+        self.assertEqual([(run.rule_id, run.result) for run in runs],
+                         [('test-rule-pass', 'pass'),
+                          ('test-rule-fail', 'fail'),
+                          ('test-rule-slow', 'error'),
+                          ('test-rule-oval', 'notchecked'),
+                          ('test-rule-cluster', 'error')],
+                         'Results do not match')
+        self.assertEqual(runs[0].stdout, 'passed 5\n',
+                         'Exported value does not match')
+
+        self.executor.processes = 1
+        self.assertEqual([run.result for run in
+                          self.executor.execute('test-profile')],
+                         ['pass', 'fail', 'notchecked', 'error'],
+                         'Sequential results do not match')
+
+    def test_method_execute_cache(self):
+        """
+        Tests the execute method with a result cache
+        """
+
+        cache = ResultCache()
+        self.executor.cache = cache
+
+        first_runs = self.executor.execute('test-profile')
+        self.assertEqual(len(cache), 2,
+                         'Only the pass and fail results must be cached')
+
+        # Changed and missing scripts are run again
+        os.remove(os.path.join(self.content_dir, 'fail.sh'))
+        with io.open(os.path.join(self.content_dir, 'pass.sh'), 'a') as script:
+            script.write('# changed\n')
+
+        runs = self.executor.execute('test-profile')
+        self.assertEqual([run.result for run in runs],
+                         ['pass', 'error', 'notchecked', 'error'],
+                         'Results do not match')
+        self.assertEqual(cache.get_hit_rates()['test-rule-pass'], 0.0,
+                         'Changed scripts must not hit the cache')
+
+        with io.open(os.path.join(self.content_dir, 'fail.sh'), 'w') as script:
+            script.write(SCRIPTS['fail.sh'])
+        runs = self.executor.execute('test-profile')
+        self.assertEqual(runs[1], first_runs[1]._replace(duration=0.0),
+                         'Cached result does not match')
+        self.assertEqual(cache.get_hit_rates()['test-rule-fail'], 0.5,
+                         'Hit rate does not match')
+
+        self.executor.facts = {'hostname': 'other-host'}
+        runs = self.executor.execute('test-profile')
+        self.assertEqual(cache.get_hit_rates()['test-rule-fail'], 1.0 / 3,
+                         'Other hosts must not hit the cache')
+
+    def test_method_execute_cache_shared_script(self):
+        """
+        Tests the cache of Rules that share a script with other Values
+        """
+
+        cache = ResultCache()
+        executor = SCEExecutor(
+            Benchmark(self.load_example_element('shared')),
+            self.content_dir, processes=1, cache=cache)
+
+        expected = ['pass', 'fail']
+        self.assertEqual([run.result for run in executor.execute()],
+                         expected, 'Results do not match')
+        self.assertEqual(len(cache), 2, 'Results of each Rule not cached')
+        self.assertEqual([run.result for run in executor.execute()],
+                         expected, 'Cached results do not match')
+        self.assertEqual(cache.get_hit_rates(),
+                         {'test-rule-enabled': 0.5,
+                          'test-rule-disabled': 0.5},
+                         'Results not served from the cache')
+
+    def test_method_build_test_result(self):
+        """
+        Tests the build_test_result method
+        """
+
+        runs = [CheckRun('test-rule-pass', None, 'pass', 101, '', '', 0.0),
+                CheckRun('test-rule-fail', None, 'fail', 102, '', '', 0.0)]
+        test_result = self.executor.build_test_result(
+            runs, 'test-profile', end_time='2014-07-01T10:00:00')
+
+        self.assertIsInstance(test_result, TestResult,
+                              'TestResult not built')
+        self.assertEqual(test_result.profile_idref, 'test-profile',
+                         'Profile does not match')
+        self.assertEqual(len(test_result.targets), 1,
+                         'Target not set')
+        self.assertEqual([(rule_result.idref, rule_result.get_result())
+                          for rule_result in test_result.get_rule_results()],
+                         [('test-rule-pass', 'pass'),
+                          ('test-rule-fail', 'fail')],
+                         'Rule results do not match')
+        self.assertEqual(test_result.get_rule_results()[0].severity, 'high',
+                         'Severity not copied')
+
+        # Weights 1 and 2 in the same group
+        self.assertAlmostEqual(test_result.get_scores()[SCORING_DEFAULT],
+                               100.0 / 3,
+                               msg='Score does not match')
+
+        loaded = TestResult(etree.fromstring(
+            etree.tostring(test_result.update_xml_element())))
+        self.assertEqual(len(loaded.get_rule_results()), 2,
+                         'TestResult XML does not load back')
+
+    def test_method_run(self):
+        """
+        Tests the run method
+        """
+
+        test_result = self.executor.run('test-profile')
+
+        self.assertTrue(hasattr(test_result, 'start_time'),
+                        'Start time not set')
+        self.assertEqual([rule_result.get_result()
+                          for rule_result in test_result.get_rule_results()],
+                         ['pass', 'fail', 'notchecked', 'error'],
+                         'Results do not match')
+
+
+def suite():
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+    suite.addTest(loader.loadTestsFromTestCase(SCEExecutorTestCase))
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.TextTestRunner(verbosity=2).run(suite())
@@ -0,0 +1,351 @@
+# -*- coding: utf-8 -*-
+
+# Python stdlib
+import unittest
+import os
+import io
+import random
+import tracemalloc
+
+# lxml
+from lxml import etree
+
+# XCCDF
+from xccdf.scoring import ScoringTree
+from xccdf.scoring import IncrementalScore
+from xccdf.scoring import numpy
+from xccdf.scoring import SCORING_SYSTEMS
+from xccdf.scoring import SCORING_DEFAULT
+from xccdf.scoring import SCORING_FLAT
+from xccdf.scoring import SCORING_FLAT_UNWEIGHTED
+from xccdf.scoring import SCORING_ABSOLUTE
+from xccdf.models.benchmark import Benchmark
+from xccdf.builder import load
+from xccdf.testing.generate import generate_benchmark
+from xccdf.constants.result import RESULT_CODES
+from xccdf.constants.result import RESULT_CODE_NONE
+
+
+class ScoringBaseTestCase(unittest.TestCase):
+
+    """
+    Scoring tree and results of the example Benchmark
+    """
+
+    def load_example_element(self, xml_file_type='benchmark'):
+        """
+        Helper method to load an XML element
+        """
+
+        file_name = 'example_xccdf_scoring_{type}.xml'.format(
+            type=xml_file_type)
+
+        xml_path = os.path.abspath(os.path.dirname(__file__))
+        xml_file = io.open(os.path.join(
+            xml_path,
+            'examples',
+            file_name))
+
+        xml_string = xml_file.read()
+        xml_file.close()
+
+        element_tree = etree.fromstring(xml_string.encode('utf-8'))
+
+        return element_tree
+
+    def setUp(self):
+        """
+        Builds the scoring tree of the example Benchmark
+        """
+
+        self.tree = ScoringTree(Benchmark(self.load_example_element()))
+        self.hosts = [
+            self.tree.encode({'test-rule-1': 'pass',
+                              'test-rule-2': 'fail',
+                              'test-rule-3': 'pass',
+                              'test-rule-4': 'notapplicable'}),
+            self.tree.encode({'test-rule-1': 'pass',
+                              'test-rule-2': 'fixed',
+                              'test-rule-3': 'pass',
+                              'test-rule-4': 'pass'}),
+            self.tree.encode(dict()),
+        ]
+
+
+class ScoringTestCase(ScoringBaseTestCase):
+
+    """
+    Test cases for ScoringTree class
+    """
+
+    def test_init(self):
+        """
+        Tests the weight tree of the Benchmark
+        """
+
+        self.assertEqual(self.tree.rule_ids, ['test-rule-3', 'test-rule-1',
+                                              'test-rule-2', 'test-rule-4'],
+                         'Rule ids do not match')
+        self.assertEqual(self.tree.rule_weights, [1.0, 1.0, 3.0, 0.5],
+                         'Rule weights do not match')
+        self.assertEqual(self.tree.group_ids, ['test-benchmark',
+                                               'test-group-1',
+                                               'test-group-2'],
+                         'Group ids do not match')
+        self.assertEqual(self.tree.group_parents, [-1, 0, 1],
+                         'Group parents do not match')
+        self.assertEqual(str(self.tree),
+                         'scoring tree test-benchmark (2 groups, 4 rules)',
+                         'String representation does not match')
+
+    def test_method_encode(self):
+        """
+        Tests the encode method
+        """
+
+        codes = self.tree.encode({'test-rule-2': 'error',
+                                  'missing-rule': 'pass'})
+
+        self.assertEqual(codes, [RESULT_CODE_NONE, RESULT_CODE_NONE,
+                                 RESULT_CODES['error'], RESULT_CODE_NONE],
+                         'Result codes do not match')
+
+    def test_score_default(self):
+        """
+        Tests the default scoring model
+        """
+
+        scores, maximums = self.tree.score(self.hosts, SCORING_DEFAULT,
+                                           use_numpy=False)
+
+        self.assertEqual(scores, [40.0, 100.0, 0.0], 'Scores do not match')
+        self.assertEqual(maximums, [100.0, 100.0, 100.0],
+                         'Maximum scores do not match')
+
+    def test_score_flat(self):
+        """
+        Tests the flat scoring models
+        """
+
+        self.assertEqual(self.tree.score(self.hosts, SCORING_FLAT,
+                                         use_numpy=False),
+                         ([2.0, 5.5, 0.0], [5.0, 5.5, 0.0]),
+                         'Flat scores do not match')
+        self.assertEqual(self.tree.score(self.hosts, SCORING_FLAT_UNWEIGHTED,
+                                         use_numpy=False),
+                         ([2.0, 4.0, 0.0], [3.0, 4.0, 0.0]),
+                         'Flat unweighted scores do not match')
+
+    def test_score_absolute(self):
+        """
+        Tests the absolute scoring model
+        """
+
+        self.assertEqual(self.tree.score(self.hosts, SCORING_ABSOLUTE,
+                                         use_numpy=False),
+                         ([0.0, 1.0, 1.0], [1.0, 1.0, 1.0]),
+                         'Absolute scores do not match')
+
+    def test_score_invalid_system(self):
+        """
+        Tests the score method with an unknown scoring model
+        """
+
+        with self.assertRaises(ValueError):
+            self.tree.score(self.hosts, 'urn:xccdf:scoring:unknown',
+                            use_numpy=False)
+
+    @unittest.skipIf(numpy is None, 'NumPy is not installed')
+    def test_score_numpy(self):
+        """
+        Tests that the vectorized scores match the per host scores exactly
+        """
+
+        generator = random.Random(42)
+        codes = list(RESULT_CODES.values()) + [RESULT_CODE_NONE]
+        matrix = [[generator.choice(codes) for rule in self.tree.rule_ids]
+                  for host in range(500)]
+        matrix.extend(self.hosts)
+
+        for system in SCORING_SYSTEMS:
+            scores, maximums = self.tree.score(matrix, system,
+                                               use_numpy=False)
+            np_scores, np_maximums = self.tree.score(matrix, system,
+                                                     use_numpy=True)
+            self.assertEqual(np_scores.tolist(), scores,
+                             '{system} scores do not match'.format(
+                                 system=system))
+            self.assertEqual(np_maximums.tolist(), maximums,
+                             '{system} maximum scores do not match'.format(
+                                 system=system))
+
+    @unittest.skipIf(numpy is None, 'NumPy is not installed')
+    def test_score_numpy_memory(self):
+        """
+        Tests that the vectorized score doesn't copy the result matrix
+        """
+
+        document = io.BytesIO()
+        generate_benchmark(document, rules=400)
+        tree = ScoringTree(load(document.getvalue()))
+
+        generator = numpy.random.RandomState(42)
+        matrix = generator.randint(0, len(RESULT_CODES) + 1, size=(
+            5000, len(tree.rule_ids))).astype(numpy.uint8)
+
+        for system in SCORING_SYSTEMS:
+            tracemalloc.start()
+            try:
+                tree.score(matrix, system, use_numpy=True)
+                peak = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+
+            self.assertLess(peak, matrix.nbytes,
+                            '{system} copies the matrix'.format(
+                                system=system))
+
+    @unittest.skipIf(numpy is None, 'NumPy is not installed')
+    def test_score_numpy_invalid_matrix(self):
+        """
+        Tests the vectorized score with a wrong number of columns
+        """
+
+        with self.assertRaises(ValueError):
+            self.tree.score([[1, 2]], use_numpy=True)
+
+
+class IncrementalScoreTestCase(ScoringBaseTestCase):
+
+    """
+    Test cases for IncrementalScore class
+    """
+
+    def test_init(self):
+        """
+        Tests the initial score
+        """
+
+        incremental = IncrementalScore(self.tree, self.hosts[0])
+
+        self.assertEqual(incremental.get_score(), 40.0,
+                         'Score does not match')
+        self.assertEqual(str(incremental),
+                         'incremental score test-benchmark 40.0',
+                         'String representation does not match')
+
+    def test_method_update(self):
+        """
+        Tests the update method
+        """
+
+        incremental = IncrementalScore(self.tree, self.hosts[0])
+
+        score = incremental.update({'test-rule-2': 'fixed',
+                                    'test-rule-4': 'pass',
+                                    'missing-rule': 'fail'})
+
+        self.assertEqual(score, 100.0, 'Score does not match')
+        self.assertEqual(incremental.codes, self.hosts[1],
+                         'Result codes do not match')
+
+    def test_method_update_unchanged_group(self):
+        """
+        Tests that the ancestors of an unchanged group are not recomputed
+        """
+
+        incremental = IncrementalScore(self.tree, self.hosts[0])
+        incremental.scores[0] = None
+
+        incremental.update({'test-rule-3': 'fixed'})
+
+        self.assertIsNone(incremental.scores[0],
+                          'Benchmark score must not be recomputed')
+
+    def test_method_update_random(self):
+        """
+        Tests that the updates match a full recompute exactly
+        """
+
+        generator = random.Random(42)
+        results = list(RESULT_CODES.keys())
+        incremental = IncrementalScore(self.tree, self.hosts[2])
+
+        for step in range(500):
+            deltas = dict((generator.choice(self.tree.rule_ids),
+                           generator.choice(results))
+                          for change in range(generator.randint(1, 3)))
+            score = incremental.update(deltas)
+            self.assertEqual(score,
+                             self.tree.score_host(incremental.codes)[0],
+                             'Score does not match a full recompute')
+
+        self.assertEqual(incremental.get_score(),
+                         IncrementalScore(self.tree,
+                                          incremental.codes).get_score(),
+                         'Sums drifted with the updates')
+
+    def test_method_update_generated(self):
+        """
+        Tests that the updates of a large tree with uneven weights
+        match a full recompute exactly
+        """
+
+        document = io.BytesIO()
+        generate_benchmark(document, rules=300)
+        tree = ScoringTree(load(document.getvalue()))
+
+        generator = random.Random(7)
+        weights = [0.1, 0.3, 0.7, 1.0, 2.5, 3.3, 9.9]
+        tree.rule_weights = [generator.choice(weights)
+                             for rule_id in tree.rule_ids]
+        tree.group_weights = [generator.choice(weights)
+                              for group_id in tree.group_ids]
+
+        names = list(RESULT_CODES.keys())
+        results = dict((rule_id, generator.choice(names))
+                       for rule_id in tree.rule_ids)
+        incremental = IncrementalScore(tree, tree.encode(results))
+
+        for step in range(300):
+            deltas = dict((generator.choice(tree.rule_ids),
+                           generator.choice(names))
+                          for change in range(generator.randint(1, 5)))
+            results.update(deltas)
+            self.assertEqual(incremental.update(deltas),
+                             tree.score_host(tree.encode(results))[0],
+                             'Score does not match a full recompute')
+
+        if numpy is not None:
+            self.assertEqual(
+                tree.score([tree.encode(results)], use_numpy=True)[0][0],
+                incremental.get_score(),
+                'Vectorized score does not match')
+
+    def test_method_update_sums(self):
+        """
+        Tests that an update doesn't add up the other children again
+        """
+
+        incremental = IncrementalScore(self.tree, self.hosts[0])
+        self.tree.score_group = None
+
+        try:
+            score = incremental.update({'test-rule-2': 'fail'})
+        finally:
+            del self.tree.score_group
+
+        self.assertEqual(score, self.tree.score_host(incremental.codes)[0],
+                         'Score does not match a full recompute')
+
+
+def suite():
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+    suite.addTest(loader.loadTestsFromTestCase(ScoringTestCase))
+    suite.addTest(loader.loadTestsFromTestCase(IncrementalScoreTestCase))
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.TextTestRunner(verbosity=2).run(suite())
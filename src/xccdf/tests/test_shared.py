@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+
+# Python stdlib
+import unittest
+import os
+import io
+import shutil
+import tempfile
+import multiprocessing
+import subprocess
+import sys
+
+# lxml
+from lxml import etree
+
+# XCCDF
+from xccdf.shared import SharedBenchmarkStore
+from xccdf.shared import pack_benchmark
+from xccdf.models.benchmark import Benchmark
+from xccdf.models.group import Group
+from xccdf.models.rule import Rule
+
+
+#: Script that attaches to a shared Benchmark from an unrelated process,
+#: and waits for its resource tracker to clean up, as when it exits
+ATTACH_SCRIPT = """
+import sys
+from multiprocessing import resource_tracker
+from xccdf.shared import SharedBenchmarkStore
+store = SharedBenchmarkStore.attach(sys.argv[1])
+print(' '.join(store.get_selected_rule_ids('test-profile')))
+store.close()
+resource_tracker._resource_tracker._stop()
+"""
+
+
+def get_attached_rule_ids(name, queue):
+    """
+    Attaches to a shared Benchmark from another process
+    """
+
+    store = SharedBenchmarkStore.attach(name)
+    queue.put(store.get_selected_rule_ids('test-profile'))
+    store.close()
+
+
+class SharedBenchmarkStoreTestCase(unittest.TestCase):
+
+    """
+    Test cases for SharedBenchmarkStore class
+    """
+
+    def load_example_element(self, xml_file_type='benchmark'):
+        """
+        Helper method to load an XML element
+        """
+
+        file_name = 'example_xccdf_dependencies_{type}.xml'.format(
+            type=xml_file_type)
+
+        xml_file = io.open(os.path.join(
+            os.path.abspath(os.path.dirname(__file__)),
+            'examples', file_name))
+
+        xml_string = xml_file.read()
+        xml_file.close()
+
+        element_tree = etree.fromstring(xml_string.encode('utf-8'))
+
+        return element_tree
+
+    def setUp(self):
+        """
+        Packs the example Benchmark
+        """
+
+        self.benchmark = Benchmark(self.load_example_element())
+        self.store = SharedBenchmarkStore.from_benchmark(self.benchmark)
+
+    def test_init(self):
+        """
+        Tests the packed records
+        """
+
+        self.assertEqual(len(self.store), 11, 'Item count does not match')
+        self.assertIn('test-rule-4', self.store, 'Item not found')
+        self.assertNotIn('test-rule-unknown', self.store,
+                         'Unknown items must not exist')
+        self.assertEqual(self.store.get_item_ids(),
+                         list(self.benchmark.get_item_index().keys()),
+                         'Item ids do not match')
+        self.assertEqual(self.store.get_parent_id('test-rule-4'),
+                         'test-group-b', 'Parent does not match')
+        self.assertIsNone(self.store.get_parent_id('test-rule-6'),
+                          'Top level items have no parent')
+
+        with self.assertRaises(ValueError):
+            SharedBenchmarkStore(b'not a packed benchmark')
+
+    def test_method_get_item(self):
+        """
+        Tests the get_item method
+        """
+
+        rule = self.store.get_item('test-rule-1')
+        self.assertIsInstance(rule, Rule, 'Rule not built')
+        self.assertEqual(rule.as_dict(),
+                         self.benchmark.get_item_index()['test-rule-1']
+                         .as_dict(),
+                         'Rule does not match')
+
+        group = self.store.get_item('test-group-a')
+        self.assertIsInstance(group, Group, 'Group not built')
+        self.assertEqual([child.id for child in group.children
+                          if isinstance(child, Rule)], list(),
+                         'Nested items must not be stored with the Group')
+
+        self.assertIsNone(self.store.get_item('test-profile'),
+                          'Profiles are not items')
+        self.assertEqual(self.store.get_profile('test-profile').id,
+                         'test-profile', 'Profile does not match')
+        self.assertIsNone(self.store.get_value('test-rule-1'),
+                          'Rules are not Values')
+
+    def test_method_get_selections(self):
+        """
+        Tests the get_selections and get_selected_rule_ids methods
+        """
+
+        for profile_id in [None, 'test-profile']:
+            self.assertEqual(self.store.get_selections(profile_id),
+                             self.benchmark.get_selections(profile_id),
+                             'Selections do not match')
+            self.assertEqual(
+                [rule.id for rule in
+                 self.store.get_selected_rules(profile_id)],
+                [rule.id for rule in
+                 self.benchmark.get_selected_rules(profile_id)],
+                'Selected rules do not match')
+
+        with self.assertRaises(ValueError):
+            self.store.get_selections('unknown-profile')
+
+    def test_method_open(self):
+        """
+        Tests the save and open methods
+        """
+
+        temp_dir = tempfile.mkdtemp()
+        path = os.path.join(temp_dir, 'benchmark.xcsb')
+
+        try:
+            SharedBenchmarkStore.save(self.benchmark, path)
+            store = SharedBenchmarkStore.open(path)
+            self.assertEqual(store.buffer.tobytes(),
+                             pack_benchmark(self.benchmark),
+                             'Mapped file does not match')
+            self.assertEqual(store.get_selected_rule_ids(),
+                             self.store.get_selected_rule_ids(),
+                             'Selected rules do not match')
+            store.close()
+        finally:
+            shutil.rmtree(temp_dir)
+
+    def test_method_attach(self):
+        """
+        Tests the create and attach methods from another process
+        """
+
+        store = SharedBenchmarkStore.create(self.benchmark)
+        queue = multiprocessing.Queue()
+
+        try:
+            process = multiprocessing.Process(
+                target=get_attached_rule_ids, args=(store.shm.name, queue))
+            process.start()
+            rule_ids = queue.get(timeout=30)
+            process.join()
+
+            attached = SharedBenchmarkStore.attach(store.shm.name)
+            self.assertTrue(attached.buffer.readonly,
+                            'Attached stores must be read-only')
+            attached.close()
+        finally:
+            store.close()
+            store.unlink()
+
+        self.assertEqual(rule_ids,
+                         self.store.get_selected_rule_ids('test-profile'),
+                         'Attached selections do not match')
+
+    def test_method_attach_processes(self):
+        """
+        Tests that processes attaching in turn don't remove the segment
+        """
+
+        store = SharedBenchmarkStore.create(self.benchmark)
+        expected = self.store.get_selected_rule_ids('test-profile')
+        environment = dict(os.environ)
+        environment['PYTHONPATH'] = os.pathsep.join(sys.path)
+
+        try:
+            for attempt in range(2):
+                output = subprocess.check_output(
+                    [sys.executable, '-c', ATTACH_SCRIPT, store.shm.name],
+                    env=environment, universal_newlines=True)
+                self.assertEqual(output.split(), expected,
+                                 'Attached selections do not match')
+
+            queue = multiprocessing.Queue()
+            process = multiprocessing.Process(
+                target=get_attached_rule_ids, args=(store.shm.name, queue))
+            process.start()
+            self.assertEqual(queue.get(timeout=30), expected,
+                             'Attached selections do not match')
+            process.join()
+
+            attached = SharedBenchmarkStore.attach(store.shm.name)
+            attached.close()
+        finally:
+            store.close()
+            store.unlink()
+
+
+def suite():
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+    suite.addTest(loader.loadTestsFromTestCase(SharedBenchmarkStoreTestCase))
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.TextTestRunner(verbosity=2).run(suite())
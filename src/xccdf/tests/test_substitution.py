@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+
+# Python stdlib
+import unittest
+import os
+import io
+
+# lxml
+from lxml import etree
+
+# XCCDF
+from xccdf.substitution import Substitution
+from xccdf.models.benchmark import Benchmark
+
+
+class SubstitutionTestCase(unittest.TestCase):
+
+    """
+    Test cases for Substitution class
+    """
+
+    def load_example_element(self, xml_file_type='benchmark'):
+        """
+        Helper method to load an XML element
+        """
+
+        file_name = 'example_xccdf_substitution_{type}.xml'.format(
+            type=xml_file_type)
+
+        xml_path = os.path.abspath(os.path.dirname(__file__))
+        xml_file = io.open(os.path.join(
+            xml_path,
+            'examples',
+            file_name))
+
+        xml_string = xml_file.read()
+        xml_file.close()
+
+        element_tree = etree.fromstring(xml_string.encode('utf-8'))
+
+        return element_tree
+
+    def setUp(self):
+        """
+        Loads the Benchmark and its substitution engine
+        """
+
+        self.benchmark = Benchmark(self.load_example_element())
+        self.substitution = Substitution(self.benchmark)
+        self.items = self.benchmark.get_item_index()
+
+    def test_value_index(self):
+        """
+        Tests the Values of the Benchmark and its Groups
+        """
+
+        self.assertEqual(list(self.benchmark.get_value_index().keys()),
+                         ['test-value-age', 'test-value-length'],
+                         'Values do not match')
+        self.assertEqual(str(self.substitution),
+                         'substitution (2 values, 4 profiles)',
+                         'String representation does not match')
+
+    def test_method_get_value_map(self):
+        """
+        Tests the value maps of the profiles
+        """
+
+        self.assertEqual(self.substitution.get_value_map(),
+                         {'test-value-age': '90',
+                          'test-value-length': '12'},
+                         'Default values do not match')
+        self.assertEqual(self.substitution.get_value_map('strict-profile'),
+                         {'test-value-age': '90',
+                          'test-value-length': '16'},
+                         'Refined values do not match')
+        self.assertEqual(self.substitution.get_value_map('custom-profile'),
+                         {'test-value-age': '30',
+                          'test-value-length': '16'},
+                         'Extended values do not match')
+
+    def test_method_get_value_map_cached(self):
+        """
+        Tests that the value map of a profile is computed once
+        """
+
+        value_map = self.substitution.get_value_map('custom-profile')
+
+        self.assertIs(self.substitution.get_value_map('custom-profile'),
+                      value_map, 'Value map must be cached')
+
+    def test_method_get_value_map_invalid_profiles(self):
+        """
+        Tests the value maps of unknown and looping profiles
+        """
+
+        with self.assertRaises(ValueError):
+            self.substitution.get_value_map('missing-profile')
+        with self.assertRaises(ValueError):
+            self.substitution.get_value_map('loop-profile')
+
+    def test_method_render(self):
+        """
+        Tests the rendered descriptions of a Rule
+        """
+
+        rule = self.items['test-rule-1']
+
+        self.assertEqual(self.substitution.render(rule),
+                         ['Passwords must have 12 characters and expire in '
+                          '90 <b>days</b>.', 'Sin valores.'],
+                         'Default descriptions do not match')
+        self.assertEqual(self.substitution.render(rule, 'custom-profile')[0],
+                         'Passwords must have 16 characters and expire in '
+                         '30 <b>days</b>.',
+                         'Profile descriptions do not match')
+
+    def test_method_render_markup_value(self):
+        """
+        Tests that the markup characters of a Value are escaped
+        """
+
+        rule = self.items['test-rule-1']
+
+        self.assertEqual(self.substitution.render(rule, 'markup-profile')[0],
+                         'Passwords must have 12 characters and expire in '
+                         'a &lt;b&gt; &amp; c <b>days</b>.',
+                         'Value markup not escaped')
+
+    def test_method_render_unknown_value(self):
+        """
+        Tests the rendered description of an unknown Value
+        """
+
+        rule = self.items['test-rule-2']
+
+        self.assertEqual(self.substitution.render(rule, 'strict-profile'),
+                         ['Unknown  value.'],
+                         'Description does not match')
+
+    def test_method_render_cached(self):
+        """
+        Tests that the rendered descriptions are cached
+        """
+
+        rule = self.items['test-rule-1']
+        rendered = self.substitution.render(rule, 'strict-profile')
+
+        self.assertIs(self.substitution.render(rule, 'strict-profile'),
+                      rendered, 'Rendered descriptions must be cached')
+
+
+def suite():
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+    suite.addTest(loader.loadTestsFromTestCase(SubstitutionTestCase))
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.TextTestRunner(verbosity=2).run(suite())
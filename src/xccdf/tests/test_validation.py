@@ -0,0 +1,324 @@
+# -*- coding: utf-8 -*-
+
+# Python stdlib
+import unittest
+import os
+import io
+import sys
+
+# lxml
+from lxml import etree
+
+# XCCDF
+from xccdf.validation import validate
+from xccdf.validation import get_schema
+from xccdf.validation import validate_schema
+from xccdf.validation import validate_files
+from xccdf.validation import XSD_PATH
+from xccdf.validation import SCHEMATRON_PATH
+from xccdf.builder import load
+from xccdf.testing.generate import generate_benchmark
+from xccdf.models.benchmark import Benchmark
+from xccdf.models.status import Status
+from xccdf.exceptions import RequiredAttributeException
+from xccdf.exceptions import CardinalityException
+from xccdf.exceptions import InvalidValueException
+
+
+class ValidationTestCase(unittest.TestCase):
+
+    """
+    Test cases for validate function
+    """
+
+    def load_example_element(self, xml_file_type='ok'):
+        """
+        Helper method to load an XML element
+        """
+
+        file_name = 'example_xccdf_validation_{type}.xml'.format(
+            type=xml_file_type)
+
+        xml_path = os.path.abspath(os.path.dirname(__file__))
+        xml_file = io.open(os.path.join(
+            xml_path,
+            'examples',
+            file_name))
+
+        xml_string = xml_file.read()
+        xml_file.close()
+
+        element_tree = etree.fromstring(xml_string.encode('utf-8'))
+
+        return element_tree
+
+    def test_validate_ok(self):
+        """
+        Tests the validate function with a valid document
+        """
+
+        errors = validate(self.load_example_element('ok'))
+
+        self.assertEqual(errors, list(), 'Valid document has errors')
+
+    def test_validate_errors(self):
+        """
+        Tests the validate function collects every error
+        """
+
+        errors = validate(self.load_example_element('errors'))
+
+        expected = [
+            (CardinalityException, 2),
+            (InvalidValueException, 3),
+            (CardinalityException, 5),
+            (RequiredAttributeException, 7),
+            (InvalidValueException, 7),
+            (CardinalityException, 13),
+            (RequiredAttributeException, 15),
+            (RequiredAttributeException, 17),
+        ]
+        found = [(type(error), error.sourceline) for error in errors]
+
+        self.assertEqual(found, expected, 'Validation errors do not match')
+
+    def test_validate_error_path(self):
+        """
+        Tests the element path of the validation errors
+        """
+
+        errors = validate(self.load_example_element('errors'))
+        paths = [error.path for error in errors]
+
+        self.assertIn("/Benchmark[@id='test-benchmark']/status", paths,
+                      'Status path not found')
+        self.assertIn("/Benchmark[@id='test-benchmark']"
+                      "/Group[@id='test-group']/Rule[@id='test-rule-1']"
+                      "/version[2]",
+                      paths, 'Duplicated version path not found')
+
+    def test_validate_object(self):
+        """
+        Tests the validate function with a Benchmark object
+        """
+
+        xccdf_benchmark = Benchmark(self.load_example_element('ok'))
+
+        self.assertEqual(validate(xccdf_benchmark), list(),
+                         'Valid Benchmark object has errors')
+
+    def test_validate_invalid_element(self):
+        """
+        Tests the validate function with an element that is not a document
+        """
+
+        error_msg = 'only Benchmark and Tailoring can be validated'
+        if sys.version_info[0] >= 3 and sys.version_info[1] >= 2:
+            with self.assertRaisesRegex(ValueError, error_msg):
+                validate(Status(state='accepted'))
+        else:
+            with self.assertRaisesRegexp(ValueError, error_msg):
+                validate(Status(state='accepted'))
+
+    def test_load_non_strict(self):
+        """
+        Tests a non strict load keeps the invalid elements
+        """
+
+        xml_element = self.load_example_element('errors')
+        xccdf_benchmark = Benchmark(xml_element, strict=False)
+
+        self.assertEqual(len(xccdf_benchmark.errors), 8,
+                         'Errors were not collected')
+        self.assertEqual(xccdf_benchmark.id, 'test-benchmark',
+                         'Benchmark id does not match')
+
+    def test_load_strict(self):
+        """
+        Tests a strict load raises the first error
+        """
+
+        xml_element = self.load_example_element('errors')
+
+        with self.assertRaises(InvalidValueException):
+            Benchmark(xml_element)
+
+
+class SchemaValidationTestCase(unittest.TestCase):
+
+    """
+    Test cases for the schema validation functions
+    """
+
+    def get_example_path(self, file_name):
+        """
+        Helper method to get the path of an example file
+        """
+
+        xml_path = os.path.abspath(os.path.dirname(__file__))
+
+        return os.path.join(xml_path, 'examples', file_name)
+
+    def setUp(self):
+        """
+        Sets the paths of the test schemas
+        """
+
+        self.xsd_path = self.get_example_path(
+            'example_xccdf_validation_schema.xsd')
+        self.schematron_path = self.get_example_path(
+            'example_xccdf_validation_schematron.sch')
+
+    def test_get_schema_cached(self):
+        """
+        Tests the schema is compiled only once
+        """
+
+        schema = get_schema(self.xsd_path)
+
+        self.assertIs(get_schema(self.xsd_path), schema,
+                      'Schema was compiled again')
+
+    def test_get_schema_missing(self):
+        """
+        Tests a missing schema file
+        """
+
+        with self.assertRaises(IOError):
+            get_schema(self.get_example_path('missing.xsd'))
+
+    def test_validate_schema_ok(self):
+        """
+        Tests the validate_schema function with a valid document
+        """
+
+        path = self.get_example_path('example_xccdf_validation_ok.xml')
+        errors = validate_schema(path, self.xsd_path, self.schematron_path)
+
+        self.assertEqual(errors, list(), 'Valid document has errors')
+
+    def test_validate_schema_errors(self):
+        """
+        Tests the validate_schema function with an invalid document
+        """
+
+        path = self.get_example_path('example_xccdf_validation_no_id.xml')
+        errors = validate_schema(path, self.xsd_path, self.schematron_path)
+
+        self.assertEqual(len(errors), 2, 'Schema errors were not found')
+        self.assertEqual(errors[0].sourceline, 2,
+                         'XML Schema error line does not match')
+        self.assertEqual(errors[1].path,
+                         "/Benchmark/Group[@id='test-group']"
+                         "/Rule[@id='test-rule-1']",
+                         'Schematron error path does not match')
+        self.assertEqual(str(errors[1]), 'a Rule must have a title',
+                         'Schematron error message does not match')
+
+    def test_validate_schema_object(self):
+        """
+        Tests the validate_schema function with a Benchmark object
+        """
+
+        xml_element = etree.parse(self.get_example_path(
+            'example_xccdf_validation_ok.xml')).getroot()
+        xccdf_benchmark = Benchmark(xml_element)
+
+        self.assertEqual(validate_schema(xccdf_benchmark, self.xsd_path),
+                         list(), 'Valid Benchmark object has errors')
+
+    def test_validate_schema_bundled(self):
+        """
+        Tests the validate_schema function with the bundled XCCDF 1.2 schemas
+        """
+
+        path = self.get_example_path('example_xccdf_validation_1.2_ok.xml')
+        errors = validate_schema(path, XSD_PATH, SCHEMATRON_PATH)
+
+        self.assertEqual(errors, list(), 'Valid document has errors')
+
+        path = self.get_example_path(
+            'example_xccdf_validation_1.2_errors.xml')
+        errors = validate_schema(path, XSD_PATH, SCHEMATRON_PATH)
+
+        self.assertEqual(len(errors), 2, 'Schema errors were not found')
+        self.assertIn("'test-benchmark'", str(errors[0]),
+                      'XML Schema error does not match')
+        self.assertEqual(errors[1].path,
+                         "/Benchmark[@id='test-benchmark']"
+                         "/Profile[@id='xccdf_org.example_profile_test']"
+                         "/select",
+                         'Schematron error path does not match')
+
+    def test_validate_schema_bundled_loaded(self):
+        """
+        Tests the bundled schemas with Benchmark objects loaded by the library
+        """
+
+        xccdf_benchmark = load(self.get_example_path(
+            'example_xccdf_validation_1.2_ok.xml'))
+
+        self.assertEqual(validate_schema(xccdf_benchmark, XSD_PATH,
+                                         SCHEMATRON_PATH),
+                         list(), 'Valid Benchmark object has errors')
+
+        document = io.BytesIO()
+        generate_benchmark(document, rules=5)
+        for xccdf_benchmark in (
+                load(self.get_example_path('example_xccdf_validation_ok.xml')),
+                load(document.getvalue())):
+            errors = validate_schema(xccdf_benchmark, XSD_PATH,
+                                     SCHEMATRON_PATH)
+
+            self.assertEqual(len(errors), 1, 'Namespace not rejected')
+            self.assertEqual(
+                str(errors[0]),
+                'unsupported namespace http://checklists.nist.gov/xccdf/1.1,'
+                ' the XML Schema validates '
+                'http://checklists.nist.gov/xccdf/1.2 documents',
+                'Namespace error message does not match')
+            self.assertEqual(errors[0].path,
+                             "/Benchmark[@id='{id}']".format(
+                                 id=xccdf_benchmark.id),
+                             'Namespace error path does not match')
+
+    def test_validate_files(self):
+        """
+        Tests the validate_files function in a process pool
+        """
+
+        paths = [
+            self.get_example_path('example_xccdf_validation_ok.xml'),
+            self.get_example_path('example_xccdf_validation_no_id.xml'),
+            self.get_example_path('example_xccdf_validation_schema.xsd'),
+            self.get_example_path('missing.xml'),
+        ]
+        reports = validate_files(paths, self.xsd_path, processes=2)
+
+        self.assertEqual([path for path, errors in reports], paths,
+                         'Reports do not follow the given order')
+        self.assertEqual([len(errors) for path, errors in reports],
+                         [0, 1, 1, 1],
+                         'Errors found do not match')
+
+    def test_validate_files_missing_schema(self):
+        """
+        Tests the validate_files function with a missing schema
+        """
+
+        with self.assertRaises(IOError):
+            validate_files(
+                [self.get_example_path('example_xccdf_validation_ok.xml')],
+                self.get_example_path('missing.xsd'), processes=2)
+
+
+def suite():
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+    suite.addTest(loader.loadTestsFromTestCase(ValidationTestCase))
+    suite.addTest(loader.loadTestsFromTestCase(SchemaValidationTestCase))
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.TextTestRunner(verbosity=2).run(suite())
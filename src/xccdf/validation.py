@@ -0,0 +1,306 @@
+# -*- coding: utf-8 -*-
+
+"""
+xccdf.validation includes the function validate, to check a whole
+document against the rules of the models collecting every error found
+instead of stopping at the first one.
+
+Also includes the functions to validate documents against the XCCDF
+XML Schema and Schematron rules. The XCCDF 1.2 schemas are bundled in
+the schemas directory of the package. A document whose namespace isn't
+the target namespace of the XML Schema, like the XCCDF 1.1 documents
+of the models with the bundled schemas, is reported as unsupported.
+The schemas are compiled once per process and cached, and
+validate_files validates many files in a process pool.
+
+This module is part of the xccdf library.
+
+Author: Rodrigo Núñez <rnunezmujica@icloud.com>
+"""
+
+# Python stdlib
+from copy import deepcopy
+from functools import partial
+from multiprocessing import Pool
+import os
+
+# lxml
+from lxml import etree
+from lxml import isoschematron
+
+# XCCDF
+from xccdf.models.element import Element
+from xccdf.models.benchmark import Benchmark
+from xccdf.models.tailoring import Tailoring
+from xccdf.exceptions import InvalidValueException
+
+#: Directory of the bundled schemas
+SCHEMA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                          'schemas')
+
+#: XCCDF 1.2 XML Schema
+XSD_PATH = os.path.join(SCHEMA_DIR, 'xccdf_1.2.xsd')
+
+#: XCCDF 1.2 Schematron rules
+SCHEMATRON_PATH = os.path.join(SCHEMA_DIR, 'xccdf_1.2.sch')
+
+#: Compiled schemas of this process, by kind and path
+SCHEMA_CACHE = dict()
+
+#: Namespaces of the Schematron validation reports
+SVRL_NSMAP = {'svrl': 'http://purl.oclc.org/dsdl/svrl'}
+
+
+#: Models that can be validated, by tag name
+VALIDATION_MODELS = {
+    'Benchmark': Benchmark,
+    'Tailoring': Tailoring,
+}
+
+
+def validate(element):
+    """
+    Validates a Benchmark or a Tailoring, loading it in non strict mode
+    in a single pass over the XML tree.
+
+    Every cardinality, required attribute and invalid value error is
+    collected, with its element path and the line of the source document.
+
+    :param element: Benchmark or Tailoring object, or its XML element.
+    :type element: xccdf.models.element.Element or lxml.etree._Element
+    :returns: Errors found, sorted by source line.
+    :rtype: list of xccdf.exceptions.ValidationException
+    :raises ValueError: If the element is not a Benchmark or a Tailoring.
+    """
+
+    if isinstance(element, Element):
+        model = type(element)
+        if hasattr(element, 'xml_element'):
+            xml_element = element.xml_element
+        else:
+            xml_element = element.update_xml_element()
+    else:
+        uri, tag = Element.get_namespace_and_tag(element.tag)
+        model = VALIDATION_MODELS.get(tag)
+        xml_element = element
+
+    if model not in VALIDATION_MODELS.values():
+        raise ValueError('only Benchmark and Tailoring can be validated')
+
+    errors = model(xml_element, strict=False).errors
+
+    return sorted(errors, key=lambda error: error.sourceline or 0)
+
+
+def get_schema(path=XSD_PATH):
+    """
+    Returns the compiled XML Schema of the path,
+    compiling it only the first time it is requested in this process.
+
+    :param str path: Path of the XML Schema file.
+    :returns: Compiled XML Schema.
+    :rtype: lxml.etree.XMLSchema
+    :raises IOError: If the schema file does not exist.
+    """
+
+    key = ('xsd', os.path.abspath(path))
+    if key not in SCHEMA_CACHE:
+        xsd_tree = etree.parse(path)
+        SCHEMA_CACHE[key] = etree.XMLSchema(xsd_tree)
+        SCHEMA_CACHE[('namespace', key[1])] = xsd_tree.getroot().get(
+            'targetNamespace')
+
+    return SCHEMA_CACHE[key]
+
+
+def get_schema_namespace(path=XSD_PATH):
+    """
+    Returns the target namespace of the XML Schema of the path,
+    compiling the schema if it is not cached yet.
+
+    :param str path: Path of the XML Schema file.
+    :returns: Target namespace URI, None if the schema has none.
+    :rtype: str or NoneType
+    :raises IOError: If the schema file does not exist.
+    """
+
+    get_schema(path)
+
+    return SCHEMA_CACHE[('namespace', os.path.abspath(path))]
+
+
+def get_schematron(path=SCHEMATRON_PATH):
+    """
+    Returns the compiled Schematron of the path,
+    compiling it only the first time it is requested in this process.
+
+    :param str path: Path of the Schematron file.
+    :returns: Compiled Schematron.
+    :rtype: lxml.isoschematron.Schematron
+    :raises IOError: If the schematron file does not exist.
+    """
+
+    key = ('schematron', os.path.abspath(path))
+    if key not in SCHEMA_CACHE:
+        SCHEMA_CACHE[key] = isoschematron.Schematron(etree.parse(path),
+                                                     store_report=True)
+
+    return SCHEMA_CACHE[key]
+
+
+def schema_error(message, xml_tree, path):
+    """
+    Creates the exception of a schema error,
+    located at the element selected by the XPath expression.
+
+    :param str message: Error message.
+    :param lxml.etree._ElementTree xml_tree: Validated document.
+    :param str path: XPath of the offending element.
+    :returns: Schema error.
+    :rtype: xccdf.exceptions.InvalidValueException
+    """
+
+    error = InvalidValueException(message)
+
+    try:
+        elements = xml_tree.xpath(path) if path else list()
+    except etree.XPathError:
+        elements = list()
+
+    if len(elements) > 0 and isinstance(elements[0], etree._Element):
+        error.path = Element.get_element_path(elements[0])
+        error.sourceline = elements[0].sourceline
+    else:
+        error.path = path
+
+    return error
+
+
+def validate_schema(source, xsd_path=XSD_PATH, schematron_path=None):
+    """
+    Validates a Benchmark or a Tailoring against the XML Schema,
+    and optionally the Schematron rules.
+
+    :param source: Benchmark or Tailoring object, its XML element,
+                   or the path or file object of the document.
+    :param str xsd_path: Path of the XML Schema file.
+    :param str schematron_path: Path of the Schematron file.
+                                If None, the Schematron rules are not checked.
+    :returns: Errors found, sorted by source line. A document whose
+              namespace isn't the target namespace of the XML Schema
+              only has the unsupported namespace error.
+    :rtype: list of xccdf.exceptions.InvalidValueException
+    """
+
+    if isinstance(source, Element):
+        if hasattr(source, 'xml_element'):
+            source = source.xml_element
+        else:
+            source = source.update_xml_element()
+
+    if isinstance(source, etree._Element):
+        if source.getparent() is not None:
+            source = deepcopy(source)
+        xml_tree = source.getroottree()
+    else:
+        xml_tree = etree.parse(source)
+
+    errors = list()
+
+    schema = get_schema(xsd_path)
+    namespace = get_schema_namespace(xsd_path)
+    uri, tag = Element.get_namespace_and_tag(xml_tree.getroot().tag)
+    if uri != namespace:
+        error_msg = 'unsupported namespace {uri}, the XML Schema '\
+                    'validates {namespace} documents'.format(
+                        uri=uri, namespace=namespace)
+        errors.append(schema_error(error_msg, xml_tree, '/*'))
+        return errors
+
+    if not schema.validate(xml_tree):
+        for entry in schema.error_log:
+            errors.append(schema_error(entry.message, xml_tree, entry.path))
+
+    if schematron_path is not None:
+        schematron = get_schematron(schematron_path)
+        if not schematron.validate(xml_tree):
+            report = schematron.validation_report
+            for failed in report.iterfind('.//svrl:failed-assert',
+                                          namespaces=SVRL_NSMAP):
+                message = failed.findtext('svrl:text', namespaces=SVRL_NSMAP)
+                errors.append(schema_error(message.strip(), xml_tree,
+                                           failed.get('location')))
+
+    return sorted(errors, key=lambda error: error.sourceline or 0)
+
+
+def validate_file(path, xsd_path=XSD_PATH, schematron_path=None):
+    """
+    Validates a document file against the schemas, reporting the read
+    and XML syntax errors of the file as validation errors.
+
+    :param str path: Path of the document.
+    :param str xsd_path: Path of the XML Schema file.
+    :param str schematron_path: Path of the Schematron file.
+    :returns: Path of the document and errors found.
+    :rtype: tuple
+    """
+
+    try:
+        errors = validate_schema(path, xsd_path, schematron_path)
+    except etree.XMLSyntaxError as syntax_error:
+        error = InvalidValueException(str(syntax_error))
+        error.sourceline = syntax_error.lineno
+        errors = [error]
+    except IOError as io_error:
+        errors = [InvalidValueException(str(io_error))]
+
+    return path, errors
+
+
+def validate_files(paths, xsd_path=XSD_PATH, schematron_path=None,
+                   processes=None):
+    """
+    Validates many document files against the schemas in a process pool.
+    The schemas are compiled once, before the pool is created, so the
+    forked processes inherit them and a schema that can't be loaded
+    is reported here instead of in every process.
+
+    :param list paths: Paths of the documents.
+    :param str xsd_path: Path of the XML Schema file.
+    :param str schematron_path: Path of the Schematron file.
+    :param int processes: Number of processes, by default the CPU count.
+    :returns: Path and errors found of every document, in the given order.
+    :rtype: list of tuple
+    :raises IOError: If a schema file does not exist.
+    :raises lxml.etree.XMLSchemaParseError: If the XML Schema is invalid.
+    :raises lxml.etree.SchematronParseError: If the Schematron is invalid.
+    """
+
+    load_schemas(xsd_path, schematron_path)
+
+    validator = partial(validate_file, xsd_path=xsd_path,
+                        schematron_path=schematron_path)
+
+    pool = Pool(processes)
+    try:
+        return pool.map(validator, paths)
+    finally:
+        pool.close()
+        pool.join()
+
+
+def load_schemas(xsd_path=XSD_PATH, schematron_path=None):
+    """
+    Compiles the schemas into the cache of this process.
+
+    :param str xsd_path: Path of the XML Schema file.
+    :param str schematron_path: Path of the Schematron file.
+    :raises IOError: If a schema file does not exist.
+    :raises lxml.etree.XMLSchemaParseError: If the XML Schema is invalid.
+    :raises lxml.etree.SchematronParseError: If the Schematron is invalid.
+    """
+
+    get_schema(xsd_path)
+    if schematron_path is not None:
+        get_schematron(schematron_path)